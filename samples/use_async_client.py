@@ -0,0 +1,49 @@
+import asyncio
+from pprint import pprint
+from configparser import ConfigParser
+from td.credentials import TdCredentials
+from td.aio.client import AsyncTdAmeritradeClient
+
+# Initialize the Parser.
+config = ConfigParser()
+
+# Read the file.
+config.read('config/config.ini')
+
+# Get the specified credentials.
+client_id = config.get('main', 'client_id')
+redirect_uri = config.get('main', 'redirect_uri')
+
+# Intialize our `Crednetials` object.
+td_credentials = TdCredentials(
+    client_id=client_id,
+    redirect_uri=redirect_uri,
+    credential_file='config/td_credentials.json'
+)
+
+
+async def main():
+
+    # Initalize the `AsyncTdAmeritradeClient`, the session is closed on exit.
+    async with AsyncTdAmeritradeClient(credentials=td_credentials) as td_client:
+
+        # Initialize the `AsyncQuotes` and `AsyncPriceHistory` services.
+        quote_service = td_client.quotes()
+        price_history_service = td_client.price_history()
+
+        # Run the requests concurrently over the same connection pool.
+        quotes, price_history = await asyncio.gather(
+            quote_service.get_quotes(instruments=['AAPL', 'SQ']),
+            price_history_service.get_price_history(
+                symbol='MSFT',
+                frequency_type='minute',
+                frequency=1,
+                period_type='day',
+                period=10
+            )
+        )
+
+        pprint(quotes)
+        pprint(price_history['candles'][:5])
+
+asyncio.run(main())
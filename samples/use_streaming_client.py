@@ -130,5 +130,5 @@ streaming_services.level_two_options(
     fields=LevelTwoOptions.All
 )
 
-# Start Streaming.
-streaming_api_service.open_stream()
+# Start Streaming, the messages are logged at the INFO level.
+streaming_api_service.open_stream(print_messages=True)
@@ -35,8 +35,12 @@ setup(
     # there are some dependencies to use the library, so let's list them out.
     install_requires=[
         'requests>=2.24.0',
+        'aiohttp>=3.7.4',
+        'numpy>=1.19.0',
         'dataclasses>=0.6',
-        'websockets>=9.1'
+        'websockets>=9.1',
+        'backports.zoneinfo>=0.2.1; python_version < "3.9"',
+        'tzdata>=2021.1; platform_system == "Windows"'
     ],
 
     # some keywords for my library.
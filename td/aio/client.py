@@ -0,0 +1,289 @@
+from td.credentials import TdCredentials
+from td.utils.rate_limiter import RateLimiter
+from td.utils.retry_policy import RetryPolicy
+from td.utils.quote_cache import QuoteCache
+from td.utils.candle_store import CandleStore
+from td.utils.option_chain_cache import OptionChainCache
+from td.aio.session import AsyncTdAmeritradeSession
+from td.aio.rest import AsyncQuotes
+from td.aio.rest import AsyncMovers
+from td.aio.rest import AsyncAccounts
+from td.aio.rest import AsyncMarketHours
+from td.aio.rest import AsyncInstruments
+from td.aio.rest import AsyncUserInfo
+from td.aio.rest import AsyncPriceHistory
+from td.aio.rest import AsyncOptionsChain
+from td.aio.rest import AsyncWatchlists
+from td.aio.rest import AsyncOrders
+from td.aio.rest import AsyncSavedOrders
+
+
+class AsyncTdAmeritradeClient():
+
+    """
+    ### Overview
+    ----
+    Handles initializing all the different asyncio API Services
+    and ensures that your session is authenticated. All the services
+    share the same connection pool.
+    """
+
+    def __init__(
+        self,
+        credentials: TdCredentials,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        quote_cache: QuoteCache = None,
+        candle_store: CandleStore = None,
+        option_chain_cache: OptionChainCache = None
+    ) -> None:
+        """Initializes the `AsyncTdAmeritradeClient` object.
+
+        ### Parameters
+        credentials : TdCredentials
+            Your TD Credentials stored in your credentials object
+            so that you can authenitcate with TD.
+
+        limit : int (optional, Default=100)
+            The maximum number of connections kept open in total.
+
+        limit_per_host : int (optional, Default=10)
+            The maximum number of connections kept open per host,
+            and the default number of requests run at the same time.
+
+        keep_alive : bool (optional, Default=True)
+            If `True` connections are kept alive between requests,
+            if `False` every connection is closed after each response.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            The token bucket shared by every request of the client,
+            defaults to 120 requests per minute.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            Decides which failed requests are retried, defaults
+            to retrying transient errors on `GET` requests only.
+
+        quote_cache : QuoteCache (optional, Default=None)
+            An opt-in cache shared by every `Quotes` service
+            created from this client.
+
+        candle_store : CandleStore (optional, Default=None)
+            The on-disk candle store used by every `PriceHistory`
+            service created from this client.
+
+        option_chain_cache : OptionChainCache (optional, Default=None)
+            The snapshot cache shared by every `OptionsChain`
+            service created from this client.
+        """
+
+        self.td_credentials = credentials
+        self.quote_cache = quote_cache
+        self.candle_store = candle_store
+        self.option_chain_cache = option_chain_cache
+        self.td_session = AsyncTdAmeritradeSession(
+            td_client=self,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keep_alive=keep_alive,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy
+        )
+
+    async def __aenter__(self) -> 'AsyncTdAmeritradeClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the shared session and its connection pool."""
+
+        await self.td_session.close()
+
+    def quotes(self) -> AsyncQuotes:
+        """Used to access the `AsyncQuotes` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncQuotes:
+            The `AsyncQuotes` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> quotes_service = td_client.quotes()
+        """
+
+        return AsyncQuotes(
+            session=self.td_session,
+            quote_cache=self.quote_cache
+        )
+
+    def movers(self) -> AsyncMovers:
+        """Used to access the `AsyncMovers` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncMovers:
+            The `AsyncMovers` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> movers_service = td_client.movers()
+        """
+
+        return AsyncMovers(session=self.td_session)
+
+    def accounts(self) -> AsyncAccounts:
+        """Used to access the `AsyncAccounts` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncAccounts:
+            The `AsyncAccounts` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> accounts_service = td_client.accounts()
+        """
+
+        return AsyncAccounts(session=self.td_session)
+
+    def market_hours(self) -> AsyncMarketHours:
+        """Used to access the `AsyncMarketHours` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncMarketHours:
+            The `AsyncMarketHours` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> market_hours_service = td_client.market_hours()
+        """
+
+        return AsyncMarketHours(session=self.td_session)
+
+    def instruments(self) -> AsyncInstruments:
+        """Used to access the `AsyncInstruments` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncInstruments:
+            The `AsyncInstruments` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> instruments_service = td_client.instruments()
+        """
+
+        return AsyncInstruments(session=self.td_session)
+
+    def user_info(self) -> AsyncUserInfo:
+        """Used to access the `AsyncUserInfo` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncUserInfo:
+            The `AsyncUserInfo` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> user_info_service = td_client.user_info()
+        """
+
+        return AsyncUserInfo(session=self.td_session)
+
+    def price_history(self) -> AsyncPriceHistory:
+        """Used to access the `AsyncPriceHistory` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncPriceHistory:
+            The `AsyncPriceHistory` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> price_history_service = td_client.price_history()
+        """
+
+        return AsyncPriceHistory(
+            session=self.td_session,
+            candle_store=self.candle_store
+        )
+
+    def options_chain(self) -> AsyncOptionsChain:
+        """Used to access the `AsyncOptionsChain` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncOptionsChain:
+            The `AsyncOptionsChain` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> options_chain_service = td_client.options_chain()
+        """
+
+        return AsyncOptionsChain(
+            session=self.td_session,
+            option_chain_cache=self.option_chain_cache
+        )
+
+    def watchlists(self) -> AsyncWatchlists:
+        """Used to access the `AsyncWatchlists` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncWatchlists:
+            The `AsyncWatchlists` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> watchlists_service = td_client.watchlists()
+        """
+
+        return AsyncWatchlists(session=self.td_session)
+
+    def orders(self) -> AsyncOrders:
+        """Used to access the `AsyncOrders` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncOrders:
+            The `AsyncOrders` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> orders_service = td_client.orders()
+        """
+
+        return AsyncOrders(session=self.td_session)
+
+    def saved_orders(self) -> AsyncSavedOrders:
+        """Used to access the `AsyncSavedOrders` Services and metadata.
+
+        ### Returns
+        ---
+        AsyncSavedOrders:
+            The `AsyncSavedOrders` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = AsyncTdAmeritradeClient()
+            >>> saved_orders_service = td_client.saved_orders()
+        """
+
+        return AsyncSavedOrders(session=self.td_session)
@@ -0,0 +1,1573 @@
+import asyncio
+import logging
+import pathlib
+
+from enum import Enum
+from typing import List
+from typing import Union
+from typing import AsyncIterator
+from datetime import tzinfo
+from datetime import datetime
+from datetime import date as date_type
+
+import numpy as np
+
+from td.rest.quotes import QuotesBase
+from td.rest.movers import Movers
+from td.rest.accounts import Accounts
+from td.rest.market_hours import MarketHours
+from td.rest.instruments import Instruments
+from td.rest.user_info import UserInfo
+from td.rest.price_history import PriceHistoryBase
+from td.rest.price_history import BulkPriceHistoryError
+from td.rest.options_chain import OptionsChainBase
+from td.rest.options_chain import BulkOptionChainError
+from td.rest.watchlists import Watchlists
+from td.rest.orders import Orders
+from td.rest.saved_orders import SavedOrders
+from td.aio.session import AsyncTdAmeritradeSession
+from td.utils.quote_cache import QuoteCache
+from td.utils.quote_frame import QuoteFrame
+from td.utils.orders import Order
+from td.utils.enums import RequestPriority
+from td.utils.candle_store import CandleStore
+from td.utils.bounded_requests import run_bounded_async
+from td.utils.option_chain import OptionChainQuery
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_cache import OptionChainDiff
+from td.utils.option_chain_cache import OptionChainCache
+from td.utils.user_preferences import UserPreferences
+
+
+class RequestBuilder():
+
+    """
+    ## Overview
+    ----
+    Stands in for the session of a sync service, so the service
+    builds and validates a request and hands back the arguments of
+    `make_request` instead of sending it. The asyncio services use
+    it to reuse the request building of the sync services and send
+    the request themselves.
+    """
+
+    def make_request(self, **kwargs) -> dict:
+        """Returns the arguments of the request instead of sending it."""
+
+        return kwargs
+
+
+class AsyncQuotes(QuotesBase):
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Quotes` service. Every method
+    takes the same arguments as `Quotes` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(
+        self,
+        session: AsyncTdAmeritradeSession,
+        quote_cache: QuoteCache = None
+    ) -> None:
+        """Initializes the `AsyncQuotes` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        quote_cache : QuoteCache (optional, Default=None)
+            If provided, quotes are served from the cache while
+            they are fresh and concurrent requests for the same
+            symbols share one fetch.
+
+        ### Usage
+        ----
+            >>> quote_service = td_client.quotes()
+            >>> await quote_service.get_quotes(instruments=['AAPL','SQ'])
+        """
+
+        super().__init__(session=session, quote_cache=quote_cache)
+
+    async def get_quote(self, instrument=str) -> dict:
+        """Grabs real-time quotes for an instrument.
+
+        ### Parameters
+        ----
+        instruments: str
+            A list of different financial instruments.
+
+        ### Usage
+        ----
+            >>> quote_service = td_client.quotes()
+            >>> await quote_service.get_quote(instrument='AAPL')
+        """
+
+        if self.quote_cache:
+            return await self.quote_cache.get_or_fetch_async(
+                symbols=[instrument],
+                fetch=self._request_quotes
+            )
+
+        return await self._request_quotes(instruments=[instrument])
+
+    async def _request_quotes(self, instruments: List[str]) -> dict:
+        """Makes a single Get Quotes request.
+
+        ### Parameters
+        ----
+        instruments: List[str]
+            A list of at most 500 financial instruments.
+
+        ### Returns
+        ----
+        dict:
+            The quotes keyed by symbol.
+        """
+
+        return await self.session.make_request(
+            method='get',
+            endpoint='marketdata/quotes',
+            params={'symbol': ','.join(instruments)}
+        )
+
+    async def get_quotes(
+        self,
+        instruments=List[str],
+        chunk_size: int = 500,
+        max_url_length: int = 4000,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> dict:
+        """Grabs real-time quotes for multiple instruments.
+
+        ### Overview
+        ----
+        The asyncio version of `Quotes.get_quotes`, larger lists
+        are split into chunks that are requested concurrently and
+        merged together.
+
+        ### Parameters
+        ----
+        instruments: str
+            A list of different financial instruments.
+
+        chunk_size: int (optional, Default=500)
+            The maximum number of symbols sent in one request.
+
+        max_url_length: int (optional, Default=4000)
+            The maximum length of the encoded `symbol` param of
+            one request.
+
+        max_workers: int (optional, Default=None)
+            The number of chunks requested at the same time, defaults
+            to the connection pool size of the session.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `QuotesChunkError` holding the quotes of the
+            successful chunks is raised when any chunk fails. If `False`
+            failures are logged and the successful quotes are returned.
+
+        ### Usage
+        ----
+            >>> quote_service = td_client.quotes()
+            >>> await quote_service.get_quotes(instruments=['AAPL','SQ'])
+        """
+
+        # Nothing to request.
+        if not instruments:
+            return {}
+
+        if self.quote_cache:
+            return await self.quote_cache.get_or_fetch_async(
+                symbols=instruments,
+                fetch=lambda symbols: self._fetch_quotes(
+                    instruments=symbols,
+                    chunk_size=chunk_size,
+                    max_url_length=max_url_length,
+                    max_workers=max_workers,
+                    raise_errors=raise_errors
+                )
+            )
+
+        return await self._fetch_quotes(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length,
+            max_workers=max_workers,
+            raise_errors=raise_errors
+        )
+
+    async def get_quotes_frame(
+        self,
+        instruments: List[str],
+        fields: List[str] = None,
+        chunk_size: int = 500,
+        max_url_length: int = 4000,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> QuoteFrame:
+        """Grabs real-time quotes as a columnar `QuoteFrame`.
+
+        ### Parameters
+        ----
+        See `Quotes.get_quotes_frame`.
+
+        ### Usage
+        ----
+            >>> quote_service = td_client.quotes()
+            >>> quote_frame = await quote_service.get_quotes_frame(
+                    instruments=['AAPL','SQ'],
+                    fields=['bidPrice', 'askPrice', 'lastPrice', 'totalVolume']
+                )
+        """
+
+        content = await self.get_quotes(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length,
+            max_workers=max_workers,
+            raise_errors=raise_errors
+        )
+
+        return QuoteFrame.from_quotes(content=content, fields=fields)
+
+    async def _fetch_quotes(
+        self,
+        instruments: List[str],
+        chunk_size: int,
+        max_url_length: int,
+        max_workers: int,
+        raise_errors: bool
+    ) -> dict:
+        """Fetches the quotes in concurrent chunks, bypassing the cache.
+
+        ### Parameters
+        ----
+        See `AsyncQuotes.get_quotes`.
+
+        ### Returns
+        ----
+        dict:
+            The merged quotes keyed by symbol.
+        """
+
+        chunks = self._chunk_instruments(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length
+        )
+
+        if len(chunks) <= 1:
+            return await self._request_quotes(instruments=chunks[0] if chunks else [])
+
+        semaphore = asyncio.Semaphore(max_workers or self.session.limit_per_host)
+
+        async def request_chunk(chunk: List[str]) -> dict:
+            async with semaphore:
+                return await self._request_quotes(instruments=chunk)
+
+        results = await asyncio.gather(
+            *[request_chunk(chunk) for chunk in chunks],
+            return_exceptions=True
+        )
+
+        return self._merge_chunks(
+            chunks=chunks,
+            results=results,
+            raise_errors=raise_errors
+        )
+
+
+class AsyncMovers():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Movers` service. Every method
+    takes the same arguments as `Movers` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncMovers` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> movers_service = td_client.movers()
+            >>> await movers_service.get_movers(index='$DJI', direction='up', change='percent')
+        """
+
+        self.session = session
+        self._requests = Movers(session=RequestBuilder())
+
+    async def get_movers(
+        self,
+        index=str,
+        direction: Union[str, Enum] = None,
+        change: Union[str, Enum] = None
+    ) -> dict:
+        """Gets Active movers for a specific Index.
+
+        ### Parameters
+        ----
+        See `Movers.get_movers`.
+        """
+
+        request = self._requests.get_movers(
+            index=index,
+            direction=direction,
+            change=change
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncAccounts():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Accounts` service. Every method
+    takes the same arguments as `Accounts` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncAccounts` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> accounts_service = td_client.accounts()
+            >>> await accounts_service.get_accounts(account_id='123456789')
+        """
+
+        self.session = session
+        self._requests = Accounts(session=RequestBuilder())
+
+    async def get_accounts(
+        self,
+        account_id: str = None,
+        include_orders: bool = True,
+        include_positions: bool = True
+    ) -> dict:
+        """Queries accounts for a user.
+
+        ### Parameters
+        ----
+        See `Accounts.get_accounts`.
+        """
+
+        request = self._requests.get_accounts(
+            account_id=account_id,
+            include_orders=include_orders,
+            include_positions=include_positions
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_transactions(
+        self,
+        account_id: str,
+        transaction_type: Union[str, Enum] = None,
+        symbol: str = None,
+        start_date: Union[str, datetime] = None,
+        end_date: Union[str, datetime] = None
+    ) -> dict:
+        """Queries the transactions for an account.
+
+        ### Parameters
+        ----
+        See `Accounts.get_transactions`.
+        """
+
+        request = self._requests.get_transactions(
+            account_id=account_id,
+            transaction_type=transaction_type,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_transaction(self, account_id: str, transaction_id: str) -> dict:
+        """Queries a transaction for a specific account.
+
+        ### Parameters
+        ----
+        See `Accounts.get_transaction`.
+        """
+
+        request = self._requests.get_transaction(
+            account_id=account_id,
+            transaction_id=transaction_id
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncMarketHours():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `MarketHours` service. Every method
+    takes the same arguments as `MarketHours` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncMarketHours` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> market_hours_service = td_client.market_hours()
+            >>> await market_hours_service.get_market_hours(market='EQUITY', date=datetime.now())
+        """
+
+        self.session = session
+        self._requests = MarketHours(session=RequestBuilder())
+
+    async def get_multiple_market_hours(
+        self,
+        markets: list,
+        date: Union[str, datetime, date_type]
+    ) -> dict:
+        """Returns the market hours for all the markets.
+
+        ### Parameters
+        ----
+        See `MarketHours.get_multiple_market_hours`.
+        """
+
+        request = self._requests.get_multiple_market_hours(
+            markets=markets,
+            date=date
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_market_hours(
+        self,
+        market: Union[str, Enum],
+        date: Union[str, datetime, date_type]
+    ) -> dict:
+        """Returns the market hours for the specified market.
+
+        ### Parameters
+        ----
+        See `MarketHours.get_market_hours`.
+        """
+
+        request = self._requests.get_market_hours(
+            market=market,
+            date=date
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncInstruments():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Instruments` service. Every method
+    takes the same arguments as `Instruments` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncInstruments` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> instruments_service = td_client.instruments()
+            >>> await instruments_service.get_instrument(cusip='617446448')
+        """
+
+        self.session = session
+        self._requests = Instruments(session=RequestBuilder())
+
+    async def search_instruments(self, symbol: str, projection: Union[str, Enum]) -> dict:
+        """Search or retrieve instrument data, including fundamental data.
+
+        ### Parameters
+        ----
+        See `Instruments.search_instruments`.
+        """
+
+        request = self._requests.search_instruments(
+            symbol=symbol,
+            projection=projection
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_instrument(self, cusip: str) -> dict:
+        """Get an instrument by CUSIP.
+
+        ### Parameters
+        ----
+        See `Instruments.get_instrument`.
+        """
+
+        request = self._requests.get_instrument(
+            cusip=cusip
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncUserInfo():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `UserInfo` service. Every method
+    takes the same arguments as `UserInfo` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncUserInfo` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> user_info_service = td_client.user_info()
+            >>> await user_info_service.get_user_principals()
+        """
+
+        self.session = session
+        self._requests = UserInfo(session=RequestBuilder())
+
+    async def get_preferences(self, account_id: str) -> dict:
+        """Get's User Preferences for a specific account.
+
+        ### Parameters
+        ----
+        See `UserInfo.get_preferences`.
+        """
+
+        request = self._requests.get_preferences(
+            account_id=account_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_streamer_subscription_keys(self, account_ids: List[str]) -> dict:
+        """SubscriptionKey for provided accounts or default accounts.
+
+        ### Parameters
+        ----
+        See `UserInfo.get_streamer_subscription_keys`.
+        """
+
+        request = self._requests.get_streamer_subscription_keys(
+            account_ids=account_ids
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_user_principals(self) -> dict:
+        """Get's User principals details.
+
+        ### Parameters
+        ----
+        See `UserInfo.get_user_principals`.
+        """
+
+        request = self._requests.get_user_principals()
+
+        return await self.session.make_request(**request)
+
+    async def update_user_preferences(
+        self,
+        account_id: str,
+        preferences: Union[dict, UserPreferences]
+    ) -> dict:
+        """Update preferences for a specific account.
+
+        ### Parameters
+        ----
+        See `UserInfo.update_user_preferences`.
+        """
+
+        request = self._requests.update_user_preferences(
+            account_id=account_id,
+            preferences=preferences
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncPriceHistory(PriceHistoryBase):
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `PriceHistory` service. Every method
+    takes the same arguments as `PriceHistory` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(
+        self,
+        session: AsyncTdAmeritradeSession,
+        candle_store: CandleStore = None
+    ) -> None:
+        """Initializes the `AsyncPriceHistory` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        candle_store : CandleStore (optional, Default=None)
+            The on-disk store used by `get_cached_price_history`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> await price_history_service.get_price_history(
+                    symbol='MSFT',
+                    frequency_type='minute',
+                    frequency=1,
+                    period_type='day',
+                    period=10
+                )
+        """
+
+        super().__init__(session=session, candle_store=candle_store)
+
+    async def get_price_history(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True,
+        priority: RequestPriority = RequestPriority.Low
+    ) -> dict:
+        """Gets historical candle data for a financial instrument.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_price_history`.
+        """
+
+        params = self._build_params(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        return await self.session.make_request(
+            method='get',
+            endpoint=f'marketdata/{symbol}/pricehistory',
+            params=params,
+            priority=priority
+        )
+
+    async def get_price_history_range(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        start_date: Union[datetime, int],
+        end_date: Union[datetime, int],
+        extended_hours_needed: bool = True,
+        max_workers: int = None,
+        raise_errors: bool = True,
+        gap_threshold: int = None,
+        time_zone: tzinfo = None
+    ) -> dict:
+        """Gets historical candle data for any date range.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_price_history_range`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> price_history = await price_history_service.get_price_history_range(
+                symbol='MSFT',
+                frequency_type='minute',
+                frequency=1,
+                start_date=datetime(2021, 1, 1),
+                end_date=datetime(2021, 3, 31)
+            )
+        """
+
+        windows, window_params = self._build_range_windows(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+        semaphore = asyncio.Semaphore(max_workers or self.session.limit_per_host)
+
+        async def request_window(params: dict) -> dict:
+            async with semaphore:
+                return await self.session.make_request(
+                    method='get',
+                    endpoint=f'marketdata/{symbol}/pricehistory',
+                    params=params,
+                    priority=RequestPriority.Low
+                )
+
+        results = await asyncio.gather(
+            *[request_window(params) for params in window_params],
+            return_exceptions=True
+        )
+
+        return self._merge_range(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            windows=windows,
+            results=results,
+            raise_errors=raise_errors,
+            gap_threshold=gap_threshold,
+            time_zone=time_zone
+        )
+
+    async def get_cached_price_history(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True
+    ) -> np.ndarray:
+        """Gets historical candle data, only downloading new candles.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_cached_price_history`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> candles = await price_history_service.get_cached_price_history(
+                symbol='MSFT',
+                frequency_type='daily',
+                frequency=1,
+                period_type='year',
+                period=10
+            )
+        """
+
+        cached_requests = self._build_cached_requests(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        contents = [
+            await self.get_price_history(**request_args) for request_args in cached_requests
+        ]
+
+        return self._store_cached_candles(
+            cached_requests=cached_requests,
+            contents=contents,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    async def get_bulk_price_history(
+        self,
+        symbols: List[str],
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True,
+        max_workers: int = None,
+        progress_file: Union[str, pathlib.Path] = None,
+        raise_errors: bool = True
+    ) -> AsyncIterator[tuple]:
+        """Gets historical candle data for many financial instruments.
+
+        ### Overview
+        ----
+        The asyncio version of `PriceHistory.get_bulk_price_history`,
+        the results are yielded as each symbol completes.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_bulk_price_history`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> async for symbol, price_history in price_history_service.get_bulk_price_history(
+                    symbols=['MSFT', 'AAPL', 'SQ'],
+                    frequency_type='daily',
+                    frequency=1,
+                    period_type='year',
+                    period=10,
+                    progress_file='backfill_progress.jsonl'
+                ):
+                    save_candles(symbol, price_history['candles'])
+        """
+
+        # Validate once, so bad arguments fail before any request is made.
+        params = self._build_params(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        completed = self._load_progress(progress_file=progress_file)
+        pending = [symbol for symbol in dict.fromkeys(symbols) if symbol not in completed]
+        max_workers = max_workers or self.session.limit_per_host
+        errors = {}
+
+        async def request_symbol(symbol: str) -> dict:
+            return await self.session.make_request(
+                method='get',
+                endpoint=f'marketdata/{symbol}/pricehistory',
+                params=params,
+                priority=RequestPriority.Low
+            )
+
+        results = run_bounded_async(
+            jobs=zip(pending, pending),
+            request=request_symbol,
+            max_workers=max_workers
+        )
+
+        try:
+
+            async for symbol, content, symbol_error in results:
+
+                if symbol_error is not None:
+                    errors[symbol] = symbol_error
+                    logging.error(
+                        "Price history for %s failed: %r", symbol, symbol_error
+                    )
+                    continue
+
+                yield symbol, content
+
+                self._save_progress(progress_file=progress_file, symbol=symbol)
+
+        finally:
+
+            # Stop the requests if the caller stops iterating early.
+            await results.aclose()
+
+        if errors and raise_errors:
+            raise BulkPriceHistoryError(errors=errors)
+
+
+class AsyncOptionsChain(OptionsChainBase):
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `OptionsChain` service. Every method
+    takes the same arguments as `OptionsChain` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(
+        self,
+        session: AsyncTdAmeritradeSession,
+        option_chain_cache: OptionChainCache = None
+    ) -> None:
+        """Initializes the `AsyncOptionsChain` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        option_chain_cache : OptionChainCache (optional, Default=None)
+            Keeps the latest snapshot of each chain so refreshes
+            can return only the contracts that moved.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> await options_chain_service.get_option_chain(
+                    option_chain_query=option_chain_query
+                )
+        """
+
+        super().__init__(session=session, option_chain_cache=option_chain_cache)
+
+    async def get_option_chain(
+        self,
+        option_chain_query: OptionChainQuery = None,
+        option_chain_dict: dict = None,
+        raise_validation_errors: bool = True
+    ) -> dict:
+        """Get option chain for an optionable Symbol.
+
+        ### Parameters
+        ----
+        See `OptionsChain.get_option_chain`.
+        """
+
+        params = self._build_params(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
+
+        return await self.session.make_request(
+            method='get',
+            endpoint='marketdata/chains',
+            params=params
+        )
+
+    async def get_option_chain_frame(
+        self,
+        option_chain_query: OptionChainQuery = None,
+        option_chain_dict: dict = None,
+        raise_validation_errors: bool = True,
+        fields: List[str] = None
+    ) -> OptionChainFrame:
+        """Get option chain for an optionable Symbol as a columnar
+        `OptionChainFrame`.
+
+        ### Parameters
+        ----
+        See `OptionsChain.get_option_chain_frame`.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_frame = await options_chain_service.get_option_chain_frame(
+                    option_chain_query=option_chain_query
+                )
+        """
+
+        content = await self.get_option_chain(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
+
+        return OptionChainFrame.from_chain(content=content, fields=fields)
+
+    async def get_option_chains(
+        self,
+        option_chain_queries: List[Union[OptionChainQuery, dict]],
+        raise_validation_errors: bool = True,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> AsyncIterator[tuple]:
+        """Get option chains for many underlyings concurrently.
+
+        ### Overview
+        ----
+        An async generator, chains are yielded as they arrive. Stop
+        iterating, or close the generator, to cancel the requests
+        that are still in flight.
+
+        ### Parameters
+        ----
+        See `OptionsChain.get_option_chains`.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> async for position, option_chain in options_chain_service.get_option_chains(
+                    option_chain_queries=option_chain_queries
+                ):
+                    print(position, option_chain['symbol'])
+        """
+
+        # Validate every query, so bad arguments fail before any request is made.
+        queries = [
+            self._build_params(
+                option_chain_query=query if isinstance(query, OptionChainQuery) else None,
+                option_chain_dict=query if isinstance(query, dict) else None,
+                raise_validation_errors=raise_validation_errors
+            )
+            for query in option_chain_queries
+        ]
+
+        max_workers = max_workers or self.session.limit_per_host
+        errors = {}
+
+        async def request_chain(params: dict) -> dict:
+            return await self.session.make_request(
+                method='get',
+                endpoint='marketdata/chains',
+                params=params
+            )
+
+        results = run_bounded_async(
+            jobs=enumerate(queries),
+            request=request_chain,
+            max_workers=max_workers
+        )
+
+        try:
+
+            async for position, content, chain_error in results:
+
+                if chain_error is not None:
+                    errors[position] = chain_error
+                    logging.error(
+                        "Option chain for %s failed: %r",
+                        queries[position].get('symbol'), chain_error
+                    )
+                    continue
+
+                yield position, content
+
+        finally:
+
+            # Stop the requests if the caller stops iterating early.
+            await results.aclose()
+
+        if errors and raise_errors:
+            raise BulkOptionChainError(errors=errors)
+
+    async def refresh_option_chain(
+        self,
+        option_chain_query: OptionChainQuery = None,
+        option_chain_dict: dict = None,
+        raise_validation_errors: bool = True,
+        fields: List[str] = None
+    ) -> OptionChainDiff:
+        """Refreshes a cached option chain and returns what moved.
+
+        ### Parameters
+        ----
+        See `OptionsChain.refresh_option_chain`.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_diff = await options_chain_service.refresh_option_chain(
+                    option_chain_query=option_chain_query
+                )
+        """
+
+        if self.option_chain_cache is None:
+            raise ValueError(
+                'An `OptionChainCache` is needed, pass one to the client.'
+            )
+
+        params = self._build_params(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
+
+        option_chain_frame = await self.get_option_chain_frame(
+            option_chain_dict=params,
+            fields=fields
+        )
+
+        return self.option_chain_cache.update(
+            query=params,
+            option_chain_frame=option_chain_frame
+        )
+
+
+class AsyncWatchlists():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Watchlists` service. Every method
+    takes the same arguments as `Watchlists` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncWatchlists` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> watchlists_service = td_client.watchlists()
+            >>> await watchlists_service.get_all_accounts_watchlists()
+        """
+
+        self.session = session
+        self._requests = Watchlists(session=RequestBuilder())
+
+    async def get_all_accounts_watchlists(self) -> dict:
+        """All watchlists for all of the user's linked accounts.
+
+        ### Parameters
+        ----
+        See `Watchlists.get_all_accounts_watchlists`.
+        """
+
+        request = self._requests.get_all_accounts_watchlists()
+
+        return await self.session.make_request(**request)
+
+    async def get_accounts_watchlist(self, account_id: str) -> dict:
+        """Gets all the watchlists of an account.
+
+        ### Parameters
+        ----
+        See `Watchlists.get_accounts_watchlist`.
+        """
+
+        request = self._requests.get_accounts_watchlist(
+            account_id=account_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_watchlist(self, account_id: str, watchlist_id: str) -> dict:
+        """Gets a specific watchlist for a specific account.
+
+        ### Parameters
+        ----
+        See `Watchlists.get_watchlist`.
+        """
+
+        request = self._requests.get_watchlist(
+            account_id=account_id,
+            watchlist_id=watchlist_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def create_watchlist(self, account_id: str, name: str, watchlist_items: dict) -> dict:
+        """Creates a new watchlist.
+
+        ### Parameters
+        ----
+        See `Watchlists.create_watchlist`.
+        """
+
+        request = self._requests.create_watchlist(
+            account_id=account_id,
+            name=name,
+            watchlist_items=watchlist_items
+        )
+
+        return await self.session.make_request(**request)
+
+    async def update_watchlist(
+        self,
+        account_id: str,
+        watchlist_id: str,
+        name: str = None,
+        watchlist_items: dict = None
+    ) -> dict:
+        """Updates an existing watchlist.
+
+        ### Parameters
+        ----
+        See `Watchlists.update_watchlist`.
+        """
+
+        request = self._requests.update_watchlist(
+            account_id=account_id,
+            watchlist_id=watchlist_id,
+            name=name,
+            watchlist_items=watchlist_items
+        )
+
+        return await self.session.make_request(**request)
+
+    async def replace_watchlist(
+        self,
+        account_id: str,
+        watchlist_id: str,
+        name: str,
+        watchlist_items: dict
+    ) -> dict:
+        """Replaces an existing watchlist.
+
+        ### Parameters
+        ----
+        See `Watchlists.replace_watchlist`.
+        """
+
+        request = self._requests.replace_watchlist(
+            account_id=account_id,
+            watchlist_id=watchlist_id,
+            name=name,
+            watchlist_items=watchlist_items
+        )
+
+        return await self.session.make_request(**request)
+
+    async def delete_watchlist(self, account_id: str, watchlist_id: str) -> dict:
+        """Deletes a watchlist for a specific account.
+
+        ### Parameters
+        ----
+        See `Watchlists.delete_watchlist`.
+        """
+
+        request = self._requests.delete_watchlist(
+            account_id=account_id,
+            watchlist_id=watchlist_id
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncOrders():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `Orders` service. Every method
+    takes the same arguments as `Orders` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncOrders` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> orders_service = td_client.orders()
+            >>> await orders_service.get_order(
+                    account_id='123456789',
+                    order_id='12345678'
+                )
+        """
+
+        self.session = session
+        self._requests = Orders(session=RequestBuilder())
+
+    async def get_orders_by_path(
+        self,
+        account_id: str,
+        max_results: int = None,
+        from_entered_time: Union[datetime, str] = None,
+        to_entered_time: Union[datetime, str] = None,
+        order_status: Union[Enum, str] = None
+    ) -> dict:
+        """Returns the orders for a specific account.
+
+        ### Parameters
+        ----
+        See `Orders.get_orders_by_path`.
+        """
+
+        request = self._requests.get_orders_by_path(
+            account_id=account_id,
+            max_results=max_results,
+            from_entered_time=from_entered_time,
+            to_entered_time=to_entered_time,
+            order_status=order_status
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_order(
+        self,
+        account_id: str,
+        order_id: str
+    ) -> dict:
+        """Get a specific order for a specific account.
+
+        ### Parameters
+        ----
+        See `Orders.get_order`.
+        """
+
+        request = self._requests.get_order(
+            account_id=account_id,
+            order_id=order_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_orders_by_query(
+        self,
+        account_id: str = None,
+        max_results: int = None,
+        from_entered_time: Union[datetime, str] = None,
+        to_entered_time: Union[datetime, str] = None,
+        order_status: Union[Enum, str] = None
+    ) -> dict:
+        """Returns the orders for a specific account.
+
+        ### Parameters
+        ----
+        See `Orders.get_orders_by_query`.
+        """
+
+        request = self._requests.get_orders_by_query(
+            account_id=account_id,
+            max_results=max_results,
+            from_entered_time=from_entered_time,
+            to_entered_time=to_entered_time,
+            order_status=order_status
+        )
+
+        return await self.session.make_request(**request)
+
+    async def place_order(
+        self,
+        account_id: str,
+        order_object: Order = None,
+        order_dict: dict = None
+    ) -> dict:
+        """Place an order for a specific account. Order throttle
+
+        ### Parameters
+        ----
+        See `Orders.place_order`.
+        """
+
+        request = self._requests.place_order(
+            account_id=account_id,
+            order_object=order_object,
+            order_dict=order_dict
+        )
+
+        return await self.session.make_request(**request)
+
+    async def replace_order(
+        self,
+        account_id: str,
+        order_id: str,
+        order_object: Order = None,
+        order_dict: dict = None
+    ) -> dict:
+        """Replace an existing order for an account.
+
+        ### Parameters
+        ----
+        See `Orders.replace_order`.
+        """
+
+        request = self._requests.replace_order(
+            account_id=account_id,
+            order_id=order_id,
+            order_object=order_object,
+            order_dict=order_dict
+        )
+
+        return await self.session.make_request(**request)
+
+    async def cancel_order(
+        self,
+        account_id: str,
+        order_id: str
+    ) -> dict:
+        """Cancels an order for a specific account. Order throttle
+
+        ### Parameters
+        ----
+        See `Orders.cancel_order`.
+        """
+
+        request = self._requests.cancel_order(
+            account_id=account_id,
+            order_id=order_id
+        )
+
+        return await self.session.make_request(**request)
+
+
+class AsyncSavedOrders():
+
+    """
+    ## Overview
+    ----
+    The asyncio version of the `SavedOrders` service. Every method
+    takes the same arguments as `SavedOrders` and returns a coroutine
+    that resolves to the response content.
+    """
+
+    def __init__(self, session: AsyncTdAmeritradeSession) -> None:
+        """Initializes the `AsyncSavedOrders` services.
+
+        ### Parameters
+        ----
+        session : AsyncTdAmeritradeSession
+            An authenticated `AsyncTdAmeritradeSession`
+            object.
+
+        ### Usage
+        ----
+            >>> saved_orders_service = td_client.saved_orders()
+            >>> await saved_orders_service.get_saved_orders_by_path(
+                    account_id='123456789'
+                )
+        """
+
+        self.session = session
+        self._requests = SavedOrders(session=RequestBuilder())
+
+    async def get_saved_orders_by_path(
+        self,
+        account_id: str
+    ) -> dict:
+        """Returns the saved orders for a specific account.
+
+        ### Parameters
+        ----
+        See `SavedOrders.get_saved_orders_by_path`.
+        """
+
+        request = self._requests.get_saved_orders_by_path(
+            account_id=account_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def get_saved_order(
+        self,
+        account_id: str,
+        saved_order_id: str
+    ) -> dict:
+        """Get a specific saved order for a specific account.
+
+        ### Parameters
+        ----
+        See `SavedOrders.get_saved_order`.
+        """
+
+        request = self._requests.get_saved_order(
+            account_id=account_id,
+            saved_order_id=saved_order_id
+        )
+
+        return await self.session.make_request(**request)
+
+    async def place_saved_order(
+        self,
+        account_id: str,
+        saved_order_object: Order = None,
+        saved_order_dict: dict = None
+    ) -> dict:
+        """Place an order for a specific account. Order throttle
+
+        ### Parameters
+        ----
+        See `SavedOrders.place_saved_order`.
+        """
+
+        request = self._requests.place_saved_order(
+            account_id=account_id,
+            saved_order_object=saved_order_object,
+            saved_order_dict=saved_order_dict
+        )
+
+        return await self.session.make_request(**request)
+
+    async def replace_saved_order(
+        self,
+        account_id: str,
+        saved_order_id: str,
+        saved_order_object: Order = None,
+        saved_order_dict: dict = None
+    ) -> dict:
+        """Replace an existing saved order for an account.
+
+        ### Parameters
+        ----
+        See `SavedOrders.replace_saved_order`.
+        """
+
+        request = self._requests.replace_saved_order(
+            account_id=account_id,
+            saved_order_id=saved_order_id,
+            saved_order_object=saved_order_object,
+            saved_order_dict=saved_order_dict
+        )
+
+        return await self.session.make_request(**request)
+
+    async def cancel_saved_order(
+        self,
+        account_id: str,
+        saved_order_id: str
+    ) -> dict:
+        """Cancels a saved order for a specific account. Order throttle
+
+        ### Parameters
+        ----
+        See `SavedOrders.cancel_saved_order`.
+        """
+
+        request = self._requests.cancel_saved_order(
+            account_id=account_id,
+            saved_order_id=saved_order_id
+        )
+
+        return await self.session.make_request(**request)
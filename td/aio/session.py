@@ -0,0 +1,367 @@
+import json
+import time
+import asyncio
+import logging
+
+import aiohttp
+import requests
+
+from td.session import TdAmeritradeSessionBase
+from td.utils.enums import RequestPriority
+from td.utils.rate_limiter import RateLimiter
+from td.utils.retry_policy import RetryPolicy
+
+
+class AsyncTdAmeritradeSession(TdAmeritradeSessionBase):
+
+    """Serves as the asyncio Session for TD Ameritrade API."""
+
+    def __init__(
+        self,
+        td_client: object,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None
+    ) -> None:
+        """Initializes the `AsyncTdAmeritradeSession` client.
+
+        ### Overview
+        ----
+        The `AsyncTdAmeritradeSession` object handles all the requests
+        made for the different endpoints on the TD Ameritrade API from
+        inside an asyncio event loop. Every service created from the same
+        session shares one `aiohttp` connection pool, so hundreds of
+        requests can run concurrently next to the streaming client
+        without blocking the loop.
+
+        ### Parameters
+        ----
+        client : object
+            The `AsyncTdAmeritradeClient` Python Client.
+
+        limit : int (optional, Default=100)
+            The maximum number of connections kept open in total,
+            the `aiohttp.TCPConnector` argument of the same name.
+
+        limit_per_host : int (optional, Default=10)
+            The maximum number of connections kept open per host,
+            the `aiohttp.TCPConnector` argument of the same name.
+            Every request goes to the same host, so this is also the
+            default number of requests the services run at once.
+
+        keep_alive : bool (optional, Default=True)
+            If `True` connections are kept alive between requests,
+            if `False` every connection is closed after each response.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            The token bucket every request has to pass through, pass
+            the same limiter to several sessions to share one budget.
+            Defaults to a new `RateLimiter` with 120 requests per minute.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            Decides which failed requests are retried and how long to
+            wait in between. Defaults to a `RetryPolicy` that retries
+            transient errors on `GET` requests only.
+
+        ### Usage:
+        ----
+            >>> async with AsyncTdAmeritradeSession(td_client=td_client) as td_session:
+                    await td_session.make_request(method='get', endpoint='marketdata/quotes')
+        """
+
+        super().__init__(
+            td_client=td_client,
+            keep_alive=keep_alive,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy
+        )
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+
+        # Both are bound to the running loop, so they are created on first use.
+        self.http_session: aiohttp.ClientSession = None
+        self._token_lock: asyncio.Lock = None
+
+    # The session closes asynchronously, `with` could not close it.
+    def __enter__(self) -> None:
+        raise TypeError(
+            "AsyncTdAmeritradeSession closes asynchronously, use `async with` instead of `with`."
+        )
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        raise TypeError(
+            "AsyncTdAmeritradeSession closes asynchronously, use `async with` instead of `with`."
+        )
+
+    async def __aenter__(self) -> 'AsyncTdAmeritradeSession':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Grabs the shared `aiohttp` session, creating it if needed.
+
+        ### Returns
+        ----
+        aiohttp.ClientSession:
+            The session holding the shared connection pool.
+        """
+
+        if self.http_session is None or self.http_session.closed:
+
+            # Count the new connections.
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(
+                self._on_connection_create_end
+            )
+
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                force_close=not self.keep_alive
+            )
+
+            self.http_session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[trace_config]
+            )
+
+        return self.http_session
+
+    async def _on_connection_create_end(self, _session, _context, _params) -> None:
+        self._on_new_connection()
+
+    async def _validate_token(self) -> None:
+        """Refreshes the access token without blocking the event loop.
+
+        ### Overview
+        ----
+        `TdCredentials.validate_token` makes a blocking request when
+        a token expired, so it runs in the default executor. Requests
+        waiting on the same refresh share it.
+        """
+
+        credentials = self.client.td_credentials
+
+        if not (credentials.is_access_token_expired or credentials.is_refresh_token_expired):
+            return
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                credentials.validate_token
+            )
+
+    async def close(self) -> None:
+        """Closes the session and all of its pooled connections."""
+
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+
+    def _build_params(self, params: dict) -> list:
+        """Converts the params into a form `aiohttp` accepts.
+
+        ### Overview
+        ----
+        `requests` silently drops `None` values and converts booleans
+        and lists for us, `aiohttp` does not, so this mirrors the
+        `requests` behavior to keep the services identical.
+
+        ### Parameters
+        ----
+        params : dict
+            The URL params for the request.
+
+        ### Returns
+        ----
+        list:
+            A list of key-value tuples.
+        """
+
+        if not params:
+            return None
+
+        clean_params = []
+
+        for key, value in params.items():
+
+            if value is None:
+                continue
+
+            if not isinstance(value, (list, tuple)):
+                value = [value]
+
+            for item in value:
+                if item is None:
+                    continue
+                if isinstance(item, bool):
+                    item = str(item)
+                clean_params.append((key, item))
+
+        return clean_params
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None,
+        priority: RequestPriority = RequestPriority.Normal,
+        retry: bool = None
+    ) -> dict:
+        """Handles all the requests in the library.
+
+        ### Overview
+        ---
+        The asyncio version of `TdAmeritradeSession.make_request`, it
+        builds the URL, defines the Content-Type, passes through payloads,
+        and handles any errors that may arise during the request.
+
+        ### Parameters
+        ----
+        method : str
+            The Request method, can be one of the following:
+            ['get','post','put','delete','patch']
+
+        endpoint : str
+            The API URL endpoint, example is 'quotes'
+
+        params : dict (optional, Default={})
+            The URL params for the request.
+
+        data : dict (optional, Default={})
+        A data payload for a request.
+
+        json_payload : dict (optional, Default={})
+            A json data payload for a request
+
+        priority : RequestPriority (optional, Default=RequestPriority.Normal)
+            The rate limiter lane of the request, `High` requests
+            are sent before `Normal` and `Low` ones.
+
+        retry : bool (optional, Default=None)
+            Overrides the `RetryPolicy` methods for this request, pass
+            `True` to opt a non-idempotent request into retries.
+
+        ### Returns
+        ----
+        Dict:
+            A Dictionary object containing the
+            JSON values.
+        """
+
+        await self._validate_token()
+
+        # Build the URL.
+        url = self.build_url(endpoint=endpoint)
+
+        # Define the headers.
+        headers = self.build_headers()
+
+        logging.info("Request URL: %s", url)
+
+        http_session = self._get_http_session()
+        request_params = self._build_params(params=params)
+
+        can_retry = self.retry_policy.is_retryable_method(
+            method=method,
+            retry=retry
+        )
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+
+            # Wait for our turn in the request budget.
+            await self.rate_limiter.acquire_async(priority=priority)
+
+            with self._stats_lock:
+                self._requests_sent += 1
+
+            # Send the request over the pooled session.
+            try:
+                async with http_session.request(
+                    method=method.upper(),
+                    url=url,
+                    headers=headers,
+                    params=request_params,
+                    data=data,
+                    json=json_payload
+                ) as response:
+                    content = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as request_error:
+
+                delay = None
+                if can_retry:
+                    delay = self.retry_policy.get_retry_delay(
+                        attempt=attempt,
+                        elapsed=time.monotonic() - start
+                    )
+
+                if delay is None:
+                    raise
+
+                logging.warning(
+                    "Retrying %s in %.2fs after %s.", url, delay, type(request_error).__name__
+                )
+
+            else:
+
+                # Back off everyone sharing the budget if we got throttled.
+                if response.status == 429:
+                    self.rate_limiter.drain()
+
+                if response.ok or not can_retry:
+                    break
+
+                if not self.retry_policy.is_retryable_status(response.status):
+                    break
+
+                delay = self.retry_policy.get_retry_delay(
+                    attempt=attempt,
+                    elapsed=time.monotonic() - start,
+                    retry_after=response.headers.get('Retry-After')
+                )
+
+                if delay is None:
+                    break
+
+                logging.warning(
+                    "Retrying %s in %.2fs after status %s.", url, delay, response.status
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        # If it's okay and no details.
+        if response.ok and len(content) > 0:
+            return json.loads(content)
+        elif response.ok:
+            return {
+                'message': 'response successful',
+                'status_code': response.status
+            }
+        else:
+
+            if len(content) == 0:
+                response_data = ''
+            else:
+                response_data = json.loads(content)
+
+            self._log_error(
+                error_code=response.status,
+                response_url=response.url,
+                response_body=response_data,
+                request_headers=response.request_info.headers,
+                request_method=response.method
+            )
+
+            raise requests.HTTPError()
@@ -1,5 +1,10 @@
 from td.session import TdAmeritradeSession
 from td.credentials import TdCredentials
+from td.utils.rate_limiter import RateLimiter
+from td.utils.retry_policy import RetryPolicy
+from td.utils.quote_cache import QuoteCache
+from td.utils.candle_store import CandleStore
+from td.utils.option_chain_cache import OptionChainCache
 from td.rest.quotes import Quotes
 from td.rest.movers import Movers
 from td.rest.accounts import Accounts
@@ -12,6 +17,7 @@ from td.rest.watchlists import Watchlists
 from td.rest.orders import Orders
 from td.rest.saved_orders import SavedOrders
 from td.streaming.client import StreamingApiClient
+from td.streaming.sharded import ShardedStreamingClient
 
 
 class TdAmeritradeClient():
@@ -23,17 +29,68 @@ class TdAmeritradeClient():
     that your session is authenticated.
     """
 
-    def __init__(self, credentials: TdCredentials) -> None:
+    def __init__(
+        self,
+        credentials: TdCredentials,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        quote_cache: QuoteCache = None,
+        candle_store: CandleStore = None,
+        option_chain_cache: OptionChainCache = None
+    ) -> None:
         """Initializes the `TdClient` object.
 
         ### Parameters
         credentials : TdCredentials
             Your TD Credentials stored in your credentials object
             so that you can authenitcate with TD.
+
+        pool_connections : int (optional, Default=10)
+            The number of host connection pools the session caches.
+
+        pool_maxsize : int (optional, Default=10)
+            The maximum number of connections kept open per host.
+
+        keep_alive : bool (optional, Default=True)
+            If `True` connections are kept alive between requests,
+            if `False` every connection is closed after each response.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            The token bucket shared by every request of the client,
+            defaults to 120 requests per minute.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            Decides which failed requests are retried, defaults
+            to retrying transient errors on `GET` requests only.
+
+        quote_cache : QuoteCache (optional, Default=None)
+            An opt-in cache shared by every `Quotes` service
+            created from this client.
+
+        candle_store : CandleStore (optional, Default=None)
+            The on-disk candle store used by every `PriceHistory`
+            service created from this client.
+
+        option_chain_cache : OptionChainCache (optional, Default=None)
+            The snapshot cache shared by every `OptionsChain`
+            service created from this client.
         """
 
         self.td_credentials = credentials
-        self.td_session = TdAmeritradeSession(td_client=self)
+        self.quote_cache = quote_cache
+        self.candle_store = candle_store
+        self.option_chain_cache = option_chain_cache
+        self.td_session = TdAmeritradeSession(
+            td_client=self,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy
+        )
 
     def __repr__(self):
         pass
@@ -52,7 +109,10 @@ class TdAmeritradeClient():
             >>> quotes_service = td_client.quotes()
         """
 
-        return Quotes(session=self.td_session)
+        return Quotes(
+            session=self.td_session,
+            quote_cache=self.quote_cache
+        )
 
     def movers(self) -> Movers:
         """Used to access the `Movers` Services and metadata.
@@ -148,7 +208,10 @@ class TdAmeritradeClient():
             >>> price_history_service = td_client.price_history()
         """
 
-        return PriceHistory(session=self.td_session)
+        return PriceHistory(
+            session=self.td_session,
+            candle_store=self.candle_store
+        )
 
     def options_chain(self) -> OptionsChain:
         """Used to access the `OptionsChain` Services and metadata.
@@ -164,7 +227,10 @@ class TdAmeritradeClient():
             >>> options_chain_service = td_client.options_chain()
         """
 
-        return OptionsChain(session=self.td_session)
+        return OptionsChain(
+            session=self.td_session,
+            option_chain_cache=self.option_chain_cache
+        )
 
     def watchlists(self) -> Watchlists:
         """Used to access the `Watchlists` Services and metadata.
@@ -214,9 +280,22 @@ class TdAmeritradeClient():
 
         return SavedOrders(session=self.td_session)
 
-    def streaming_api_client(self) -> StreamingApiClient:
+    def streaming_api_client(
+        self,
+        auto_reconnect: bool = True,
+        reconnect_policy: RetryPolicy = None
+    ) -> StreamingApiClient:
         """Used to access the `StreamingApiClient` Services and metadata.
 
+        ### Parameters
+        ----
+        auto_reconnect: bool (optional, Default=True)
+            If `True` a dropped connection is reopened and
+            resubscribed automatically.
+
+        reconnect_policy: RetryPolicy (optional, Default=None)
+            The backoff between reconnect attempts.
+
         ### Returns
         ---
         StreamingApiClient:
@@ -228,4 +307,50 @@ class TdAmeritradeClient():
             >>> streaming_api_service = td_client.streaming_api_client()
         """
 
-        return StreamingApiClient(session=self.td_session)
+        return StreamingApiClient(
+            session=self.td_session,
+            auto_reconnect=auto_reconnect,
+            reconnect_policy=reconnect_policy
+        )
+
+    def sharded_streaming_client(
+        self,
+        shards: int = 2,
+        auto_reconnect: bool = True,
+        reconnect_policy: RetryPolicy = None
+    ) -> ShardedStreamingClient:
+        """Used to spread streaming subscriptions over several connections.
+
+        ### Parameters
+        ----
+        shards: int (optional, Default=2)
+            The number of connections, keep it within the
+            number of connections the account is allowed.
+
+        auto_reconnect: bool (optional, Default=True)
+            If `True` a dropped connection is reopened and
+            resubscribed automatically.
+
+        reconnect_policy: RetryPolicy (optional, Default=None)
+            The backoff between reconnect attempts.
+
+        ### Returns
+        ---
+        ShardedStreamingClient:
+            The `ShardedStreamingClient` services Object.
+
+        ### Usage
+        ----
+            >>> td_client = TdAmeritradeClient()
+            >>> sharded_streaming_client = td_client.sharded_streaming_client(shards=2)
+        """
+
+        return ShardedStreamingClient(
+            streaming_api_clients=[
+                self.streaming_api_client(
+                    auto_reconnect=auto_reconnect,
+                    reconnect_policy=reconnect_policy
+                )
+                for _ in range(shards)
+            ]
+        )
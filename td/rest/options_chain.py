@@ -1,28 +1,92 @@
-from td.session import TdAmeritradeSession
+import logging
+
+from typing import List
+from typing import Union
+from typing import Iterator
+
+import requests
+
+from td.session import TdAmeritradeSessionBase
+from td.utils.bounded_requests import run_bounded
 from td.utils.option_chain import OptionChainQuery
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_cache import OptionChainDiff
+from td.utils.option_chain_cache import OptionChainCache
 
 
-class OptionsChain():
+class BulkOptionChainError(requests.HTTPError):
 
     """
     ## Overview
     ----
-    Allows the user to query options chain data from the
-    the TD Ameritrade API along with helping to formulate
-    queries.
+    Raised by `OptionsChain.get_option_chains` once every query was
+    tried and some of them failed. The failed queries are kept in
+    `errors`, keyed by their position in the list of queries.
     """
 
-    def __init__(self, session: TdAmeritradeSession) -> None:
+    def __init__(self, errors: dict) -> None:
+        """Initializes the `BulkOptionChainError` object.
+
+        ### Parameters
+        ----
+        errors : dict
+            The exception of each failed query.
+        """
+
+        super().__init__(f"{len(errors)} option chain request(s) failed.")
+        self.errors = errors
+
+
+class OptionsChainBase():
+
+    """The query handling shared by `OptionsChain` and `AsyncOptionsChain`."""
+
+    def __init__(
+        self,
+        session: TdAmeritradeSessionBase,
+        option_chain_cache: OptionChainCache = None
+    ) -> None:
         """Initializes the `OptionsChain` services.
 
         ### Parameters
         ----
-        session : TdAmeritradeSession
-            An authenticated `TDAmeritradeSession
-            object.
+        session : TdAmeritradeSessionBase
+            An authenticated `TdAmeritradeSession` or
+            `AsyncTdAmeritradeSession` object.
+
+        option_chain_cache : OptionChainCache (optional, Default=None)
+            Keeps the latest snapshot of each chain so refreshes
+            can return only the contracts that moved.
         """
 
         self.session = session
+        self.option_chain_cache = option_chain_cache
+
+    def _build_params(
+        self,
+        option_chain_query: OptionChainQuery,
+        option_chain_dict: dict,
+        raise_validation_errors: bool
+    ) -> dict:
+        """Builds the query params of an Option Chain request."""
+
+        if option_chain_query:
+            return option_chain_query.to_dict(
+                raise_errors=raise_validation_errors
+            )
+
+        return option_chain_dict
+
+
+class OptionsChain(OptionsChainBase):
+
+    """
+    ## Overview
+    ----
+    Allows the user to query options chain data from the
+    the TD Ameritrade API along with helping to formulate
+    queries.
+    """
 
     def get_option_chain(
         self,
@@ -83,12 +147,11 @@ class OptionsChain():
                 )
         """
 
-        if option_chain_query:
-            params = option_chain_query.to_dict(
-                raise_errors=raise_validation_errors
-            )
-        else:
-            params = option_chain_dict
+        params = self._build_params(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
 
         content = self.session.make_request(
             method='get',
@@ -97,3 +160,222 @@ class OptionsChain():
         )
 
         return content
+
+    def get_option_chain_frame(
+        self,
+        option_chain_query: OptionChainQuery = None,
+        option_chain_dict: dict = None,
+        raise_validation_errors: bool = True,
+        fields: List[str] = None
+    ) -> OptionChainFrame:
+        """Get option chain for an optionable Symbol as a columnar
+        `OptionChainFrame`.
+
+        ### Overview
+        ----
+        Makes the same request as `get_option_chain` but flattens the
+        nested expiration and strike maps into one NumPy array per field,
+        so large chains can be filtered and sorted with vectorized
+        operations.
+
+        ### Parameters
+        ----
+        option_chain_query: OptionChainQuery (optional, Default=None)
+            See `OptionsChain.get_option_chain`.
+
+        option_chain_dict: dict (optional, Default=None)
+            See `OptionsChain.get_option_chain`.
+
+        raise_validation_errors: bool (optional, Default=True)
+            See `OptionsChain.get_option_chain`.
+
+        fields: List[str] (optional, Default=None)
+            The contract fields to keep, for example `['bid', 'ask', 'delta']`.
+            Defaults to every field in `OPTION_CHAIN_COLUMNS`.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_frame = options_chain_service.get_option_chain_frame(
+                    option_chain_query=option_chain_query
+                )
+            >>> option_chain_frame['mark']
+        """
+
+        content = self.get_option_chain(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
+
+        return OptionChainFrame.from_chain(content=content, fields=fields)
+
+    def get_option_chains(
+        self,
+        option_chain_queries: List[Union[OptionChainQuery, dict]],
+        raise_validation_errors: bool = True,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> Iterator[tuple]:
+        """Get option chains for many underlyings concurrently.
+
+        ### Overview
+        ----
+        Keeps up to `max_workers` requests in flight, every request
+        still goes through the session's rate limiter, and yields each
+        chain as soon as it arrives instead of in the order of the
+        queries. Stop iterating, or close the generator, and no new
+        request is started. Requests already waiting on the rate limiter
+        or on the wire finish in the background and are discarded, the
+        generator does not wait for them.
+
+        ### Parameters
+        ----
+        option_chain_queries: List[Union[OptionChainQuery, dict]]
+            The queries to run, either `OptionChainQuery` objects or
+            query dictionaries.
+
+        raise_validation_errors: bool (optional, Default=True)
+            See `OptionsChain.get_option_chain`.
+
+        max_workers: int (optional, Default=None)
+            The number of requests in flight at the same time, defaults
+            to the connection pool size of the session.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `BulkOptionChainError` is raised after every
+            query was tried if any of them failed. If `False` the failed
+            queries are logged and skipped.
+
+        ### Yields
+        ----
+        tuple:
+            The position of the query in `option_chain_queries`
+            and the chain content.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_queries = [
+                    OptionChainQuery(symbol=symbol, strike_count=10)
+                    for symbol in ['MSFT', 'AAPL', 'SQ']
+                ]
+            >>> for position, option_chain in options_chain_service.get_option_chains(
+                    option_chain_queries=option_chain_queries
+                ):
+                    if option_chain['volatility'] > 40.0:
+                        break
+        """
+
+        # Validate every query, so bad arguments fail before any request is made.
+        queries = [
+            self._build_params(
+                option_chain_query=query if isinstance(query, OptionChainQuery) else None,
+                option_chain_dict=query if isinstance(query, dict) else None,
+                raise_validation_errors=raise_validation_errors
+            )
+            for query in option_chain_queries
+        ]
+
+        max_workers = max_workers or self.session.pool_maxsize
+        errors = {}
+
+        def request_chain(params: dict) -> dict:
+            return self.session.make_request(
+                method='get',
+                endpoint='marketdata/chains',
+                params=params
+            )
+
+        results = run_bounded(
+            jobs=enumerate(queries),
+            request=request_chain,
+            max_workers=max_workers
+        )
+
+        try:
+
+            for position, content, chain_error in results:
+
+                if chain_error is not None:
+                    errors[position] = chain_error
+                    logging.error(
+                        "Option chain for %s failed: %r",
+                        queries[position].get('symbol'), chain_error
+                    )
+                    continue
+
+                yield position, content
+
+        finally:
+
+            # Stop the remaining queries if the caller stops iterating early.
+            results.close()
+
+        if errors and raise_errors:
+            raise BulkOptionChainError(errors=errors)
+
+    def refresh_option_chain(
+        self,
+        option_chain_query: OptionChainQuery = None,
+        option_chain_dict: dict = None,
+        raise_validation_errors: bool = True,
+        fields: List[str] = None
+    ) -> OptionChainDiff:
+        """Refreshes a cached option chain and returns what moved.
+
+        ### Overview
+        ----
+        Requests the chain, stores the new snapshot in the
+        `OptionChainCache` and compares it with the previous snapshot
+        of the same query, contract by contract.
+
+        ### Parameters
+        ----
+        option_chain_query: OptionChainQuery (optional, Default=None)
+            See `OptionsChain.get_option_chain`.
+
+        option_chain_dict: dict (optional, Default=None)
+            See `OptionsChain.get_option_chain`.
+
+        raise_validation_errors: bool (optional, Default=True)
+            See `OptionsChain.get_option_chain`.
+
+        fields: List[str] (optional, Default=None)
+            See `OptionsChain.get_option_chain_frame`.
+
+        ### Returns
+        ----
+        OptionChainDiff:
+            The added, changed and removed contracts along
+            with the full new snapshot.
+
+        ### Usage
+        ----
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_diff = options_chain_service.refresh_option_chain(
+                    option_chain_query=option_chain_query
+                )
+            >>> option_chain_diff.changed['mark']
+        """
+
+        if self.option_chain_cache is None:
+            raise ValueError(
+                'An `OptionChainCache` is needed, pass one to the client.'
+            )
+
+        params = self._build_params(
+            option_chain_query=option_chain_query,
+            option_chain_dict=option_chain_dict,
+            raise_validation_errors=raise_validation_errors
+        )
+
+        option_chain_frame = self.get_option_chain_frame(
+            option_chain_dict=params,
+            fields=fields
+        )
+
+        return self.option_chain_cache.update(
+            query=params,
+            option_chain_frame=option_chain_frame
+        )
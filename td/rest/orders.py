@@ -5,6 +5,7 @@ from datetime import datetime
 
 from td.session import TdAmeritradeSession
 from td.utils.orders import Order
+from td.utils.enums import RequestPriority
 
 
 class Orders():
@@ -280,7 +281,8 @@ class Orders():
         content = self.session.make_request(
             method='post',
             endpoint=endpoint,
-            json_payload=order
+            json_payload=order,
+            priority=RequestPriority.High
         )
 
         return content
@@ -346,7 +348,8 @@ class Orders():
         content = self.session.make_request(
             method='put',
             endpoint=endpoint,
-            json_payload=order
+            json_payload=order,
+            priority=RequestPriority.High
         )
 
         return content
@@ -386,7 +389,8 @@ class Orders():
 
         content = self.session.make_request(
             method='delete',
-            endpoint=endpoint
+            endpoint=endpoint,
+            priority=RequestPriority.High
         )
 
         return content
@@ -1,26 +1,88 @@
+import json
+import logging
+import pathlib
+
+from typing import List
 from typing import Union
+from typing import Iterator
 from enum import Enum
+from datetime import tzinfo
 from datetime import datetime
-from td.session import TdAmeritradeSession
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+from td.session import TdAmeritradeSessionBase
+from td.utils.enums import RequestPriority
+from td.utils.bounded_requests import run_bounded
+from td.utils.candle_store import CandleStore
+from td.utils.candle_store import candles_to_array
+from td.utils.candle_resampler import find_gaps
 
 
-class PriceHistory():
+class BulkPriceHistoryError(requests.HTTPError):
 
     """
-    ## Overview:
+    ## Overview
     ----
-    Allows the user to query price history data for equity
-    instruments.
+    Raised by `PriceHistory.get_bulk_price_history` once every symbol
+    was tried and some of them failed. The failed symbols are kept
+    in `errors` and were not marked as done in the progress file, so
+    rerunning the download only fetches them.
     """
 
-    def __init__(self, session: TdAmeritradeSession) -> None:
+    def __init__(self, errors: dict) -> None:
+        """Initializes the `BulkPriceHistoryError` object.
+
+        ### Parameters
+        ----
+        errors : dict
+            The exception of each failed symbol.
+        """
+
+        super().__init__(f"{len(errors)} price history download(s) failed.")
+        self.errors = errors
+
+
+# The longest window a single request may cover and the default
+# period type, based on the largest `period` allowed per frequency.
+RANGE_WINDOWS = {
+    'minute': (10 * 86400000, 'day'),
+    'daily': (20 * 365 * 86400000, 'year'),
+    'weekly': (20 * 365 * 86400000, 'year'),
+    'monthly': (20 * 365 * 86400000, 'year')
+}
+
+# The length of one candle per frequency type, in milliseconds.
+CANDLE_INTERVALS = {
+    'minute': 60000,
+    'daily': 86400000,
+    'weekly': 7 * 86400000,
+    'monthly': 31 * 86400000
+}
+
+
+class PriceHistoryBase():
+
+    """The validation, windowing and candle merging used by both
+    `PriceHistory` and `AsyncPriceHistory`."""
+
+    def __init__(
+        self,
+        session: TdAmeritradeSessionBase,
+        candle_store: CandleStore = None
+    ) -> None:
         """Initializes the `PriceHistory` services.
 
         ### Parameters
         ----
-        session : TdAmeritradeSession
-            An authenticated `TDAmeritradeSession
-            object.
+        session : TdAmeritradeSessionBase
+            An authenticated `TdAmeritradeSession` or
+            `AsyncTdAmeritradeSession` object.
+
+        candle_store : CandleStore (optional, Default=None)
+            The on-disk store used by `get_cached_price_history`.
 
         ### Usage
         ----
@@ -29,6 +91,7 @@ class PriceHistory():
         """
 
         self.session = session
+        self.candle_store = candle_store
         self._period_type = ""
         self._period = ""
         self._frequency = ""
@@ -37,64 +100,318 @@ class PriceHistory():
         self._frequency_type = ""
         self._extended_hours_needed = True
 
-    def get_price_history(
+    def _build_range_windows(
+        self,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        start_date: Union[datetime, int],
+        end_date: Union[datetime, int],
+        extended_hours_needed: bool
+    ) -> tuple:
+        """Splits a date range into windows the API accepts.
+
+        ### Returns
+        ----
+        tuple:
+            The `(start, end)` millisecond pairs of the windows
+            and the request params of each window.
+        """
+
+        if isinstance(frequency_type, Enum):
+            frequency_type = frequency_type.value
+
+        if frequency_type not in RANGE_WINDOWS:
+            raise KeyError(
+                "The frequency you provided is not a valid frequency."
+            )
+
+        if isinstance(start_date, datetime):
+            start_date = int(start_date.timestamp() * 1000)
+
+        if isinstance(end_date, datetime):
+            end_date = int(end_date.timestamp() * 1000)
+
+        if start_date > end_date:
+            raise ValueError('The start date must be before the end date.')
+
+        window_length, period_type = RANGE_WINDOWS[frequency_type]
+
+        windows = []
+        window_start = start_date
+
+        # Windows share their boundary, the duplicate candles are removed later.
+        while True:
+            window_end = min(window_start + window_length, end_date)
+            windows.append((window_start, window_end))
+            if window_end >= end_date:
+                break
+            window_start = window_end
+
+        window_params = [
+            self._build_params(
+                frequency_type=frequency_type,
+                frequency=frequency,
+                period_type=period_type,
+                start_date=window_start,
+                end_date=window_end,
+                extended_hours_needed=extended_hours_needed
+            )
+            for window_start, window_end in windows
+        ]
+
+        return windows, window_params
+
+    def _merge_range(
         self,
         symbol: str,
         frequency_type: Union[str, Enum],
         frequency: str,
-        period_type: Union[str, Enum] = 'day',
-        period: int = None,
-        start_date: Union[datetime] = None,
-        end_date: Union[datetime] = None,
-        extended_hours_needed: bool = True
+        windows: list,
+        results: list,
+        raise_errors: bool,
+        gap_threshold: int = None,
+        time_zone: tzinfo = None
     ) -> dict:
-        """Gets historical candle data for a financial instrument.
+        """Stitches the window responses into one series.
 
-        ### Documentation
+        ### Returns
         ----
-        https://developer.tdameritrade.com/price-history/apis
+        dict:
+            See `PriceHistory.get_price_history_range`.
+        """
 
-        ### Parameters
+        if isinstance(frequency_type, Enum):
+            frequency_type = frequency_type.value
+
+        candle_arrays = []
+        errors = {}
+
+        for window, result in zip(windows, results):
+
+            if isinstance(result, BaseException):
+                errors[window] = result
+                logging.error(
+                    "Price history for %s between %s and %s failed: %r",
+                    symbol, window[0], window[1], result
+                )
+            else:
+                candle_arrays.append(
+                    candles_to_array(candles=result.get('candles', []))
+                )
+
+        if errors and raise_errors:
+            raise BulkPriceHistoryError(errors=errors)
+
+        candles = candles_to_array(candles=[])
+        if candle_arrays:
+            candles = np.concatenate(candle_arrays)
+
+        # Sort by time and drop the candles duplicated on window boundaries.
+        _, unique_index = np.unique(candles['datetime'], return_index=True)
+        candles = candles[unique_index]
+
+        gaps = find_gaps(
+            candles=candles,
+            interval=CANDLE_INTERVALS[frequency_type] * int(frequency),
+            gap_threshold=gap_threshold,
+            time_zone=time_zone
+        )
+
+        return {
+            'symbol': symbol,
+            'candles': candles,
+            'gaps': gaps,
+            'failed_windows': list(errors.keys()),
+            'empty': len(candles) == 0
+        }
+
+    def _build_cached_requests(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum],
+        period: int,
+        start_date: Union[datetime],
+        end_date: Union[datetime],
+        extended_hours_needed: bool
+    ) -> List[dict]:
+        """Builds the `get_price_history` arguments for a cached request.
+
+        ### Returns
         ----
-        symbol: str
-            The ticker symbol to request data for.
+        List[dict]:
+            The full window if nothing is stored yet, otherwise the
+            window starting at the last stored candle, preceded by the
+            window before the first stored candle if `start_date` is
+            earlier than it.
+        """
 
-        frequency_type:  Union[str, Enum]
-            The type of frequency with  which a new candle
-            is formed.
+        if self.candle_store is None:
+            raise ValueError(
+                'A `CandleStore` is needed to use the cached price history.'
+            )
 
-        frequency: str
-            The number of the frequency type
-            to be included in each candle.
+        key = {
+            'symbol': symbol,
+            'frequency_type': frequency_type,
+            'frequency': frequency,
+            'extended_hours_needed': extended_hours_needed
+        }
 
-        period_type: Union[str, Enum] (optional, Default='day')
-            The type of period to show.  Valid values are `day`,
-            `month`, `year`, or `ytd` (year to date).
+        last_datetime = self.candle_store.last_datetime(**key)
 
-        period: int (optional, Default=None)
-            The number of periods to show.
+        if last_datetime is None:
+            return [
+                {
+                    'period_type': period_type,
+                    'period': period,
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    **key
+                }
+            ]
 
-        start_date: Union[str, datetime] (optional, Default=None)
-            Start date as milliseconds since epoch.
+        cached_requests = []
 
-        end_date: Union[str, datetime] (optional, Default=None)
-            Start date as milliseconds since epoch.
+        first_datetime = self.candle_store.first_datetime(**key)
 
-        extended_hours: bool (optional, Default=True)
-            True to return extended hours data, false for regular
-            market hours only.
+        start_timestamp = start_date
+        if isinstance(start_timestamp, datetime):
+            start_timestamp = int(start_timestamp.timestamp() * 1000)
 
-        ### Usage
+        # The window starts before the store does, fetch the missing head.
+        if start_timestamp is not None and start_timestamp < first_datetime:
+            cached_requests.append(
+                {
+                    'period_type': period_type,
+                    'period': None,
+                    'start_date': start_date,
+                    'end_date': first_datetime,
+                    **key
+                }
+            )
+
+        # Re-request the last candle, it may have been a partial bar.
+        cached_requests.append(
+            {
+                'period_type': period_type,
+                'period': None,
+                'start_date': last_datetime,
+                'end_date': end_date or datetime.now(),
+                **key
+            }
+        )
+
+        return cached_requests
+
+    def _store_cached_candles(
+        self,
+        cached_requests: List[dict],
+        contents: List[dict],
+        start_date: Union[datetime],
+        end_date: Union[datetime]
+    ) -> np.ndarray:
+        """Merges the responses into the store and slices the window.
+
+        ### Returns
         ----
-            >>> price_history_service = td_client.price_history()
-            >>> price_history = price_history_service.get_price_history(
-                symbol='MSFT',
-                frequency_type='minute',
-                frequency=1,
-                period_type='day',
-                period=10,
-                extended_hours_needed=False
+        np.ndarray:
+            The stored candles between `start_date` and `end_date`.
+        """
+
+        for request_args, content in zip(cached_requests, contents):
+            candles = self.candle_store.save_price_history(
+                content=content,
+                frequency_type=request_args['frequency_type'],
+                frequency=request_args['frequency'],
+                extended_hours_needed=request_args['extended_hours_needed'],
+                symbol=request_args['symbol']
             )
+
+        if isinstance(start_date, datetime):
+            start_date = int(start_date.timestamp() * 1000)
+
+        if isinstance(end_date, datetime):
+            end_date = int(end_date.timestamp() * 1000)
+
+        if start_date is not None:
+            candles = candles[candles['datetime'] >= start_date]
+
+        if end_date is not None:
+            candles = candles[candles['datetime'] <= end_date]
+
+        return candles
+
+    def _load_progress(self, progress_file: Union[str, pathlib.Path]) -> set:
+        """Loads the symbols already marked as done.
+
+        ### Parameters
+        ----
+        progress_file: Union[str, pathlib.Path]
+            The progress file of a bulk download.
+
+        ### Returns
+        ----
+        set:
+            The completed symbols.
+        """
+
+        if progress_file is None or not pathlib.Path(progress_file).exists():
+            return set()
+
+        completed = set()
+
+        with open(file=progress_file, mode='r', encoding='utf-8') as progress_data:
+            for line in progress_data:
+                line = line.strip()
+                if line:
+                    completed.add(json.loads(line)['symbol'])
+
+        return completed
+
+    def _save_progress(
+        self,
+        progress_file: Union[str, pathlib.Path],
+        symbol: str
+    ) -> None:
+        """Marks a symbol of a bulk download as done.
+
+        ### Parameters
+        ----
+        progress_file: Union[str, pathlib.Path]
+            The progress file of a bulk download.
+
+        symbol: str
+            The symbol that completed.
+        """
+
+        if progress_file is None:
+            return
+
+        with open(file=progress_file, mode='a', encoding='utf-8') as progress_data:
+            progress_data.write(json.dumps({'symbol': symbol}) + '\n')
+
+    def _build_params(
+        self,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True
+    ) -> dict:
+        """Validates the arguments and builds the request params.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_price_history`.
+
+        ### Returns
+        ----
+        dict:
+            The URL params for the Price History endpoint.
         """
 
         # Fail early, can't have a period with start and end date specified.
@@ -170,10 +487,404 @@ class PriceHistory():
             'needExtendedHoursData': extended_hours_needed
         }
 
+        return params
+
+
+class PriceHistory(PriceHistoryBase):
+
+    """
+    ## Overview:
+    ----
+    Allows the user to query price history data for equity
+    instruments.
+    """
+
+    def get_price_history(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True,
+        priority: RequestPriority = RequestPriority.Low
+    ) -> dict:
+        """Gets historical candle data for a financial instrument.
+
+        ### Documentation
+        ----
+        https://developer.tdameritrade.com/price-history/apis
+
+        ### Parameters
+        ----
+        symbol: str
+            The ticker symbol to request data for.
+
+        frequency_type:  Union[str, Enum]
+            The type of frequency with  which a new candle
+            is formed.
+
+        frequency: str
+            The number of the frequency type
+            to be included in each candle.
+
+        period_type: Union[str, Enum] (optional, Default='day')
+            The type of period to show.  Valid values are `day`,
+            `month`, `year`, or `ytd` (year to date).
+
+        period: int (optional, Default=None)
+            The number of periods to show.
+
+        start_date: Union[str, datetime] (optional, Default=None)
+            Start date as milliseconds since epoch.
+
+        end_date: Union[str, datetime] (optional, Default=None)
+            Start date as milliseconds since epoch.
+
+        extended_hours: bool (optional, Default=True)
+            True to return extended hours data, false for regular
+            market hours only.
+
+        priority: RequestPriority (optional, Default=RequestPriority.Low)
+            The rate limiter lane of the request, pass `Normal` or
+            `High` when a user is waiting on the candles.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> price_history = price_history_service.get_price_history(
+                symbol='MSFT',
+                frequency_type='minute',
+                frequency=1,
+                period_type='day',
+                period=10,
+                extended_hours_needed=False
+            )
+        """
+
+        params = self._build_params(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
         content = self.session.make_request(
             method='get',
             endpoint=f'marketdata/{symbol}/pricehistory',
-            params=params
+            params=params,
+            priority=priority
         )
 
         return content
+
+    def get_bulk_price_history(
+        self,
+        symbols: List[str],
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True,
+        max_workers: int = None,
+        progress_file: Union[str, pathlib.Path] = None,
+        raise_errors: bool = True
+    ) -> Iterator[tuple]:
+        """Gets historical candle data for many financial instruments.
+
+        ### Overview
+        ----
+        Downloads the price history of every symbol with the same
+        parameters. The requests run concurrently under the session's
+        rate limit and the results are yielded as each symbol completes,
+        not in the order they were provided. If a `progress_file` is
+        given, every symbol is marked as done once the caller moves past
+        it, and symbols already marked as done are skipped, so a crashed
+        backfill picks up where it stopped.
+
+        ### Parameters
+        ----
+        symbols: List[str]
+            The ticker symbols to request data for.
+
+        frequency_type, frequency, period_type, period, start_date,
+        end_date, extended_hours_needed:
+            See `PriceHistory.get_price_history`.
+
+        max_workers: int (optional, Default=None)
+            The number of requests in flight at the same time, defaults
+            to the connection pool size of the session.
+
+        progress_file: Union[str, pathlib.Path] (optional, Default=None)
+            A file used to remember which symbols are done.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `BulkPriceHistoryError` is raised after every
+            symbol was tried if any of them failed. If `False` the
+            failures are only logged.
+
+        ### Yields
+        ----
+        tuple:
+            The `(symbol, content)` of each completed symbol.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> for symbol, price_history in price_history_service.get_bulk_price_history(
+                    symbols=['MSFT', 'AAPL', 'SQ'],
+                    frequency_type='daily',
+                    frequency=1,
+                    period_type='year',
+                    period=10,
+                    progress_file='backfill_progress.jsonl'
+                ):
+                    save_candles(symbol, price_history['candles'])
+        """
+
+        # Validate once, so bad arguments fail before any request is made.
+        params = self._build_params(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        completed = self._load_progress(progress_file=progress_file)
+        pending = [symbol for symbol in dict.fromkeys(symbols) if symbol not in completed]
+        max_workers = max_workers or self.session.pool_maxsize
+        errors = {}
+
+        def request_symbol(symbol: str) -> dict:
+            return self.session.make_request(
+                method='get',
+                endpoint=f'marketdata/{symbol}/pricehistory',
+                params=params,
+                priority=RequestPriority.Low
+            )
+
+        results = run_bounded(
+            jobs=zip(pending, pending),
+            request=request_symbol,
+            max_workers=max_workers
+        )
+
+        try:
+
+            for symbol, content, symbol_error in results:
+
+                if symbol_error is not None:
+                    errors[symbol] = symbol_error
+                    logging.error(
+                        "Price history for %s failed: %r", symbol, symbol_error
+                    )
+                    continue
+
+                yield symbol, content
+
+                self._save_progress(progress_file=progress_file, symbol=symbol)
+
+        finally:
+
+            # Stop the remaining symbols if the caller stops iterating early.
+            results.close()
+
+        if errors and raise_errors:
+            raise BulkPriceHistoryError(errors=errors)
+
+    def get_price_history_range(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        start_date: Union[datetime, int],
+        end_date: Union[datetime, int],
+        extended_hours_needed: bool = True,
+        max_workers: int = None,
+        raise_errors: bool = True,
+        gap_threshold: int = None,
+        time_zone: tzinfo = None
+    ) -> dict:
+        """Gets historical candle data for any date range.
+
+        ### Overview
+        ----
+        Splits the range into the largest windows the API accepts for
+        the frequency type (10 days for minute candles), requests the
+        windows concurrently, removes the duplicate candles where the
+        windows touch, and returns one sorted series.
+
+        ### Parameters
+        ----
+        symbol: str
+            The ticker symbol to request data for.
+
+        frequency_type:  Union[str, Enum]
+            The type of frequency with  which a new candle
+            is formed.
+
+        frequency: str
+            The number of the frequency type
+            to be included in each candle.
+
+        start_date: Union[datetime, int]
+            The start of the range, as a datetime or as milliseconds
+            since epoch.
+
+        end_date: Union[datetime, int]
+            The end of the range, as a datetime or as milliseconds
+            since epoch.
+
+        extended_hours: bool (optional, Default=True)
+            True to return extended hours data, false for regular
+            market hours only.
+
+        max_workers: int (optional, Default=None)
+            The number of windows requested at the same time, defaults
+            to the connection pool size of the session.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `BulkPriceHistoryError` is raised when any window
+            fails. If `False` the failed windows are listed in the result.
+
+        gap_threshold: int (optional, Default=None)
+            The shortest gap reported in milliseconds, defaults to one
+            candle. Only gaps while the market is open are reported,
+            see `find_gaps`.
+
+        time_zone: tzinfo (optional, Default=None)
+            The exchange time zone the gaps are found in, defaults
+            to `market_time_zone()`.
+
+        ### Returns
+        ----
+        dict:
+            The `symbol`, the `candles` as a `CANDLE_DTYPE` array sorted
+            by `datetime`, the `gaps` as an `(n, 2)` array of the candle
+            timestamps on each side of every gap, and the `failed_windows`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> price_history = price_history_service.get_price_history_range(
+                symbol='MSFT',
+                frequency_type='minute',
+                frequency=1,
+                start_date=datetime(2021, 1, 1),
+                end_date=datetime(2021, 3, 31)
+            )
+            >>> price_history['candles']['close']
+        """
+
+        windows, window_params = self._build_range_windows(
+            frequency_type=frequency_type,
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+        max_workers = max_workers or self.session.pool_maxsize
+
+        def request_window(params: dict) -> dict:
+            try:
+                return self.session.make_request(
+                    method='get',
+                    endpoint=f'marketdata/{symbol}/pricehistory',
+                    params=params,
+                    priority=RequestPriority.Low
+                )
+            except Exception as window_error:
+                return window_error
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+            results = list(executor.map(request_window, window_params))
+
+        return self._merge_range(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            windows=windows,
+            results=results,
+            raise_errors=raise_errors,
+            gap_threshold=gap_threshold,
+            time_zone=time_zone
+        )
+
+    def get_cached_price_history(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: str,
+        period_type: Union[str, Enum] = 'day',
+        period: int = None,
+        start_date: Union[datetime] = None,
+        end_date: Union[datetime] = None,
+        extended_hours_needed: bool = True
+    ) -> np.ndarray:
+        """Gets historical candle data, only downloading new candles.
+
+        ### Overview
+        ----
+        The first call for a `(symbol, frequency_type, frequency,
+        extended_hours_needed)` key downloads the requested window and
+        saves it to the service's `CandleStore`. Later calls only request
+        the candles from the last stored timestamp onwards, and the ones
+        before the first stored timestamp if `start_date` is earlier,
+        merge them in, and serve the rest from disk.
+
+        ### Parameters
+        ----
+        See `PriceHistory.get_price_history`. The `period`, `start_date`
+        and `end_date` define the first download, `start_date` and
+        `end_date` also limit the candles that are returned.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The candles as a structured array with the `CANDLE_DTYPE`
+            layout, sorted by `datetime`.
+
+        ### Usage
+        ----
+            >>> price_history_service = td_client.price_history()
+            >>> candles = price_history_service.get_cached_price_history(
+                symbol='MSFT',
+                frequency_type='daily',
+                frequency=1,
+                period_type='year',
+                period=10
+            )
+            >>> candles['close'][-5:]
+        """
+
+        cached_requests = self._build_cached_requests(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            period_type=period_type,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        contents = [
+            self.get_price_history(**request_args) for request_args in cached_requests
+        ]
+
+        return self._store_cached_candles(
+            cached_requests=cached_requests,
+            contents=contents,
+            start_date=start_date,
+            end_date=end_date
+        )
@@ -1,28 +1,177 @@
+import logging
+
 from typing import List
-from td.session import TdAmeritradeSession
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
 
+from td.session import TdAmeritradeSessionBase
+from td.utils.quote_cache import QuoteCache
+from td.utils.quote_frame import QuoteFrame
 
-class Quotes():
+
+class QuotesChunkError(requests.HTTPError):
 
     """
     ## Overview
     ----
-    Allows the user to query real-time quotes from the TD
-    API if they have an authorization token otherwise it
-    will be delayed by 5 minutes.
+    Raised by `Quotes.get_quotes` when some of the symbol chunks
+    failed. The quotes of the chunks that succeeded are kept in
+    `content` and the failed chunks in `errors`.
     """
 
-    def __init__(self, session: TdAmeritradeSession) -> None:
+    def __init__(self, content: dict, errors: dict) -> None:
+        """Initializes the `QuotesChunkError` object.
+
+        ### Parameters
+        ----
+        content : dict
+            The merged quotes of the chunks that succeeded.
+
+        errors : dict
+            The exception of each failed chunk, keyed by
+            the tuple of symbols in the chunk.
+        """
+
+        failed_symbols = sum(len(chunk) for chunk in errors)
+        super().__init__(
+            f"{len(errors)} quote chunk(s) with {failed_symbols} symbol(s) failed."
+        )
+
+        self.content = content
+        self.errors = errors
+
+
+class QuotesBase():
+
+    """The request building and merging shared by `Quotes` and `AsyncQuotes`."""
+
+    def __init__(
+        self,
+        session: TdAmeritradeSessionBase,
+        quote_cache: QuoteCache = None
+    ) -> None:
         """Initializes the `Quotes` services.
 
         ### Parameters
         ----
-        session : TdAmeritradeSession
-            An authenticated `TDAmeritradeSession
-            object.
+        session : TdAmeritradeSessionBase
+            An authenticated `TdAmeritradeSession` or
+            `AsyncTdAmeritradeSession` object.
+
+        quote_cache : QuoteCache (optional, Default=None)
+            If provided, quotes are served from the cache while
+            they are fresh and concurrent requests for the same
+            symbols share one fetch.
         """
 
         self.session = session
+        self.quote_cache = quote_cache
+
+    def _chunk_instruments(
+        self,
+        instruments: List[str],
+        chunk_size: int,
+        max_url_length: int
+    ) -> List[List[str]]:
+        """Splits the instruments into URL-length-safe chunks.
+
+        ### Parameters
+        ----
+        instruments: List[str]
+            A list of different financial instruments, duplicates
+            are removed.
+
+        chunk_size: int
+            The maximum number of symbols in a chunk.
+
+        max_url_length: int
+            The maximum length of the encoded `symbol` param.
+
+        ### Returns
+        ----
+        List[List[str]]:
+            The instruments split into chunks.
+        """
+
+        chunks = []
+        chunk = []
+        chunk_length = 0
+
+        for instrument in dict.fromkeys(instruments):
+
+            # Each symbol is URL encoded and followed by an encoded comma.
+            instrument_length = len(quote(instrument, safe='')) + 3
+
+            if chunk and (len(chunk) >= chunk_size or chunk_length + instrument_length > max_url_length):
+                chunks.append(chunk)
+                chunk = []
+                chunk_length = 0
+
+            chunk.append(instrument)
+            chunk_length += instrument_length
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _merge_chunks(
+        self,
+        chunks: List[List[str]],
+        results: list,
+        raise_errors: bool
+    ) -> dict:
+        """Merges the chunk responses into a single dictionary.
+
+        ### Parameters
+        ----
+        chunks: List[List[str]]
+            The symbol chunks that were requested.
+
+        results: list
+            The response content or exception of each chunk.
+
+        raise_errors: bool
+            If `True` a `QuotesChunkError` is raised when a chunk
+            failed, otherwise the failures are only logged.
+
+        ### Returns
+        ----
+        dict:
+            The merged quotes keyed by symbol.
+        """
+
+        content = {}
+        errors = {}
+
+        for chunk, result in zip(chunks, results):
+
+            if isinstance(result, BaseException):
+                errors[tuple(chunk)] = result
+                logging.error(
+                    "Quote chunk %s...%s (%s symbols) failed: %r",
+                    chunk[0], chunk[-1], len(chunk), result
+                )
+            else:
+                content.update(result)
+
+        if errors and raise_errors:
+            raise QuotesChunkError(content=content, errors=errors)
+
+        return content
+
+
+class Quotes(QuotesBase):
+
+    """
+    ## Overview
+    ----
+    Allows the user to query real-time quotes from the TD
+    API if they have an authorization token otherwise it
+    will be delayed by 5 minutes.
+    """
 
     def get_quote(self, instrument=str) -> dict:
         """Grabs real-time quotes for an instrument.
@@ -49,6 +198,12 @@ class Quotes():
             >>> quote_service.get_quote(instrument='AAPL')
         """
 
+        if self.quote_cache:
+            return self.quote_cache.get_or_fetch(
+                symbols=[instrument],
+                fetch=self._request_quotes
+            )
+
         params = {
             'symbol': instrument
         }
@@ -61,7 +216,40 @@ class Quotes():
 
         return content
 
-    def get_quotes(self, instruments=List[str]) -> dict:
+    def _request_quotes(self, instruments: List[str]) -> dict:
+        """Makes a single Get Quotes request.
+
+        ### Parameters
+        ----
+        instruments: List[str]
+            A list of at most 500 financial instruments.
+
+        ### Returns
+        ----
+        dict:
+            The quotes keyed by symbol.
+        """
+
+        params = {
+            'symbol': ','.join(instruments)
+        }
+
+        content = self.session.make_request(
+            method='get',
+            endpoint='marketdata/quotes',
+            params=params
+        )
+
+        return content
+
+    def get_quotes(
+        self,
+        instruments=List[str],
+        chunk_size: int = 500,
+        max_url_length: int = 4000,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> dict:
         """Grabs real-time quotes for multiple instruments.
 
         ### Overview
@@ -70,7 +258,11 @@ class Quotes():
         Quote and Get Quotes Endpoint. If one item is provided
         a Get Quote request will be made and if more than one
         item is provided then a Get Quotes request will be made.
-        Only 500 symbols can be sent at a single time.
+        Only 500 symbols can be sent at a single time, so larger
+        lists are split into chunks that are fetched concurrently
+        over the session's connection pool and merged together.
+        If the service has a `QuoteCache`, only the symbols that are
+        not fresh in the cache are requested.
 
         ### Documentation
         ----
@@ -81,20 +273,155 @@ class Quotes():
         instruments: str
             A list of different financial instruments.
 
+        chunk_size: int (optional, Default=500)
+            The maximum number of symbols sent in one request.
+
+        max_url_length: int (optional, Default=4000)
+            The maximum length of the encoded `symbol` param of
+            one request.
+
+        max_workers: int (optional, Default=None)
+            The number of chunks fetched at the same time, defaults
+            to the connection pool size of the session.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `QuotesChunkError` holding the quotes of the
+            successful chunks is raised when any chunk fails. If `False`
+            failures are logged and the successful quotes are returned.
+
         ### Usage
         ----
             >>> quote_service = td_client.quotes()
             >>> quote_service.get_quotes(instruments=['AAPL','SQ'])
         """
 
-        params = {
-            'symbol': ','.join(instruments)
-        }
+        # Nothing to request.
+        if not instruments:
+            return {}
 
-        content = self.session.make_request(
-            method='get',
-            endpoint='marketdata/quotes',
-            params=params
+        if self.quote_cache:
+            return self.quote_cache.get_or_fetch(
+                symbols=instruments,
+                fetch=lambda symbols: self._fetch_quotes(
+                    instruments=symbols,
+                    chunk_size=chunk_size,
+                    max_url_length=max_url_length,
+                    max_workers=max_workers,
+                    raise_errors=raise_errors
+                )
+            )
+
+        return self._fetch_quotes(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length,
+            max_workers=max_workers,
+            raise_errors=raise_errors
         )
 
-        return content
+    def get_quotes_frame(
+        self,
+        instruments: List[str],
+        fields: List[str] = None,
+        chunk_size: int = 500,
+        max_url_length: int = 4000,
+        max_workers: int = None,
+        raise_errors: bool = True
+    ) -> QuoteFrame:
+        """Grabs real-time quotes as a columnar `QuoteFrame`.
+
+        ### Overview
+        ----
+        Makes the same requests as `get_quotes` but returns one
+        NumPy array per field plus a symbol index, so large
+        universes can be screened with vectorized operations.
+
+        ### Parameters
+        ----
+        instruments: List[str]
+            A list of different financial instruments.
+
+        fields: List[str] (optional, Default=None)
+            The fields to keep, for example `['bidPrice', 'askPrice']`.
+            Defaults to every field in the response.
+
+        chunk_size: int (optional, Default=500)
+            The maximum number of symbols sent in one request.
+
+        max_url_length: int (optional, Default=4000)
+            The maximum length of the encoded `symbol` param of
+            one request.
+
+        max_workers: int (optional, Default=None)
+            The number of chunks fetched at the same time, defaults
+            to the connection pool size of the session.
+
+        raise_errors: bool (optional, Default=True)
+            If `True` a `QuotesChunkError` is raised when any chunk
+            fails, otherwise the failed symbols are left out.
+
+        ### Usage
+        ----
+            >>> quote_service = td_client.quotes()
+            >>> quote_frame = quote_service.get_quotes_frame(
+                    instruments=['AAPL','SQ'],
+                    fields=['bidPrice', 'askPrice', 'lastPrice', 'totalVolume']
+                )
+            >>> quote_frame['lastPrice']
+        """
+
+        content = self.get_quotes(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length,
+            max_workers=max_workers,
+            raise_errors=raise_errors
+        )
+
+        return QuoteFrame.from_quotes(content=content, fields=fields)
+
+    def _fetch_quotes(
+        self,
+        instruments: List[str],
+        chunk_size: int,
+        max_url_length: int,
+        max_workers: int,
+        raise_errors: bool
+    ) -> dict:
+        """Fetches the quotes in concurrent chunks, bypassing the cache.
+
+        ### Parameters
+        ----
+        See `Quotes.get_quotes`.
+
+        ### Returns
+        ----
+        dict:
+            The merged quotes keyed by symbol.
+        """
+
+        chunks = self._chunk_instruments(
+            instruments=instruments,
+            chunk_size=chunk_size,
+            max_url_length=max_url_length
+        )
+
+        if len(chunks) <= 1:
+            return self._request_quotes(instruments=chunks[0] if chunks else [])
+
+        max_workers = max_workers or self.session.pool_maxsize
+
+        def request_chunk(chunk: List[str]) -> dict:
+            try:
+                return self._request_quotes(instruments=chunk)
+            except Exception as chunk_error:
+                return chunk_error
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = list(executor.map(request_chunk, chunks))
+
+        return self._merge_chunks(
+            chunks=chunks,
+            results=results,
+            raise_errors=raise_errors
+        )
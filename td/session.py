@@ -1,30 +1,80 @@
 import json
+import time
 import logging
 import pathlib
+import threading
+
+from typing import Callable
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from td.utils.enums import RequestPriority
+from td.utils.rate_limiter import RateLimiter
+from td.utils.retry_policy import RetryPolicy
 
-class TdAmeritradeSession():
 
-    """Serves as the Session for TD Ameritrade API."""
+def _counting_pool_class(pool_class: type, on_new_connection: Callable) -> type:
+    """Subclasses a `urllib3` connection pool so every new connection
+    is reported, the pool's own counters reset when it is dropped."""
 
-    def __init__(self, td_client: object) -> None:
-        """Initializes the `TdAmeritradeSession` client.
+    class CountingConnectionPool(pool_class):
+
+        def _new_conn(self):
+            on_new_connection()
+            return super()._new_conn()
+
+    return CountingConnectionPool
 
-        ### Overview
-        ----
-        The `TdAmeritradeSession` object handles all the requests made
-        for the different endpoints on the TD Ameritrade API.
+
+class CountingHTTPAdapter(HTTPAdapter):
+
+    """An `HTTPAdapter` whose connection pools report every connection they open."""
+
+    def __init__(self, on_new_connection: Callable, **kwargs) -> None:
+        """Initializes the `CountingHTTPAdapter` object.
 
         ### Parameters
         ----
-        client : object
-            The `TdAmeritradeClient` Python Client.
+        on_new_connection : Callable
+            Called without arguments each time a pool opens a connection.
 
-        ### Usage:
+        **kwargs : dict
+            The `HTTPAdapter` arguments.
+        """
+
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(
+                pool_class=pool_class,
+                on_new_connection=self._on_new_connection
+            )
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class TdAmeritradeSessionBase():
+
+    """Holds what `TdAmeritradeSession` and `AsyncTdAmeritradeSession`
+    share, everything but sending the requests."""
+
+    def __init__(
+        self,
+        td_client: object,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None
+    ) -> None:
+        """Initializes the settings shared by the sessions.
+
+        ### Parameters
         ----
-            >>> td_session = TdAmeritradeSession()
+        See `TdAmeritradeSession`.
         """
 
         from td.client import TdAmeritradeClient
@@ -46,6 +96,50 @@ class TdAmeritradeSession():
             format=log_format,
         )
 
+        self.keep_alive = keep_alive
+        self._stats_lock = threading.Lock()
+        self._connections_opened = 0
+        self._requests_sent = 0
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def _on_new_connection(self) -> None:
+        with self._stats_lock:
+            self._connections_opened += 1
+
+    @property
+    def connection_stats(self) -> dict:
+        """Returns the connection counters for the session.
+
+        ### Overview
+        ----
+        The counters are kept by the session for its whole lifetime,
+        closing the session or evicting a connection pool does not
+        reset them. A connection is counted as reused when a request
+        was sent over a connection that was already open.
+
+        ### Returns
+        ----
+        dict:
+            A dictionary with the `requests_sent`, `connections_opened`
+            and `connections_reused` counts.
+
+        ### Usage
+        ----
+            >>> td_session.connection_stats
+            {'requests_sent': 12, 'connections_opened': 1, 'connections_reused': 11}
+        """
+
+        with self._stats_lock:
+            requests_sent = self._requests_sent
+            connections_opened = self._connections_opened
+
+        return {
+            'requests_sent': requests_sent,
+            'connections_opened': connections_opened,
+            'connections_reused': max(requests_sent - connections_opened, 0)
+        }
+
     def build_headers(self) -> dict:
         """Used to build the headers needed to make the request.
 
@@ -86,13 +180,166 @@ class TdAmeritradeSession():
 
         return url
 
+    def _log_error(
+        self,
+        error_code: int,
+        response_url: str,
+        response_body: object,
+        request_headers: dict,
+        request_method: str
+    ) -> None:
+        """Logs a failed request with the access token masked.
+
+        ### Parameters
+        ----
+        error_code : int
+            The HTTP status code of the response.
+
+        response_url : str
+            The URL the request was sent to.
+
+        response_body : object
+            The decoded response body, if there was one.
+
+        request_headers : dict
+            The headers that were sent with the request.
+
+        request_method : str
+            The HTTP method of the request.
+        """
+
+        request_headers = dict(request_headers)
+        request_headers['Authorization'] = 'Bearer XXXXXXX'
+
+        # Define the error dict.
+        error_dict = {
+            'error_code': error_code,
+            'response_url': str(response_url),
+            'response_body': response_body,
+            'response_request': request_headers,
+            'response_method': request_method,
+        }
+
+        # Log the error.
+        logging.error(
+            msg=json.dumps(obj=error_dict, indent=4)
+        )
+
+
+class TdAmeritradeSession(TdAmeritradeSessionBase):
+
+    """Serves as the Session for TD Ameritrade API."""
+
+    def __init__(
+        self,
+        td_client: object,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None
+    ) -> None:
+        """Initializes the `TdAmeritradeSession` client.
+
+        ### Overview
+        ----
+        The `TdAmeritradeSession` object handles all the requests made
+        for the different endpoints on the TD Ameritrade API. A single
+        `requests.Session` is kept open for the lifetime of the object
+        so that TCP and TLS connections are reused between requests.
+
+        ### Parameters
+        ----
+        client : object
+            The `TdAmeritradeClient` Python Client.
+
+        pool_connections : int (optional, Default=10)
+            The number of host connection pools to cache.
+
+        pool_maxsize : int (optional, Default=10)
+            The maximum number of connections to keep open
+            per host, raise this if you make requests from
+            multiple threads.
+
+        keep_alive : bool (optional, Default=True)
+            If `True` connections are kept alive between requests,
+            if `False` every connection is closed after each response.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            The token bucket every request has to pass through, pass
+            the same limiter to several sessions to share one budget.
+            Defaults to a new `RateLimiter` with 120 requests per minute.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            Decides which failed requests are retried and how long to
+            wait in between. Defaults to a `RetryPolicy` that retries
+            transient errors on `GET` requests only.
+
+        ### Usage:
+        ----
+            >>> td_session = TdAmeritradeSession()
+            >>> with TdAmeritradeSession(td_client=td_client) as td_session:
+                    td_session.make_request(method='get', endpoint='marketdata/quotes')
+        """
+
+        super().__init__(
+            td_client=td_client,
+            keep_alive=keep_alive,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy
+        )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.http_session: requests.Session = self._build_http_session()
+
+    def __enter__(self) -> 'TdAmeritradeSession':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _build_http_session(self) -> requests.Session:
+        """Builds the long-lived session used for every request.
+
+        ### Returns
+        ----
+        requests.Session:
+            A session with a mounted connection pool.
+        """
+
+        http_session = requests.Session()
+        http_session.verify = True
+
+        # Mount a connection pool sized to the user's needs.
+        self._http_adapter = CountingHTTPAdapter(
+            on_new_connection=self._on_new_connection,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        http_session.mount('https://', self._http_adapter)
+
+        if self.keep_alive:
+            http_session.headers['Connection'] = 'keep-alive'
+        else:
+            http_session.headers['Connection'] = 'close'
+
+        return http_session
+
+    def close(self) -> None:
+        """Closes the session and all of its pooled connections."""
+
+        self.http_session.close()
+
     def make_request(
         self,
         method: str,
         endpoint: str,
         params: dict = None,
         data: dict = None,
-        json_payload: dict = None
+        json_payload: dict = None,
+        priority: RequestPriority = RequestPriority.Normal,
+        retry: bool = None
     ) -> dict:
         """Handles all the requests in the library.
 
@@ -121,6 +368,14 @@ class TdAmeritradeSession():
         json_payload : dict (optional, Default={})
             A json data payload for a request
 
+        priority : RequestPriority (optional, Default=RequestPriority.Normal)
+            The rate limiter lane of the request, `High` requests
+            are sent before `Normal` and `Low` ones.
+
+        retry : bool (optional, Default=None)
+            Overrides the `RetryPolicy` methods for this request, pass
+            `True` to opt a non-idempotent request into retries.
+
         ### Returns
         ----
         Dict:
@@ -138,27 +393,81 @@ class TdAmeritradeSession():
 
         logging.info("Request URL: %s", url)
 
-        # Define a new session.
-        request_session = requests.Session()
-        request_session.verify = True
-
-        # Define a new request.
-        request_request = requests.Request(
-            method=method.upper(),
-            headers=headers,
-            url=url,
-            params=params,
-            data=data,
-            json=json_payload
-        ).prepare()
-
-        # Send the request.
-        response: requests.Response = request_session.send(
-            request=request_request
+        # Define a new request, merged with the session defaults.
+        request_request = self.http_session.prepare_request(
+            requests.Request(
+                method=method.upper(),
+                headers=headers,
+                url=url,
+                params=params,
+                data=data,
+                json=json_payload
+            )
+        )
+
+        can_retry = self.retry_policy.is_retryable_method(
+            method=method,
+            retry=retry
         )
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+
+            # Wait for our turn in the request budget.
+            self.rate_limiter.acquire(priority=priority)
+
+            with self._stats_lock:
+                self._requests_sent += 1
 
-        # Close the session.
-        request_session.close()
+            # Send the request over the pooled session.
+            try:
+                response: requests.Response = self.http_session.send(
+                    request=request_request
+                )
+            except (requests.ConnectionError, requests.Timeout) as request_error:
+
+                delay = None
+                if can_retry:
+                    delay = self.retry_policy.get_retry_delay(
+                        attempt=attempt,
+                        elapsed=time.monotonic() - start
+                    )
+
+                if delay is None:
+                    raise
+
+                logging.warning(
+                    "Retrying %s in %.2fs after %s.", url, delay, type(request_error).__name__
+                )
+
+            else:
+
+                # Back off everyone sharing the budget if we got throttled.
+                if response.status_code == 429:
+                    self.rate_limiter.drain()
+
+                if response.ok or not can_retry:
+                    break
+
+                if not self.retry_policy.is_retryable_status(response.status_code):
+                    break
+
+                delay = self.retry_policy.get_retry_delay(
+                    attempt=attempt,
+                    elapsed=time.monotonic() - start,
+                    retry_after=response.headers.get('Retry-After')
+                )
+
+                if delay is None:
+                    break
+
+                logging.warning(
+                    "Retrying %s in %.2fs after status %s.", url, delay, response.status_code
+                )
+
+            time.sleep(delay)
+            attempt += 1
 
         # If it's okay and no details.
         if response.ok and len(response.content) > 0:
@@ -175,20 +484,12 @@ class TdAmeritradeSession():
             else:
                 response_data = response.json()
 
-            response.request.headers['Authorization'] = 'Bearer XXXXXXX'
-
-            # Define the error dict.
-            error_dict = {
-                'error_code': response.status_code,
-                'response_url': response.url,
-                'response_body': response_data,
-                'response_request': dict(response.request.headers),
-                'response_method': response.request.method,
-            }
-
-            # Log the error.
-            logging.error(
-                msg=json.dumps(obj=error_dict, indent=4)
+            self._log_error(
+                error_code=response.status_code,
+                response_url=response.url,
+                response_body=response_data,
+                request_headers=response.request.headers,
+                request_method=response.request.method
             )
 
             raise requests.HTTPError()
@@ -1,15 +1,29 @@
 import json
+import time
 import urllib
 import pprint
 import asyncio
-import textwrap
-
+import logging
+
+from enum import Enum
+from collections import deque
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import AsyncIterator
 from datetime import datetime
 from websockets import client as ws_client
 from websockets import exceptions as ws_exceptions
 
 from td.rest.user_info import UserInfo
 from td.session import TdAmeritradeSession
+from td.utils.retry_policy import RetryPolicy
+from td.streaming.records import StreamRecord
+from td.streaming.records import split_message
+from td.streaming.records import parse_message
+from td.streaming.decoders import StreamDecoder
+from td.streaming.decoders import SERVICE_FIELDS
+from td.streaming.services import normalize_fields
 from td.streaming.services import StreamingServices
 
 
@@ -23,7 +37,13 @@ class StreamingApiClient():
     streams data back to the user.
     """
 
-    def __init__(self, session: TdAmeritradeSession) -> None:
+    def __init__(
+        self,
+        session: TdAmeritradeSession,
+        auto_reconnect: bool = True,
+        reconnect_policy: RetryPolicy = None,
+        login_timeout: float = 30.0
+    ) -> None:
         """Initalizes the Streaming Client.
 
         ### Overview
@@ -31,12 +51,84 @@ class StreamingApiClient():
         Initalizes the Client Object and defines different components that will be needed to
         make a connection with the TD Streaming API.
 
+        ### Parameters
+        ----
+        session: TdAmeritradeSession
+            The session used to look up the streamer info.
+
+        auto_reconnect: bool (optional, Default=True)
+            If `True` a dropped connection is reopened, logged in
+            again and resubscribed, see `_reconnect`.
+
+        reconnect_policy: RetryPolicy (optional, Default=None)
+            The backoff between reconnect attempts, defaults to ten
+            attempts within five minutes, waiting at most 30 seconds.
+
+        login_timeout: float (optional, Default=30.0)
+            The number of seconds to wait for the answer to the
+            login request, a connection that does not answer in
+            time counts as a failed attempt.
+
         ### Usage
         ----
             >>> td_streaming_client = td_client.streaming_api()
         """
+
+        self.session = session
+        self._load_user_principals()
+
+        self.connection: ws_client.WebSocketClientProtocol = None
+        self.data_requests = {
+            "requests": []
+        }
+
+        try:
+            self.loop = asyncio.get_event_loop()
+        except RuntimeError:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+
+        self.unsubscribe_count = 0
+
+        # Message handlers keyed by service, see `add_handler`.
+        self.print_messages = False
+        self._handlers = {}
+        self._message_logger = None
+        self._message_log_level = logging.DEBUG
+
+        # The effective subscription and field decoder of each service.
+        self.subscriptions = {}
+        self.decoders = {}
+
+        # Messages dropped because an `async for` consumer fell behind.
+        self.dropped_messages = 0
+
+        # Reconnect supervision, see `_reconnect`.
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_policy = reconnect_policy or RetryPolicy(
+            max_retries=10,
+            backoff_factor=1.0,
+            max_backoff=30.0,
+            max_retry_time=300.0
+        )
+        self.login_timeout = login_timeout
+        self.reconnect_count = 0
+        self.reconnect_attempts = 0
+        self.gaps = deque(maxlen=1000)
+        self._closing = False
+        self._reconnect_task = None
+
+    def _load_user_principals(self) -> None:
+        """Looks up the streamer info and builds the login credentials.
+
+        ### Overview
+        ----
+        Called when the client is created, and again when a reconnect
+        is refused so the streamer token is fresh.
+        """
+
         self.user_principal_data = UserInfo(
-            session=session
+            session=self.session
         ).get_user_principals()
 
         socket_url = self.user_principal_data['streamerInfo']['streamerSocketUrl']
@@ -64,18 +156,161 @@ class StreamingApiClient():
             "acl": self.user_principal_data['streamerInfo']['acl']
         }
 
-        self.connection: ws_client.WebSocketClientProtocol = None
-        self.data_requests = {
-            "requests": []
-        }
+    def add_handler(
+        self,
+        service: Union[str, Enum],
+        handler: Callable[[dict], None]
+    ) -> None:
+        """Registers a callback for the messages of a service.
 
-        try:
-            self.loop = asyncio.get_event_loop()
-        except ws_exceptions.WebSocketProtocolError:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+        ### Overview
+        ----
+        Every `data` and `snapshot` entry of a message is passed to the
+        handlers of its service, for example `QUOTE`, `OPTION` or
+        `TIMESALE_EQUITY`. Use `RESPONSE` and `NOTIFY` for command
+        responses and heartbeats, `GAP` for the outages bridged by a
+        reconnect, and `*` for every entry. Handlers may
+        be plain functions or coroutine functions, they run on the
+        receive loop so they should hand heavy work off elsewhere.
 
-        self.unsubscribe_count = 0
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The service the handler listens to.
+
+        handler: Callable[[dict], None]
+            Called with each entry, the entry holds the `service`,
+            `timestamp`, `command` and `content` of the message.
+
+        ### Usage
+        ----
+            >>> streaming_api_service = td_client.streaming_api_client()
+            >>> def on_quote(entry: dict) -> None:
+                    for quote in entry['content']:
+                        latest[quote['key']] = quote
+            >>> streaming_api_service.add_handler(service='QUOTE', handler=on_quote)
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        self._handlers.setdefault(service.upper(), []).append(handler)
+
+    def remove_handler(
+        self,
+        service: Union[str, Enum],
+        handler: Callable[[dict], None]
+    ) -> None:
+        """Removes a callback registered with `add_handler`.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The service the handler listens to.
+
+        handler: Callable[[dict], None]
+            The handler to remove.
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        handlers = self._handlers.get(service.upper(), [])
+
+        if handler in handlers:
+            handlers.remove(handler)
+
+        if not handlers:
+            self._handlers.pop(service.upper(), None)
+
+    def enable_message_logging(
+        self,
+        logger: logging.Logger = None,
+        level: int = logging.DEBUG
+    ) -> None:
+        """Logs a structured record for every entry of every message.
+
+        ### Overview
+        ----
+        Off by default. Each record carries the `service`, `command`,
+        `timestamp` and `records` count as `extra` fields, and nothing
+        is formatted unless the logger is enabled for the level.
+
+        ### Parameters
+        ----
+        logger: logging.Logger (optional, Default=None)
+            The logger to write to, defaults to `td.streaming`.
+
+        level: int (optional, Default=logging.DEBUG)
+            The level of the records.
+        """
+
+        self._message_logger = logger or logging.getLogger('td.streaming')
+        self._message_log_level = level
+
+    def disable_message_logging(self) -> None:
+        """Stops the structured message logging."""
+
+        self._message_logger = None
+
+    async def _dispatch_message(self, message: dict) -> None:
+        """Hands each entry of a message to its handlers.
+
+        ### Parameters
+        ----
+        message: dict
+            The decoded streaming message.
+        """
+
+        logger = self._message_logger
+
+        if logger is not None and not logger.isEnabledFor(self._message_log_level):
+            logger = None
+
+        if not self._handlers and logger is None:
+            return
+
+        wildcard_handlers = self._handlers.get('*')
+
+        for section, entries in message.items():
+
+            if not isinstance(entries, list):
+                continue
+
+            for entry in entries:
+
+                if section in ('data', 'snapshot'):
+                    service = entry.get('service')
+                else:
+                    service = section.upper()
+
+                if logger is not None:
+                    logger.log(
+                        self._message_log_level,
+                        "Streaming %s %s",
+                        section,
+                        service,
+                        extra={
+                            'service': service,
+                            'command': entry.get('command'),
+                            'timestamp': entry.get('timestamp'),
+                            'records': len(entry.get('content') or ())
+                        }
+                    )
+
+                # The service's handlers first, then the `*` handlers.
+                for handlers in (self._handlers.get(service), wildcard_handlers):
+
+                    if not handlers:
+                        continue
+
+                    for handler in handlers:
+                        try:
+                            result = handler(entry)
+                            if asyncio.iscoroutine(result):
+                                await result
+                        except Exception:
+                            logging.exception("Streaming handler for %s failed.", service)
 
     def _build_login_request(self) -> str:
         """Builds the Login request for the streamer.
@@ -120,6 +355,14 @@ class StreamingApiClient():
         returns a WebSocketClientProtocol, which is used to send
         and receive messages
 
+        ### Raises
+        ----
+        ValueError:
+            If the login is refused.
+
+        asyncio.TimeoutError:
+            If the login is not answered within `login_timeout`.
+
         ### Returns
         ---
         websockets.WebSocketClientProtocol:
@@ -141,12 +384,21 @@ class StreamingApiClient():
 
             while True:
 
-                # Grab the Response.
-                response = await self._receive_message(return_value=True)
-                responses = response.get('response')
+                # Grab the Response, a dropped socket is left to the caller.
+                try:
+                    message = await asyncio.wait_for(
+                        self.connection.recv(),
+                        timeout=self.login_timeout
+                    )
+                except asyncio.TimeoutError:
+                    await self.connection.close()
+                    raise
+                response = await self._parse_json_message(message=message)
+                await self._dispatch_message(message=response)
+                responses = response.get('response') or []
 
                 # If we get a code 3, we had a login error.
-                if responses[0]['content']['code'] == 3:
+                if responses and responses[0]['content']['code'] == 3:
                     raise ValueError(
                         f"LOGIN ERROR: {responses[0]['content']['msg']}"
                     )
@@ -154,9 +406,7 @@ class StreamingApiClient():
                 # see if we had a login response.
                 for r in responses:
                     if r.get('service') == 'ADMIN' and r.get('command') == 'LOGIN':
-                        print(
-                            "Message: User Login successful, streaming will being shortly."
-                        )
+                        logging.info("User login successful, streaming will begin shortly.")
                         return self.connection
 
     async def _check_connection(self) -> bool:
@@ -181,15 +431,11 @@ class StreamingApiClient():
 
         # if it's open we can stream.
         if self.connection.open:
-            print("="*80)
-            print('Message: Connection established. Streaming will begin shortly.')
-            print("-"*80)
+            logging.info("Connection established, streaming will begin shortly.")
             return True
 
         if self.connection.close:
-            print("="*80)
-            print('Message: Connection was never opened and was closed.')
-            print("-"*80)
+            logging.warning("Connection was never opened and was closed.")
             return False
 
         raise ConnectionError
@@ -225,23 +471,119 @@ class StreamingApiClient():
         while True:
 
             try:
-
                 message = await self.connection.recv()
-                message_decoded = await self._parse_json_message(message=message)
-                print(message_decoded)
+            except ws_exceptions.ConnectionClosed as closed:
+                if await self._reconnect(reason=closed):
+                    continue
+                await self.close_stream()
+                break
 
-                if return_value:
-                    return message_decoded
+            message_decoded = await self._parse_json_message(message=message)
+            await self._dispatch_message(message=message_decoded)
 
-                print(textwrap.dedent('='*80))
-                print(textwrap.dedent("Message Received:"))
-                print(textwrap.dedent('-'*80))
-                pprint.pprint(message_decoded)
-                print(textwrap.dedent('-'*80))
+            if return_value:
+                return message_decoded
 
-            except ws_exceptions.ConnectionClosed:
-                await self.close_stream()
-                break
+            # Message output is opt-in, formatting is too slow for busy feeds.
+            if self.print_messages:
+                logging.info("Message received:\n%s", pprint.pformat(message_decoded))
+
+    async def _reconnect(self, reason: Exception = None) -> bool:
+        """Reopens a dropped connection and replays the subscriptions.
+
+        ### Overview
+        ----
+        Tries to connect again with the backoff of `reconnect_policy`,
+        redoing the ADMIN LOGIN and resending the current subscriptions. A login
+        that is refused reloads the streamer token before the next
+        attempt. Every outage is recorded in `gaps` and, once the stream
+        is back, passed to the `GAP` handlers and yielded by `stream` as
+        a `gap` record, so state built from the stream can be rebuilt.
+        Concurrent callers share the same attempt.
+
+        ### Parameters
+        ----
+        reason: Exception (optional, Default=None)
+            The error that dropped the connection.
+
+        ### Returns
+        ----
+        bool:
+            `True` once the stream is back, `False` if reconnecting
+            is disabled, the stream was closed on purpose or the
+            policy gave up.
+        """
+
+        if not self.auto_reconnect or self._closing:
+            return False
+
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.ensure_future(self._run_reconnect(reason=reason))
+
+        try:
+            return await asyncio.shield(self._reconnect_task)
+        finally:
+            if self._reconnect_task is not None and self._reconnect_task.done():
+                self._reconnect_task = None
+
+    async def _run_reconnect(self, reason: Exception = None) -> bool:
+        """Runs the reconnect attempts of `_reconnect`."""
+
+        disconnected = int(time.time() * 1000)
+        started = time.monotonic()
+        attempt = 0
+
+        logging.warning("Streaming connection dropped: %s", reason)
+
+        while not self._closing:
+
+            delay = self.reconnect_policy.get_retry_delay(
+                attempt=attempt,
+                elapsed=time.monotonic() - started
+            )
+
+            if delay is None:
+                logging.error("Streaming reconnect gave up after %s attempts.", attempt)
+                return False
+
+            await asyncio.sleep(delay)
+
+            attempt += 1
+            self.reconnect_attempts += 1
+
+            try:
+                await self._connect()
+                await self._send_message(json.dumps(self._subscription_requests(replay=True)))
+            except ValueError:
+
+                # The login was refused, the streamer token may be stale.
+                logging.warning("Streaming login refused, reloading the streamer info.")
+
+                # The lookup is a blocking request, keep it off the event loop.
+                try:
+                    await asyncio.get_event_loop().run_in_executor(None, self._load_user_principals)
+                except Exception as error:
+                    logging.warning("Reloading the streamer info failed: %s", error)
+
+                continue
+            except (OSError, asyncio.TimeoutError, ws_exceptions.WebSocketException) as error:
+                logging.warning("Streaming reconnect attempt %s failed: %s", attempt, error)
+                continue
+
+            gap = {
+                'disconnected': disconnected,
+                'reconnected': int(time.time() * 1000),
+                'attempts': attempt,
+                'reason': str(reason)
+            }
+
+            self.reconnect_count += 1
+            self.gaps.append(gap)
+            await self._dispatch_message(message={'gap': [gap]})
+
+            return True
+
+        return False
 
     async def _parse_json_message(self, message: str) -> dict:
         """Parses incoming messages from the stream
@@ -257,15 +599,7 @@ class StreamingApiClient():
             The parsed message content.
         """
 
-        try:
-            message_decoded = json.loads(message)
-        except TypeError:
-            message = message.encode(
-                'utf-8'
-            ).replace(b'\xef\xbf\xbd', bytes('"None"', 'utf-8')).decode('utf-8')
-            message_decoded = json.loads(message)
-
-        return message_decoded
+        return parse_message(message=message)
 
     async def heartbeat(self) -> None:
         """Sending heartbeat to server every 5 seconds."""
@@ -275,7 +609,13 @@ class StreamingApiClient():
                 await self.connection.send('ping')
                 await asyncio.sleep(5)
             except ws_exceptions.ConnectionClosed:
-                self.close_stream()
+
+                # The receive loop owns the reconnect, wait for it.
+                if self.auto_reconnect and not self._closing:
+                    await asyncio.sleep(5)
+                    continue
+
+                await self.close_stream()
                 break
 
     def services(self) -> StreamingServices:
@@ -295,40 +635,54 @@ class StreamingApiClient():
 
         return StreamingServices(streaming_api_client=self)
 
-    def open_stream(self) -> None:
-        """Starts the stream and prints the output to the console.
+    def open_stream(self, print_messages: bool = False) -> None:
+        """Starts the stream and keeps the event loop running.
 
         ### Overview
         ----
         Initalizes the stream by building a login request, starting
         an event loop, creating a connection, passing through the
         requests, and keeping the loop running.
+
+        ### Parameters
+        ----
+        print_messages: bool (optional, Default=False)
+            If `True` every message is pretty printed to the log
+            at the `INFO` level, leave it off when the messages are
+            consumed by handlers.
         """
 
+        self.print_messages = print_messages
+
         # Connect to the Websocket.
         self.loop.run_until_complete(self._connect())
 
         # Send the data requests, and start getting messages.
-        data_requests = json.dumps(self.data_requests)
+        data_requests = json.dumps(self._subscription_requests())
         asyncio.ensure_future(self._send_message(data_requests))
         asyncio.ensure_future(self._receive_message(return_value=False))
         self.loop.run_forever()
 
+    async def close_connection(self) -> None:
+        """Closes the websocket without reconnecting it.
+
+        ### Overview
+        ----
+        Unlike `close_stream` the event loop keeps running, so this
+        ends a `stream` that other tasks on the loop are reading.
+        """
+
+        # A closed stream is not reconnected.
+        self._closing = True
+
+        if self.connection is not None:
+            await self.connection.close()
+
     async def close_stream(self) -> None:
         """Closes the connection to the streaming service."""
 
         # close the connection.
-        await self.connection.close()
-
-        # Define the Message.
-        message = textwrap.dedent("""
-        {lin_brk}
-        CLOSING PROCESS INITIATED:
-        {lin_brk}
-        WebSocket Closed: True
-        Event Loop Closed: True
-        {lin_brk}
-        """).format(lin_brk="="*80)
+        await self.close_connection()
 
         # Shutdown all asynchronus generators.
         await self.loop.shutdown_asyncgens()
@@ -336,7 +690,7 @@ class StreamingApiClient():
         # Stop the loop.
         if self.loop.is_running():
             self.loop.call_soon_threadsafe(self.loop.stop())
-            print(message)
+            logging.info("Streaming closed, the websocket and the event loop are closed.")
             await asyncio.sleep(3)
 
     async def build_pipeline(self) -> ws_client.WebSocketClientProtocol:
@@ -359,7 +713,7 @@ class StreamingApiClient():
         await self._connect()
 
         # Build the Data Request.
-        await self._send_message(json.dumps(self.data_requests))
+        await self._send_message(json.dumps(self._subscription_requests()))
 
         return self.connection
 
@@ -374,9 +728,153 @@ class StreamingApiClient():
 
         return await self._receive_message(return_value=True)
 
+    async def _read_messages(self, queue: asyncio.Queue, block: bool) -> None:
+        """Reads the socket into the queue of `stream`.
+
+        ### Parameters
+        ----
+        queue: asyncio.Queue
+            The bounded queue, `None` is put on it once the
+            connection closes or the reader fails.
+
+        block: bool
+            If `True` the reader waits for room in the queue,
+            otherwise the oldest message is dropped.
+        """
+
+        try:
+            while True:
+
+                try:
+                    message = await self.connection.recv()
+                    message_decoded = await self._parse_json_message(message=message)
+                    await self._dispatch_message(message=message_decoded)
+                except ws_exceptions.ConnectionClosed as closed:
+                    if not await self._reconnect(reason=closed):
+                        raise
+                    message_decoded = {'gap': [self.gaps[-1]]}
+
+                if block:
+                    await queue.put(message_decoded)
+                    continue
+
+                if queue.full():
+                    queue.get_nowait()
+                    self.dropped_messages += 1
+
+                queue.put_nowait(message_decoded)
+
+        except ws_exceptions.ConnectionClosed:
+            pass
+        except Exception:
+            logging.exception("Streaming reader failed.")
+
+        # Tell the consumer the stream ended.
+        if block:
+            await queue.put(None)
+        else:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_messages += 1
+            queue.put_nowait(None)
+
+    async def stream(
+        self,
+        queue_size: int = 1000,
+        block: bool = False,
+        include_responses: bool = False,
+        decode: bool = True
+    ) -> AsyncIterator[StreamRecord]:
+        """Yields the streaming records as they arrive.
+
+        ### Overview
+        ----
+        A reader task keeps pulling messages off the socket into a
+        bounded queue, so a slow consumer does not hold up the socket.
+        Each message is split into one `StreamRecord` per symbol. When
+        the queue is full the oldest message is dropped and counted in
+        `dropped_messages`, unless `block` is set. The pipeline is
+        built first if the client is not connected yet. Outages bridged
+        by a reconnect are yielded as `gap` records, and the iteration
+        ends when the connection closes for good.
+
+        ### Parameters
+        ----
+        queue_size: int (optional, Default=1000)
+            The number of messages the queue holds.
+
+        block: bool (optional, Default=False)
+            If `True` the reader waits for the consumer instead
+            of dropping messages.
+
+        include_responses: bool (optional, Default=False)
+            If `True` the `response` and `notify` entries are
+            yielded as well.
+
+        decode: bool (optional, Default=True)
+            If `True` the fields of the subscribed services are keyed
+            by name, for example `BidPrice` instead of `1`.
+
+        ### Returns
+        ----
+        AsyncIterator[StreamRecord]:
+            The records, in the order they were received.
+
+        ### Usage
+        ----
+            >>> streaming_api_service = td_client.streaming_api_client()
+            >>> streaming_services = streaming_api_service.services()
+            >>> streaming_services.level_one_quotes(
+                    symbols=['MSFT', 'AAPL'],
+                    fields=LevelOneQuotes.All
+                )
+            >>> async for record in streaming_api_service.stream():
+                    print(record.service, record.key, record.fields['BidPrice'])
+        """
+
+        if self.connection is None:
+            await self.build_pipeline()
+
+        decoders = self.decoders if decode else None
+        queue = asyncio.Queue(maxsize=queue_size)
+        reader = asyncio.ensure_future(self._read_messages(queue=queue, block=block))
+
+        try:
+            while True:
+
+                message = await queue.get()
+
+                if message is None:
+                    break
+
+                records = split_message(
+                    message=message,
+                    include_responses=include_responses,
+                    decoders=decoders
+                )
+
+                for record in records:
+                    yield record
+
+        finally:
+            reader.cancel()
+
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+
+    def __aiter__(self) -> AsyncIterator[StreamRecord]:
+        return self.stream()
+
     async def unsubscribe(self, service: str) -> dict:
         """Unsubscribe from a service.
 
+        ### Overview
+        ----
+        Sends an `UNSUBS` for every symbol of the service and stops
+        tracking it, so it is not resubscribed after a reconnect.
+
         ### Parameters
         ----
         service: str
@@ -386,28 +884,397 @@ class StreamingApiClient():
         ### Returns
         ----
         dict:
-            A message from the websocket specifiying whether
-            the unsubscribe command was successful.
+            The request that was sent, the response arrives on the
+            stream, see the `RESPONSE` handlers.
         """
 
-        self.unsubscribe_count += 1
+        service = service.upper()
 
-        service_count = len(
-            self.data_requests['requests']
-        ) + self.unsubscribe_count
+        self.subscriptions.pop(service, None)
 
-        request = {
-            "requests": [
-                {
-                    "service": service.upper(),
-                    "requestid": service_count,
-                    "command": 'UNSUBS',
-                    "account": self.user_principal_data['accounts'][0]['accountId'],
-                    "source": self.user_principal_data['streamerInfo']['appId']
-                }
-            ]
+        request = self._build_live_request(service=service, command='UNSUBS')
+        await self._send_live_request(request=request)
+
+        return request
+
+    def _track_request(self, request: dict) -> None:
+        """Records the subscription of a `SUBS` request.
+
+        ### Parameters
+        ----
+        request: dict
+            A service request, a `SUBS` request replaces the keys and
+            fields of its service like it does on the server.
+        """
+
+        if request.get('command') != 'SUBS':
+            return
+
+        service = request['service']
+        keys = request['parameters'].get('keys') or ''
+        fields = request['parameters'].get('fields') or ''
+
+        self.subscriptions[service] = {
+            'keys': set(key for key in keys.split(',') if key),
+            'fields': [field for field in fields.split(',') if field],
+            'requestid': request['requestid']
         }
+        self._update_decoder(service=service)
 
-        await self._send_message(json.dumps(request))
+    def _update_decoder(self, service: str) -> None:
+        """Rebuilds the field decoder of a subscribed service."""
 
-        return await self._receive_message(return_value=True)
+        subscription = self.subscriptions.get(service)
+
+        if subscription and service in SERVICE_FIELDS:
+            self.decoders[service] = StreamDecoder(
+                service=service,
+                fields=subscription['fields']
+            )
+
+    def _build_live_request(
+        self,
+        service: str,
+        command: str,
+        keys: List[str] = None,
+        fields: List[str] = None,
+        request_id: int = None
+    ) -> dict:
+        """Builds a request for a running stream.
+
+        ### Parameters
+        ----
+        service: str
+            The name of the service.
+
+        command: str
+            The command, `SUBS`, `ADD`, `UNSUBS` or `VIEW`.
+
+        keys: List[str] (optional, Default=None)
+            The symbols of the request.
+
+        fields: List[str] (optional, Default=None)
+            The field numbers of the request.
+
+        request_id: int (optional, Default=None)
+            The id of the request, defaults to the next free id.
+
+        ### Returns
+        ----
+        dict:
+            The service request.
+        """
+
+        # Live requests share the counter of `unsubscribe`.
+        if request_id is None:
+            self.unsubscribe_count += 1
+            request_id = len(self.data_requests['requests']) + self.unsubscribe_count
+
+        parameters = {}
+
+        if keys is not None:
+            parameters['keys'] = ','.join(keys)
+
+        if fields is not None:
+            parameters['fields'] = ','.join(fields)
+
+        return {
+            "service": service,
+            "requestid": request_id,
+            "command": command,
+            "account": self.user_principal_data['accounts'][0]['accountId'],
+            "source": self.user_principal_data['streamerInfo']['appId'],
+            "parameters": parameters
+        }
+
+    def _subscription_requests(self, replay: bool = False) -> dict:
+        """Builds the requests that open the current subscriptions.
+
+        ### Overview
+        ----
+        Requests that are not subscriptions, such as the quality of
+        service, are sent as they were queued. Every tracked service
+        gets a single `SUBS` with its current keys and fields, so the
+        symbols added or removed on a live stream survive a reconnect.
+
+        ### Parameters
+        ----
+        replay: bool (optional, Default=False)
+            If `True` the requests are for a reconnect, one-shot requests
+            such as a chart history `GET` were answered already and are
+            left out, only the `ADMIN` settings and the subscriptions
+            are sent again.
+
+        ### Returns
+        ----
+        dict:
+            The requests, in the order they were first queued.
+        """
+
+        requests = []
+        replayed = set()
+
+        for request in self.data_requests['requests']:
+
+            if request.get('command') != 'SUBS':
+                if not replay or request.get('service') == 'ADMIN':
+                    requests.append(request)
+                continue
+
+            service = request['service']
+
+            # Already replayed or unsubscribed since.
+            if service in replayed or service not in self.subscriptions:
+                continue
+
+            replayed.add(service)
+            requests.append(self._subscription_request(service=service))
+
+        for service in self.subscriptions:
+            if service not in replayed:
+                requests.append(self._subscription_request(service=service))
+
+        return {"requests": requests}
+
+    def _subscription_request(self, service: str) -> dict:
+        """Builds the `SUBS` request of a tracked service."""
+
+        subscription = self.subscriptions[service]
+
+        # A replay keeps the id of the subscription, it is not a new request.
+        return self._build_live_request(
+            service=service,
+            command='SUBS',
+            keys=sorted(subscription['keys']),
+            fields=subscription['fields'],
+            request_id=subscription.get('requestid')
+        )
+
+    async def _send_live_request(self, request: dict) -> None:
+        """Sends a request if the stream is open.
+
+        ### Overview
+        ----
+        Before the stream opens, or while it reconnects, the request
+        is not sent, the tracked subscriptions are sent once connected.
+        The response arrives on the stream, see the `RESPONSE` handlers.
+        """
+
+        if self.connection is None:
+            return
+
+        try:
+            await self._send_message(json.dumps({"requests": [request]}))
+        except ws_exceptions.ConnectionClosed:
+            pass
+
+    async def add_symbols(
+        self,
+        service: Union[str, Enum],
+        symbols: List[str],
+        fields: Union[Enum, List[Enum], List[str], List[int]] = None
+    ) -> Union[dict, None]:
+        """Adds symbols to a service on a running stream.
+
+        ### Overview
+        ----
+        Sends an `ADD` with only the symbols that are not subscribed
+        yet, or a `SUBS` if the service has no subscription. The
+        existing symbols of the service are left untouched.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        symbols: List[str]
+            The symbols to add.
+
+        fields: Union[Enum, List[Enum], List[str], List[int]] (optional, Default=None)
+            The fields of a new subscription, an existing
+            subscription keeps its fields, see `set_fields`.
+
+        ### Raises
+        ----
+        ValueError:
+            If the service is not subscribed and no fields are provided.
+
+        ### Returns
+        ----
+        Union[dict, None]:
+            The request that was sent, `None` if every symbol
+            was already subscribed.
+
+        ### Usage
+        ----
+            >>> await streaming_api_service.add_symbols(
+                    service='QUOTE',
+                    symbols=['NVDA', 'AMD']
+                )
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        subscription = self.subscriptions.get(service)
+        symbols = list(dict.fromkeys(symbols))
+
+        if subscription is None:
+
+            if fields is None:
+                raise ValueError(f'The {service} service is not subscribed, provide the fields.')
+
+            subscription = {'keys': set(), 'fields': normalize_fields(fields=fields)}
+            self.subscriptions[service] = subscription
+            self._update_decoder(service=service)
+            command = 'SUBS'
+
+        else:
+            symbols = [symbol for symbol in symbols if symbol not in subscription['keys']]
+            command = 'ADD'
+
+        if not symbols:
+            return None
+
+        subscription['keys'].update(symbols)
+
+        request = self._build_live_request(
+            service=service,
+            command=command,
+            keys=symbols,
+            fields=subscription['fields']
+        )
+
+        if command == 'SUBS':
+            subscription['requestid'] = request['requestid']
+
+        await self._send_live_request(request=request)
+
+        return request
+
+    async def remove_symbols(
+        self,
+        service: Union[str, Enum],
+        symbols: List[str]
+    ) -> Union[dict, None]:
+        """Removes symbols from a service on a running stream.
+
+        ### Overview
+        ----
+        Sends an `UNSUBS` with only the symbols that are subscribed,
+        the other symbols of the service keep streaming. The service
+        is no longer tracked once its last symbol is removed.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        symbols: List[str]
+            The symbols to remove.
+
+        ### Returns
+        ----
+        Union[dict, None]:
+            The request that was sent, `None` if none of the
+            symbols were subscribed.
+
+        ### Usage
+        ----
+            >>> await streaming_api_service.remove_symbols(
+                    service='QUOTE',
+                    symbols=['AMD']
+                )
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        subscription = self.subscriptions.get(service)
+
+        if subscription is None:
+            return None
+
+        symbols = [symbol for symbol in dict.fromkeys(symbols) if symbol in subscription['keys']]
+
+        if not symbols:
+            return None
+
+        subscription['keys'].difference_update(symbols)
+
+        if not subscription['keys']:
+            del self.subscriptions[service]
+
+        request = self._build_live_request(
+            service=service,
+            command='UNSUBS',
+            keys=symbols
+        )
+        await self._send_live_request(request=request)
+
+        return request
+
+    async def set_fields(
+        self,
+        service: Union[str, Enum],
+        fields: Union[Enum, List[Enum], List[str], List[int]]
+    ) -> Union[dict, None]:
+        """Changes the fields of a service on a running stream.
+
+        ### Overview
+        ----
+        Sends a `VIEW`, which changes the fields of every symbol of
+        the service without resubscribing them. The decoder of the
+        service is rebuilt for the new fields.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        fields: Union[Enum, List[Enum], List[str], List[int]]
+            The new fields of the service.
+
+        ### Raises
+        ----
+        ValueError:
+            If the service is not subscribed.
+
+        ### Returns
+        ----
+        Union[dict, None]:
+            The request that was sent, `None` if the fields
+            did not change.
+
+        ### Usage
+        ----
+            >>> await streaming_api_service.set_fields(
+                    service='QUOTE',
+                    fields=[LevelOneQuotes.BidPrice, LevelOneQuotes.AskPrice]
+                )
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        subscription = self.subscriptions.get(service)
+
+        if subscription is None:
+            raise ValueError(f'The {service} service is not subscribed.')
+
+        fields = normalize_fields(fields=fields)
+
+        if fields == subscription['fields']:
+            return None
+
+        subscription['fields'] = fields
+        self._update_decoder(service=service)
+
+        request = self._build_live_request(
+            service=service,
+            command='VIEW',
+            fields=fields
+        )
+        await self._send_live_request(request=request)
+
+        return request
@@ -0,0 +1,339 @@
+from enum import Enum
+from typing import List
+from typing import Union
+
+import numpy as np
+
+from td.utils.enums import Timesale
+from td.utils.enums import ChartEquity
+from td.utils.enums import ChartFutures
+from td.utils.enums import NewsHeadlines
+from td.utils.enums import LevelOneForex
+from td.utils.enums import LevelOneQuotes
+from td.utils.enums import LevelOneOptions
+from td.utils.enums import LevelOneFutures
+from td.utils.enums import LevelOneFuturesOptions
+
+
+# The field enum of each streaming service.
+SERVICE_FIELDS = {
+    'QUOTE': LevelOneQuotes,
+    'OPTION': LevelOneOptions,
+    'LEVELONE_FUTURES': LevelOneFutures,
+    'LEVELONE_FUTURES_OPTIONS': LevelOneFuturesOptions,
+    'LEVELONE_FOREX': LevelOneForex,
+    'NEWS_HEADLINE': NewsHeadlines,
+    'CHART_EQUITY': ChartEquity,
+    'CHART_FUTURES': ChartFutures,
+    'TIMESALE_EQUITY': Timesale,
+    'TIMESALE_FOREX': Timesale,
+    'TIMESALE_FUTURES': Timesale,
+    'TIMESALE_OPTIONS': Timesale
+}
+
+# Fields that are not floats, every other field is stored as a float.
+STRING_FIELDS = {
+    'Symbol', 'AskId', 'BidId', 'BidTick', 'ExchangeId', 'Description', 'LastId',
+    'ExchangeName', 'ExhangeName', 'SecurityStatus', 'DividendDate', 'ContractType',
+    'Underlying', 'Deliverables', 'UvExpirationType', 'Product', 'FuturePriceFormat',
+    'FutureTradingHours', 'FutureActiveSymbol', 'TradingHours', 'MarketMaker',
+    'HeadlineId', 'Status', 'Headline', 'StoryId', 'KeywordArray', 'StorySource'
+}
+
+BOOLEAN_FIELDS = {
+    'Marginable', 'Shortable', 'RegularMarketQuote', 'RegularMarketTrade',
+    'FutureIsTradable', 'FutureIsActive', 'IsTradable', 'IsHot'
+}
+
+INTEGER_FIELDS = {
+    'BidSize', 'AskSize', 'LastSize', 'TotalVolume', 'TradeTime', 'QuoteTime',
+    'QuoteDay', 'TradeDay', 'IslandVolume', 'IslandBidSize', 'IslandAskSize', 'Digits',
+    'RegularMarketLastSize', 'RegularMarketTradeTime', 'RegularMarketTradeDay',
+    'QuoteTimeInLong', 'TradeTimeInLong', 'RegularMarketTradeTimeInLong', 'OpenInterest',
+    'ExpirationYear', 'ExpirationMonth', 'ExpirationDay', 'DaysToExpiration',
+    'FutureExpirationDate', 'Volume', 'Sequence', 'Chart_Time', 'Chart_Day', 'ChartTime',
+    'LastSequence', 'ErrorCode', 'StoryDatetime', 'CountForKeyword'
+}
+
+
+def field_dtype(name: str) -> np.dtype:
+    """Returns the dtype a streaming field is stored as.
+
+    ### Parameters
+    ----
+    name : str
+        The name of the field in its enum, for example `BidPrice`.
+
+    ### Returns
+    ----
+    np.dtype:
+        `object` for strings, `bool`, `int64` or `float64`.
+    """
+
+    if name in STRING_FIELDS:
+        return np.dtype(object)
+
+    if name in BOOLEAN_FIELDS:
+        return np.dtype(np.bool_)
+
+    if name in INTEGER_FIELDS:
+        return np.dtype(np.int64)
+
+    return np.dtype(np.float64)
+
+
+def field_default(dtype: np.dtype) -> Union[float, int, bool, None]:
+    """Returns the value of a field that was not sent.
+
+    ### Parameters
+    ----
+    dtype : np.dtype
+        The dtype of the field, see `field_dtype`.
+
+    ### Returns
+    ----
+    Union[float, int, bool, None]:
+        `NaN` for floats, `None` for strings, `0` or `False` otherwise.
+    """
+
+    if dtype.kind == 'f':
+        return np.nan
+
+    if dtype.kind == 'O':
+        return None
+
+    return dtype.type(0).item()
+
+
+class StreamDecoder():
+
+    """
+    ### Overview
+    ----
+    Translates the numbered fields of a streaming service into named,
+    typed fields. The tables are built once from the service's field
+    enum, so decoding a record is one dictionary lookup per field.
+    `decode` returns dictionaries keyed by field name, `decode_into`
+    writes records straight into preallocated column arrays.
+
+    ### Usage
+    ----
+        >>> quote_decoder = StreamDecoder(service='QUOTE', fields=['1', '2', '3'])
+        >>> quote_decoder.decode({'key': 'MSFT', '1': 251.1, '2': 251.2})
+        {'Symbol': 'MSFT', 'BidPrice': 251.1, 'AskPrice': 251.2}
+        >>> quotes, present = quote_decoder.to_array(records)
+        >>> quotes['BidPrice'][present[:, quote_decoder.position('BidPrice')]]
+    """
+
+    def __init__(
+        self,
+        service: Union[str, Enum],
+        fields: Union[List[str], List[int]] = None
+    ) -> None:
+        """Initializes the `StreamDecoder` object.
+
+        ### Parameters
+        ----
+        service : Union[str, Enum]
+            The streaming service, for example `QUOTE` or
+            `TIMESALE_EQUITY`.
+
+        fields : Union[List[str], List[int]] (optional, Default=None)
+            The subscribed field numbers, they become the columns
+            of `to_array`. Defaults to every field of the service.
+
+        ### Raises
+        ----
+        ValueError:
+            If the service has no field enum.
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        if service not in SERVICE_FIELDS:
+            raise ValueError(f'The {service} service has no field table.')
+
+        self.service = service
+
+        members = [member for member in SERVICE_FIELDS[service] if member.name != 'All']
+
+        # The symbol comes back under `key`, not under field 0.
+        self.names = {str(member.value): member.name for member in members if member.value != 0}
+        self.names['key'] = 'Symbol'
+
+        if fields is None:
+            fields = [str(member.value) for member in members]
+
+        numbers = sorted({int(field) for field in fields if str(field).isdigit()} - {0})
+
+        self.fields = ['key'] + [str(number) for number in numbers if str(number) in self.names]
+        self.columns = [self.names[field] for field in self.fields]
+        self.dtypes = {name: field_dtype(name) for name in self.columns}
+
+        self._positions = {field: position for position, field in enumerate(self.fields)}
+        self._defaults = [field_default(dtype=field_dtype(name)) for name in self.columns]
+
+    def position(self, name: str) -> int:
+        """Returns the column position of a named field.
+
+        ### Parameters
+        ----
+        name : str
+            The name of the field, for example `BidPrice`.
+
+        ### Returns
+        ----
+        int:
+            The position of the field in `columns`.
+        """
+
+        return self.columns.index(name)
+
+    def decode(self, record: dict) -> dict:
+        """Renames the fields of a record.
+
+        ### Parameters
+        ----
+        record : dict
+            A content item of a streaming message.
+
+        ### Returns
+        ----
+        dict:
+            The record keyed by field name, keys without a name
+            such as `delayed` are kept as they are.
+        """
+
+        names = self.names
+
+        return {names.get(key, key): value for key, value in record.items()}
+
+    def decode_many(self, records: List[dict]) -> List[dict]:
+        """Renames the fields of many records.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The content items of a streaming message.
+
+        ### Returns
+        ----
+        List[dict]:
+            The records keyed by field name.
+        """
+
+        names = self.names
+
+        return [
+            {names.get(key, key): value for key, value in record.items()}
+            for record in records
+        ]
+
+    def allocate(self, size: int) -> tuple:
+        """Allocates the arrays `decode_into` writes to.
+
+        ### Parameters
+        ----
+        size : int
+            The number of rows.
+
+        ### Returns
+        ----
+        tuple:
+            One array per column keyed by field name, and the
+            `(size, columns)` boolean array of the fields that were sent.
+        """
+
+        out = {
+            name: np.full(size, default, dtype=self.dtypes[name])
+            for name, default in zip(self.columns, self._defaults)
+        }
+
+        # Column major, so each field's mask is contiguous.
+        return out, np.zeros((size, len(self.columns)), dtype=bool, order='F')
+
+    def decode_into(
+        self,
+        records: List[dict],
+        out: dict,
+        present: np.ndarray = None,
+        start: int = 0
+    ) -> int:
+        """Writes records into preallocated arrays.
+
+        ### Overview
+        ----
+        The level one services only send the fields that changed, so
+        the rows of fields that were not sent keep their default and
+        are left `False` in `present`.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The content items of a streaming message.
+
+        out : dict
+            The column arrays from `allocate`.
+
+        present : np.ndarray (optional, Default=None)
+            The mask from `allocate`, updated when provided.
+
+        start : int (optional, Default=0)
+            The first row to write.
+
+        ### Returns
+        ----
+        int:
+            The number of rows written.
+        """
+
+        count = len(records)
+        end = start + count
+        positions = self._positions
+        sent_rows = [[] for _ in self.columns]
+        sent_values = [[] for _ in self.columns]
+
+        # Only the fields that were sent are gathered, then each
+        # column is handed to NumPy once.
+        for row, record in enumerate(records):
+            for key, value in record.items():
+                position = positions.get(key)
+                if position is not None:
+                    sent_rows[position].append(row)
+                    sent_values[position].append(value)
+
+        for position, name in enumerate(self.columns):
+
+            column = out[name]
+            column[start:end] = self._defaults[position]
+            rows = np.asarray(sent_rows[position], dtype=np.intp) + start
+
+            if len(rows):
+                column[rows] = sent_values[position]
+
+            if present is not None:
+                present[start:end, position] = False
+                present[rows, position] = True
+
+        return count
+
+    def to_array(self, records: List[dict]) -> tuple:
+        """Decodes records into new arrays.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The content items of a streaming message.
+
+        ### Returns
+        ----
+        tuple:
+            The column arrays and the mask of the fields
+            that were sent, see `allocate`.
+        """
+
+        out, present = self.allocate(size=len(records))
+        self.decode_into(records=records, out=out, present=present)
+
+        return out, present
@@ -0,0 +1,326 @@
+import threading
+
+from enum import Enum
+from typing import List
+from typing import Union
+
+import numpy as np
+
+from td.utils.quote_frame import QuoteFrame
+from td.streaming.decoders import StreamDecoder
+from td.streaming.decoders import field_default
+
+
+class LastValueCache():
+
+    """
+    ### Overview
+    ----
+    Keeps the latest value of every field for every symbol of a level
+    one service. The level one feeds only send the fields that changed,
+    so each update is written in place into a fixed slot of the row (the
+    symbol id) assigned to the symbol the first time it is seen. The rows
+    live in one NumPy block per dtype, so reading a full quote is a row
+    lookup per block, and `snapshot` copies every block under the same
+    lock the updates take, so a snapshot never holds half of a message.
+    The cache can be shared by threads and asyncio tasks.
+
+    ### Usage
+    ----
+        >>> last_value_cache = LastValueCache(service='QUOTE')
+        >>> last_value_cache.attach(streaming_api_client=streaming_api_service)
+        >>> async for record in streaming_api_service.stream():
+                ...
+        >>> last_value_cache.get('MSFT')['BidPrice']
+        >>> quote_frame = last_value_cache.snapshot()
+        >>> quote_frame.symbols[quote_frame['NetChange'] > 0]
+    """
+
+    def __init__(
+        self,
+        service: Union[str, Enum] = 'QUOTE',
+        fields: Union[List[str], List[int]] = None,
+        capacity: int = 1024
+    ) -> None:
+        """Initializes the `LastValueCache` object.
+
+        ### Parameters
+        ----
+        service : Union[str, Enum] (optional, Default='QUOTE')
+            The level one service that feeds the cache, for example
+            `QUOTE`, `OPTION` or `LEVELONE_FUTURES`.
+
+        fields : Union[List[str], List[int]] (optional, Default=None)
+            The field numbers to keep, defaults to every
+            field of the service.
+
+        capacity : int (optional, Default=1024)
+            The number of symbols the columns hold before
+            they are grown.
+        """
+
+        decoder = StreamDecoder(service=service, fields=fields)
+
+        self.service = decoder.service
+
+        # The symbol lives in `symbols`, every other field gets a slot.
+        self.fields = decoder.fields[1:]
+        self.names = decoder.columns[1:]
+
+        # One row-major block per dtype, a symbol's fields sit side by side.
+        self._dtypes = []
+        self._block_names = []
+        self._slots = {}
+        self._name_slots = {}
+
+        for field, name in zip(self.fields, self.names):
+
+            dtype = decoder.dtypes[name]
+
+            if dtype not in self._dtypes:
+                self._dtypes.append(dtype)
+                self._block_names.append([])
+
+            block = self._dtypes.index(dtype)
+            self._slots[field] = (block, len(self._block_names[block]))
+            self._name_slots[name] = self._slots[field]
+            self._block_names[block].append(name)
+
+        self._lock = threading.Lock()
+        self._capacity = max(capacity, 1)
+        self._blocks = [self._allocate(block=block, size=self._capacity) for block in range(len(self._dtypes))]
+        self._timestamps = np.zeros(self._capacity, dtype=np.int64)
+
+        self.symbols = []
+        self.index = {}
+        self.updates = 0
+
+    def _allocate(self, block: int, size: int) -> np.ndarray:
+        """Allocates a block of rows filled with the defaults of its dtype."""
+
+        dtype = self._dtypes[block]
+
+        return np.full((size, len(self._block_names[block])), field_default(dtype=dtype), dtype=dtype)
+
+    def _grow(self) -> None:
+        """Doubles the blocks, the lock has to be held by the caller."""
+
+        capacity = self._capacity * 2
+
+        for position, block in enumerate(self._blocks):
+            grown = self._allocate(block=position, size=capacity)
+            grown[:self._capacity] = block
+            self._blocks[position] = grown
+
+        timestamps = np.zeros(capacity, dtype=np.int64)
+        timestamps[:self._capacity] = self._timestamps
+
+        self._timestamps = timestamps
+        self._capacity = capacity
+
+    def _symbol_id(self, symbol: str) -> int:
+        """Returns the row of a symbol, assigning one to new symbols,
+        the lock has to be held by the caller."""
+
+        symbol_id = self.index.get(symbol)
+
+        if symbol_id is None:
+
+            symbol_id = len(self.symbols)
+
+            if symbol_id == self._capacity:
+                self._grow()
+
+            self.index[symbol] = symbol_id
+            self.symbols.append(symbol)
+
+        return symbol_id
+
+    def update(self, content: List[dict], timestamp: int = 0) -> None:
+        """Applies partial updates in place.
+
+        ### Parameters
+        ----
+        content : List[dict]
+            The content items of a streaming message, keyed by
+            field number as they come off the socket.
+
+        timestamp : int (optional, Default=0)
+            The timestamp of the message in milliseconds.
+        """
+
+        slots = self._slots
+
+        with self._lock:
+
+            for item in content:
+
+                symbol_id = self._symbol_id(symbol=item['key'])
+                blocks = self._blocks
+
+                for key, value in item.items():
+                    slot = slots.get(key)
+                    if slot is not None:
+                        blocks[slot[0]][symbol_id, slot[1]] = value
+
+                self._timestamps[symbol_id] = timestamp
+
+            self.updates += len(content)
+
+    def on_message(self, entry: dict) -> None:
+        """Updates the cache from a streaming entry, use it as a handler.
+
+        ### Parameters
+        ----
+        entry : dict
+            A `data` entry of a streaming message.
+        """
+
+        self.update(content=entry.get('content') or (), timestamp=entry.get('timestamp') or 0)
+
+    def attach(self, streaming_api_client: object) -> None:
+        """Feeds the cache from a streaming client.
+
+        ### Overview
+        ----
+        The cache is registered as a handler of the service, so it
+        is updated on the event loop as every message is received,
+        whether it is read through `stream` or a merged sharded
+        stream.
+
+        ### Parameters
+        ----
+        streaming_api_client : Union[StreamingApiClient, ShardedStreamingClient]
+            The client streaming the service of the cache.
+        """
+
+        streaming_api_client.add_handler(service=self.service, handler=self.on_message)
+
+    def get(self, symbol: str) -> Union[dict, None]:
+        """Returns the current quote of a symbol.
+
+        ### Parameters
+        ----
+        symbol : str
+            The symbol to look up.
+
+        ### Returns
+        ----
+        Union[dict, None]:
+            The latest value of every field, `None` if the
+            symbol has not been streamed.
+        """
+
+        with self._lock:
+
+            symbol_id = self.index.get(symbol)
+
+            if symbol_id is None:
+                return None
+
+            quote = {}
+
+            for names, block in zip(self._block_names, self._blocks):
+                quote.update(zip(names, block[symbol_id].tolist()))
+
+            quote['Symbol'] = symbol
+            quote['timestamp'] = int(self._timestamps[symbol_id])
+
+        return quote
+
+    def get_value(self, symbol: str, name: str) -> Union[float, int, bool, str, None]:
+        """Returns the latest value of one field of a symbol.
+
+        ### Parameters
+        ----
+        symbol : str
+            The symbol to look up.
+
+        name : str
+            The name of the field, for example `BidPrice`.
+
+        ### Returns
+        ----
+        Union[float, int, bool, str, None]:
+            The value, `None` if the symbol has not been streamed.
+
+        ### Raises
+        ----
+        ValueError:
+            If the cache does not keep the field.
+        """
+
+        if name not in self._name_slots:
+            raise ValueError(f'The {self.service} cache does not keep the field {name}.')
+
+        block, position = self._name_slots[name]
+
+        with self._lock:
+
+            symbol_id = self.index.get(symbol)
+
+            if symbol_id is None:
+                return None
+
+            return self._blocks[block][symbol_id].item(position)
+
+    def snapshot(self, symbols: List[str] = None) -> QuoteFrame:
+        """Copies the current values of every symbol at once.
+
+        ### Parameters
+        ----
+        symbols : List[str] (optional, Default=None)
+            The symbols to copy, defaults to every symbol. Symbols
+            that have not been streamed are left out.
+
+        ### Returns
+        ----
+        QuoteFrame:
+            The columns keyed by field name, plus the `timestamp`
+            of each symbol's last update.
+        """
+
+        with self._lock:
+
+            if symbols is None:
+                rows = slice(0, len(self.symbols))
+                selected = list(self.symbols)
+            else:
+                selected = [symbol for symbol in symbols if symbol in self.index]
+                rows = np.array([self.index[symbol] for symbol in selected], dtype=np.intp)
+
+            blocks = [block[rows].copy() for block in self._blocks]
+            timestamps = self._timestamps[rows].copy()
+
+        columns = {}
+
+        for names, block in zip(self._block_names, blocks):
+            for position, name in enumerate(names):
+                columns[name] = block[:, position]
+
+        # Keep the field order of the subscription.
+        columns = {name: columns[name] for name in self.names}
+        columns['timestamp'] = timestamps
+
+        return QuoteFrame(symbols=np.array(selected, dtype=str), columns=columns)
+
+    def clear(self) -> None:
+        """Forgets every symbol and value."""
+
+        with self._lock:
+
+            for position, block in enumerate(self._blocks):
+                block[:] = field_default(dtype=self._dtypes[position])
+
+            self._timestamps[:] = 0
+            self.symbols = []
+            self.index = {}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __repr__(self) -> str:
+        return f"LastValueCache(service={self.service}, symbols={len(self)}, fields={len(self.names)})"
@@ -0,0 +1,200 @@
+import json
+
+from typing import List
+from typing import Union
+from dataclasses import dataclass
+
+
+@dataclass
+class StreamRecord():
+
+    """
+    ### Overview
+    ----
+    A single record of a streaming message. Every item in the
+    `content` of a `data` or `snapshot` entry becomes one record,
+    so a message with quotes for five symbols yields five records.
+    `response` and `notify` entries yield one record each, and a
+    reconnect yields a `gap` record whose fields hold the
+    `disconnected` and `reconnected` timestamps.
+
+    ### Parameters
+    ----
+    kind : str
+        The section of the message, one of `data`, `snapshot`,
+        `response`, `notify` or `gap`.
+
+    service : str
+        The service of the record, for example `QUOTE` or
+        `TIMESALE_EQUITY`. Heartbeats use `HEARTBEAT`.
+
+    command : str
+        The command of the entry, for example `SUBS`.
+
+    timestamp : int
+        The timestamp of the entry in milliseconds.
+
+    key : str
+        The symbol or key of the record, `None` for responses
+        and notifications.
+
+    fields : dict
+        The fields of the record, keyed by field number for
+        `data` records, or by field name once decoded.
+    """
+
+    kind: str
+    service: str
+    command: str
+    timestamp: int
+    key: Union[str, None]
+    fields: dict
+
+
+def split_message(
+    message: dict,
+    include_responses: bool = False,
+    decoders: dict = None
+) -> List[StreamRecord]:
+    """Splits a decoded streaming message into records.
+
+    ### Parameters
+    ----
+    message : dict
+        The decoded streaming message.
+
+    include_responses : bool (optional, Default=False)
+        If `True` the `response` and `notify` entries are
+        returned as well, otherwise only `data` and `snapshot`.
+
+    decoders : dict (optional, Default=None)
+        A `StreamDecoder` per service, the fields of the services
+        with a decoder are keyed by field name.
+
+    ### Returns
+    ----
+    List[StreamRecord]:
+        The records in the order they appear in the message.
+
+    ### Usage
+    ----
+        >>> message = await streaming_api_service.start_pipeline()
+        >>> for record in split_message(message=message):
+                latest[record.key] = record.fields
+    """
+
+    records = []
+
+    for kind in ('data', 'snapshot'):
+        for entry in message.get(kind, ()):
+
+            service = entry.get('service')
+            command = entry.get('command')
+            timestamp = entry.get('timestamp')
+            content = entry.get('content') or ()
+
+            if isinstance(content, dict):
+                content = (content,)
+
+            decoder = decoders.get(service) if decoders else None
+
+            for item in content:
+
+                if not isinstance(item, dict):
+                    key = None
+                else:
+                    key = item.get('key')
+                    if decoder is not None:
+                        item = decoder.decode(record=item)
+
+                records.append(
+                    StreamRecord(
+                        kind=kind,
+                        service=service,
+                        command=command,
+                        timestamp=timestamp,
+                        key=key,
+                        fields=item
+                    )
+                )
+
+    # Outages are always passed on, state built from the stream is stale.
+    for entry in message.get('gap', ()):
+        records.append(
+            StreamRecord(
+                kind='gap',
+                service='GAP',
+                command=None,
+                timestamp=entry.get('reconnected'),
+                key=None,
+                fields=entry
+            )
+        )
+
+    if not include_responses:
+        return records
+
+    for entry in message.get('response', ()):
+        records.append(
+            StreamRecord(
+                kind='response',
+                service=entry.get('service'),
+                command=entry.get('command'),
+                timestamp=entry.get('timestamp'),
+                key=None,
+                fields=entry.get('content') or {}
+            )
+        )
+
+    for entry in message.get('notify', ()):
+
+        # Heartbeats only carry their timestamp.
+        if 'heartbeat' in entry:
+            records.append(
+                StreamRecord(
+                    kind='notify',
+                    service='HEARTBEAT',
+                    command=None,
+                    timestamp=int(entry['heartbeat']),
+                    key=None,
+                    fields=entry
+                )
+            )
+        else:
+            records.append(
+                StreamRecord(
+                    kind='notify',
+                    service=entry.get('service'),
+                    command=entry.get('command'),
+                    timestamp=entry.get('timestamp'),
+                    key=None,
+                    fields=entry.get('content') or {}
+                )
+            )
+
+    return records
+
+
+def parse_message(message: str) -> dict:
+    """Parses a streaming message.
+
+    ### Parameters
+    ----
+    message: str
+        The JSON string received from the socket.
+
+    ### Returns
+    ----
+    dict:
+        The decoded message.
+    """
+
+    try:
+        message_decoded = json.loads(message)
+    except TypeError:
+        message = message.encode(
+            'utf-8'
+        ).replace(b'\xef\xbf\xbd', bytes('"None"', 'utf-8')).decode('utf-8')
+        message_decoded = json.loads(message)
+
+    return message_decoded
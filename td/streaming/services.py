@@ -60,6 +60,19 @@ class StreamingServices():
 
         return request
 
+    def _add_request(self, request: dict) -> None:
+        """Queues a service request and tracks its subscription.
+
+        ### Parameters
+        ----
+        request: dict
+            The service request, `SUBS` requests become the tracked
+            subscription of their service, see `StreamingApiClient.subscriptions`.
+        """
+
+        self.streaming_api_client.data_requests['requests'].append(request)
+        self.streaming_api_client._track_request(request=request)
+
     def quality_of_service(self, qos_level: Union[str, Enum]) -> None:
         """Quality of Service Subscription.
 
@@ -89,7 +102,7 @@ class StreamingServices():
         request['service'] = 'ADMIN'
         request['command'] = 'QOS'
         request['parameters']['qoslevel'] = qos_level
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_one_quotes(
         self,
@@ -122,7 +135,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -137,7 +150,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_one_options(
         self,
@@ -170,7 +183,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -185,7 +198,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_one_futures(
         self,
@@ -218,7 +231,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -233,7 +246,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_one_futures_options(
         self,
@@ -267,7 +280,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -282,7 +295,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_one_forex(
         self,
@@ -315,7 +328,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -330,7 +343,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def account_activity(self) -> None:
         """
@@ -354,7 +367,7 @@ class StreamingServices():
         request['parameters']['keys'] = keys
         request['parameters']['fields'] = '0,1,2,3'
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def news_headline(
         self,
@@ -387,7 +400,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -402,7 +415,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def chart(
         self,
@@ -449,7 +462,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -463,7 +476,7 @@ class StreamingServices():
         request['command'] = 'SUBS'
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def timesale(
         self,
@@ -505,7 +518,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -520,7 +533,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def actives(
         self,
@@ -571,7 +584,7 @@ class StreamingServices():
         request['command'] = 'SUBS'
         request['parameters']['keys'] = venue + '-' + duration
         request['parameters']['fields'] = '1'
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def chart_history_futures(
         self,
@@ -660,7 +673,7 @@ class StreamingServices():
         del request['parameters']['fields']
 
         request['requestid'] = str(request['requestid'])
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_two_quotes(
         self,
@@ -693,7 +706,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -708,7 +721,7 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
 
     def level_two_options(
         self,
@@ -741,7 +754,7 @@ class StreamingServices():
             new_fields = []
             for field in fields:
                 if isinstance(field, int):
-                    field = str(int)
+                    field = str(field)
                 elif isinstance(field, Enum):
                     field = str(field.value)
                 new_fields.append(field)
@@ -756,4 +769,31 @@ class StreamingServices():
         request['parameters']['keys'] = ','.join(symbols)
         request['parameters']['fields'] = ','.join(new_fields)
 
-        self.streaming_api_client.data_requests['requests'].append(request)
+        self._add_request(request=request)
+
+
+def normalize_fields(fields: Union[Enum, List[Enum], List[str], List[int]]) -> List[str]:
+    """Converts the fields of a request to their numbers.
+
+    ### Parameters
+    ----
+    fields: Union[Enum, List[Enum], List[str], List[int]]
+        An enum holding a list, such as `LevelOneQuotes.All`, or a
+        list of enum members, strings or integers.
+
+    ### Returns
+    ----
+    List[str]:
+        The field numbers as strings.
+    """
+
+    if isinstance(fields, Enum):
+        fields = fields.value
+
+    if isinstance(fields, str):
+        fields = fields.split(',')
+
+    return [
+        str(field.value) if isinstance(field, Enum) else str(field)
+        for field in fields
+    ]
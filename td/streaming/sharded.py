@@ -0,0 +1,371 @@
+import zlib
+import asyncio
+import logging
+
+from enum import Enum
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import AsyncIterator
+
+from td.streaming.client import StreamingApiClient
+from td.streaming.records import StreamRecord
+from td.streaming.services import normalize_fields
+
+
+class ShardedStreamingClient():
+
+    """
+    ### Overview
+    ----
+    Spreads the subscriptions of a large symbol universe over several
+    streaming connections. Every symbol is assigned to a shard by a
+    stable hash, so each shard streams its slice of every service and
+    adding or removing symbols only touches the shard that owns them.
+    The shards are merged into one `async for` stream.
+
+    Keep the number of shards within the number of streaming
+    connections the account is allowed.
+
+    ### Usage
+    ----
+        >>> sharded_streaming_client = td_client.sharded_streaming_client(shards=2)
+        >>> await sharded_streaming_client.add_symbols(
+                service='QUOTE',
+                symbols=universe,
+                fields=LevelOneQuotes.All
+            )
+        >>> async for record in sharded_streaming_client.stream():
+                latest[record.key] = record.fields
+    """
+
+    def __init__(self, streaming_api_clients: List[StreamingApiClient]) -> None:
+        """Initializes the `ShardedStreamingClient` object.
+
+        ### Parameters
+        ----
+        streaming_api_clients : List[StreamingApiClient]
+            One client per connection, the clients should not
+            be connected yet.
+
+        ### Raises
+        ----
+        ValueError:
+            If no clients are provided.
+        """
+
+        if not streaming_api_clients:
+            raise ValueError('At least one streaming client is required.')
+
+        self.shards = list(streaming_api_clients)
+
+    def shard_for(self, symbol: str) -> int:
+        """Returns the shard that owns a symbol.
+
+        ### Parameters
+        ----
+        symbol : str
+            The symbol to look up.
+
+        ### Returns
+        ----
+        int:
+            The position of the shard in `shards`.
+        """
+
+        return zlib.crc32(symbol.encode('utf-8')) % len(self.shards)
+
+    def _split_symbols(self, symbols: List[str]) -> dict:
+        """Groups symbols by the shard that owns them."""
+
+        groups = {}
+
+        for symbol in symbols:
+            groups.setdefault(self.shard_for(symbol=symbol), []).append(symbol)
+
+        return groups
+
+    def _fields_of(self, service: str) -> Union[List[str], None]:
+        """Returns the fields of a service subscribed on any shard."""
+
+        for shard in self.shards:
+            if service in shard.subscriptions:
+                return shard.subscriptions[service]['fields']
+
+        return None
+
+    @property
+    def subscriptions(self) -> dict:
+        """Returns the effective subscriptions across the shards.
+
+        ### Returns
+        ----
+        dict:
+            The keys of every shard merged per service,
+            along with the fields of the service.
+        """
+
+        subscriptions = {}
+
+        for shard in self.shards:
+            for service, subscription in shard.subscriptions.items():
+                merged = subscriptions.setdefault(
+                    service,
+                    {'keys': set(), 'fields': subscription['fields']}
+                )
+                merged['keys'] |= subscription['keys']
+
+        return subscriptions
+
+    @property
+    def stats(self) -> dict:
+        """Returns the counters of the shards.
+
+        ### Returns
+        ----
+        dict:
+            The `symbols` per shard, and the `reconnect_count` and
+            `dropped_messages` summed over the shards.
+        """
+
+        return {
+            'symbols': [
+                sum(len(subscription['keys']) for subscription in shard.subscriptions.values())
+                for shard in self.shards
+            ],
+            'reconnect_count': sum(shard.reconnect_count for shard in self.shards),
+            'dropped_messages': sum(shard.dropped_messages for shard in self.shards)
+        }
+
+    def add_handler(self, service: Union[str, Enum], handler: Callable[[dict], None]) -> None:
+        """Registers a callback on every shard, see `StreamingApiClient.add_handler`."""
+
+        for shard in self.shards:
+            shard.add_handler(service=service, handler=handler)
+
+    async def add_symbols(
+        self,
+        service: Union[str, Enum],
+        symbols: List[str],
+        fields: Union[Enum, List[Enum], List[str], List[int]] = None
+    ) -> List[dict]:
+        """Adds symbols to the shards that own them.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        symbols: List[str]
+            The symbols to add.
+
+        fields: Union[Enum, List[Enum], List[str], List[int]] (optional, Default=None)
+            The fields of the service, required the first
+            time the service is subscribed.
+
+        ### Returns
+        ----
+        List[dict]:
+            The requests that were sent, or queued if the
+            shards are not connected yet.
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        if fields is None:
+            fields = self._fields_of(service=service)
+        else:
+            fields = normalize_fields(fields=fields)
+
+        requests = []
+
+        for position, shard_symbols in self._split_symbols(symbols=symbols).items():
+
+            request = await self.shards[position].add_symbols(
+                service=service,
+                symbols=shard_symbols,
+                fields=fields
+            )
+
+            if request is not None:
+                requests.append(request)
+
+        return requests
+
+    async def remove_symbols(self, service: Union[str, Enum], symbols: List[str]) -> List[dict]:
+        """Removes symbols from the shards that own them.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        symbols: List[str]
+            The symbols to remove.
+
+        ### Returns
+        ----
+        List[dict]:
+            The requests that were sent.
+        """
+
+        requests = []
+
+        for position, shard_symbols in self._split_symbols(symbols=symbols).items():
+
+            request = await self.shards[position].remove_symbols(
+                service=service,
+                symbols=shard_symbols
+            )
+
+            if request is not None:
+                requests.append(request)
+
+        return requests
+
+    async def set_fields(
+        self,
+        service: Union[str, Enum],
+        fields: Union[Enum, List[Enum], List[str], List[int]]
+    ) -> List[dict]:
+        """Changes the fields of a service on every shard streaming it.
+
+        ### Parameters
+        ----
+        service: Union[str, Enum]
+            The name of the service, for example `QUOTE`.
+
+        fields: Union[Enum, List[Enum], List[str], List[int]]
+            The new fields of the service.
+
+        ### Returns
+        ----
+        List[dict]:
+            The requests that were sent.
+        """
+
+        if isinstance(service, Enum):
+            service = service.value
+
+        requests = []
+
+        for shard in self.shards:
+
+            if service not in shard.subscriptions:
+                continue
+
+            request = await shard.set_fields(service=service, fields=fields)
+
+            if request is not None:
+                requests.append(request)
+
+        return requests
+
+    async def _pump_records(
+        self,
+        position: int,
+        merged: asyncio.Queue,
+        queue_size: int,
+        block: bool,
+        include_responses: bool,
+        decode: bool
+    ) -> None:
+        """Moves the records of one shard onto the merged queue."""
+
+        try:
+            async for record in self.shards[position].stream(
+                queue_size=queue_size,
+                block=block,
+                include_responses=include_responses,
+                decode=decode
+            ):
+                if record.kind == 'gap':
+                    record.fields = dict(record.fields, shard=position)
+                await merged.put(record)
+        except Exception:
+            logging.exception("Streaming shard %s failed.", position)
+
+        await merged.put(None)
+
+    async def stream(
+        self,
+        queue_size: int = 1000,
+        block: bool = False,
+        include_responses: bool = False,
+        decode: bool = True
+    ) -> AsyncIterator[StreamRecord]:
+        """Yields the records of every shard as they arrive.
+
+        ### Overview
+        ----
+        Each shard keeps its own reader and bounded queue, see
+        `StreamingApiClient.stream`, and the records are merged in
+        arrival order. Gap records carry the `shard` they came from.
+        The iteration ends once every shard has closed for good.
+
+        ### Parameters
+        ----
+        queue_size: int (optional, Default=1000)
+            The number of messages each shard's queue holds, also
+            the number of records the merged queue holds.
+
+        block: bool (optional, Default=False)
+            If `True` the readers wait for the consumer instead
+            of dropping messages.
+
+        include_responses: bool (optional, Default=False)
+            If `True` the `response` and `notify` entries are
+            yielded as well.
+
+        decode: bool (optional, Default=True)
+            If `True` the fields are keyed by name.
+
+        ### Returns
+        ----
+        AsyncIterator[StreamRecord]:
+            The records of every shard.
+        """
+
+        merged = asyncio.Queue(maxsize=queue_size)
+        tasks = [
+            asyncio.ensure_future(
+                self._pump_records(
+                    position=position,
+                    merged=merged,
+                    queue_size=queue_size,
+                    block=block,
+                    include_responses=include_responses,
+                    decode=decode
+                )
+            )
+            for position in range(len(self.shards))
+        ]
+
+        running = len(tasks)
+
+        try:
+            while running:
+
+                record = await merged.get()
+
+                if record is None:
+                    running -= 1
+                    continue
+
+                yield record
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __aiter__(self) -> AsyncIterator[StreamRecord]:
+        return self.stream()
+
+    async def close(self) -> None:
+        """Closes every shard's connection, they are not reconnected."""
+
+        for shard in self.shards:
+            await shard.close_connection()
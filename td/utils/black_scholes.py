@@ -0,0 +1,460 @@
+from typing import Union
+
+import numpy as np
+
+from td.utils.option_chain_frame import CALL
+from td.utils.option_chain_frame import OptionChainFrame
+
+
+# Keeps expiring contracts and zero volatility away from a division by zero.
+MINIMUM_TIME = 1e-8
+MINIMUM_VOLATILITY = 1e-8
+
+DAYS_PER_YEAR = 365.0
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """The standard normal probability density function."""
+
+    return np.exp(-0.5 * np.square(x)) / np.sqrt(2.0 * np.pi)
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """The standard normal cumulative distribution function.
+
+    ### Overview
+    ----
+    Uses Hart's double precision rational approximation as given
+    by West, accurate to about 1e-14, so the engine only needs NumPy.
+
+    ### Parameters
+    ----
+    x : np.ndarray
+        The points to evaluate.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The probability of a standard normal being below `x`.
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    x_abs = np.abs(x)
+    exponential = np.exp(-0.5 * np.square(x_abs))
+
+    # Rational approximation close to the mean.
+    numerator = 3.52624965998911e-02 * x_abs + 0.700383064443688
+    for coefficient in (6.37396220353165, 33.912866078383, 112.079291497871,
+                        221.213596169931, 220.206867912376):
+        numerator = numerator * x_abs + coefficient
+
+    denominator = 8.83883476483184e-02 * x_abs + 1.75566716318264
+    for coefficient in (16.064177579207, 86.7807322029461, 296.564248779674,
+                        637.333633378831, 793.826512519948, 440.413735824752):
+        denominator = denominator * x_abs + coefficient
+
+    # Continued fraction in the tails.
+    fraction = x_abs + 0.65
+    for coefficient in (4.0, 3.0, 2.0, 1.0):
+        fraction = x_abs + coefficient / fraction
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail = np.where(
+            x_abs < 7.07106781186547,
+            exponential * numerator / denominator,
+            exponential / fraction / 2.506628274631
+        )
+
+    tail = np.where(x_abs > 37.0, 0.0, tail)
+
+    return np.where(x > 0, 1.0 - tail, tail)
+
+
+def black_scholes(
+    is_call: np.ndarray,
+    underlying_price: np.ndarray,
+    strike_price: np.ndarray,
+    time_to_expiration: np.ndarray,
+    volatility: np.ndarray,
+    interest_rate: np.ndarray,
+    dividend_yield: np.ndarray = 0.0
+) -> dict:
+    """Prices European options and their greeks with Black-Scholes-Merton.
+
+    ### Overview
+    ----
+    Every argument can be a scalar or an array, the arguments are
+    broadcast against each other, so a whole chain can be repriced
+    under many scenarios in one call by giving the scenarios their
+    own axis.
+
+    ### Parameters
+    ----
+    is_call : np.ndarray
+        `True` for calls, `False` for puts.
+
+    underlying_price : np.ndarray
+        The price of the underlying.
+
+    strike_price : np.ndarray
+        The strike of each contract.
+
+    time_to_expiration : np.ndarray
+        The time left in years.
+
+    volatility : np.ndarray
+        The annualized volatility as a decimal, `0.25` for 25%.
+
+    interest_rate : np.ndarray
+        The continuously compounded risk free rate as a decimal.
+
+    dividend_yield : np.ndarray (optional, Default=0.0)
+        The continuous dividend yield as a decimal.
+
+    ### Returns
+    ----
+    dict:
+        The `price`, `delta`, `gamma`, `theta`, `vega` and `rho` arrays.
+        Like the Option Chain response, `theta` is per calendar day while
+        `vega` and `rho` are per percentage point.
+
+    ### Usage
+    ----
+        >>> scenarios = np.linspace(200.0, 300.0, 101)[:, np.newaxis]
+        >>> values = black_scholes(
+                is_call=True,
+                underlying_price=scenarios,
+                strike_price=np.array([240.0, 250.0, 260.0]),
+                time_to_expiration=30 / 365,
+                volatility=0.25,
+                interest_rate=0.01
+            )
+        >>> values['delta'].shape
+        (101, 3)
+    """
+
+    is_call = np.asarray(is_call, dtype=bool)
+    spot = np.asarray(underlying_price, dtype=np.float64)
+    strike = np.asarray(strike_price, dtype=np.float64)
+    time = np.maximum(np.asarray(time_to_expiration, dtype=np.float64), MINIMUM_TIME)
+    sigma = np.maximum(np.asarray(volatility, dtype=np.float64), MINIMUM_VOLATILITY)
+    rate = np.asarray(interest_rate, dtype=np.float64)
+    dividend = np.asarray(dividend_yield, dtype=np.float64)
+
+    sqrt_time = np.sqrt(time)
+    sigma_sqrt_time = sigma * sqrt_time
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (np.log(spot / strike) + (rate - dividend + 0.5 * sigma * sigma) * time) / sigma_sqrt_time
+    d2 = d1 - sigma_sqrt_time
+
+    dividend_discount = np.exp(-dividend * time)
+    rate_discount = np.exp(-rate * time)
+    density = norm_pdf(d1)
+
+    # Flip the sign of d1 and d2 for puts, N(-d) = 1 - N(d).
+    sign = np.where(is_call, 1.0, -1.0)
+    cdf_d1 = norm_cdf(sign * d1)
+    cdf_d2 = norm_cdf(sign * d2)
+
+    price = sign * (spot * dividend_discount * cdf_d1 - strike * rate_discount * cdf_d2)
+    delta = sign * dividend_discount * cdf_d1
+    gamma = dividend_discount * density / (spot * sigma_sqrt_time)
+    vega = spot * dividend_discount * density * sqrt_time
+    theta = (
+        -spot * dividend_discount * density * sigma / (2.0 * sqrt_time)
+        - sign * rate * strike * rate_discount * cdf_d2
+        + sign * dividend * spot * dividend_discount * cdf_d1
+    )
+    rho = sign * strike * time * rate_discount * cdf_d2
+
+    return {
+        'price': price,
+        'delta': delta,
+        'gamma': gamma,
+        'theta': theta / DAYS_PER_YEAR,
+        'vega': vega / 100.0,
+        'rho': rho / 100.0
+    }
+
+
+def implied_volatility(
+    option_price: np.ndarray,
+    is_call: np.ndarray,
+    underlying_price: np.ndarray,
+    strike_price: np.ndarray,
+    time_to_expiration: np.ndarray,
+    interest_rate: np.ndarray,
+    dividend_yield: np.ndarray = 0.0,
+    lower_bound: float = 1e-4,
+    upper_bound: float = 5.0,
+    tolerance: float = 1e-8,
+    max_iterations: int = 100
+) -> np.ndarray:
+    """Solves for the volatility that reproduces each option price.
+
+    ### Overview
+    ----
+    Runs a bracketed Newton-Raphson on every contract at once. Each
+    contract keeps its own bracket, a Newton step that leaves the bracket
+    or stalls on a tiny vega falls back to bisection, so every contract
+    with an arbitrage free price converges.
+
+    ### Parameters
+    ----
+    option_price : np.ndarray
+        The market price of each contract, usually the `mark`.
+
+    is_call, underlying_price, strike_price, time_to_expiration,
+    interest_rate, dividend_yield:
+        See `black_scholes`.
+
+    lower_bound : float (optional, Default=1e-4)
+        The lowest volatility searched.
+
+    upper_bound : float (optional, Default=5.0)
+        The highest volatility searched.
+
+    tolerance : float (optional, Default=1e-8)
+        The largest pricing error accepted.
+
+    max_iterations : int (optional, Default=100)
+        The maximum number of iterations.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The implied volatility as a decimal, `NaN` where the price is
+        outside the range the bounds can produce.
+    """
+
+    arrays = np.broadcast_arrays(
+        np.asarray(option_price, dtype=np.float64),
+        np.asarray(is_call, dtype=bool),
+        np.asarray(underlying_price, dtype=np.float64),
+        np.asarray(strike_price, dtype=np.float64),
+        np.asarray(time_to_expiration, dtype=np.float64),
+        np.asarray(interest_rate, dtype=np.float64),
+        np.asarray(dividend_yield, dtype=np.float64)
+    )
+    price, is_call, spot, strike, time, rate, dividend = (array.ravel() for array in arrays)
+    shape = arrays[0].shape
+
+    def model(sigma: np.ndarray, rows: np.ndarray) -> dict:
+        return black_scholes(
+            is_call=is_call[rows],
+            underlying_price=spot[rows],
+            strike_price=strike[rows],
+            time_to_expiration=time[rows],
+            volatility=sigma,
+            interest_rate=rate[rows],
+            dividend_yield=dividend[rows]
+        )
+
+    everything = np.arange(price.size)
+    low = np.full(price.size, lower_bound)
+    high = np.full(price.size, upper_bound)
+
+    # Prices outside what the bounds can produce have no solution.
+    low_price = model(sigma=low, rows=everything)['price']
+    high_price = model(sigma=high, rows=everything)['price']
+    solvable = (price >= low_price - tolerance) & (price <= high_price + tolerance)
+
+    # Start from the Brenner-Subrahmanyam approximation.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.sqrt(2.0 * np.pi / np.maximum(time, MINIMUM_TIME)) * price / spot
+    sigma = np.clip(np.nan_to_num(sigma, nan=0.2), lower_bound, upper_bound)
+
+    result = np.full(price.size, np.nan)
+    active = np.flatnonzero(solvable)
+
+    for _ in range(max_iterations):
+
+        if active.size == 0:
+            break
+
+        values = model(sigma=sigma[active], rows=active)
+        error = values['price'] - price[active]
+
+        done = np.abs(error) < tolerance
+        result[active[done]] = sigma[active[done]]
+
+        # Shrink the bracket around the root.
+        too_high = error > 0
+        high[active] = np.where(too_high, sigma[active], high[active])
+        low[active] = np.where(too_high, low[active], sigma[active])
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            newton = sigma[active] - error / (values['vega'] * 100.0)
+
+        inside = (newton > low[active]) & (newton < high[active]) & np.isfinite(newton)
+        sigma[active] = np.where(inside, newton, 0.5 * (low[active] + high[active]))
+
+        # Stop once the bracket can no longer be split.
+        collapsed = (high[active] - low[active]) < tolerance * 1e-3
+        result[active[collapsed & ~done]] = sigma[active[collapsed & ~done]]
+
+        active = active[~done & ~collapsed]
+
+    return result.reshape(shape)
+
+
+def _chain_inputs(
+    option_chain_frame: OptionChainFrame,
+    underlying_price: Union[float, np.ndarray],
+    days_to_expiration: Union[float, np.ndarray],
+    interest_rate: Union[float, np.ndarray]
+) -> tuple:
+    """Picks the chain values for any input that was not overridden.
+
+    ### Returns
+    ----
+    tuple:
+        The `is_call`, underlying price, strike, time in years
+        and interest rate inputs.
+    """
+
+    if underlying_price is None:
+        underlying_price = option_chain_frame.underlying_price
+
+    if days_to_expiration is None:
+        days_to_expiration = option_chain_frame['daysToExpiration']
+
+    # The chain reports the interest rate in percent.
+    if interest_rate is None:
+        interest_rate = option_chain_frame.chain.get('interestRate', 0.0) / 100.0
+
+    return (
+        option_chain_frame.put_call == CALL,
+        underlying_price,
+        option_chain_frame['strikePrice'],
+        np.asarray(days_to_expiration, dtype=np.float64) / DAYS_PER_YEAR,
+        interest_rate
+    )
+
+
+def price_option_chain(
+    option_chain_frame: OptionChainFrame,
+    underlying_price: Union[float, np.ndarray] = None,
+    volatility: Union[float, np.ndarray] = None,
+    days_to_expiration: Union[float, np.ndarray] = None,
+    interest_rate: Union[float, np.ndarray] = None,
+    dividend_yield: Union[float, np.ndarray] = 0.0
+) -> dict:
+    """Prices every contract of a flattened chain locally.
+
+    ### Overview
+    ----
+    The local version of the `analytical` strategy, every input
+    defaults to the value in the chain and can be overridden with
+    a scalar or an array, so what-if scenarios need no API calls.
+
+    ### Parameters
+    ----
+    option_chain_frame : OptionChainFrame
+        The flattened chain.
+
+    underlying_price : Union[float, np.ndarray] (optional, Default=None)
+        The underlying price, defaults to the chain's `underlyingPrice`.
+
+    volatility : Union[float, np.ndarray] (optional, Default=None)
+        The volatility as a decimal, defaults to the `volatility`
+        column of the chain.
+
+    days_to_expiration : Union[float, np.ndarray] (optional, Default=None)
+        The calendar days left, defaults to the `daysToExpiration`
+        column of the chain.
+
+    interest_rate : Union[float, np.ndarray] (optional, Default=None)
+        The risk free rate as a decimal, defaults to the
+        chain's `interestRate`.
+
+    dividend_yield : Union[float, np.ndarray] (optional, Default=0.0)
+        The continuous dividend yield as a decimal.
+
+    ### Returns
+    ----
+    dict:
+        See `black_scholes`.
+
+    ### Usage
+    ----
+        >>> option_chain_frame = options_chain_service.get_option_chain_frame(
+                option_chain_query=option_chain_query
+            )
+        >>> # Reprice the chain for 101 underlying prices at once.
+        >>> scenarios = np.linspace(200.0, 300.0, 101)[:, np.newaxis]
+        >>> values = price_option_chain(
+                option_chain_frame=option_chain_frame,
+                underlying_price=scenarios
+            )
+    """
+
+    is_call, underlying_price, strike_price, time_to_expiration, interest_rate = _chain_inputs(
+        option_chain_frame=option_chain_frame,
+        underlying_price=underlying_price,
+        days_to_expiration=days_to_expiration,
+        interest_rate=interest_rate
+    )
+
+    # The chain reports the volatility in percent.
+    if volatility is None:
+        volatility = option_chain_frame['volatility'] / 100.0
+
+    return black_scholes(
+        is_call=is_call,
+        underlying_price=underlying_price,
+        strike_price=strike_price,
+        time_to_expiration=time_to_expiration,
+        volatility=volatility,
+        interest_rate=interest_rate,
+        dividend_yield=dividend_yield
+    )
+
+
+def implied_volatility_chain(
+    option_chain_frame: OptionChainFrame,
+    option_price: Union[float, np.ndarray] = None,
+    underlying_price: Union[float, np.ndarray] = None,
+    days_to_expiration: Union[float, np.ndarray] = None,
+    interest_rate: Union[float, np.ndarray] = None,
+    dividend_yield: Union[float, np.ndarray] = 0.0
+) -> np.ndarray:
+    """Solves the implied volatility of every contract of a flattened chain.
+
+    ### Parameters
+    ----
+    option_chain_frame : OptionChainFrame
+        The flattened chain.
+
+    option_price : Union[float, np.ndarray] (optional, Default=None)
+        The prices to solve for, defaults to the `mark` column.
+
+    underlying_price, days_to_expiration, interest_rate, dividend_yield:
+        See `price_option_chain`.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The implied volatility of each contract as a decimal.
+    """
+
+    is_call, underlying_price, strike_price, time_to_expiration, interest_rate = _chain_inputs(
+        option_chain_frame=option_chain_frame,
+        underlying_price=underlying_price,
+        days_to_expiration=days_to_expiration,
+        interest_rate=interest_rate
+    )
+
+    if option_price is None:
+        option_price = option_chain_frame['mark']
+
+    return implied_volatility(
+        option_price=option_price,
+        is_call=is_call,
+        underlying_price=underlying_price,
+        strike_price=strike_price,
+        time_to_expiration=time_to_expiration,
+        interest_rate=interest_rate,
+        dividend_yield=dividend_yield
+    )
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import AsyncIterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+
+def run_bounded(
+    jobs: Iterable[tuple],
+    request: Callable,
+    max_workers: int
+) -> Iterator[tuple]:
+    """Runs requests on a thread pool, never more than `max_workers` at a time.
+
+    ### Overview
+    ----
+    Results are yielded as each request completes, not in the order of
+    the jobs. The next job is only submitted once a request finished, so
+    closing the generator stops every job that has not started. Workers
+    check a stop flag before calling `request` and the executor is shut
+    down without waiting, so the caller is never held up by requests that
+    are still waiting on the rate limiter or on the wire. Those requests
+    finish in the background and their results are dropped.
+
+    ### Parameters
+    ----
+    jobs : Iterable[tuple]
+        The `(key, argument)` pairs to run, the argument
+        is passed to `request`.
+
+    request : Callable
+        Makes one request, called from a worker thread.
+
+    max_workers : int
+        The number of requests in flight at the same time.
+
+    ### Yields
+    ----
+    tuple:
+        The `(key, content, error)` of each job, `error` is the
+        exception the request raised or `None`.
+    """
+
+    pending = iter(jobs)
+    stopped = threading.Event()
+
+    def run_job(argument: object) -> object:
+
+        # A job that was picked up after the caller stopped is never sent.
+        if stopped.is_set():
+            return None
+
+        return request(argument)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    in_flight = {}
+
+    try:
+
+        for key, argument in pending:
+            in_flight[executor.submit(run_job, argument)] = key
+            if len(in_flight) >= max_workers:
+                break
+
+        while in_flight:
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+
+                key = in_flight.pop(future)
+
+                for next_key, next_argument in pending:
+                    in_flight[executor.submit(run_job, next_argument)] = next_key
+                    break
+
+                try:
+                    content = future.result()
+                except Exception as request_error:
+                    yield key, None, request_error
+                    continue
+
+                yield key, content, None
+
+    finally:
+
+        # `shutdown(cancel_futures=True)` needs Python 3.9.
+        stopped.set()
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def run_bounded_async(
+    jobs: Iterable[tuple],
+    request: Callable,
+    max_workers: int
+) -> AsyncIterator[tuple]:
+    """Runs coroutines as tasks, never more than `max_workers` at a time.
+
+    ### Overview
+    ----
+    The asyncio version of `run_bounded`. Closing the generator cancels
+    the tasks that are still in flight.
+
+    ### Parameters
+    ----
+    jobs : Iterable[tuple]
+        The `(key, argument)` pairs to run, the argument
+        is passed to `request`.
+
+    request : Callable
+        Returns the coroutine of one request.
+
+    max_workers : int
+        The number of requests in flight at the same time.
+
+    ### Yields
+    ----
+    tuple:
+        The `(key, content, error)` of each job, `error` is the
+        exception the request raised or `None`.
+    """
+
+    pending = iter(jobs)
+    in_flight = {}
+
+    try:
+
+        for key, argument in pending:
+            in_flight[asyncio.ensure_future(request(argument))] = key
+            if len(in_flight) >= max_workers:
+                break
+
+        while in_flight:
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+
+                key = in_flight.pop(task)
+
+                for next_key, next_argument in pending:
+                    in_flight[asyncio.ensure_future(request(next_argument))] = next_key
+                    break
+
+                try:
+                    content = task.result()
+                except Exception as request_error:
+                    yield key, None, request_error
+                    continue
+
+                yield key, content, None
+
+    finally:
+
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,495 @@
+from datetime import time
+from datetime import tzinfo
+from datetime import datetime
+from datetime import timezone
+from datetime import timedelta
+
+import numpy as np
+
+from td.utils.candle_store import CANDLE_DTYPE
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    try:
+        from backports.zoneinfo import ZoneInfo
+    except ImportError:
+        ZoneInfo = None
+
+
+MILLISECONDS_PER_MINUTE = 60000
+MILLISECONDS_PER_DAY = 86400000
+
+
+class UsEasternTime(tzinfo):
+
+    """
+    ### Overview
+    ----
+    The US Eastern time zone with the daylight saving time rules in
+    effect since 2007, it is used when no time zone database is
+    installed. Daylight saving time starts at 2:00 on the second
+    Sunday of March and ends at 2:00 on the first Sunday of November.
+    """
+
+    standard_offset = timedelta(hours=-5)
+    daylight_offset = timedelta(hours=1)
+
+    def _daylight_range(self, year: int) -> tuple:
+        """Returns the local start and end of daylight saving time."""
+
+        march_first = datetime(year, 3, 1, 2)
+        november_first = datetime(year, 11, 1, 2)
+
+        start = march_first + timedelta(days=(6 - march_first.weekday()) % 7 + 7)
+        end = november_first + timedelta(days=(6 - november_first.weekday()) % 7)
+
+        return start, end
+
+    def utcoffset(self, dt: datetime) -> timedelta:
+        return self.standard_offset + self.dst(dt)
+
+    def dst(self, dt: datetime) -> timedelta:
+
+        if dt is None:
+            return timedelta(0)
+
+        start, end = self._daylight_range(year=dt.year)
+        dt = dt.replace(tzinfo=None)
+
+        # The skipped hour in March and the repeated hour in November.
+        if start <= dt < start + self.daylight_offset:
+            return self.daylight_offset if dt.fold else timedelta(0)
+
+        if end - self.daylight_offset <= dt < end:
+            return timedelta(0) if dt.fold else self.daylight_offset
+
+        if start <= dt < end:
+            return self.daylight_offset
+
+        return timedelta(0)
+
+    def tzname(self, dt: datetime) -> str:
+        return 'EDT' if self.dst(dt) else 'EST'
+
+    def fromutc(self, dt: datetime) -> datetime:
+
+        start, end = self._daylight_range(year=dt.year)
+        standard_time = (dt + self.standard_offset).replace(tzinfo=None)
+        daylight_time = standard_time + self.daylight_offset
+
+        if end <= daylight_time < end + self.daylight_offset:
+            return standard_time.replace(tzinfo=self, fold=1)
+
+        if start <= standard_time and daylight_time < end:
+            return daylight_time.replace(tzinfo=self)
+
+        return standard_time.replace(tzinfo=self)
+
+    def __repr__(self) -> str:
+        return 'UsEasternTime()'
+
+
+def market_time_zone() -> tzinfo:
+    """Returns the `America/New_York` time zone the markets trade in.
+
+    ### Overview
+    ----
+    Uses the time zone database through `zoneinfo`, or its
+    `backports.zoneinfo` backport before Python 3.9. Without a time
+    zone database, for example on Windows without `tzdata`, the rules
+    of `UsEasternTime` are used instead.
+
+    ### Returns
+    ----
+    tzinfo:
+        The exchange time zone.
+    """
+
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo('America/New_York')
+        except (KeyError, OSError):
+            pass
+
+    return UsEasternTime()
+
+
+def local_offsets(datetimes: np.ndarray, time_zone: tzinfo = None) -> np.ndarray:
+    """Calculates the UTC offset of each timestamp.
+
+    ### Overview
+    ----
+    The offset is looked up once per calendar day instead of once
+    per candle, the US markets switch daylight saving time early on
+    a Sunday morning so every candle of a day shares one offset.
+
+    ### Parameters
+    ----
+    datetimes : np.ndarray
+        The timestamps in milliseconds since epoch.
+
+    time_zone : tzinfo (optional, Default=None)
+        The time zone to convert to, defaults to the
+        market time zone.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The offset of each timestamp in milliseconds.
+    """
+
+    time_zone = time_zone or market_time_zone()
+    datetimes = np.asarray(datetimes, dtype=np.int64)
+
+    if len(datetimes) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    days = datetimes // MILLISECONDS_PER_DAY
+    first_day = int(days.min())
+    last_day = int(days.max())
+
+    # Look up the offset at noon of every day in the range.
+    day_offsets = np.array([
+        datetime.fromtimestamp(
+            day * 86400 + 43200, tz=timezone.utc
+        ).astimezone(time_zone).utcoffset().total_seconds() * 1000
+        for day in range(first_day, last_day + 1)
+    ], dtype=np.int64)
+
+    return day_offsets[days - first_day]
+
+
+def session_mask(
+    candles: np.ndarray,
+    time_zone: tzinfo = None,
+    regular_start: time = time(9, 30),
+    regular_end: time = time(16, 0)
+) -> np.ndarray:
+    """Flags the candles that fall in the regular session.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout.
+
+    time_zone : tzinfo (optional, Default=None)
+        The exchange time zone, defaults to the market time zone.
+
+    regular_start : time (optional, Default=time(9, 30))
+        The local open of the regular session.
+
+    regular_end : time (optional, Default=time(16, 0))
+        The local close of the regular session.
+
+    ### Returns
+    ----
+    np.ndarray:
+        `True` for regular hours candles, `False` for
+        pre-market and after-hours candles.
+    """
+
+    datetimes = candles['datetime']
+    local_datetimes = datetimes + local_offsets(datetimes=datetimes, time_zone=time_zone)
+    time_of_day = local_datetimes % MILLISECONDS_PER_DAY
+
+    start = (regular_start.hour * 60 + regular_start.minute) * MILLISECONDS_PER_MINUTE
+    end = (regular_end.hour * 60 + regular_end.minute) * MILLISECONDS_PER_MINUTE
+
+    return (time_of_day >= start) & (time_of_day < end)
+
+
+def aggregate_candles(candles: np.ndarray, bucket_ids: np.ndarray) -> np.ndarray:
+    """Aggregates consecutive candles that share a bucket.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    bucket_ids : np.ndarray
+        The bucket of each candle, candles of one bucket
+        have to be next to each other.
+
+    ### Returns
+    ----
+    np.ndarray:
+        One `CANDLE_DTYPE` bar per bucket, stamped with the
+        `datetime` of its first candle.
+    """
+
+    if len(candles) == 0:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+
+    bucket_ids = np.asarray(bucket_ids)
+    starts = np.flatnonzero(np.r_[True, bucket_ids[1:] != bucket_ids[:-1]])
+    ends = np.r_[starts[1:], len(candles)] - 1
+
+    bars = np.empty(len(starts), dtype=CANDLE_DTYPE)
+    bars['datetime'] = candles['datetime'][starts]
+    bars['open'] = candles['open'][starts]
+    bars['high'] = np.maximum.reduceat(candles['high'], starts)
+    bars['low'] = np.minimum.reduceat(candles['low'], starts)
+    bars['close'] = candles['close'][ends]
+    bars['volume'] = np.add.reduceat(candles['volume'], starts)
+
+    return bars
+
+
+def _filter_session(candles: np.ndarray, session: str, time_zone: tzinfo) -> np.ndarray:
+    """Keeps the candles of the `regular` or `extended` session."""
+
+    if session == 'all':
+        return candles
+
+    if session not in ('regular', 'extended'):
+        raise ValueError("The session must be one of 'all', 'regular' or 'extended'.")
+
+    regular = session_mask(candles=candles, time_zone=time_zone)
+
+    if session == 'regular':
+        return candles[regular]
+
+    return candles[~regular]
+
+
+def resample_candles(
+    candles: np.ndarray,
+    minutes: int,
+    session: str = 'all',
+    time_zone: tzinfo = None
+) -> np.ndarray:
+    """Resamples candles into bars of a larger interval.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    minutes : int
+        The length of the new bars, for example `5`, `15` or `60`.
+
+    session : str (optional, Default='all')
+        Which candles to include, one of `all`, `regular`
+        or `extended`.
+
+    time_zone : tzinfo (optional, Default=None)
+        The time zone the bars are aligned to, defaults to the
+        market time zone so hourly bars start on the local hour.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The `CANDLE_DTYPE` bars, stamped with the start of
+        their interval.
+
+    ### Usage
+    ----
+        >>> candles = candle_store.load(
+                symbol='MSFT',
+                frequency_type='minute',
+                frequency=1,
+                extended_hours_needed=True,
+                mmap=True
+            )
+        >>> bars = resample_candles(candles=candles, minutes=15, session='regular')
+    """
+
+    candles = _filter_session(candles=candles, session=session, time_zone=time_zone)
+
+    if len(candles) == 0:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+
+    interval = int(minutes) * MILLISECONDS_PER_MINUTE
+    offsets = local_offsets(datetimes=candles['datetime'], time_zone=time_zone)
+    bucket_ids = (candles['datetime'] + offsets) // interval
+
+    bars = aggregate_candles(candles=candles, bucket_ids=bucket_ids)
+
+    # Stamp each bar with the start of its interval instead of its first candle.
+    starts = np.flatnonzero(np.r_[True, bucket_ids[1:] != bucket_ids[:-1]])
+    bars['datetime'] = bucket_ids[starts] * interval - offsets[starts]
+
+    return bars
+
+
+def resample_sessions(
+    candles: np.ndarray,
+    session: str = 'regular',
+    time_zone: tzinfo = None
+) -> np.ndarray:
+    """Resamples candles into one bar per trading day.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    session : str (optional, Default='regular')
+        Which candles make up the bar, one of `all`, `regular`
+        or `extended`.
+
+    time_zone : tzinfo (optional, Default=None)
+        The exchange time zone, defaults to the market time zone.
+
+    ### Returns
+    ----
+    np.ndarray:
+        One `CANDLE_DTYPE` bar per day, stamped with the
+        `datetime` of its first candle.
+    """
+
+    candles = _filter_session(candles=candles, session=session, time_zone=time_zone)
+
+    offsets = local_offsets(datetimes=candles['datetime'], time_zone=time_zone)
+    local_days = (candles['datetime'] + offsets) // MILLISECONDS_PER_DAY
+
+    return aggregate_candles(candles=candles, bucket_ids=local_days)
+
+
+def rolling_vwap(candles: np.ndarray, window: int) -> np.ndarray:
+    """Calculates the volume weighted average price over a rolling window.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    window : int
+        The number of candles in the window.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The VWAP of each candle using the typical price, `NaN` until
+        the window is full or when the window has no volume.
+    """
+
+    if window <= 0:
+        raise ValueError('The window must be a positive number of candles.')
+
+    vwap = np.full(len(candles), np.nan)
+
+    if len(candles) < window:
+        return vwap
+
+    volume = candles['volume'].astype(np.float64)
+    typical_price = (candles['high'] + candles['low'] + candles['close']) / 3.0
+
+    price_volume = np.r_[0.0, np.cumsum(typical_price * volume)]
+    total_volume = np.r_[0.0, np.cumsum(volume)]
+
+    window_price_volume = price_volume[window:] - price_volume[:-window]
+    window_volume = total_volume[window:] - total_volume[:-window]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        vwap[window - 1:] = np.where(
+            window_volume > 0, window_price_volume / window_volume, np.nan
+        )
+
+    return vwap
+
+
+def session_vwap(candles: np.ndarray, time_zone: tzinfo = None) -> np.ndarray:
+    """Calculates the VWAP anchored at the start of each trading day.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    time_zone : tzinfo (optional, Default=None)
+        The exchange time zone, defaults to the market time zone.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The running VWAP of each candle within its day, `NaN`
+        while the day has no volume.
+    """
+
+    if len(candles) == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    offsets = local_offsets(datetimes=candles['datetime'], time_zone=time_zone)
+    local_days = (candles['datetime'] + offsets) // MILLISECONDS_PER_DAY
+
+    volume = candles['volume'].astype(np.float64)
+    typical_price = (candles['high'] + candles['low'] + candles['close']) / 3.0
+
+    price_volume = np.cumsum(typical_price * volume)
+    total_volume = np.cumsum(volume)
+
+    # Subtract the running totals from before the start of each day.
+    starts = np.flatnonzero(np.r_[True, local_days[1:] != local_days[:-1]])
+    day_lengths = np.diff(np.r_[starts, len(candles)])
+    day_start = np.repeat(starts, day_lengths)
+
+    price_volume = price_volume - (price_volume[day_start] - (typical_price * volume)[day_start])
+    total_volume = total_volume - (total_volume[day_start] - volume[day_start])
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total_volume > 0, price_volume / total_volume, np.nan)
+
+
+def find_gaps(
+    candles: np.ndarray,
+    interval: int,
+    gap_threshold: int = None,
+    time_zone: tzinfo = None
+) -> np.ndarray:
+    """Finds the stretches of a candle series where candles are missing.
+
+    ### Overview
+    ----
+    Only gaps while the market is open are reported. For intraday
+    candles a gap has to start and end on the same local day, so
+    nights, weekends and holidays are skipped, and so is a day that
+    starts late or ends early. For daily candles a gap has to skip a
+    weekday, so weekends are skipped but holidays are still reported.
+    Weekly and monthly candles are compared to their interval only.
+
+    ### Parameters
+    ----
+    candles : np.ndarray
+        The candles with the `CANDLE_DTYPE` layout, sorted by `datetime`.
+
+    interval : int
+        The length of one candle in milliseconds.
+
+    gap_threshold : int (optional, Default=None)
+        The shortest gap reported in milliseconds, the time
+        between the two candles. Defaults to one candle.
+
+    time_zone : tzinfo (optional, Default=None)
+        The exchange time zone, defaults to the market time zone.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The `(n, 2)` timestamps of the candles on each side
+        of every gap.
+    """
+
+    datetimes = candles['datetime']
+    threshold = interval if gap_threshold is None else gap_threshold
+
+    gap_index = np.flatnonzero(np.diff(datetimes) > threshold)
+
+    if len(gap_index) and interval <= MILLISECONDS_PER_DAY:
+
+        offsets = local_offsets(datetimes=datetimes, time_zone=time_zone)
+        local_days = (datetimes + offsets) // MILLISECONDS_PER_DAY
+        before = local_days[gap_index]
+        after = local_days[gap_index + 1]
+
+        if interval < MILLISECONDS_PER_DAY:
+            gap_index = gap_index[before == after]
+        else:
+            missing_weekdays = np.busday_count(
+                (before + 1).astype('datetime64[D]'),
+                after.astype('datetime64[D]')
+            )
+            gap_index = gap_index[missing_weekdays > 0]
+
+    return np.column_stack([datetimes[gap_index], datetimes[gap_index + 1]])
@@ -0,0 +1,401 @@
+import os
+import json
+import uuid
+import pathlib
+import threading
+
+from enum import Enum
+from typing import List
+from typing import Union
+from urllib.parse import quote
+
+import numpy as np
+
+
+CANDLE_DTYPE = np.dtype([
+    ('datetime', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<i8')
+])
+
+
+def candles_to_array(candles: List[dict]) -> np.ndarray:
+    """Converts the `candles` of a Price History response.
+
+    ### Parameters
+    ----
+    candles : List[dict]
+        The `candles` list returned by `PriceHistory.get_price_history`.
+
+    ### Returns
+    ----
+    np.ndarray:
+        A structured array with the `CANDLE_DTYPE` layout.
+    """
+
+    candle_array = np.empty(len(candles), dtype=CANDLE_DTYPE)
+
+    for field in CANDLE_DTYPE.names:
+        candle_array[field] = [candle.get(field, 0) for candle in candles]
+
+    return candle_array
+
+
+class CandleStore():
+
+    """
+    ### Overview
+    ----
+    Keeps price history candles on disk, one file per `(symbol,
+    frequencyType, frequency, extended hours)` key. Candles are stored
+    as fixed-width `CANDLE_DTYPE` records in a `.npy` file, so a whole
+    column can be read as a single array and new candles can be merged
+    in without re-downloading the full window.
+
+    Files can be opened as read-only memory maps, so every process on
+    a machine shares one copy in the page cache instead of parsing its
+    own. Merges replace the file atomically, processes that already
+    mapped a file keep reading the old version until they reload.
+
+    Writers are single-process: merges are serialized by a lock inside
+    one `CandleStore`, two processes merging into the same series can
+    lose each other's candles. Any number of processes may read.
+
+    On Windows a file can't be replaced while another process holds it
+    as a memory map, so merges into a mapped series raise a
+    `PermissionError` there. Load without `mmap` on Windows if another
+    process writes to the store.
+    """
+
+    def __init__(self, directory: Union[str, pathlib.Path] = 'candles') -> None:
+        """Initializes the `CandleStore` object.
+
+        ### Parameters
+        ----
+        directory : Union[str, pathlib.Path] (optional, Default='candles')
+            The folder the candle files are kept in.
+
+        ### Usage
+        ----
+            >>> candle_store = CandleStore(directory='data/candles')
+            >>> td_client = TdAmeritradeClient(
+                    credentials=td_credentials,
+                    candle_store=candle_store
+                )
+        """
+
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def build_path(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool
+    ) -> pathlib.Path:
+        """Builds the file path of a candle series.
+
+        ### Parameters
+        ----
+        symbol : str
+            The ticker symbol of the series.
+
+        frequency_type : Union[str, Enum]
+            The frequency type of the candles.
+
+        frequency : int
+            The frequency of the candles.
+
+        extended_hours_needed : bool
+            `True` if the series includes extended hours.
+
+        ### Returns
+        ----
+        pathlib.Path:
+            The path of the `.npy` file.
+        """
+
+        if isinstance(frequency_type, Enum):
+            frequency_type = frequency_type.value
+
+        session = 'ext' if extended_hours_needed else 'reg'
+        file_name = f"{quote(symbol, safe='')}_{frequency_type}_{frequency}_{session}.npy"
+
+        return self.directory.joinpath(file_name)
+
+    def load(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool,
+        mmap: bool = False
+    ) -> np.ndarray:
+        """Loads a candle series from disk.
+
+        ### Parameters
+        ----
+        symbol, frequency_type, frequency, extended_hours_needed:
+            See `CandleStore.build_path`.
+
+        mmap : bool (optional, Default=False)
+            If `True` the file is opened as a read-only memory map
+            instead of being read into memory.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The candles sorted by `datetime`, an empty array
+            if nothing is stored yet.
+
+        ### Usage
+        ----
+            >>> candles = candle_store.load(
+                    symbol='MSFT',
+                    frequency_type='minute',
+                    frequency=1,
+                    extended_hours_needed=False,
+                    mmap=True
+                )
+            >>> candles['close'].mean()
+        """
+
+        path = self.build_path(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        if not path.exists():
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+        if mmap:
+            return np.load(file=path, mmap_mode='r')
+
+        return np.load(file=path)
+
+    def first_datetime(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool
+    ) -> Union[int, None]:
+        """Returns the timestamp of the first stored candle.
+
+        ### Parameters
+        ----
+        See `CandleStore.build_path`.
+
+        ### Returns
+        ----
+        Union[int, None]:
+            The first `datetime` in milliseconds since epoch,
+            `None` if nothing is stored yet.
+        """
+
+        candles = self.load(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed,
+            mmap=True
+        )
+
+        if len(candles) == 0:
+            return None
+
+        return int(candles['datetime'][0])
+
+    def last_datetime(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool
+    ) -> Union[int, None]:
+        """Returns the timestamp of the last stored candle.
+
+        ### Parameters
+        ----
+        See `CandleStore.build_path`.
+
+        ### Returns
+        ----
+        Union[int, None]:
+            The last `datetime` in milliseconds since epoch,
+            `None` if nothing is stored yet.
+        """
+
+        candles = self.load(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed,
+            mmap=True
+        )
+
+        if len(candles) == 0:
+            return None
+
+        return int(candles['datetime'][-1])
+
+    def merge(
+        self,
+        symbol: str,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool,
+        candles: np.ndarray
+    ) -> np.ndarray:
+        """Merges new candles into a stored series.
+
+        ### Overview
+        ----
+        New candles replace stored candles with the same `datetime`,
+        which keeps the last, possibly partial, bar up to date. The
+        file is replaced atomically so readers never see half a write.
+
+        ### Parameters
+        ----
+        symbol, frequency_type, frequency, extended_hours_needed:
+            See `CandleStore.build_path`.
+
+        candles : np.ndarray
+            The new candles with the `CANDLE_DTYPE` layout.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The merged series sorted by `datetime`.
+        """
+
+        path = self.build_path(
+            symbol=symbol,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed
+        )
+
+        with self._lock:
+
+            stored = self.load(
+                symbol=symbol,
+                frequency_type=frequency_type,
+                frequency=frequency,
+                extended_hours_needed=extended_hours_needed
+            )
+
+            combined = np.concatenate([stored, candles.astype(CANDLE_DTYPE)])
+
+            # Keep the newest copy of each timestamp, sorted by time.
+            reversed_candles = combined[::-1]
+            _, first_index = np.unique(
+                reversed_candles['datetime'], return_index=True
+            )
+            merged = reversed_candles[first_index]
+
+            self._write(path=path, candles=merged)
+
+        return merged
+
+    def save_price_history(
+        self,
+        content: dict,
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool,
+        symbol: str = None
+    ) -> np.ndarray:
+        """Saves a `PriceHistory.get_price_history` response.
+
+        ### Parameters
+        ----
+        content : dict
+            The Price History response.
+
+        frequency_type, frequency, extended_hours_needed:
+            The arguments the response was requested with.
+
+        symbol : str (optional, Default=None)
+            The symbol of the series, defaults to the `symbol`
+            field of the response.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The merged series sorted by `datetime`.
+        """
+
+        return self.merge(
+            symbol=symbol or content['symbol'],
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed,
+            candles=candles_to_array(candles=content.get('candles', []))
+        )
+
+    def import_json(
+        self,
+        file_path: Union[str, pathlib.Path],
+        frequency_type: Union[str, Enum],
+        frequency: int,
+        extended_hours_needed: bool,
+        symbol: str = None
+    ) -> np.ndarray:
+        """Imports a Price History response that was saved as JSON.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The JSON file holding the response.
+
+        frequency_type, frequency, extended_hours_needed, symbol:
+            See `CandleStore.save_price_history`.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The merged series sorted by `datetime`.
+
+        ### Usage
+        ----
+            >>> candle_store.import_json(
+                    file_path='data/msft_minute.json',
+                    frequency_type='minute',
+                    frequency=1,
+                    extended_hours_needed=False
+                )
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as json_file:
+            content = json.load(json_file)
+
+        return self.save_price_history(
+            content=content,
+            frequency_type=frequency_type,
+            frequency=frequency,
+            extended_hours_needed=extended_hours_needed,
+            symbol=symbol
+        )
+
+    def _write(self, path: pathlib.Path, candles: np.ndarray) -> None:
+        """Writes the candles to a temporary file and swaps it in."""
+
+        # Opened like any other file, so it gets the normal permissions.
+        temp_path = path.with_name(f'{path.name}.{uuid.uuid4().hex}.tmp')
+
+        try:
+            with open(file=temp_path, mode='xb') as temp_file:
+                np.save(file=temp_file, arr=candles)
+            os.replace(temp_path, path)
+        except BaseException:
+            if temp_path.exists():
+                os.remove(temp_path)
+            raise
@@ -1164,3 +1164,18 @@ class LevelTwoOptions(Enum):
     Key = 0
     Time = 1
     Data = 2
+
+
+class RequestPriority(Enum):
+    """Represents the priority lanes of the `RateLimiter`,
+    requests with a lower value are sent first.
+
+    ### Usage
+    ----
+        >>> from td.utils.enums import RequestPriority
+        >>> RequestPriority.High.value
+    """
+
+    High = 0
+    Normal = 1
+    Low = 2
@@ -206,4 +206,4 @@ class OptionChainQuery():
                         f"{value} cannot be set with strategy type SINGLE."
                     )
 
-                delattr(self, value)
+                setattr(self, value, None)
@@ -0,0 +1,377 @@
+import time
+import threading
+
+from typing import List
+from typing import Union
+from collections import OrderedDict
+
+import numpy as np
+
+from td.utils.option_chain import OptionChainQuery
+from td.utils.option_chain_frame import OptionChainFrame
+
+
+# Fields that move on every refresh without the contract moving.
+DIFF_IGNORED_FIELDS = ['quoteTimeInLong', 'daysToExpiration']
+
+class OptionChainDiff():
+
+    """
+    ### Overview
+    ----
+    The contracts that moved between two snapshots of the same
+    option chain. `added` and `changed` hold the new values of the
+    contracts as `OptionChainFrame` objects, `removed` holds the
+    symbols of the contracts that are no longer listed.
+    """
+
+    def __init__(
+        self,
+        added: OptionChainFrame,
+        changed: OptionChainFrame,
+        removed: np.ndarray,
+        snapshot: OptionChainFrame
+    ) -> None:
+        """Initializes the `OptionChainDiff` object.
+
+        ### Parameters
+        ----
+        added : OptionChainFrame
+            The contracts that were not in the previous snapshot.
+
+        changed : OptionChainFrame
+            The contracts with at least one field that changed.
+
+        removed : np.ndarray
+            The symbols of the contracts that disappeared.
+
+        snapshot : OptionChainFrame
+            The full new snapshot.
+        """
+
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.snapshot = snapshot
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def __repr__(self) -> str:
+        return (
+            f"OptionChainDiff(added={len(self.added)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)})"
+        )
+
+
+def diff_option_chains(
+    previous: OptionChainFrame,
+    current: OptionChainFrame,
+    ignore_fields: List[str] = None
+) -> OptionChainDiff:
+    """Compares two snapshots of an option chain by option symbol.
+
+    ### Parameters
+    ----
+    previous : OptionChainFrame
+        The older snapshot, `None` if there is none.
+
+    current : OptionChainFrame
+        The newer snapshot.
+
+    ignore_fields : List[str] (optional, Default=None)
+        The fields that don't make a contract count as changed,
+        defaults to the timestamp and bookkeeping fields in
+        `DIFF_IGNORED_FIELDS`.
+
+    ### Returns
+    ----
+    OptionChainDiff:
+        The added, changed and removed contracts.
+    """
+
+    if previous is None:
+        return OptionChainDiff(
+            added=current,
+            changed=current.take(np.zeros(0, dtype=np.intp)),
+            removed=np.array([], dtype=str),
+            snapshot=current
+        )
+
+    # Line the contracts up by symbol.
+    _, previous_rows, current_rows = np.intersect1d(
+        previous.symbols, current.symbols, assume_unique=True, return_indices=True
+    )
+
+    if ignore_fields is None:
+        ignore_fields = DIFF_IGNORED_FIELDS
+
+    changed = np.zeros(len(current_rows), dtype=bool)
+
+    for field in (set(previous.fields) & set(current.fields)) - set(ignore_fields):
+
+        old_values = previous[field][previous_rows]
+        new_values = current[field][current_rows]
+        different = old_values != new_values
+
+        # NaN never equals itself, so unchanged NaNs are not a change.
+        if new_values.dtype.kind == 'f':
+            different &= ~(np.isnan(old_values) & np.isnan(new_values))
+
+        changed |= different
+
+    added = np.ones(len(current), dtype=bool)
+    added[current_rows] = False
+
+    kept = np.zeros(len(previous), dtype=bool)
+    kept[previous_rows] = True
+
+    return OptionChainDiff(
+        added=current.take(np.flatnonzero(added)),
+        changed=current.take(np.sort(current_rows[changed])),
+        removed=previous.symbols[~kept],
+        snapshot=current
+    )
+
+
+class OptionChainCache():
+
+    """
+    ### Overview
+    ----
+    Keeps the latest snapshot of each option chain, keyed by its
+    canonical query. Every refresh is compared with the previous
+    snapshot so consumers only process the contracts that moved.
+    Chains that are not refreshed within the TTL are evicted. The
+    cache can be shared by threads and asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_size: int = 500,
+        ignore_fields: List[str] = None
+    ) -> None:
+        """Initializes the `OptionChainCache` object.
+
+        ### Parameters
+        ----
+        ttl : float (optional, Default=300.0)
+            The number of seconds a chain is kept after its
+            last refresh.
+
+        max_size : int (optional, Default=500)
+            The maximum number of chains held in the cache.
+
+        ignore_fields : List[str] (optional, Default=None)
+            The fields left out of the diffs, defaults to the
+            timestamp and bookkeeping fields in `DIFF_IGNORED_FIELDS`.
+
+        ### Usage
+        ----
+            >>> option_chain_cache = OptionChainCache(ttl=60.0)
+            >>> td_client = TdAmeritradeClient(
+                    credentials=td_credentials,
+                    option_chain_cache=option_chain_cache
+                )
+            >>> options_chain_service = td_client.options_chain()
+            >>> option_chain_diff = options_chain_service.refresh_option_chain(
+                    option_chain_query=option_chain_query
+                )
+            >>> option_chain_diff.changed.symbols
+        """
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.ignore_fields = ignore_fields
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    @staticmethod
+    def build_key(query: Union[OptionChainQuery, dict]) -> tuple:
+        """Builds the canonical key of a query.
+
+        ### Overview
+        ----
+        Queries that request the same chain get the same key, no
+        matter the argument order, enum or string values, or the
+        case of the symbol.
+
+        ### Parameters
+        ----
+        query : Union[OptionChainQuery, dict]
+            The query object or the query params.
+
+        ### Returns
+        ----
+        tuple:
+            The sorted `(param, value)` pairs of the query.
+        """
+
+        if isinstance(query, OptionChainQuery):
+            query = query.to_dict(raise_errors=False)
+
+        key = []
+
+        for param, value in query.items():
+
+            if value is None:
+                continue
+
+            if param == 'symbol':
+                value = value.upper()
+
+            key.append((param, str(value)))
+
+        return tuple(sorted(key))
+
+    def _evict_expired(self, now: float) -> None:
+        """Removes the chains that outlived the TTL, the lock
+        has to be held by the caller."""
+
+        expired = [
+            key for key, (refreshed, _) in self._entries.items()
+            if refreshed + self.ttl <= now
+        ]
+
+        for key in expired:
+            del self._entries[key]
+            self._evictions += 1
+
+    def get(self, query: Union[OptionChainQuery, dict]) -> Union[OptionChainFrame, None]:
+        """Returns the latest snapshot of a chain.
+
+        ### Parameters
+        ----
+        query : Union[OptionChainQuery, dict]
+            The query of the chain.
+
+        ### Returns
+        ----
+        Union[OptionChainFrame, None]:
+            The snapshot, `None` if the chain is not cached.
+        """
+
+        key = self.build_key(query=query)
+
+        with self._lock:
+
+            self._evict_expired(now=time.monotonic())
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+            return entry[1]
+
+    def update(
+        self,
+        query: Union[OptionChainQuery, dict],
+        option_chain_frame: OptionChainFrame
+    ) -> OptionChainDiff:
+        """Stores a new snapshot and compares it with the previous one.
+
+        ### Parameters
+        ----
+        query : Union[OptionChainQuery, dict]
+            The query of the chain.
+
+        option_chain_frame : OptionChainFrame
+            The new snapshot.
+
+        ### Returns
+        ----
+        OptionChainDiff:
+            The contracts that moved, every contract counts as
+            added the first time a chain is stored.
+        """
+
+        key = self.build_key(query=query)
+        now = time.monotonic()
+
+        with self._lock:
+
+            self._evict_expired(now=now)
+
+            previous = self._entries.get(key)
+            self._entries[key] = (now, option_chain_frame)
+            self._entries.move_to_end(key)
+            self._refreshes += 1
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return diff_option_chains(
+            previous=previous[1] if previous else None,
+            current=option_chain_frame,
+            ignore_fields=self.ignore_fields
+        )
+
+    def invalidate(self, queries: List[Union[OptionChainQuery, dict]] = None) -> None:
+        """Removes chains from the cache, or every chain if no
+        queries are provided."""
+
+        with self._lock:
+            if queries is None:
+                self._entries.clear()
+            else:
+                for query in queries:
+                    self._entries.pop(self.build_key(query=query), None)
+
+    @property
+    def memory_usage(self) -> int:
+        """Returns the number of bytes held by the cached snapshots.
+
+        ### Returns
+        ----
+        int:
+            The size of every column, symbol and code array.
+        """
+
+        with self._lock:
+            snapshots = [entry[1] for entry in self._entries.values()]
+
+        total = 0
+
+        for snapshot in snapshots:
+            total += snapshot.symbols.nbytes
+            total += snapshot.put_call.nbytes
+            total += snapshot.expiration_code.nbytes
+            total += snapshot.expirations.nbytes
+            total += sum(column.nbytes for column in snapshot.columns.values())
+
+        return total
+
+    @property
+    def stats(self) -> dict:
+        """Returns the counters of the cache.
+
+        ### Returns
+        ----
+        dict:
+            The `hits`, `misses`, `refreshes` and `evictions`
+            counts along with the current `size` and `memory_usage`.
+        """
+
+        memory_usage = self.memory_usage
+
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'refreshes': self._refreshes,
+                'evictions': self._evictions,
+                'size': len(self._entries),
+                'memory_usage': memory_usage
+            }
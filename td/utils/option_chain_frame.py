@@ -0,0 +1,270 @@
+from typing import List
+from typing import Union
+
+import numpy as np
+
+
+# The integer codes of the `put_call` column.
+CALL = 0
+PUT = 1
+
+# The contract fields kept as columns and their dtypes.
+OPTION_CHAIN_COLUMNS = {
+    'strikePrice': np.float64,
+    'expirationDate': np.int64,
+    'daysToExpiration': np.int64,
+    'bid': np.float64,
+    'ask': np.float64,
+    'last': np.float64,
+    'mark': np.float64,
+    'bidSize': np.int64,
+    'askSize': np.int64,
+    'totalVolume': np.int64,
+    'openInterest': np.int64,
+    'volatility': np.float64,
+    'delta': np.float64,
+    'gamma': np.float64,
+    'theta': np.float64,
+    'vega': np.float64,
+    'rho': np.float64,
+    'timeValue': np.float64,
+    'theoreticalOptionValue': np.float64,
+    'multiplier': np.float64,
+    'inTheMoney': np.bool_,
+    'quoteTimeInLong': np.int64
+}
+
+# The API reports greeks it could not calculate as -999.
+MISSING_GREEK_COLUMNS = ['volatility', 'delta', 'gamma', 'theta', 'vega', 'rho']
+
+
+class OptionChainFrame():
+
+    """
+    ### Overview
+    ----
+    A columnar snapshot of a Get Option Chain response. The nested
+    `callExpDateMap` and `putExpDateMap` are flattened into one row
+    per contract with a typed NumPy array per field, the side and the
+    expiration of each contract are stored as integer codes, so chains
+    can be filtered and sorted with vectorized operations.
+
+    ### Usage
+    ----
+        >>> option_chain_frame = options_chain_service.get_option_chain_frame(
+                option_chain_query=option_chain_query
+            )
+        >>> calls = option_chain_frame.take(option_chain_frame.put_call == CALL)
+        >>> calls.symbols[calls['delta'] > 0.3]
+    """
+
+    def __init__(
+        self,
+        symbols: np.ndarray,
+        put_call: np.ndarray,
+        expiration_code: np.ndarray,
+        expirations: np.ndarray,
+        columns: dict,
+        chain: dict = None
+    ) -> None:
+        """Initializes the `OptionChainFrame` object.
+
+        ### Parameters
+        ----
+        symbols : np.ndarray
+            The option symbol of each row.
+
+        put_call : np.ndarray
+            The side of each row, `CALL` or `PUT`.
+
+        expiration_code : np.ndarray
+            The position of each row's expiration in `expirations`.
+
+        expirations : np.ndarray
+            The expiration keys of the chain, for example
+            `2021-06-18:3`, sorted by date.
+
+        columns : dict
+            One NumPy array per field, keyed by field name.
+
+        chain : dict (optional, Default=None)
+            The chain level fields of the response, such as
+            `symbol`, `underlyingPrice` and `interestRate`.
+        """
+
+        self.symbols = symbols
+        self.put_call = put_call
+        self.expiration_code = expiration_code
+        self.expirations = expirations
+        self.columns = columns
+        self.chain = chain or {}
+        self.index = {symbol: row for row, symbol in enumerate(symbols.tolist())}
+
+    @classmethod
+    def from_chain(cls, content: dict, fields: List[str] = None) -> 'OptionChainFrame':
+        """Builds an `OptionChainFrame` from a Get Option Chain response.
+
+        ### Parameters
+        ----
+        content : dict
+            The response of `OptionsChain.get_option_chain`.
+
+        fields : List[str] (optional, Default=None)
+            The contract fields to keep, defaults to every
+            field in `OPTION_CHAIN_COLUMNS`.
+
+        ### Returns
+        ----
+        OptionChainFrame:
+            The columnar snapshot.
+        """
+
+        call_map = content.get('callExpDateMap') or {}
+        put_map = content.get('putExpDateMap') or {}
+
+        expirations = sorted(set(call_map) | set(put_map))
+        expiration_codes = {key: code for code, key in enumerate(expirations)}
+
+        contracts = []
+        put_call = []
+        expiration_code = []
+
+        # Walk the nested maps once, keeping the codes next to the contracts.
+        for side, expiration_map in ((CALL, call_map), (PUT, put_map)):
+            for expiration, strikes in expiration_map.items():
+                code = expiration_codes[expiration]
+                for strike_contracts in strikes.values():
+                    contracts.extend(strike_contracts)
+                    put_call.extend([side] * len(strike_contracts))
+                    expiration_code.extend([code] * len(strike_contracts))
+
+        columns = {}
+
+        for field in fields or OPTION_CHAIN_COLUMNS:
+            columns[field] = cls._to_array(
+                values=[contract.get(field) for contract in contracts],
+                dtype=OPTION_CHAIN_COLUMNS.get(field, object)
+            )
+
+            if field in MISSING_GREEK_COLUMNS:
+                columns[field][columns[field] == -999.0] = np.nan
+
+        chain = {
+            key: value for key, value in content.items()
+            if key not in ('callExpDateMap', 'putExpDateMap')
+        }
+
+        return cls(
+            symbols=np.array([contract.get('symbol') for contract in contracts], dtype=str),
+            put_call=np.array(put_call, dtype=np.int8),
+            expiration_code=np.array(expiration_code, dtype=np.int32),
+            expirations=np.array(expirations, dtype=str),
+            columns=columns,
+            chain=chain
+        )
+
+    @staticmethod
+    def _to_array(values: list, dtype: type) -> np.ndarray:
+        """Converts the values of one field to its column.
+
+        ### Overview
+        ----
+        Missing or `NaN` values become `NaN` in float columns and `0`
+        in integer and boolean columns.
+
+        ### Parameters
+        ----
+        values : list
+            The values of one field for every contract.
+
+        dtype : type
+            The dtype of the column.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The column.
+        """
+
+        if dtype is np.float64 or dtype is object:
+            return np.array(values, dtype=dtype)
+
+        return np.array(
+            [0 if value is None or value == 'NaN' else value for value in values],
+            dtype=dtype
+        )
+
+    @property
+    def fields(self) -> List[str]:
+        """Returns the names of the columns."""
+
+        return list(self.columns.keys())
+
+    @property
+    def underlying_price(self) -> Union[float, None]:
+        """Returns the underlying price the chain was priced with."""
+
+        return self.chain.get('underlyingPrice')
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __repr__(self) -> str:
+        return (
+            f"OptionChainFrame(symbol={self.chain.get('symbol')}, rows={len(self)}, "
+            f"expirations={len(self.expirations)})"
+        )
+
+    def row(self, symbol: str) -> dict:
+        """Returns the values of a single contract.
+
+        ### Parameters
+        ----
+        symbol : str
+            The option symbol to look up.
+
+        ### Returns
+        ----
+        dict:
+            The field values of the contract.
+        """
+
+        row = self.index[symbol]
+
+        return {field: column[row] for field, column in self.columns.items()}
+
+    def take(self, rows: np.ndarray) -> 'OptionChainFrame':
+        """Selects a subset of the contracts.
+
+        ### Parameters
+        ----
+        rows : np.ndarray
+            A boolean mask or an array of row numbers.
+
+        ### Returns
+        ----
+        OptionChainFrame:
+            A new frame with the selected rows, the `expirations`
+            and their codes are kept unchanged.
+
+        ### Usage
+        ----
+            >>> puts = option_chain_frame.take(option_chain_frame.put_call == PUT)
+            >>> order = np.argsort(puts['strikePrice'])
+            >>> puts.take(order)
+        """
+
+        return OptionChainFrame(
+            symbols=self.symbols[rows],
+            put_call=self.put_call[rows],
+            expiration_code=self.expiration_code[rows],
+            expirations=self.expirations,
+            columns={field: column[rows] for field, column in self.columns.items()},
+            chain=self.chain
+        )
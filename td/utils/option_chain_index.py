@@ -0,0 +1,337 @@
+from typing import Union
+
+import numpy as np
+
+from td.utils.option_chain_frame import CALL
+from td.utils.option_chain_frame import PUT
+from td.utils.option_chain_frame import OptionChainFrame
+
+
+def _nearest(sorted_values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Finds the position of the closest sorted value to each target.
+
+    ### Parameters
+    ----
+    sorted_values : np.ndarray
+        The values to search, sorted ascending.
+
+    targets : np.ndarray
+        The values to look for.
+
+    ### Returns
+    ----
+    np.ndarray:
+        The position of the nearest value, ties go to the lower one.
+    """
+
+    if len(sorted_values) == 1:
+        return np.zeros(np.shape(targets), dtype=np.intp)
+
+    upper = np.clip(np.searchsorted(sorted_values, targets), 1, len(sorted_values) - 1)
+    lower = upper - 1
+
+    closer_to_upper = np.abs(sorted_values[upper] - targets) < np.abs(targets - sorted_values[lower])
+
+    return np.where(closer_to_upper, upper, lower)
+
+
+class OptionChainIndex():
+
+    """
+    ### Overview
+    ----
+    Sorted views over a flattened option chain so the common strategy
+    lookups are binary searches instead of scans. The index keeps a
+    sorted days to expiration array and, for every expiration and side,
+    the contracts sorted by strike and by delta. Every lookup returns
+    row numbers of the `OptionChainFrame`.
+
+    ### Usage
+    ----
+        >>> option_chain_index = OptionChainIndex(option_chain_frame=option_chain_frame)
+        >>> # The 30-delta put nearest 45 days to expiration.
+        >>> row = option_chain_index.nearest_delta(
+                delta=-0.30,
+                days_to_expiration=45,
+                put_call=PUT
+            )
+        >>> option_chain_frame.symbols[row]
+        >>> # The at-the-money straddle of the same expiration.
+        >>> call_row, put_row = option_chain_index.atm_straddle(days_to_expiration=45)
+    """
+
+    def __init__(self, option_chain_frame: OptionChainFrame) -> None:
+        """Initializes the `OptionChainIndex` object.
+
+        ### Parameters
+        ----
+        option_chain_frame : OptionChainFrame
+            The flattened chain, it needs the `strikePrice` and
+            `daysToExpiration` columns, and `delta` for delta lookups.
+        """
+
+        self.option_chain_frame = option_chain_frame
+
+        codes = option_chain_frame.expiration_code
+        put_call = option_chain_frame.put_call
+        strikes = option_chain_frame['strikePrice']
+
+        # One days to expiration value per expiration, sorted.
+        expiration_codes, first_rows = np.unique(codes, return_index=True)
+        days = option_chain_frame['daysToExpiration'][first_rows]
+        order = np.argsort(days, kind='stable')
+
+        self.days_to_expiration = days[order]
+        self.expiration_codes = expiration_codes[order]
+
+        # Every (expiration, side) group sorted by strike.
+        self._strike_rows = np.lexsort((strikes, put_call, codes))
+        self._strike_values = strikes[self._strike_rows]
+        self._groups = self._build_groups(
+            codes=codes[self._strike_rows],
+            put_call=put_call[self._strike_rows]
+        )
+
+        # The same groups sorted by delta, contracts without a delta are left out.
+        self._delta_rows = np.array([], dtype=np.intp)
+        self._delta_values = np.array([], dtype=np.float64)
+        self._delta_groups = {}
+
+        if 'delta' in option_chain_frame.columns:
+
+            deltas = option_chain_frame['delta']
+            rows = np.flatnonzero(np.isfinite(deltas))
+            rows = rows[np.lexsort((deltas[rows], put_call[rows], codes[rows]))]
+
+            self._delta_rows = rows
+            self._delta_values = deltas[rows]
+            self._delta_groups = self._build_groups(
+                codes=codes[rows],
+                put_call=put_call[rows]
+            )
+
+    @staticmethod
+    def _build_groups(codes: np.ndarray, put_call: np.ndarray) -> dict:
+        """Finds where each `(expiration code, side)` group starts and ends."""
+
+        boundaries = np.flatnonzero(
+            np.r_[True, (codes[1:] != codes[:-1]) | (put_call[1:] != put_call[:-1]), True]
+        )
+
+        return {
+            (int(codes[start]), int(put_call[start])): (start, end)
+            for start, end in zip(boundaries[:-1].tolist(), boundaries[1:].tolist())
+        }
+
+    def nearest_expiration(self, days_to_expiration: Union[int, np.ndarray]) -> np.ndarray:
+        """Finds the expiration closest to a number of days.
+
+        ### Parameters
+        ----
+        days_to_expiration : Union[int, np.ndarray]
+            The target days to expiration.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The expiration code of the closest expiration, look the
+            key up in `option_chain_frame.expirations`.
+        """
+
+        if len(self.days_to_expiration) == 0:
+            raise LookupError('The option chain has no contracts.')
+
+        position = _nearest(
+            sorted_values=self.days_to_expiration,
+            targets=np.asarray(days_to_expiration)
+        )
+
+        return self.expiration_codes[position]
+
+    def _resolve_expiration(
+        self,
+        days_to_expiration: int,
+        expiration_code: int
+    ) -> int:
+        """Picks the expiration code from either argument, one of
+        them has to be given."""
+
+        if expiration_code is not None:
+            return int(expiration_code)
+
+        if days_to_expiration is None:
+            raise ValueError('Pass either `days_to_expiration` or `expiration_code`.')
+
+        return int(self.nearest_expiration(days_to_expiration=days_to_expiration))
+
+    def strikes(
+        self,
+        put_call: int = CALL,
+        days_to_expiration: int = None,
+        expiration_code: int = None
+    ) -> np.ndarray:
+        """Returns the sorted strikes of one expiration and side.
+
+        ### Parameters
+        ----
+        put_call : int (optional, Default=CALL)
+            The side, `CALL` or `PUT`.
+
+        days_to_expiration : int (optional, Default=None)
+            Picks the expiration closest to this many days.
+
+        expiration_code : int (optional, Default=None)
+            Picks the expiration directly.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The strikes sorted ascending.
+        """
+
+        code = self._resolve_expiration(
+            days_to_expiration=days_to_expiration,
+            expiration_code=expiration_code
+        )
+        start, end = self._groups.get((code, put_call), (0, 0))
+
+        return self._strike_values[start:end]
+
+    def nearest_strike(
+        self,
+        strike: Union[float, np.ndarray],
+        put_call: int = CALL,
+        days_to_expiration: int = None,
+        expiration_code: int = None
+    ) -> np.ndarray:
+        """Finds the contract with the strike closest to a price.
+
+        ### Parameters
+        ----
+        strike : Union[float, np.ndarray]
+            The target strike or strikes.
+
+        put_call : int (optional, Default=CALL)
+            The side, `CALL` or `PUT`.
+
+        days_to_expiration : int (optional, Default=None)
+            Picks the expiration closest to this many days.
+
+        expiration_code : int (optional, Default=None)
+            Picks the expiration directly.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The row of the contract in the `OptionChainFrame`.
+        """
+
+        code = self._resolve_expiration(
+            days_to_expiration=days_to_expiration,
+            expiration_code=expiration_code
+        )
+
+        if (code, put_call) not in self._groups:
+            raise LookupError(f'No contracts for expiration code {code} and side {put_call}.')
+
+        start, end = self._groups[(code, put_call)]
+        position = _nearest(
+            sorted_values=self._strike_values[start:end],
+            targets=np.asarray(strike, dtype=np.float64)
+        )
+
+        return self._strike_rows[start + position]
+
+    def nearest_delta(
+        self,
+        delta: Union[float, np.ndarray],
+        put_call: int = CALL,
+        days_to_expiration: int = None,
+        expiration_code: int = None
+    ) -> np.ndarray:
+        """Finds the contract with the delta closest to a target.
+
+        ### Parameters
+        ----
+        delta : Union[float, np.ndarray]
+            The target delta or deltas, negative for puts.
+
+        put_call : int (optional, Default=CALL)
+            The side, `CALL` or `PUT`.
+
+        days_to_expiration : int (optional, Default=None)
+            Picks the expiration closest to this many days.
+
+        expiration_code : int (optional, Default=None)
+            Picks the expiration directly.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The row of the contract in the `OptionChainFrame`.
+        """
+
+        code = self._resolve_expiration(
+            days_to_expiration=days_to_expiration,
+            expiration_code=expiration_code
+        )
+
+        if (code, put_call) not in self._delta_groups:
+            raise LookupError(f'No contracts with a delta for expiration code {code} and side {put_call}.')
+
+        start, end = self._delta_groups[(code, put_call)]
+        position = _nearest(
+            sorted_values=self._delta_values[start:end],
+            targets=np.asarray(delta, dtype=np.float64)
+        )
+
+        return self._delta_rows[start + position]
+
+    def atm_straddle(
+        self,
+        days_to_expiration: int = None,
+        expiration_code: int = None,
+        underlying_price: float = None
+    ) -> tuple:
+        """Finds the call and put at the strike closest to the underlying.
+
+        ### Parameters
+        ----
+        days_to_expiration : int (optional, Default=None)
+            Picks the expiration closest to this many days.
+
+        expiration_code : int (optional, Default=None)
+            Picks the expiration directly.
+
+        underlying_price : float (optional, Default=None)
+            Defaults to the chain's `underlyingPrice`.
+
+        ### Returns
+        ----
+        tuple:
+            The rows of the call and of the put, both at the same strike.
+        """
+
+        if underlying_price is None:
+            underlying_price = self.option_chain_frame.underlying_price
+
+        code = self._resolve_expiration(
+            days_to_expiration=days_to_expiration,
+            expiration_code=expiration_code
+        )
+
+        # Only strikes listed on both sides make a straddle.
+        common_strikes = np.intersect1d(
+            self.strikes(put_call=CALL, expiration_code=code),
+            self.strikes(put_call=PUT, expiration_code=code)
+        )
+
+        if len(common_strikes) == 0:
+            raise LookupError(f'No strike has both a call and a put for expiration code {code}.')
+
+        strike = common_strikes[_nearest(sorted_values=common_strikes, targets=underlying_price)]
+
+        return (
+            int(self.nearest_strike(strike=strike, put_call=CALL, expiration_code=code)),
+            int(self.nearest_strike(strike=strike, put_call=PUT, expiration_code=code))
+        )
@@ -0,0 +1,291 @@
+import time
+import asyncio
+import threading
+
+from typing import List
+from typing import Callable
+from typing import Awaitable
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class QuoteCache():
+
+    """
+    ### Overview
+    ----
+    An in-memory quote cache for the `Quotes` service. Each symbol
+    expires on its own after its TTL, the least recently used symbols
+    are evicted once the cache is full, and requests for symbols that
+    are already being fetched wait on the pending fetch instead of
+    making their own round-trip. The cache can be shared by threads
+    and asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1.0,
+        max_size: int = 10000,
+        symbol_ttls: dict = None
+    ) -> None:
+        """Initializes the `QuoteCache` object.
+
+        ### Parameters
+        ----
+        ttl : float (optional, Default=1.0)
+            The number of seconds a quote stays fresh.
+
+        max_size : int (optional, Default=10000)
+            The maximum number of symbols held in the cache.
+
+        symbol_ttls : dict (optional, Default=None)
+            Overrides the `ttl` for specific symbols, for example
+            `{'$SPX.X': 0.25}`.
+
+        ### Usage
+        ----
+            >>> quote_cache = QuoteCache(ttl=0.5, max_size=5000)
+            >>> td_client = TdAmeritradeClient(
+                    credentials=td_credentials,
+                    quote_cache=quote_cache
+                )
+            >>> td_client.quotes().get_quote(instrument='AAPL')
+            >>> quote_cache.stats
+        """
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.symbol_ttls = symbol_ttls or {}
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._in_flight = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def _claim(self, symbols: List[str]) -> tuple:
+        """Sorts the symbols into cached, pending and missing ones.
+
+        ### Parameters
+        ----
+        symbols : List[str]
+            The symbols requested by the caller.
+
+        ### Returns
+        ----
+        tuple:
+            The fresh cached quotes, the pending futures to wait on,
+            and the futures this caller is now responsible for.
+        """
+
+        now = time.monotonic()
+        cached = {}
+        pending = {}
+        claimed = {}
+
+        with self._lock:
+
+            for symbol in dict.fromkeys(symbols):
+
+                entry = self._entries.get(symbol)
+
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(symbol)
+                    cached[symbol] = entry[1]
+                    self._hits += 1
+                elif symbol in self._in_flight:
+                    pending[symbol] = self._in_flight[symbol]
+                    self._coalesced += 1
+                else:
+                    future = Future()
+                    self._in_flight[symbol] = future
+                    claimed[symbol] = future
+                    self._misses += 1
+
+        return cached, pending, claimed
+
+    def _store(self, claimed: dict, content: dict) -> None:
+        """Stores the fetched quotes and resolves the claimed futures.
+
+        ### Parameters
+        ----
+        claimed : dict
+            The futures of the symbols that were fetched.
+
+        content : dict
+            The quotes returned by the API keyed by symbol.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+
+            for symbol, quote in content.items():
+
+                expires = now + self.symbol_ttls.get(symbol, self.ttl)
+                self._entries[symbol] = (expires, quote)
+                self._entries.move_to_end(symbol)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+            for symbol in claimed:
+                self._in_flight.pop(symbol, None)
+
+        # Symbols the API did not return resolve to `None`.
+        for symbol, future in claimed.items():
+            future.set_result(content.get(symbol))
+
+    def _fail(self, claimed: dict, error: BaseException) -> None:
+        """Hands the fetch error to every caller waiting on it. When
+        only some quote chunks failed, the quotes of the other chunks
+        are stored and only the symbols of the failed chunks fail."""
+
+        # Imported here, `td.rest.quotes` imports this module.
+        from td.rest.quotes import QuotesChunkError
+
+        if isinstance(error, QuotesChunkError):
+
+            failed_symbols = {symbol for chunk in error.errors for symbol in chunk}
+            fetched = {
+                symbol: future
+                for symbol, future in claimed.items()
+                if symbol not in failed_symbols
+            }
+
+            self._store(claimed=fetched, content=error.content)
+            claimed = {
+                symbol: future
+                for symbol, future in claimed.items()
+                if symbol in failed_symbols
+            }
+
+        with self._lock:
+            for symbol in claimed:
+                self._in_flight.pop(symbol, None)
+
+        for future in claimed.values():
+            future.set_exception(error)
+
+    def _assemble(self, symbols: List[str], quotes: dict) -> dict:
+        """Puts the quotes in the order they were requested."""
+
+        return {
+            symbol: quotes[symbol]
+            for symbol in dict.fromkeys(symbols)
+            if quotes.get(symbol) is not None
+        }
+
+    def get_or_fetch(
+        self,
+        symbols: List[str],
+        fetch: Callable[[List[str]], dict]
+    ) -> dict:
+        """Returns the quotes, fetching only what is missing.
+
+        ### Parameters
+        ----
+        symbols : List[str]
+            The symbols to return quotes for.
+
+        fetch : Callable[[List[str]], dict]
+            Fetches the quotes of the missing symbols.
+
+        ### Returns
+        ----
+        dict:
+            The quotes keyed by symbol.
+        """
+
+        quotes, pending, claimed = self._claim(symbols=symbols)
+
+        if claimed:
+
+            try:
+                content = fetch(list(claimed))
+            except BaseException as fetch_error:
+                self._fail(claimed=claimed, error=fetch_error)
+                raise
+
+            self._store(claimed=claimed, content=content)
+            quotes.update(content)
+
+        for symbol, future in pending.items():
+            quotes[symbol] = future.result()
+
+        return self._assemble(symbols=symbols, quotes=quotes)
+
+    async def get_or_fetch_async(
+        self,
+        symbols: List[str],
+        fetch: Callable[[List[str]], Awaitable[dict]]
+    ) -> dict:
+        """Returns the quotes, fetching only what is missing.
+
+        ### Parameters
+        ----
+        symbols : List[str]
+            The symbols to return quotes for.
+
+        fetch : Callable[[List[str]], Awaitable[dict]]
+            A coroutine function that fetches the quotes of
+            the missing symbols.
+
+        ### Returns
+        ----
+        dict:
+            The quotes keyed by symbol.
+        """
+
+        quotes, pending, claimed = self._claim(symbols=symbols)
+
+        if claimed:
+
+            try:
+                content = await fetch(list(claimed))
+            except BaseException as fetch_error:
+                self._fail(claimed=claimed, error=fetch_error)
+                raise
+
+            self._store(claimed=claimed, content=content)
+            quotes.update(content)
+
+        for symbol, future in pending.items():
+            quotes[symbol] = await asyncio.wrap_future(future)
+
+        return self._assemble(symbols=symbols, quotes=quotes)
+
+    def invalidate(self, symbols: List[str] = None) -> None:
+        """Removes symbols from the cache, or every symbol if none
+        are provided."""
+
+        with self._lock:
+            if symbols is None:
+                self._entries.clear()
+            else:
+                for symbol in symbols:
+                    self._entries.pop(symbol, None)
+
+    @property
+    def stats(self) -> dict:
+        """Returns the counters of the cache.
+
+        ### Returns
+        ----
+        dict:
+            The `hits`, `misses`, `coalesced` and `evictions`
+            counts along with the current `size`.
+        """
+
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'coalesced': self._coalesced,
+                'evictions': self._evictions,
+                'size': len(self._entries)
+            }
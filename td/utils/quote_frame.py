@@ -0,0 +1,148 @@
+from typing import List
+
+import numpy as np
+
+
+class QuoteFrame():
+
+    """
+    ### Overview
+    ----
+    A columnar snapshot of a Get Quotes response. Each field is
+    stored in a single NumPy array and rows line up with the
+    `symbols` array, so screeners can filter and sort with
+    vectorized operations.
+
+    ### Usage
+    ----
+        >>> quote_frame = quote_service.get_quotes_frame(
+                instruments=['AAPL', 'SQ', 'MSFT'],
+                fields=['bidPrice', 'askPrice', 'totalVolume']
+            )
+        >>> spread = quote_frame['askPrice'] - quote_frame['bidPrice']
+        >>> quote_frame.symbols[spread < 0.05]
+    """
+
+    def __init__(self, symbols: np.ndarray, columns: dict) -> None:
+        """Initializes the `QuoteFrame` object.
+
+        ### Parameters
+        ----
+        symbols : np.ndarray
+            The symbol of each row.
+
+        columns : dict
+            One NumPy array per field, keyed by field name.
+        """
+
+        self.symbols = symbols
+        self.columns = columns
+        self.index = {symbol: row for row, symbol in enumerate(symbols.tolist())}
+
+    @classmethod
+    def from_quotes(cls, content: dict, fields: List[str] = None) -> 'QuoteFrame':
+        """Builds a `QuoteFrame` from a Get Quotes response.
+
+        ### Parameters
+        ----
+        content : dict
+            The quotes keyed by symbol, as returned by
+            `Quotes.get_quotes`.
+
+        fields : List[str] (optional, Default=None)
+            The fields to keep, defaults to every field
+            found in the response.
+
+        ### Returns
+        ----
+        QuoteFrame:
+            The columnar snapshot.
+        """
+
+        quotes = list(content.values())
+        symbols = np.array(list(content.keys()), dtype=str)
+
+        if fields is None:
+            fields = list(dict.fromkeys(
+                field for quote in quotes for field in quote
+            ))
+
+        columns = {}
+
+        for field in fields:
+            values = [quote.get(field) for quote in quotes]
+            columns[field] = cls._to_array(values=values)
+
+        return cls(symbols=symbols, columns=columns)
+
+    @staticmethod
+    def _to_array(values: list) -> np.ndarray:
+        """Picks the tightest dtype for a column.
+
+        ### Overview
+        ----
+        Lets NumPy infer the dtype first, so complete boolean, integer,
+        float and string columns keep their native type. Numeric columns
+        with missing values become `float64` with `NaN`, anything else
+        is kept as an `object` array.
+
+        ### Parameters
+        ----
+        values : list
+            The values of one field for every row.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The column.
+        """
+
+        column = np.array(values)
+
+        if column.dtype.kind in 'bifU':
+            return column
+
+        # Missing values or mixed types.
+        try:
+            return np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64
+            )
+        except (TypeError, ValueError):
+            return np.array(values, dtype=object)
+
+    @property
+    def fields(self) -> List[str]:
+        """Returns the names of the columns."""
+
+        return list(self.columns.keys())
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __repr__(self) -> str:
+        return f"QuoteFrame(rows={len(self)}, fields={len(self.columns)})"
+
+    def row(self, symbol: str) -> dict:
+        """Returns the values of a single symbol.
+
+        ### Parameters
+        ----
+        symbol : str
+            The symbol to look up.
+
+        ### Returns
+        ----
+        dict:
+            The field values of the symbol.
+        """
+
+        row = self.index[symbol]
+
+        return {field: column[row] for field, column in self.columns.items()}
@@ -0,0 +1,255 @@
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+
+from enum import Enum
+from typing import Union
+
+from td.utils.enums import RequestPriority
+
+
+class RateLimiter():
+
+    """
+    ### Overview
+    ----
+    A token bucket that keeps the library under the TD Ameritrade
+    request budget. Tokens refill continuously at `max_requests`
+    per `period` seconds, and callers waiting for a token are served
+    by priority lane first and arrival order second, so orders can
+    jump ahead of bulk downloads. The same limiter can be shared by
+    threads and asyncio tasks, and by a `TdAmeritradeSession` and an
+    `AsyncTdAmeritradeSession` so they spend one budget.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 120,
+        period: float = 60.0,
+        burst: int = None
+    ) -> None:
+        """Initializes the `RateLimiter` object.
+
+        ### Parameters
+        ----
+        max_requests : int (optional, Default=120)
+            The number of requests allowed per `period`.
+
+        period : float (optional, Default=60.0)
+            The length of the window in seconds.
+
+        burst : int (optional, Default=None)
+            The maximum number of tokens the bucket can hold,
+            defaults to `max_requests`.
+
+        ### Usage
+        ----
+            >>> rate_limiter = RateLimiter(max_requests=120, period=60)
+            >>> wait_time = rate_limiter.acquire(priority=RequestPriority.High)
+        """
+
+        if max_requests <= 0 or period <= 0:
+            raise ValueError('max_requests and period must be greater than 0.')
+
+        self.rate = max_requests / period
+        self.capacity = burst or max_requests
+
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._condition = threading.Condition()
+        self._waiters = []
+        self._counter = itertools.count()
+
+        self._requests_acquired = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def _refill(self) -> None:
+        """Adds the tokens earned since the last refill."""
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def _try_acquire(self, ticket: tuple) -> float:
+        """Tries to hand a token to the ticket, must hold the lock.
+
+        ### Parameters
+        ----
+        ticket : tuple
+            The `(priority, sequence)` ticket of the waiter.
+
+        ### Returns
+        ----
+        float:
+            `0.0` if a token was taken, otherwise the number of
+            seconds to wait before trying again.
+        """
+
+        self._refill()
+
+        if self._waiters[0] == ticket and self._tokens >= 1:
+            heapq.heappop(self._waiters)
+            self._tokens -= 1
+            return 0.0
+
+        # Wait for the next token, waiters behind the head re-check then too.
+        return max((1 - self._tokens) / self.rate, 0.005)
+
+    def _enqueue(self, priority: Union[RequestPriority, int]) -> tuple:
+        """Places a new ticket in the waiting queue, must hold the lock."""
+
+        if isinstance(priority, Enum):
+            priority = priority.value
+
+        ticket = (priority, next(self._counter))
+        heapq.heappush(self._waiters, ticket)
+
+        return ticket
+
+    def _discard(self, ticket: tuple) -> None:
+        """Removes an abandoned ticket from the queue, must hold the lock."""
+
+        if ticket in self._waiters:
+            self._waiters.remove(ticket)
+            heapq.heapify(self._waiters)
+
+    def _record_wait(self, wait_time: float) -> None:
+        """Updates the wait metrics, must hold the lock."""
+
+        self._requests_acquired += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def acquire(self, priority: Union[RequestPriority, int] = RequestPriority.Normal) -> float:
+        """Blocks the current thread until a token is available.
+
+        ### Parameters
+        ----
+        priority : Union[RequestPriority, int] (optional, Default=RequestPriority.Normal)
+            The lane of the request, lower values are served first.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds spent waiting.
+        """
+
+        start = time.monotonic()
+
+        with self._condition:
+
+            ticket = self._enqueue(priority=priority)
+
+            try:
+                while True:
+                    delay = self._try_acquire(ticket=ticket)
+                    if delay == 0.0:
+                        break
+                    self._condition.wait(timeout=delay)
+            except BaseException:
+                self._discard(ticket=ticket)
+                raise
+
+            wait_time = time.monotonic() - start
+            self._record_wait(wait_time=wait_time)
+
+            # Let the next waiter check if it is at the head now.
+            self._condition.notify_all()
+
+        return wait_time
+
+    async def acquire_async(self, priority: Union[RequestPriority, int] = RequestPriority.Normal) -> float:
+        """Waits without blocking the event loop until a token is available.
+
+        ### Parameters
+        ----
+        priority : Union[RequestPriority, int] (optional, Default=RequestPriority.Normal)
+            The lane of the request, lower values are served first.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds spent waiting.
+        """
+
+        start = time.monotonic()
+
+        with self._condition:
+            ticket = self._enqueue(priority=priority)
+
+        try:
+            while True:
+                with self._condition:
+                    delay = self._try_acquire(ticket=ticket)
+                    if delay == 0.0:
+                        self._condition.notify_all()
+                        break
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._condition:
+                self._discard(ticket=ticket)
+            raise
+
+        wait_time = time.monotonic() - start
+
+        with self._condition:
+            self._record_wait(wait_time=wait_time)
+
+        return wait_time
+
+    def drain(self) -> None:
+        """Empties the bucket, used when the API answers with a 429
+        so every waiter backs off until new tokens are earned."""
+
+        with self._condition:
+            self._refill()
+            self._tokens = 0.0
+
+    @property
+    def metrics(self) -> dict:
+        """Returns the queue and wait time metrics of the limiter.
+
+        ### Returns
+        ----
+        dict:
+            The current `queue_depth` overall and per priority lane,
+            the `tokens_available`, and the count, total, average and
+            max wait time of the requests that got a token.
+
+        ### Usage
+        ----
+            >>> rate_limiter.metrics
+        """
+
+        with self._condition:
+
+            self._refill()
+
+            queue_depth_by_priority = {}
+            for priority, _ in self._waiters:
+                try:
+                    priority = RequestPriority(priority).name
+                except ValueError:
+                    pass
+                queue_depth_by_priority[priority] = queue_depth_by_priority.get(priority, 0) + 1
+
+            if self._requests_acquired:
+                average_wait_time = self._total_wait_time / self._requests_acquired
+            else:
+                average_wait_time = 0.0
+
+            return {
+                'queue_depth': len(self._waiters),
+                'queue_depth_by_priority': queue_depth_by_priority,
+                'tokens_available': self._tokens,
+                'requests_acquired': self._requests_acquired,
+                'total_wait_time': self._total_wait_time,
+                'average_wait_time': average_wait_time,
+                'max_wait_time': self._max_wait_time
+            }
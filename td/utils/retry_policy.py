@@ -0,0 +1,205 @@
+import random
+
+from typing import List
+from typing import Union
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy():
+
+    """
+    ### Overview
+    ----
+    Defines when and how long the sessions wait before retrying a
+    failed request. Transient failures (429, 500, 502, 503, 504 and
+    connection errors) are retried with full-jitter exponential backoff,
+    the `Retry-After` header is honored when the API sends one, and the
+    policy gives up once the retry count or the time budget is spent.
+
+    Only idempotent `GET` requests are retried by default, order
+    placements will never be sent twice unless `POST` is explicitly
+    added to `retry_methods` or `retry=True` is passed to the request.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_time: float = 60.0,
+        max_retry_after: float = 60.0,
+        retry_statuses: List[int] = None,
+        retry_methods: List[str] = None
+    ) -> None:
+        """Initializes the `RetryPolicy` object.
+
+        ### Parameters
+        ----
+        max_retries : int (optional, Default=3)
+            The maximum number of retries for a single request,
+            set to `0` to disable retries.
+
+        backoff_factor : float (optional, Default=0.5)
+            The base delay in seconds, the delay cap doubles
+            with every attempt.
+
+        max_backoff : float (optional, Default=30.0)
+            The longest single backoff delay in seconds, it does
+            not apply to the `Retry-After` header.
+
+        max_retry_time : float (optional, Default=60.0)
+            The total number of seconds a request may spend
+            retrying before the policy gives up.
+
+        max_retry_after : float (optional, Default=60.0)
+            The longest `Retry-After` in seconds the policy waits
+            for. If the API asks for a longer wait the request is
+            not retried, retrying before then would be refused again.
+
+        retry_statuses : List[int] (optional, Default=None)
+            The status codes that will be retried, defaults to
+            `[429, 500, 502, 503, 504]`.
+
+        retry_methods : List[str] (optional, Default=None)
+            The HTTP methods that will be retried, defaults to `['GET']`.
+
+        ### Usage
+        ----
+            >>> retry_policy = RetryPolicy(max_retries=5, backoff_factor=1.0)
+            >>> td_client = TdAmeritradeClient(
+                    credentials=td_credentials,
+                    retry_policy=retry_policy
+                )
+        """
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_time = max_retry_time
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = set(retry_statuses or [429, 500, 502, 503, 504])
+        self.retry_methods = set(
+            method.upper() for method in (retry_methods or ['GET'])
+        )
+
+    def is_retryable_method(self, method: str, retry: bool = None) -> bool:
+        """Determines if requests with this method may be retried.
+
+        ### Parameters
+        ----
+        method : str
+            The HTTP method of the request.
+
+        retry : bool (optional, Default=None)
+            A per-request override, `True` forces retries and
+            `False` disables them.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the request may be retried.
+        """
+
+        if retry is not None:
+            return retry
+
+        return method.upper() in self.retry_methods
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Determines if a response status is transient.
+
+        ### Parameters
+        ----
+        status_code : int
+            The HTTP status code of the response.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the status should be retried.
+        """
+
+        return status_code in self.retry_statuses
+
+    def parse_retry_after(self, retry_after: str) -> Union[float, None]:
+        """Parses the `Retry-After` header.
+
+        ### Parameters
+        ----
+        retry_after : str
+            The header value, either a number of seconds
+            or an HTTP date.
+
+        ### Returns
+        ----
+        Union[float, None]:
+            The number of seconds to wait, `None` if the
+            header is missing or invalid.
+        """
+
+        if not retry_after:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+        return max((retry_date - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+    def get_retry_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: str = None
+    ) -> Union[float, None]:
+        """Calculates how long to wait before the next attempt.
+
+        ### Parameters
+        ----
+        attempt : int
+            The number of retries already made.
+
+        elapsed : float
+            The seconds spent on the request so far.
+
+        retry_after : str (optional, Default=None)
+            The `Retry-After` header of the response, if any.
+
+        ### Returns
+        ----
+        Union[float, None]:
+            The delay in seconds, `None` if the retry budget
+            is spent or `Retry-After` asks for a longer wait
+            than `max_retry_after`.
+        """
+
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self.parse_retry_after(retry_after=retry_after)
+
+        # Full jitter, spread the retries out between 0 and the cap.
+        if delay is None:
+            delay = random.uniform(
+                0, min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+            )
+
+        # The API told us when to come back, don't come back sooner.
+        elif delay > self.max_retry_after:
+            return None
+
+        if elapsed + delay > self.max_retry_time:
+            return None
+
+        return delay
@@ -0,0 +1,751 @@
+import pathlib
+
+from typing import Union
+
+import numpy as np
+
+from td.utils.black_scholes import black_scholes
+from td.utils.black_scholes import implied_volatility
+from td.utils.black_scholes import DAYS_PER_YEAR
+from td.utils.black_scholes import MINIMUM_TIME
+from td.utils.option_chain_frame import CALL
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_cache import OptionChainDiff
+
+
+class VolatilitySurface():
+
+    """
+    ### Overview
+    ----
+    An implied volatility surface on an expiration by strike grid.
+    Each expiration slice is interpolated from the out-of-the-money
+    contracts of the chain, butterfly arbitrage is removed by taking
+    the convex envelope of the call prices of the slice, and calendar
+    arbitrage by keeping the total variance non-decreasing in time.
+
+    Volatility at any expiration, strike or delta is found with binary
+    searches on the grid. A refresh only rebuilds the expiration slices
+    whose contracts changed.
+
+    ### Usage
+    ----
+        >>> option_chain_frame = options_chain_service.get_option_chain_frame(
+                option_chain_query=option_chain_query
+            )
+        >>> volatility_surface = VolatilitySurface.from_chain(
+                option_chain_frame=option_chain_frame
+            )
+        >>> volatility_surface.volatility_at(days_to_expiration=45, strike=250.0)
+        >>> volatility_surface.volatility_at_delta(days_to_expiration=45, delta=-0.3)
+    """
+
+    def __init__(
+        self,
+        days_to_expiration: np.ndarray,
+        strikes: np.ndarray,
+        raw_volatility: np.ndarray,
+        underlying_price: float,
+        interest_rate: float,
+        smooth: bool = True
+    ) -> None:
+        """Initializes the `VolatilitySurface` object.
+
+        ### Parameters
+        ----
+        days_to_expiration : np.ndarray
+            The sorted days to expiration of the slices.
+
+        strikes : np.ndarray
+            The sorted strikes of the grid.
+
+        raw_volatility : np.ndarray
+            The interpolated volatility of every slice before
+            smoothing, one row per expiration.
+
+        underlying_price : float
+            The underlying price of the chain.
+
+        interest_rate : float
+            The risk free rate as a decimal.
+
+        smooth : bool (optional, Default=True)
+            If `True` the arbitrage is removed from the grid.
+        """
+
+        self.days_to_expiration = np.asarray(days_to_expiration, dtype=np.float64)
+        self.strikes = np.asarray(strikes, dtype=np.float64)
+        self.raw_volatility = np.asarray(raw_volatility, dtype=np.float64)
+        self.underlying_price = float(underlying_price)
+        self.interest_rate = float(interest_rate)
+        self.smooth = smooth
+
+        self.expirations = None
+        self.option_chain_frame = None
+        self.volatility = None
+        self.butterfly_volatility = None
+        self.deltas = None
+        self._delta_keys = None
+        self._delta_volatility = None
+
+        self._smooth_slices(rows=np.arange(len(self.days_to_expiration)))
+
+    @property
+    def time_to_expiration(self) -> np.ndarray:
+        """Returns the time left of each slice in years."""
+
+        return np.maximum(self.days_to_expiration / DAYS_PER_YEAR, MINIMUM_TIME)
+
+    @classmethod
+    def from_chain(
+        cls,
+        option_chain_frame: OptionChainFrame,
+        volatility: np.ndarray = None,
+        strikes: np.ndarray = None,
+        underlying_price: float = None,
+        interest_rate: float = None,
+        smooth: bool = True
+    ) -> 'VolatilitySurface':
+        """Builds a surface from a flattened option chain.
+
+        ### Parameters
+        ----
+        option_chain_frame : OptionChainFrame
+            The flattened chain, it needs the `strikePrice` and
+            `daysToExpiration` columns.
+
+        volatility : np.ndarray (optional, Default=None)
+            The implied volatility of each contract as a decimal, for
+            example from `implied_volatility_chain`. Defaults to the
+            `volatility` column of the chain.
+
+        strikes : np.ndarray (optional, Default=None)
+            The strikes of the grid, defaults to every strike
+            in the chain.
+
+        underlying_price : float (optional, Default=None)
+            Defaults to the chain's `underlyingPrice`.
+
+        interest_rate : float (optional, Default=None)
+            The risk free rate as a decimal, defaults
+            to the chain's `interestRate`.
+
+        smooth : bool (optional, Default=True)
+            If `True` the arbitrage is removed from the grid.
+
+        ### Returns
+        ----
+        VolatilitySurface:
+            The surface.
+        """
+
+        if underlying_price is None:
+            underlying_price = option_chain_frame.underlying_price
+
+        # The chain reports the interest rate in percent.
+        if interest_rate is None:
+            interest_rate = option_chain_frame.chain.get('interestRate', 0.0) / 100.0
+
+        if strikes is None:
+            strikes = np.unique(option_chain_frame['strikePrice'])
+
+        volatility = cls._contract_volatility(
+            option_chain_frame=option_chain_frame,
+            volatility=volatility
+        )
+
+        slices = cls._build_slices(
+            option_chain_frame=option_chain_frame,
+            volatility=volatility,
+            strikes=np.asarray(strikes, dtype=np.float64),
+            underlying_price=underlying_price,
+            expiration_codes=np.arange(len(option_chain_frame.expirations))
+        )
+
+        codes = sorted(slices, key=lambda code: slices[code][0])
+
+        surface = cls(
+            days_to_expiration=np.array([slices[code][0] for code in codes], dtype=np.float64),
+            strikes=strikes,
+            raw_volatility=np.array([slices[code][1] for code in codes]).reshape(len(codes), len(strikes)),
+            underlying_price=underlying_price,
+            interest_rate=interest_rate,
+            smooth=smooth
+        )
+        surface.expirations = option_chain_frame.expirations[codes]
+        surface.option_chain_frame = option_chain_frame
+
+        return surface
+
+    @staticmethod
+    def _contract_volatility(
+        option_chain_frame: OptionChainFrame,
+        volatility: np.ndarray
+    ) -> np.ndarray:
+        """Picks the volatility of each contract as a decimal."""
+
+        if volatility is None:
+            return option_chain_frame['volatility'] / 100.0
+
+        return np.asarray(volatility, dtype=np.float64)
+
+    @staticmethod
+    def _build_slices(
+        option_chain_frame: OptionChainFrame,
+        volatility: np.ndarray,
+        strikes: np.ndarray,
+        underlying_price: float,
+        expiration_codes: np.ndarray
+    ) -> dict:
+        """Interpolates the expiration slices onto the strike grid.
+
+        ### Parameters
+        ----
+        option_chain_frame : OptionChainFrame
+            The flattened chain.
+
+        volatility : np.ndarray
+            The volatility of each contract as a decimal.
+
+        strikes : np.ndarray
+            The strikes of the grid.
+
+        underlying_price : float
+            Calls are used above this price and puts below it.
+
+        expiration_codes : np.ndarray
+            The expirations to build.
+
+        ### Returns
+        ----
+        dict:
+            The `(days to expiration, volatility row)` of each expiration
+            code that has at least one usable contract.
+        """
+
+        strike_price = option_chain_frame['strikePrice']
+        is_call = option_chain_frame.put_call == CALL
+
+        # Out-of-the-money contracts with a usable volatility.
+        usable = (
+            (is_call == (strike_price >= underlying_price))
+            & np.isfinite(volatility)
+            & (volatility > 0)
+            & np.isin(option_chain_frame.expiration_code, expiration_codes)
+        )
+        rows = np.flatnonzero(usable)
+
+        if len(rows) == 0:
+            return {}
+
+        # Group the contracts by expiration, sorted by strike.
+        order = np.lexsort((strike_price[rows], option_chain_frame.expiration_code[rows]))
+        rows = rows[order]
+        codes = option_chain_frame.expiration_code[rows]
+        boundaries = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1], True])
+
+        slices = {}
+
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+
+            slice_rows = rows[start:end]
+            slices[int(codes[start])] = (
+                float(option_chain_frame['daysToExpiration'][slice_rows[0]]),
+                np.interp(strikes, strike_price[slice_rows], volatility[slice_rows])
+            )
+
+        return slices
+
+    def _smooth_slices(self, rows: np.ndarray) -> None:
+        """Removes the butterfly arbitrage of some slices and the
+        calendar arbitrage of the whole grid.
+
+        ### Parameters
+        ----
+        rows : np.ndarray
+            The slices whose raw volatility changed.
+        """
+
+        if self.butterfly_volatility is None:
+            self.butterfly_volatility = self.raw_volatility.copy()
+
+        if self.smooth and len(rows) > 0:
+            self.butterfly_volatility[rows] = self._remove_butterfly_arbitrage(rows=rows)
+        elif len(rows) > 0:
+            self.butterfly_volatility[rows] = self.raw_volatility[rows]
+
+        volatility = self.butterfly_volatility
+
+        # Total variance may not shrink with time at any strike.
+        if self.smooth and len(volatility) > 0:
+            time = self.time_to_expiration[:, np.newaxis]
+            total_variance = np.maximum.accumulate(np.square(volatility) * time, axis=0)
+            volatility = np.sqrt(total_variance / time)
+
+        self.volatility = volatility
+        self.deltas = black_scholes(
+            is_call=True,
+            underlying_price=self.underlying_price,
+            strike_price=self.strikes,
+            time_to_expiration=self.time_to_expiration[:, np.newaxis],
+            volatility=volatility,
+            interest_rate=self.interest_rate
+        )['delta'].reshape(volatility.shape)
+
+        # Call deltas fall as the strike rises, so the reversed slices are
+        # sorted by delta. Each slice is shifted by twice its row, which
+        # keeps the flattened grid sorted for one binary search.
+        row_offsets = 2.0 * np.arange(len(volatility))[:, np.newaxis]
+        self._delta_keys = (self.deltas[:, ::-1] + row_offsets).ravel()
+        self._delta_volatility = volatility[:, ::-1].ravel()
+
+    def _remove_butterfly_arbitrage(self, rows: np.ndarray) -> np.ndarray:
+        """Replaces the call prices of each slice with their convex,
+        non-increasing envelope and solves the volatility back.
+
+        ### Parameters
+        ----
+        rows : np.ndarray
+            The slices to smooth.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The smoothed volatility of the slices.
+        """
+
+        raw_volatility = self.raw_volatility[rows]
+        time = self.time_to_expiration[rows, np.newaxis]
+
+        prices = black_scholes(
+            is_call=True,
+            underlying_price=self.underlying_price,
+            strike_price=self.strikes,
+            time_to_expiration=time,
+            volatility=raw_volatility,
+            interest_rate=self.interest_rate
+        )['price']
+
+        envelope = np.array([
+            self._lower_convex_envelope(x=self.strikes, y=row_prices)
+            for row_prices in prices
+        ]).reshape(prices.shape)
+
+        # Call prices never rise with the strike.
+        envelope = np.minimum.accumulate(envelope, axis=1)
+
+        volatility = implied_volatility(
+            option_price=envelope,
+            is_call=True,
+            underlying_price=self.underlying_price,
+            strike_price=self.strikes,
+            time_to_expiration=time,
+            interest_rate=self.interest_rate
+        )
+
+        # Deep contracts with no time value keep their raw volatility.
+        return np.where(np.isfinite(volatility), volatility, raw_volatility)
+
+    @staticmethod
+    def _lower_convex_envelope(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Evaluates the lower convex envelope of the points on `x`."""
+
+        hull = []
+
+        for point, (point_x, point_y) in enumerate(zip(x, y)):
+            while len(hull) >= 2:
+                first, second = hull[-2], hull[-1]
+                cross = (
+                    (x[second] - x[first]) * (point_y - y[first])
+                    - (y[second] - y[first]) * (point_x - x[first])
+                )
+                if cross > 0:
+                    break
+                hull.pop()
+            hull.append(point)
+
+        return np.interp(x, x[hull], y[hull])
+
+    def refresh(
+        self,
+        option_chain_diff: OptionChainDiff,
+        volatility: np.ndarray = None
+    ) -> np.ndarray:
+        """Rebuilds only the slices whose contracts moved.
+
+        ### Overview
+        ----
+        The days to expiration of every slice are updated, slices whose
+        contracts changed or whose strikes the underlying crossed are
+        interpolated again, and slices left without a usable contract
+        are dropped. Falls back to a full rebuild when an expiration was
+        added or removed, or when the surface was loaded from disk.
+
+        ### Parameters
+        ----
+        option_chain_diff : OptionChainDiff
+            The diff returned by `OptionsChain.refresh_option_chain`.
+
+        volatility : np.ndarray (optional, Default=None)
+            The implied volatility of each contract of the new snapshot,
+            defaults to its `volatility` column.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The expiration keys of the slices that were rebuilt.
+
+        ### Usage
+        ----
+            >>> option_chain_diff = options_chain_service.refresh_option_chain(
+                    option_chain_query=option_chain_query
+                )
+            >>> volatility_surface.refresh(option_chain_diff=option_chain_diff)
+        """
+
+        snapshot = option_chain_diff.snapshot
+        previous = self.option_chain_frame
+
+        new_underlying_price = snapshot.underlying_price or self.underlying_price
+
+        if previous is None or not np.array_equal(previous.expirations, snapshot.expirations):
+            return self._rebuild(
+                snapshot=snapshot,
+                volatility=volatility,
+                underlying_price=new_underlying_price
+            )
+
+        # Every slice moves one day closer to expiration, not only the changed ones.
+        expiration_days = np.zeros(len(snapshot.expirations))
+        expiration_days[snapshot.expiration_code] = snapshot['daysToExpiration']
+
+        code_of = {key: code for code, key in enumerate(snapshot.expirations.tolist())}
+        row_codes = np.array([code_of[key] for key in self.expirations.tolist()], dtype=np.intp)
+        days_to_expiration = expiration_days[row_codes]
+
+        if np.any(np.diff(days_to_expiration) < 0):
+            return self._rebuild(
+                snapshot=snapshot,
+                volatility=volatility,
+                underlying_price=new_underlying_price
+            )
+
+        # Find the expirations of every contract that moved.
+        removed_rows = [previous.index[symbol] for symbol in option_chain_diff.removed.tolist()]
+        moved_codes = [
+            option_chain_diff.added.expiration_code,
+            option_chain_diff.changed.expiration_code,
+            previous.expiration_code[np.array(removed_rows, dtype=np.intp)]
+        ]
+
+        # Strikes the underlying crossed switch between the call and the put.
+        if new_underlying_price != self.underlying_price:
+            low, high = sorted((self.underlying_price, new_underlying_price))
+            strike_price = snapshot['strikePrice']
+            moved_codes.append(
+                snapshot.expiration_code[(strike_price >= low) & (strike_price <= high)]
+            )
+
+        changed_codes = np.unique(np.concatenate(moved_codes))
+
+        aged = np.flatnonzero(days_to_expiration != self.days_to_expiration)
+        self.days_to_expiration = days_to_expiration
+        self.underlying_price = new_underlying_price
+        self.option_chain_frame = snapshot
+
+        rebuilt = np.flatnonzero(np.isin(row_codes, changed_codes))
+
+        if len(rebuilt) == 0 and len(aged) == 0:
+            return np.array([], dtype=str)
+
+        slices = self._build_slices(
+            option_chain_frame=snapshot,
+            volatility=self._contract_volatility(
+                option_chain_frame=snapshot,
+                volatility=volatility
+            ),
+            strikes=self.strikes,
+            underlying_price=self.underlying_price,
+            expiration_codes=changed_codes
+        )
+
+        for row in rebuilt:
+            if row_codes[row] in slices:
+                self.raw_volatility[row] = slices[row_codes[row]][1]
+
+        # Slices without a usable contract left are dropped, not kept stale.
+        keep = np.ones(len(row_codes), dtype=bool)
+        keep[[row for row in rebuilt if row_codes[row] not in slices]] = False
+
+        rows = np.union1d(rebuilt, aged)
+
+        if not keep.all():
+            rows = (np.cumsum(keep) - 1)[rows[keep[rows]]]
+            self.days_to_expiration = self.days_to_expiration[keep]
+            self.raw_volatility = self.raw_volatility[keep]
+            self.butterfly_volatility = self.butterfly_volatility[keep]
+            self.expirations = self.expirations[keep]
+
+        self._smooth_slices(rows=rows)
+
+        return self.expirations[rows]
+
+    def _rebuild(
+        self,
+        snapshot: OptionChainFrame,
+        volatility: np.ndarray,
+        underlying_price: float
+    ) -> np.ndarray:
+        """Rebuilds every slice of the surface from a snapshot.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The expiration keys of every slice.
+        """
+
+        rebuilt = VolatilitySurface.from_chain(
+            option_chain_frame=snapshot,
+            volatility=volatility,
+            strikes=self.strikes,
+            underlying_price=underlying_price,
+            interest_rate=self.interest_rate,
+            smooth=self.smooth
+        )
+        self.__dict__.update(rebuilt.__dict__)
+
+        return self.expirations
+
+    def _slice_bracket(self, days_to_expiration: np.ndarray) -> tuple:
+        """Finds the two slices around each time with a binary search."""
+
+        time = np.maximum(np.asarray(days_to_expiration, dtype=np.float64) / DAYS_PER_YEAR, MINIMUM_TIME)
+        slice_times = self.time_to_expiration
+
+        if len(slice_times) == 1:
+            zeros = np.zeros(time.shape, dtype=np.intp)
+            return time, zeros, zeros, np.zeros(time.shape)
+
+        upper = np.clip(np.searchsorted(slice_times, time), 1, len(slice_times) - 1)
+        lower = upper - 1
+
+        # Two slices can share a time, the later one is used then.
+        span = slice_times[upper] - slice_times[lower]
+        weight = np.clip(
+            np.divide(time - slice_times[lower], span, out=np.ones(time.shape), where=span > 0),
+            0.0,
+            1.0
+        )
+
+        return time, lower, upper, weight
+
+    def _interpolate_time(
+        self,
+        time: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        weight: np.ndarray,
+        lower_volatility: np.ndarray,
+        upper_volatility: np.ndarray
+    ) -> np.ndarray:
+        """Interpolates the total variance between two slices."""
+
+        slice_times = self.time_to_expiration
+        lower_variance = np.square(lower_volatility) * slice_times[lower]
+        upper_variance = np.square(upper_volatility) * slice_times[upper]
+        total_variance = lower_variance + (upper_variance - lower_variance) * weight
+
+        # Outside the grid the volatility of the nearest slice is kept.
+        clipped_time = np.clip(time, slice_times[0], slice_times[-1])
+        clipped_time = np.where(lower == upper, slice_times[lower], clipped_time)
+
+        return np.sqrt(total_variance / clipped_time)
+
+    def _volatility_at_strike(self, rows: np.ndarray, strike: np.ndarray) -> np.ndarray:
+        """Interpolates the volatility of some slices at the strikes."""
+
+        if len(self.strikes) == 1:
+            return self.volatility[rows, 0]
+
+        upper = np.clip(np.searchsorted(self.strikes, strike), 1, len(self.strikes) - 1)
+        lower = upper - 1
+        weight = np.clip(
+            (strike - self.strikes[lower]) / (self.strikes[upper] - self.strikes[lower]), 0.0, 1.0
+        )
+
+        return self.volatility[rows, lower] * (1.0 - weight) + self.volatility[rows, upper] * weight
+
+    def volatility_at(
+        self,
+        days_to_expiration: Union[float, np.ndarray],
+        strike: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Looks up the volatility at any expiration and strike.
+
+        ### Parameters
+        ----
+        days_to_expiration : Union[float, np.ndarray]
+            The calendar days to expiration.
+
+        strike : Union[float, np.ndarray]
+            The strike price.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The volatility as a decimal, linear in strike and in
+            total variance between expirations, flat outside the grid.
+        """
+
+        days_to_expiration, strike = np.broadcast_arrays(
+            np.asarray(days_to_expiration, dtype=np.float64),
+            np.asarray(strike, dtype=np.float64)
+        )
+        time, lower, upper, weight = self._slice_bracket(days_to_expiration=days_to_expiration)
+
+        return self._interpolate_time(
+            time=time,
+            lower=lower,
+            upper=upper,
+            weight=weight,
+            lower_volatility=self._volatility_at_strike(rows=lower, strike=strike),
+            upper_volatility=self._volatility_at_strike(rows=upper, strike=strike)
+        )
+
+    def _volatility_at_delta(self, rows: np.ndarray, delta: np.ndarray) -> np.ndarray:
+        """Interpolates the volatility of some slices at call deltas."""
+
+        width = len(self.strikes)
+
+        if width == 1:
+            return self.volatility[rows, 0]
+
+        # Search every slice at once in the shifted, flattened grid.
+        keys = delta + 2.0 * rows
+        first = rows * width
+        upper = np.clip(np.searchsorted(self._delta_keys, keys), first + 1, first + width - 1)
+        lower = upper - 1
+
+        span = self._delta_keys[upper] - self._delta_keys[lower]
+        weight = np.clip(
+            np.divide(keys - self._delta_keys[lower], span, out=np.zeros(keys.shape), where=span > 0),
+            0.0,
+            1.0
+        )
+
+        return self._delta_volatility[lower] * (1.0 - weight) + self._delta_volatility[upper] * weight
+
+    def volatility_at_delta(
+        self,
+        days_to_expiration: Union[float, np.ndarray],
+        delta: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Looks up the volatility at any expiration and delta.
+
+        ### Parameters
+        ----
+        days_to_expiration : Union[float, np.ndarray]
+            The calendar days to expiration.
+
+        delta : Union[float, np.ndarray]
+            Call deltas between `0` and `1`, or put deltas
+            between `-1` and `0`.
+
+        ### Returns
+        ----
+        np.ndarray:
+            The volatility as a decimal.
+        """
+
+        days_to_expiration, delta = np.broadcast_arrays(
+            np.asarray(days_to_expiration, dtype=np.float64),
+            np.asarray(delta, dtype=np.float64)
+        )
+
+        # A put delta maps to the call delta of the same strike.
+        delta = np.where(delta < 0, delta + 1.0, delta)
+
+        time, lower, upper, weight = self._slice_bracket(days_to_expiration=days_to_expiration)
+
+        return self._interpolate_time(
+            time=time,
+            lower=lower,
+            upper=upper,
+            weight=weight,
+            lower_volatility=self._volatility_at_delta(rows=lower, delta=delta),
+            upper_volatility=self._volatility_at_delta(rows=upper, delta=delta)
+        )
+
+    def delta_grid(self, deltas: np.ndarray = None) -> np.ndarray:
+        """Resamples the surface on a call delta grid.
+
+        ### Parameters
+        ----
+        deltas : np.ndarray (optional, Default=None)
+            The call deltas of the grid, defaults to `0.05` to `0.95`.
+
+        ### Returns
+        ----
+        np.ndarray:
+            One row per expiration, one column per delta.
+        """
+
+        if deltas is None:
+            deltas = np.linspace(0.05, 0.95, 19)
+
+        deltas = np.asarray(deltas, dtype=np.float64)
+        rows = np.repeat(np.arange(len(self.volatility)), len(deltas))
+
+        return self._volatility_at_delta(
+            rows=rows,
+            delta=np.tile(deltas, len(self.volatility))
+        ).reshape(len(self.volatility), len(deltas))
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the surface grid to a `.npz` file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The file to write.
+        """
+
+        np.savez(
+            file_path,
+            days_to_expiration=self.days_to_expiration,
+            strikes=self.strikes,
+            raw_volatility=self.raw_volatility,
+            expirations=self.expirations if self.expirations is not None else np.array([], dtype=str),
+            underlying_price=self.underlying_price,
+            interest_rate=self.interest_rate,
+            smooth=self.smooth
+        )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'VolatilitySurface':
+        """Loads a surface saved with `VolatilitySurface.save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The `.npz` file to read.
+
+        ### Returns
+        ----
+        VolatilitySurface:
+            The surface, its first refresh is a full rebuild.
+        """
+
+        with np.load(file_path) as arrays:
+
+            surface = cls(
+                days_to_expiration=arrays['days_to_expiration'],
+                strikes=arrays['strikes'],
+                raw_volatility=arrays['raw_volatility'],
+                underlying_price=float(arrays['underlying_price']),
+                interest_rate=float(arrays['interest_rate']),
+                smooth=bool(arrays['smooth'])
+            )
+            surface.expirations = arrays['expirations']
+
+        return surface
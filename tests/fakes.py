@@ -0,0 +1,193 @@
+import json
+import time
+import asyncio
+import threading
+
+from collections import deque
+from websockets import exceptions as ws_exceptions
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from td.streaming.client import StreamingApiClient
+
+# The answer of the streamer to the ADMIN LOGIN request.
+LOGIN_RESPONSE = json.dumps({
+    'response': [
+        {
+            'service': 'ADMIN',
+            'command': 'LOGIN',
+            'requestid': '0',
+            'timestamp': 1,
+            'content': {'code': 0, 'msg': '29-3'}
+        }
+    ]
+})
+
+
+class FakeCredentials():
+
+    """Credentials that record where the token was refreshed."""
+
+    access_token = 'token'
+    is_refresh_token_expired = False
+
+    def __init__(self, expired: bool = False) -> None:
+
+        self.is_access_token_expired = expired
+        self.refresh_threads = []
+
+    def validate_token(self) -> None:
+
+        if self.is_access_token_expired:
+            self.refresh_threads.append(threading.current_thread())
+            self.is_access_token_expired = False
+
+
+class FakeTdClient():
+
+    """A client that only carries the fake credentials."""
+
+    def __init__(self, credentials: FakeCredentials = None) -> None:
+
+        self.td_credentials = credentials or FakeCredentials()
+
+
+class FakeAdapter(HTTPAdapter):
+
+    """An adapter that answers from a script of `(status_code, headers)`, it never connects."""
+
+    def __init__(self, script: list) -> None:
+
+        super().__init__()
+        self.script = deque(script)
+        self.sent = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+
+        self.sent.append(request)
+        status_code, headers = self.script.popleft()
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response._content = b'{"ok": true}' if status_code < 400 else b''
+        response.request = request
+        response.url = request.url
+
+        return response
+
+
+class FakeSession():
+
+    """A session that answers every request from a function, it never connects."""
+
+    def __init__(self, respond, delay: float = 0.0, pool_maxsize: int = 10) -> None:
+
+        self.respond = respond
+        self.delay = delay
+        self.pool_maxsize = pool_maxsize
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def make_request(self, method: str, endpoint: str, params: dict = None, **kwargs) -> dict:
+
+        with self._lock:
+            self.requests.append((endpoint, params))
+
+        time.sleep(self.delay)
+
+        return self.respond(endpoint, params)
+
+
+class FakeAsyncSession(FakeSession):
+
+    """The asyncio version of `FakeSession`."""
+
+    def __init__(self, respond, delay: float = 0.0, limit_per_host: int = 10) -> None:
+
+        super().__init__(respond=respond, delay=delay)
+        self.limit_per_host = limit_per_host
+
+    async def make_request(self, method: str, endpoint: str, params: dict = None, **kwargs) -> dict:
+
+        self.requests.append((endpoint, params))
+
+        await asyncio.sleep(self.delay)
+
+        return self.respond(endpoint, params)
+
+
+class OfflineStreamingApiClient(StreamingApiClient):
+
+    """A streaming client with fixed streamer info, it never connects."""
+
+    def _load_user_principals(self) -> None:
+
+        self.user_principal_data = {
+            'accounts': [{'accountId': '123456789'}],
+            'streamerInfo': {'appId': 'app', 'token': 'token'}
+        }
+        self.websocket_url = 'wss://localhost/ws'
+        self.credentials = {}
+
+
+class FakeWebSocket():
+
+    """A websocket that answers `recv` from a script, then drops.
+
+    Each item of the script is a message, an exception to raise, or
+    `None` to never answer until the socket is closed.
+    """
+
+    def __init__(self, messages: list = None) -> None:
+
+        self.messages = deque(messages or [])
+        self.sent = []
+        self.open = True
+
+    async def send(self, message: str) -> None:
+
+        self.sent.append(json.loads(message) if message != 'ping' else message)
+
+    async def recv(self) -> str:
+
+        await asyncio.sleep(0)
+
+        if not self.open or not self.messages:
+            self.open = False
+            raise ws_exceptions.ConnectionClosedError(None, None)
+
+        message = self.messages.popleft()
+
+        if message is None:
+            while self.open:
+                await asyncio.sleep(0.01)
+            raise ws_exceptions.ConnectionClosedOK(None, None)
+
+        if isinstance(message, BaseException):
+            raise message
+
+        return message
+
+    async def close(self) -> None:
+
+        self.open = False
+
+
+def fake_connect(sockets: list):
+    """Returns a `websockets.client.connect` that hands out the sockets in
+    order, an exception in the list is raised instead."""
+
+    sockets = deque(sockets)
+
+    async def connect(url: str, **kwargs) -> FakeWebSocket:
+
+        socket = sockets.popleft()
+
+        if isinstance(socket, BaseException):
+            raise socket
+
+        return socket
+
+    return connect
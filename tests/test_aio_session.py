@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+import threading
+from unittest import TestCase
+
+from td.aio.rest import AsyncMovers
+from td.aio.rest import AsyncPriceHistory
+from td.aio.session import AsyncTdAmeritradeSession
+
+from fakes import FakeTdClient
+from fakes import FakeCredentials
+from fakes import FakeAsyncSession
+
+
+class TestAsyncTdAmeritradeSession(TestCase):
+
+    """Will perform a unit test for the `AsyncTdAmeritradeSession` object."""
+
+    def setUp(self) -> None:
+        """Set up a session without a client, it never makes a request."""
+
+        self.td_session = AsyncTdAmeritradeSession(td_client=None)
+
+    def test_sync_context_manager(self):
+        """Test `with` is refused, it could not close the session."""
+
+        with self.assertRaises(TypeError):
+            with self.td_session:
+                pass
+
+    def test_async_context_manager(self):
+        """Test `async with` closes the pooled connections."""
+
+        async def open_and_close() -> AsyncTdAmeritradeSession:
+            async with self.td_session as td_session:
+                td_session._get_http_session()
+            return td_session
+
+        td_session = asyncio.run(open_and_close())
+
+        self.assertTrue(td_session.http_session.closed)
+
+    def test_validate_token_off_the_loop(self):
+        """Test an expired token is refreshed once, outside the event loop's thread."""
+
+        credentials = FakeCredentials(expired=True)
+        td_session = AsyncTdAmeritradeSession(td_client=FakeTdClient(credentials=credentials))
+
+        async def validate_concurrently() -> None:
+            await asyncio.gather(*[td_session._validate_token() for _ in range(3)])
+
+        asyncio.run(validate_concurrently())
+
+        self.assertEqual(len(credentials.refresh_threads), 1)
+        self.assertIsNot(credentials.refresh_threads[0], threading.main_thread())
+
+        # A valid token never leaves the loop.
+        asyncio.run(td_session._validate_token())
+
+        self.assertEqual(len(credentials.refresh_threads), 1)
+
+
+class TestAsyncServices(TestCase):
+
+    """Will perform a unit test for the asyncio services on a fake session."""
+
+    def setUp(self) -> None:
+        """Set up a fake session that echoes the endpoint."""
+
+        self.session = FakeAsyncSession(respond=lambda endpoint, params: {'endpoint': endpoint})
+
+    def test_request_methods_are_coroutines(self):
+        """Test the services build the request of the sync service and await the session."""
+
+        movers_service = AsyncMovers(session=self.session)
+        price_history_service = AsyncPriceHistory(session=self.session)
+
+        self.assertTrue(asyncio.iscoroutinefunction(movers_service.get_movers))
+        self.assertTrue(asyncio.iscoroutinefunction(price_history_service.get_price_history))
+
+        content = asyncio.run(
+            movers_service.get_movers(index='$DJI', direction='up', change='percent')
+        )
+
+        self.assertEqual(content, {'endpoint': 'marketdata/$DJI/movers'})
+        self.assertEqual(self.session.requests[0][1], {'direction': 'up', 'change': 'percent'})
+
+        content = asyncio.run(
+            price_history_service.get_price_history(
+                symbol='MSFT',
+                frequency_type='daily',
+                frequency=1,
+                period_type='year',
+                period=1
+            )
+        )
+
+        self.assertEqual(content, {'endpoint': 'marketdata/MSFT/pricehistory'})
+
+
+if __name__ == '__main__':
+    unittest.main()
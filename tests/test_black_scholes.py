@@ -0,0 +1,160 @@
+import math
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.black_scholes import norm_cdf
+from td.utils.black_scholes import black_scholes
+from td.utils.black_scholes import implied_volatility
+from td.utils.black_scholes import price_option_chain
+from td.utils.black_scholes import implied_volatility_chain
+from td.utils.option_chain_frame import OptionChainFrame
+
+
+class TestBlackScholes(TestCase):
+
+    """Will perform a unit test for the Black-Scholes pricing engine."""
+
+    def setUp(self) -> None:
+        """Set up a strip of contracts."""
+
+        self.inputs = {
+            'underlying_price': 100.0,
+            'strike_price': np.array([80.0, 90.0, 100.0, 110.0, 120.0]),
+            'time_to_expiration': 0.5,
+            'volatility': 0.3,
+            'interest_rate': 0.02,
+            'dividend_yield': 0.01
+        }
+
+    def test_norm_cdf(self):
+        """Test the normal CDF against the error function."""
+
+        points = np.linspace(-40.0, 40.0, 2001)
+        expected = [0.5 * math.erfc(-point / math.sqrt(2.0)) for point in points]
+
+        np.testing.assert_allclose(norm_cdf(points), expected, rtol=1e-12, atol=1e-15)
+
+    def test_known_price(self):
+        """Test a textbook at-the-money call."""
+
+        values = black_scholes(
+            is_call=True,
+            underlying_price=100.0,
+            strike_price=100.0,
+            time_to_expiration=1.0,
+            volatility=0.2,
+            interest_rate=0.05
+        )
+
+        self.assertAlmostEqual(float(values['price']), 10.450583572185565, places=10)
+        self.assertAlmostEqual(float(values['delta']), 0.6368306511756191, places=10)
+
+    def test_put_call_parity(self):
+        """Test calls and puts satisfy put-call parity."""
+
+        calls = black_scholes(is_call=True, **self.inputs)
+        puts = black_scholes(is_call=False, **self.inputs)
+
+        forward = (
+            self.inputs['underlying_price'] * math.exp(-0.01 * 0.5)
+            - self.inputs['strike_price'] * math.exp(-0.02 * 0.5)
+        )
+
+        np.testing.assert_allclose(calls['price'] - puts['price'], forward, atol=1e-10)
+
+    def test_greeks_match_finite_differences(self):
+        """Test the greeks against bumped prices."""
+
+        values = black_scholes(is_call=False, **self.inputs)
+
+        def bumped(**changes):
+            inputs = dict(self.inputs, **changes)
+            return black_scholes(is_call=False, **inputs)['price']
+
+        spot_up = bumped(underlying_price=100.01)
+        spot_down = bumped(underlying_price=99.99)
+
+        np.testing.assert_allclose(values['delta'], (spot_up - spot_down) / 0.02, atol=1e-6)
+        np.testing.assert_allclose(
+            values['gamma'], (spot_up - 2 * values['price'] + spot_down) / 0.0001, atol=1e-4
+        )
+        np.testing.assert_allclose(
+            values['vega'], (bumped(volatility=0.3001) - bumped(volatility=0.2999)) / 0.02, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            values['rho'], (bumped(interest_rate=0.0201) - bumped(interest_rate=0.0199)) / 0.02, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            values['theta'], (bumped(time_to_expiration=0.5 - 1 / 365) - values['price']), atol=1e-3
+        )
+
+    def test_scenarios_broadcast(self):
+        """Test a scenario axis broadcasts against the contracts."""
+
+        scenarios = np.linspace(90.0, 110.0, 21)[:, np.newaxis]
+        inputs = dict(self.inputs, underlying_price=scenarios)
+        values = black_scholes(is_call=True, **inputs)
+
+        self.assertEqual(values['price'].shape, (21, 5))
+        self.assertTrue((np.diff(values['price'], axis=0) > 0).all())
+
+    def test_implied_volatility_round_trip(self):
+        """Test the solver recovers the volatility used to price."""
+
+        volatility = np.array([0.9, 0.2, 0.05, 0.45, 2.5])
+        is_call = np.array([True, False, True, False, True])
+        inputs = dict(self.inputs, volatility=volatility)
+        prices = black_scholes(is_call=is_call, **inputs)['price']
+
+        del inputs['volatility']
+        solved = implied_volatility(option_price=prices, is_call=is_call, **inputs)
+
+        np.testing.assert_allclose(solved, volatility, rtol=1e-6)
+
+    def test_implied_volatility_without_solution(self):
+        """Test prices below intrinsic value return `NaN`."""
+
+        solved = implied_volatility(
+            option_price=np.array([1.0, 5.0]),
+            is_call=True,
+            underlying_price=100.0,
+            strike_price=np.array([80.0, 100.0]),
+            time_to_expiration=0.5,
+            interest_rate=0.0
+        )
+
+        self.assertTrue(np.isnan(solved[0]))
+        self.assertFalse(np.isnan(solved[1]))
+
+    def test_option_chain(self):
+        """Test pricing and solving a flattened chain."""
+
+        contract = {
+            'strikePrice': 250.0,
+            'daysToExpiration': 30,
+            'volatility': 25.0,
+            'symbol': 'MSFT_061821C250'
+        }
+        content = {
+            'symbol': 'MSFT',
+            'underlyingPrice': 250.0,
+            'interestRate': 1.0,
+            'callExpDateMap': {'2021-06-18:30': {'250.0': [contract]}},
+            'putExpDateMap': {'2021-06-18:30': {'250.0': [dict(contract, symbol='MSFT_061821P250')]}}
+        }
+        option_chain_frame = OptionChainFrame.from_chain(content=content)
+
+        values = price_option_chain(option_chain_frame=option_chain_frame)
+        solved = implied_volatility_chain(
+            option_chain_frame=option_chain_frame,
+            option_price=values['price']
+        )
+
+        self.assertGreater(values['price'][0], values['price'][1])
+        np.testing.assert_allclose(solved, [0.25, 0.25], rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
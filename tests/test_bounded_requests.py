@@ -0,0 +1,84 @@
+import time
+import asyncio
+import threading
+import unittest
+from unittest import TestCase
+
+from td.utils.bounded_requests import run_bounded
+from td.utils.bounded_requests import run_bounded_async
+
+
+class TestBoundedRequests(TestCase):
+
+    """Will perform a unit test for the bounded request runners."""
+
+    def setUp(self) -> None:
+        """Set up ten jobs that record when they are sent."""
+
+        self.jobs = [(number, number) for number in range(10)]
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def request(self, argument: int) -> int:
+        """Records the job and takes a while to answer."""
+
+        with self._lock:
+            self.sent.append(argument)
+
+        time.sleep(0.2)
+
+        return argument * 2
+
+    def test_run_bounded(self):
+        """Test every job is run once and its result is yielded."""
+
+        results = sorted(run_bounded(jobs=self.jobs, request=lambda argument: argument * 2, max_workers=3))
+
+        self.assertListEqual(results, [(number, number * 2, None) for number in range(10)])
+
+    def test_run_bounded_close_early(self):
+        """Test closing the generator returns right away and stops the jobs that did not start."""
+
+        results = run_bounded(jobs=self.jobs, request=self.request, max_workers=2)
+        next(results)
+
+        start = time.monotonic()
+        results.close()
+
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        # Let the requests that were already sent finish.
+        time.sleep(0.5)
+
+        self.assertLessEqual(len(self.sent), 3)
+
+    def test_run_bounded_async_close_early(self):
+        """Test closing the async generator cancels the tasks in flight."""
+
+        started = []
+        cancelled = []
+
+        async def request(argument: int) -> int:
+            started.append(argument)
+            try:
+                await asyncio.sleep(0.01 if argument == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(argument)
+                raise
+            return argument
+
+        async def main():
+            results = run_bounded_async(jobs=self.jobs, request=request, max_workers=3)
+            await results.__anext__()
+            await results.aclose()
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+
+        # Only the first job finished, the others never started or were cancelled.
+        self.assertLessEqual(len(started), 4)
+        self.assertListEqual(sorted(cancelled), sorted(started)[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import unittest
+from unittest import TestCase
+from datetime import datetime
+from datetime import timezone
+from datetime import timedelta
+
+import numpy as np
+
+from td.utils.candle_store import CANDLE_DTYPE
+from td.utils.candle_resampler import find_gaps
+from td.utils.candle_resampler import session_mask
+from td.utils.candle_resampler import rolling_vwap
+from td.utils.candle_resampler import session_vwap
+from td.utils.candle_resampler import UsEasternTime
+from td.utils.candle_resampler import local_offsets
+from td.utils.candle_resampler import resample_candles
+from td.utils.candle_resampler import resample_sessions
+
+
+# A fixed UTC-5 zone keeps the tests independent of the tz database.
+EASTERN = timezone(timedelta(hours=-5))
+
+
+class TestCandleResampler(TestCase):
+
+    """Will perform a unit test for the candle resampling functions."""
+
+    def build_candles(self, start: datetime, count: int) -> np.ndarray:
+        """Builds one minute candles starting at a local time."""
+
+        first = int(start.replace(tzinfo=EASTERN).timestamp() * 1000)
+
+        candles = np.empty(count, dtype=CANDLE_DTYPE)
+        candles['datetime'] = first + np.arange(count) * 60000
+        candles['open'] = np.arange(count, dtype=float)
+        candles['high'] = candles['open'] + 1.0
+        candles['low'] = candles['open'] - 1.0
+        candles['close'] = candles['open'] + 0.5
+        candles['volume'] = 100
+
+        return candles
+
+    def test_resample_candles(self):
+        """Test aggregating one minute candles into 15 minute bars."""
+
+        candles = self.build_candles(start=datetime(2021, 3, 1, 9, 30), count=30)
+        bars = resample_candles(candles=candles, minutes=15, time_zone=EASTERN)
+
+        self.assertEqual(len(bars), 2)
+        self.assertEqual(bars['datetime'][0], candles['datetime'][0])
+        self.assertEqual(bars['open'][0], 0.0)
+        self.assertEqual(bars['high'][0], 15.0)
+        self.assertEqual(bars['low'][0], -1.0)
+        self.assertEqual(bars['close'][0], 14.5)
+        self.assertEqual(bars['volume'][0], 1500)
+
+    def test_resample_candles_aligns_to_the_local_hour(self):
+        """Test hourly bars start on the local hour."""
+
+        candles = self.build_candles(start=datetime(2021, 3, 1, 9, 30), count=60)
+        bars = resample_candles(candles=candles, minutes=60, time_zone=EASTERN)
+
+        self.assertEqual(len(bars), 2)
+        self.assertEqual(bars['volume'].tolist(), [3000, 3000])
+        self.assertEqual(bars['datetime'][1] - bars['datetime'][0], 3600000)
+        self.assertEqual(bars['datetime'][0], candles['datetime'][0] - 1800000)
+
+    def test_resample_candles_without_candles(self):
+        """Test resampling no candles, or only filtered out candles."""
+
+        bars = resample_candles(candles=np.empty(0, dtype=CANDLE_DTYPE), minutes=5, time_zone=EASTERN)
+
+        self.assertEqual(len(bars), 0)
+        self.assertEqual(bars.dtype, CANDLE_DTYPE)
+
+        # Pre-market candles only, the regular session removes all of them.
+        candles = self.build_candles(start=datetime(2021, 3, 1, 7, 0), count=30)
+        bars = resample_candles(candles=candles, minutes=5, session='regular', time_zone=EASTERN)
+
+        self.assertEqual(len(bars), 0)
+        self.assertEqual(bars.dtype, CANDLE_DTYPE)
+
+    def test_session_mask(self):
+        """Test splitting regular and extended hours."""
+
+        candles = self.build_candles(start=datetime(2021, 3, 1, 9, 0), count=60)
+        regular = session_mask(candles=candles, time_zone=EASTERN)
+
+        self.assertFalse(regular[:30].any())
+        self.assertTrue(regular[30:].all())
+
+        bars = resample_sessions(candles=candles, session='extended', time_zone=EASTERN)
+
+        self.assertEqual(len(bars), 1)
+        self.assertEqual(bars['volume'][0], 3000)
+
+    def test_rolling_vwap(self):
+        """Test the rolling VWAP against a plain loop."""
+
+        candles = self.build_candles(start=datetime(2021, 3, 1, 9, 30), count=20)
+        candles['volume'] = np.arange(1, 21)
+        vwap = rolling_vwap(candles=candles, window=5)
+
+        typical_price = (candles['high'] + candles['low'] + candles['close']) / 3.0
+        expected = [
+            np.average(typical_price[index - 4:index + 1], weights=candles['volume'][index - 4:index + 1])
+            for index in range(4, 20)
+        ]
+
+        self.assertTrue(np.isnan(vwap[:4]).all())
+        np.testing.assert_allclose(vwap[4:], expected)
+
+    def test_session_vwap(self):
+        """Test the VWAP restarts every day."""
+
+        first_day = self.build_candles(start=datetime(2021, 3, 1, 9, 30), count=10)
+        second_day = self.build_candles(start=datetime(2021, 3, 2, 9, 30), count=10)
+        candles = np.concatenate([first_day, second_day])
+
+        vwap = session_vwap(candles=candles, time_zone=EASTERN)
+        typical_price = (candles['high'] + candles['low'] + candles['close']) / 3.0
+
+        self.assertAlmostEqual(vwap[0], typical_price[0])
+        self.assertAlmostEqual(vwap[10], typical_price[10])
+        self.assertAlmostEqual(vwap[19], typical_price[10:].mean())
+
+    def test_find_gaps_intraday(self):
+        """Test only the gaps within a day are reported for minute candles."""
+
+        # Friday and Monday with five minutes missing on Monday.
+        friday = self.build_candles(start=datetime(2021, 3, 5, 15, 50), count=10)
+        monday = self.build_candles(start=datetime(2021, 3, 8, 9, 30), count=20)
+        candles = np.concatenate([friday, monday[:10], monday[15:]])
+
+        gaps = find_gaps(candles=candles, interval=60000, time_zone=EASTERN)
+
+        self.assertEqual(gaps.tolist(), [[monday['datetime'][9], monday['datetime'][15]]])
+        self.assertEqual(len(find_gaps(candles=candles, interval=60000, gap_threshold=600000, time_zone=EASTERN)), 0)
+
+    def test_find_gaps_daily(self):
+        """Test weekends are skipped and missing weekdays are reported for daily candles."""
+
+        # Thursday, Friday, Monday, then Wednesday without Tuesday.
+        days = [datetime(2021, 3, day) for day in (4, 5, 8, 10)]
+
+        candles = np.empty(len(days), dtype=CANDLE_DTYPE)
+        candles['datetime'] = [int(day.replace(tzinfo=EASTERN).timestamp() * 1000) for day in days]
+
+        gaps = find_gaps(candles=candles, interval=86400000, time_zone=EASTERN)
+
+        self.assertEqual(gaps.tolist(), [[candles['datetime'][2], candles['datetime'][3]]])
+
+    def test_find_gaps_without_candles(self):
+        """Test a series without candles has no gaps."""
+
+        gaps = find_gaps(candles=np.empty(0, dtype=CANDLE_DTYPE), interval=60000, time_zone=EASTERN)
+
+        self.assertEqual(gaps.shape, (0, 2))
+
+    def test_us_eastern_time(self):
+        """Test the fallback time zone switches at 2:00 on the DST Sundays of 2021."""
+
+        hour = 3600000
+        changes = [
+            datetime(2021, 3, 14, 7, tzinfo=timezone.utc),
+            datetime(2021, 11, 7, 6, tzinfo=timezone.utc)
+        ]
+
+        for change, before, after in zip(changes, (-5, -4), (-4, -5)):
+
+            timestamp = int(change.timestamp() * 1000)
+            offsets = [
+                change.replace(minute=minute).astimezone(UsEasternTime()).utcoffset()
+                for minute in (0, 59)
+            ]
+
+            self.assertEqual((change - timedelta(minutes=1)).astimezone(UsEasternTime()).utcoffset(), timedelta(hours=before))
+            self.assertEqual(offsets, [timedelta(hours=after)] * 2)
+            self.assertEqual(
+                local_offsets(datetimes=np.array([timestamp + 12 * hour]), time_zone=UsEasternTime()).tolist(),
+                [after * hour]
+            )
+
+        # The repeated hour of November is told apart by `fold`.
+        self.assertEqual(datetime(2021, 11, 7, 1, 30, tzinfo=UsEasternTime()).utcoffset(), timedelta(hours=-4))
+        self.assertEqual(datetime(2021, 11, 7, 1, 30, fold=1, tzinfo=UsEasternTime()).utcoffset(), timedelta(hours=-5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+
+from td.utils.candle_store import CandleStore
+from td.utils.candle_store import CANDLE_DTYPE
+from td.utils.candle_store import candles_to_array
+
+
+class TestCandleStore(TestCase):
+
+    """Will perform a unit test for the `CandleStore` object."""
+
+    def setUp(self) -> None:
+        """Set up a `CandleStore` in a temporary folder."""
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.candle_store = CandleStore(directory=self.temp_directory.name)
+        self.key = {
+            'symbol': 'MSFT',
+            'frequency_type': 'minute',
+            'frequency': 1,
+            'extended_hours_needed': False
+        }
+
+    def build_candles(self, start: int, stop: int, close: float) -> list:
+        """Builds fake Price History candles."""
+
+        return [
+            {
+                'datetime': timestamp,
+                'open': 1.0,
+                'high': 2.0,
+                'low': 0.5,
+                'close': close,
+                'volume': 100
+            }
+            for timestamp in range(start, stop)
+        ]
+
+    def test_empty_store(self):
+        """Make sure an unknown key loads as an empty series."""
+
+        candles = self.candle_store.load(**self.key)
+
+        self.assertEqual(len(candles), 0)
+        self.assertEqual(candles.dtype, CANDLE_DTYPE)
+        self.assertIsNone(self.candle_store.first_datetime(**self.key))
+        self.assertIsNone(self.candle_store.last_datetime(**self.key))
+
+    def test_incremental_merge(self):
+        """Make sure new candles are appended and overlaps are replaced."""
+
+        self.candle_store.merge(
+            candles=candles_to_array(self.build_candles(0, 10, close=1.0)),
+            **self.key
+        )
+        merged = self.candle_store.merge(
+            candles=candles_to_array(self.build_candles(9, 15, close=2.0)),
+            **self.key
+        )
+
+        self.assertEqual(len(merged), 15)
+        self.assertListEqual(merged['datetime'].tolist(), list(range(15)))
+        self.assertEqual(merged['close'][8], 1.0)
+        self.assertEqual(merged['close'][9], 2.0)
+        self.assertEqual(self.candle_store.first_datetime(**self.key), 0)
+        self.assertEqual(self.candle_store.last_datetime(**self.key), 14)
+
+    def test_keys_are_separate(self):
+        """Make sure the extended hours flag is part of the key."""
+
+        self.candle_store.merge(
+            candles=candles_to_array(self.build_candles(0, 5, close=1.0)),
+            **self.key
+        )
+
+        self.key['extended_hours_needed'] = True
+        self.assertEqual(len(self.candle_store.load(**self.key)), 0)
+
+    def test_memory_mapped_load(self):
+        """Make sure a saved response can be opened as a read-only memory map."""
+
+        json_path = pathlib.Path(self.temp_directory.name).joinpath('msft.json')
+        json_path.write_text(
+            json.dumps({'symbol': 'MSFT', 'candles': self.build_candles(0, 20, close=3.0)})
+        )
+
+        self.candle_store.import_json(
+            file_path=json_path,
+            frequency_type='minute',
+            frequency=1,
+            extended_hours_needed=False
+        )
+        candles = self.candle_store.load(mmap=True, **self.key)
+
+        self.assertEqual(len(candles), 20)
+        self.assertEqual(candles.dtype, CANDLE_DTYPE)
+        self.assertFalse(candles.flags.writeable)
+        self.assertEqual(candles['close'].sum(), 60.0)
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions only.')
+    def test_file_permissions(self):
+        """Make sure merged files get the normal permissions, not the private temp file ones."""
+
+        umask = os.umask(0)
+        os.umask(umask)
+
+        self.candle_store.merge(
+            candles=candles_to_array(self.build_candles(0, 5, close=1.0)),
+            **self.key
+        )
+        path = self.candle_store.build_path(**self.key)
+
+        self.assertEqual(path.stat().st_mode & 0o777, 0o666 & ~umask)
+        self.assertListEqual([file.name for file in path.parent.iterdir()], [path.name])
+
+    def tearDown(self) -> None:
+        """Remove the temporary folder."""
+
+        self.temp_directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import json
+import asyncio
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.streaming.sharded import ShardedStreamingClient
+from td.streaming.last_value_cache import LastValueCache
+
+from fakes import FakeWebSocket
+from fakes import OfflineStreamingApiClient
+
+
+class TestLastValueCache(TestCase):
+
+    """Will perform a unit test for the `LastValueCache` object."""
+
+    def setUp(self) -> None:
+        """Set up a quote cache with a full and a partial update."""
+
+        self.last_value_cache = LastValueCache(
+            service='QUOTE',
+            fields=['0', '1', '2', '8', '17', '25'],
+            capacity=2
+        )
+
+        self.last_value_cache.on_message(
+            entry={
+                'service': 'QUOTE',
+                'timestamp': 1000,
+                'command': 'SUBS',
+                'content': [
+                    {'key': 'MSFT', '1': 251.1, '2': 251.2, '8': 100, '17': True, '25': 'Microsoft'},
+                    {'key': 'AAPL', '1': 130.1, '2': 130.2, '8': 200}
+                ]
+            }
+        )
+
+        # Only the fields that changed are sent.
+        self.last_value_cache.update(content=[{'key': 'MSFT', '2': 251.3, '8': 150}], timestamp=2000)
+
+    def test_get(self):
+        """Test reading the merged quote of a symbol."""
+
+        quote = self.last_value_cache.get('MSFT')
+
+        self.assertEqual(quote['BidPrice'], 251.1)
+        self.assertEqual(quote['AskPrice'], 251.3)
+        self.assertEqual(quote['TotalVolume'], 150)
+        self.assertEqual(quote['Description'], 'Microsoft')
+        self.assertEqual(quote['timestamp'], 2000)
+        self.assertIsNone(self.last_value_cache.get('GOOG'))
+        self.assertEqual(self.last_value_cache.get_value('AAPL', 'AskPrice'), 130.2)
+
+    def test_get_value(self):
+        """Test single fields come back as Python values."""
+
+        ask_price = self.last_value_cache.get_value('MSFT', 'AskPrice')
+        total_volume = self.last_value_cache.get_value('MSFT', 'TotalVolume')
+
+        self.assertIs(type(ask_price), float)
+        self.assertIs(type(total_volume), int)
+        self.assertIs(self.last_value_cache.get_value('MSFT', 'Marginable'), True)
+        self.assertEqual(self.last_value_cache.get_value('MSFT', 'Description'), 'Microsoft')
+        self.assertIsNone(self.last_value_cache.get_value('AAPL', 'Description'))
+        self.assertIsNone(self.last_value_cache.get_value('GOOG', 'AskPrice'))
+
+        with self.assertRaises(ValueError):
+            self.last_value_cache.get_value('MSFT', 'NotAField')
+
+    def test_grow(self):
+        """Test the columns grow past the initial capacity."""
+
+        self.last_value_cache.update(
+            content=[{'key': f'SYM{number}', '1': float(number)} for number in range(10)],
+            timestamp=3000
+        )
+
+        self.assertEqual(len(self.last_value_cache), 12)
+        self.assertEqual(self.last_value_cache.get('SYM9')['BidPrice'], 9.0)
+        self.assertEqual(self.last_value_cache.get('MSFT')['AskPrice'], 251.3)
+
+    def test_snapshot(self):
+        """Test the snapshot is a copy of every symbol."""
+
+        quote_frame = self.last_value_cache.snapshot()
+
+        np.testing.assert_array_equal(quote_frame.symbols, ['MSFT', 'AAPL'])
+        np.testing.assert_array_equal(quote_frame['AskPrice'], [251.3, 130.2])
+        np.testing.assert_array_equal(quote_frame['timestamp'], [2000, 1000])
+        self.assertFalse(quote_frame['Marginable'][1])
+
+        # Later updates do not leak into the snapshot.
+        self.last_value_cache.update(content=[{'key': 'AAPL', '2': 131.0}], timestamp=4000)
+        self.assertEqual(quote_frame['AskPrice'][1], 130.2)
+
+        selected = self.last_value_cache.snapshot(symbols=['AAPL', 'GOOG'])
+        np.testing.assert_array_equal(selected.symbols, ['AAPL'])
+        self.assertEqual(selected['AskPrice'][0], 131.0)
+
+    def test_clear(self):
+        """Test clearing the cache."""
+
+        self.last_value_cache.clear()
+
+        self.assertEqual(len(self.last_value_cache), 0)
+        self.assertNotIn('MSFT', self.last_value_cache)
+
+        self.last_value_cache.update(content=[{'key': 'GOOG', '1': 2400.0}])
+        self.assertTrue(np.isnan(self.last_value_cache.get('GOOG')['AskPrice']))
+
+
+class TestLastValueCacheAttach(TestCase):
+
+    """Will perform a unit test for feeding the `LastValueCache` from a sharded stream."""
+
+    def test_attach_sharded(self):
+        """Test every shard's quotes reach the cache while the merged stream is read."""
+
+        sharded_streaming_client = ShardedStreamingClient(
+            streaming_api_clients=[
+                OfflineStreamingApiClient(session=None, auto_reconnect=False)
+                for _ in range(2)
+            ]
+        )
+        symbols = [f'SYM{number}' for number in range(20)]
+
+        asyncio.run(
+            sharded_streaming_client.add_symbols(service='QUOTE', symbols=symbols, fields=['0', '1', '2'])
+        )
+
+        for shard in sharded_streaming_client.shards:
+            shard.connection = FakeWebSocket(
+                messages=[
+                    json.dumps({
+                        'data': [
+                            {
+                                'service': 'QUOTE',
+                                'timestamp': 1000 + number,
+                                'command': 'SUBS',
+                                'content': [
+                                    {'key': symbol, '1': float(number)}
+                                    for symbol in sorted(shard.subscriptions['QUOTE']['keys'])
+                                ]
+                            }
+                        ]
+                    })
+                    for number in range(2)
+                ]
+            )
+
+        last_value_cache = LastValueCache(service='QUOTE', fields=['0', '1', '2'])
+        last_value_cache.attach(sharded_streaming_client)
+
+        async def read() -> list:
+            return [record async for record in sharded_streaming_client.stream(block=True)]
+
+        records = asyncio.run(read())
+
+        self.assertEqual(len(records), 40)
+        self.assertEqual(len(last_value_cache), 20)
+        self.assertTrue(all(last_value_cache.get(symbol)['BidPrice'] == 1.0 for symbol in symbols))
+
+
+if __name__ == '__main__':
+    unittest.main()
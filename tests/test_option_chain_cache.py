@@ -0,0 +1,119 @@
+import time
+import unittest
+from unittest import TestCase
+
+from td.utils.enums import ContractType
+from td.utils.option_chain import OptionChainQuery
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_cache import OptionChainCache
+
+
+class TestOptionChainCache(TestCase):
+
+    """Will perform a unit test for the `OptionChainCache` object."""
+
+    def build_chain(self, marks: dict, quote_time: int = 0) -> OptionChainFrame:
+        """Builds a chain with one call per strike."""
+
+        strikes = {
+            str(strike): [
+                {
+                    'symbol': f'MSFT_061821C{strike}',
+                    'strikePrice': strike,
+                    'mark': mark,
+                    'delta': 'NaN',
+                    'quoteTimeInLong': quote_time,
+                    'daysToExpiration': 3 - quote_time // 86400000
+                }
+            ]
+            for strike, mark in marks.items()
+        }
+
+        return OptionChainFrame.from_chain(
+            content={'symbol': 'MSFT', 'callExpDateMap': {'2021-06-18:3': strikes}}
+        )
+
+    def setUp(self) -> None:
+        """Set up the cache and a query."""
+
+        self.option_chain_cache = OptionChainCache(ttl=60.0)
+        self.query = {'symbol': 'MSFT', 'contractType': 'CALL', 'strikeCount': None}
+
+    def test_build_key(self):
+        """Make sure equivalent queries share one key."""
+
+        option_chain_query = OptionChainQuery(symbol='msft', contract_type=ContractType.Call)
+
+        self.assertEqual(
+            OptionChainCache.build_key(query={'contractType': 'CALL', 'symbol': 'MSFT'}),
+            OptionChainCache.build_key(query={'symbol': 'msft', 'contractType': 'CALL', 'strike': None})
+        )
+        self.assertEqual(
+            OptionChainCache.build_key(query=option_chain_query),
+            OptionChainCache.build_key(query=option_chain_query.to_dict(raise_errors=False))
+        )
+
+    def test_first_update_adds_everything(self):
+        """Make sure the first snapshot counts as added."""
+
+        option_chain_diff = self.option_chain_cache.update(
+            query=self.query,
+            option_chain_frame=self.build_chain(marks={245: 1.0, 250: 2.0})
+        )
+
+        self.assertEqual(len(option_chain_diff.added), 2)
+        self.assertEqual(len(option_chain_diff.changed), 0)
+        self.assertEqual(len(option_chain_diff.removed), 0)
+
+    def test_diff(self):
+        """Make sure only the moved contracts are reported."""
+
+        self.option_chain_cache.update(
+            query=self.query,
+            option_chain_frame=self.build_chain(marks={245: 1.0, 250: 2.0, 255: 3.0})
+        )
+        option_chain_diff = self.option_chain_cache.update(
+            query=self.query,
+            option_chain_frame=self.build_chain(marks={250: 2.5, 255: 3.0, 260: 4.0}, quote_time=86400000)
+        )
+
+        self.assertListEqual(option_chain_diff.added.symbols.tolist(), ['MSFT_061821C260'])
+        self.assertListEqual(option_chain_diff.changed.symbols.tolist(), ['MSFT_061821C250'])
+        self.assertListEqual(option_chain_diff.changed['mark'].tolist(), [2.5])
+        self.assertListEqual(option_chain_diff.removed.tolist(), ['MSFT_061821C245'])
+        self.assertEqual(len(option_chain_diff), 3)
+
+    def test_diff_ignore_fields(self):
+        """Make sure the quote time only counts as a change when it's not ignored."""
+
+        option_chain_cache = OptionChainCache(ttl=60.0, ignore_fields=[])
+
+        for option_chain_frame in (self.build_chain(marks={250: 2.0}), self.build_chain(marks={250: 2.0}, quote_time=1)):
+            option_chain_diff = option_chain_cache.update(
+                query=self.query,
+                option_chain_frame=option_chain_frame
+            )
+
+        self.assertListEqual(option_chain_diff.changed.symbols.tolist(), ['MSFT_061821C250'])
+
+    def test_eviction_and_memory(self):
+        """Make sure chains expire and their memory is reported."""
+
+        option_chain_cache = OptionChainCache(ttl=0.05)
+        option_chain_cache.update(
+            query=self.query,
+            option_chain_frame=self.build_chain(marks={245: 1.0})
+        )
+
+        self.assertGreater(option_chain_cache.memory_usage, 0)
+        self.assertIsNotNone(option_chain_cache.get(query=self.query))
+
+        time.sleep(0.1)
+
+        self.assertIsNone(option_chain_cache.get(query=self.query))
+        self.assertEqual(option_chain_cache.stats['evictions'], 1)
+        self.assertEqual(option_chain_cache.memory_usage, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.option_chain_frame import CALL
+from td.utils.option_chain_frame import PUT
+from td.utils.option_chain_frame import OptionChainFrame
+
+
+class TestOptionChainFrame(TestCase):
+
+    """Will perform a unit test for the `OptionChainFrame` object."""
+
+    def build_contract(self, symbol: str, put_call: str, strike: float, delta: float) -> dict:
+        """Builds a fake option contract."""
+
+        return {
+            'putCall': put_call,
+            'symbol': symbol,
+            'bid': 1.0,
+            'ask': 1.2,
+            'mark': 1.1,
+            'totalVolume': 10,
+            'openInterest': 250,
+            'delta': delta,
+            'gamma': 'NaN',
+            'strikePrice': strike,
+            'expirationDate': 1623960000000,
+            'inTheMoney': False
+        }
+
+    def setUp(self) -> None:
+        """Set up a fake Get Option Chain response."""
+
+        self.content = {
+            'symbol': 'MSFT',
+            'status': 'SUCCESS',
+            'underlyingPrice': 250.0,
+            'callExpDateMap': {
+                '2021-07-16:31': {
+                    '250.0': [self.build_contract('MSFT_071621C250', 'CALL', 250.0, 0.5)]
+                },
+                '2021-06-18:3': {
+                    '245.0': [self.build_contract('MSFT_061821C245', 'CALL', 245.0, 0.7)],
+                    '250.0': [self.build_contract('MSFT_061821C250', 'CALL', 250.0, -999.0)]
+                }
+            },
+            'putExpDateMap': {
+                '2021-06-18:3': {
+                    '245.0': [self.build_contract('MSFT_061821P245', 'PUT', 245.0, -0.3)]
+                }
+            }
+        }
+
+    def test_flatten(self):
+        """Make sure every contract becomes a row with its codes."""
+
+        option_chain_frame = OptionChainFrame.from_chain(content=self.content)
+
+        self.assertEqual(len(option_chain_frame), 4)
+        self.assertEqual(option_chain_frame.underlying_price, 250.0)
+        self.assertListEqual(
+            option_chain_frame.expirations.tolist(),
+            ['2021-06-18:3', '2021-07-16:31']
+        )
+        self.assertListEqual(
+            option_chain_frame.put_call.tolist(),
+            [CALL, CALL, CALL, PUT]
+        )
+        self.assertListEqual(
+            option_chain_frame.expirations[option_chain_frame.expiration_code].tolist(),
+            ['2021-07-16:31', '2021-06-18:3', '2021-06-18:3', '2021-06-18:3']
+        )
+
+    def test_typed_columns(self):
+        """Make sure the columns are typed and missing greeks are `NaN`."""
+
+        option_chain_frame = OptionChainFrame.from_chain(content=self.content)
+
+        self.assertEqual(option_chain_frame['strikePrice'].dtype, np.float64)
+        self.assertEqual(option_chain_frame['openInterest'].dtype, np.int64)
+        self.assertEqual(option_chain_frame['inTheMoney'].dtype, np.bool_)
+        self.assertTrue(np.isnan(option_chain_frame['gamma']).all())
+        self.assertTrue(np.isnan(option_chain_frame.row('MSFT_061821C250')['delta']))
+        self.assertListEqual(option_chain_frame['bidSize'].tolist(), [0, 0, 0, 0])
+
+    def test_take(self):
+        """Make sure a mask selects the matching contracts."""
+
+        option_chain_frame = OptionChainFrame.from_chain(content=self.content)
+        calls = option_chain_frame.take(option_chain_frame.put_call == CALL)
+
+        self.assertEqual(len(calls), 3)
+        self.assertNotIn('MSFT_061821P245', calls)
+        self.assertListEqual(calls.symbols[calls['strikePrice'] < 250.0].tolist(), ['MSFT_061821C245'])
+
+    def test_empty_chain(self):
+        """Make sure a chain without contracts gives an empty frame."""
+
+        option_chain_frame = OptionChainFrame.from_chain(
+            content={'symbol': 'MSFT', 'status': 'FAILED', 'callExpDateMap': {}, 'putExpDateMap': {}}
+        )
+
+        self.assertEqual(len(option_chain_frame), 0)
+        self.assertEqual(option_chain_frame['delta'].dtype, np.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.option_chain_frame import CALL
+from td.utils.option_chain_frame import PUT
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_index import OptionChainIndex
+
+
+class TestOptionChainIndex(TestCase):
+
+    """Will perform a unit test for the `OptionChainIndex` object."""
+
+    def setUp(self) -> None:
+        """Set up a chain with two expirations."""
+
+        content = {
+            'symbol': 'MSFT',
+            'underlyingPrice': 251.0,
+            'callExpDateMap': {},
+            'putExpDateMap': {}
+        }
+
+        for days in (7, 49):
+            expiration = f'2021-{days:03d}:{days}'
+            for side_map, side, sign in (('callExpDateMap', 'C', 1), ('putExpDateMap', 'P', -1)):
+                strikes = [260.0, 240.0, 250.0, 245.0, 255.0]
+                if side == 'P':
+                    strikes.append(230.0)
+                content[side_map][expiration] = {
+                    str(strike): [{
+                        'symbol': f'MSFT_{days}{side}{int(strike)}',
+                        'strikePrice': strike,
+                        'daysToExpiration': days,
+                        'delta': 0.5 * sign - (strike - 250.0) / 40.0 if strike != 245.0 else 'NaN'
+                    }]
+                    for strike in strikes
+                }
+
+        self.option_chain_frame = OptionChainFrame.from_chain(content=content)
+        self.option_chain_index = OptionChainIndex(option_chain_frame=self.option_chain_frame)
+
+    def symbol(self, row: int) -> str:
+        """Returns the symbol of a row."""
+
+        return self.option_chain_frame.symbols[row]
+
+    def test_nearest_expiration(self):
+        """Make sure the closest expiration is found."""
+
+        codes = self.option_chain_index.nearest_expiration(days_to_expiration=np.array([1, 20, 45, 90]))
+
+        self.assertListEqual(
+            self.option_chain_frame.expirations[codes].tolist(),
+            ['2021-007:7', '2021-007:7', '2021-049:49', '2021-049:49']
+        )
+
+    def test_sorted_strikes(self):
+        """Make sure each side keeps its own sorted strikes."""
+
+        self.assertListEqual(
+            self.option_chain_index.strikes(put_call=CALL, days_to_expiration=7).tolist(),
+            [240.0, 245.0, 250.0, 255.0, 260.0]
+        )
+        self.assertListEqual(
+            self.option_chain_index.strikes(put_call=PUT, days_to_expiration=7).tolist(),
+            [230.0, 240.0, 245.0, 250.0, 255.0, 260.0]
+        )
+
+    def test_nearest_strike(self):
+        """Make sure strikes are matched within the expiration."""
+
+        rows = self.option_chain_index.nearest_strike(
+            strike=np.array([100.0, 243.0, 252.4, 400.0]),
+            put_call=PUT,
+            days_to_expiration=45
+        )
+
+        self.assertListEqual(
+            [self.symbol(row) for row in rows],
+            ['MSFT_49P230', 'MSFT_49P245', 'MSFT_49P250', 'MSFT_49P260']
+        )
+
+    def test_nearest_delta(self):
+        """Make sure deltas are matched and missing deltas skipped."""
+
+        row = self.option_chain_index.nearest_delta(delta=-0.3, put_call=PUT, days_to_expiration=45)
+        self.assertEqual(self.symbol(row), 'MSFT_49P240')
+
+        row = self.option_chain_index.nearest_delta(delta=0.7, put_call=CALL, days_to_expiration=7)
+        self.assertEqual(self.symbol(row), 'MSFT_7C240')
+
+    def test_atm_straddle(self):
+        """Make sure the straddle shares one strike near the underlying."""
+
+        call_row, put_row = self.option_chain_index.atm_straddle(days_to_expiration=7)
+
+        self.assertEqual(self.symbol(call_row), 'MSFT_7C250')
+        self.assertEqual(self.symbol(put_row), 'MSFT_7P250')
+
+    def test_missing_side(self):
+        """Make sure a lookup without contracts raises a `LookupError`."""
+
+        with self.assertRaises(LookupError):
+            self.option_chain_index.nearest_strike(strike=250.0, put_call=2, days_to_expiration=7)
+
+    def test_missing_expiration(self):
+        """Make sure a lookup without an expiration raises a `ValueError`."""
+
+        lookups = [
+            lambda: self.option_chain_index.strikes(put_call=CALL),
+            lambda: self.option_chain_index.nearest_strike(strike=250.0),
+            lambda: self.option_chain_index.nearest_delta(delta=0.5),
+            lambda: self.option_chain_index.atm_straddle()
+        ]
+
+        for lookup in lookups:
+            with self.assertRaises(ValueError):
+                lookup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import time
+import asyncio
 import unittest
 from unittest import TestCase
 from configparser import ConfigParser
@@ -11,6 +13,12 @@ from td.credentials import TdCredentials
 from td.client import TdAmeritradeClient
 from td.rest.options_chain import OptionsChain
 from td.rest.options_chain import OptionChainQuery
+from td.rest.options_chain import BulkOptionChainError
+
+from td.aio.rest import AsyncOptionsChain
+
+from fakes import FakeSession
+from fakes import FakeAsyncSession
 
 
 class TestOptionsChainService(TestCase):
@@ -117,5 +125,85 @@ class TestOptionsChainService(TestCase):
         del self.td_credentials
 
 
+class TestBulkOptionChains(TestCase):
+
+    """Will perform a unit test for `OptionsChain.get_option_chains` without the API."""
+
+    def setUp(self) -> None:
+        """Set up an `OptionsChain` service on a fake session."""
+
+        def respond(endpoint: str, params: dict) -> dict:
+            if params['symbol'] == 'BAD':
+                raise ValueError('No chain.')
+            return {'symbol': params['symbol']}
+
+        self.session = FakeSession(respond=respond, delay=0.2)
+        self.service = OptionsChain(session=self.session)
+        self.queries = [{'symbol': f'SYM{number}'} for number in range(20)]
+
+    def test_yields_every_chain(self):
+        """Test every query is answered once."""
+
+        self.session.delay = 0.0
+
+        results = dict(self.service.get_option_chains(option_chain_queries=self.queries, max_workers=4))
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[3], {'symbol': 'SYM3'})
+
+    def test_failed_queries(self):
+        """Test the failed queries are raised once the others are done."""
+
+        self.session.delay = 0.0
+        queries = self.queries[:3] + [{'symbol': 'BAD'}]
+
+        with self.assertRaises(BulkOptionChainError) as context:
+            list(self.service.get_option_chains(option_chain_queries=queries, max_workers=2))
+
+        self.assertEqual(list(context.exception.errors), [3])
+
+    def test_break_early(self):
+        """Test stopping early starts no new request and does not wait."""
+
+        option_chains = self.service.get_option_chains(option_chain_queries=self.queries, max_workers=2)
+
+        for _ in option_chains:
+            break
+
+        start = time.monotonic()
+        option_chains.close()
+
+        # The requests in flight are not waited for.
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        time.sleep(0.5)
+
+        # The two first requests and the one that replaced the first answer.
+        self.assertLessEqual(len(self.session.requests), 3)
+
+    def test_break_early_async(self):
+        """Test stopping the async generator cancels the requests in flight."""
+
+        session = FakeAsyncSession(respond=self.session.respond, delay=0.05)
+        service = AsyncOptionsChain(session=session)
+
+        async def first_chain() -> tuple:
+
+            option_chains = service.get_option_chains(option_chain_queries=self.queries, max_workers=2)
+
+            async for position, option_chain in option_chains:
+                break
+
+            await option_chains.aclose()
+            await asyncio.sleep(0.2)
+
+            return position, option_chain
+
+        position, option_chain = asyncio.run(first_chain())
+
+        self.assertEqual(option_chain, {'symbol': f'SYM{position}'})
+        self.assertLessEqual(len(session.requests), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
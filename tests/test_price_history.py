@@ -0,0 +1,340 @@
+import time
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from datetime import datetime
+from datetime import timedelta
+
+import numpy as np
+
+from td.rest.price_history import PriceHistory
+from td.rest.price_history import BulkPriceHistoryError
+from td.utils.candle_store import CandleStore
+from td.utils.candle_resampler import UsEasternTime
+from td.utils.candle_resampler import market_time_zone
+
+from fakes import FakeSession
+
+
+class TestBulkPriceHistory(TestCase):
+
+    """Will perform a unit test for `PriceHistory.get_bulk_price_history` without the API."""
+
+    def setUp(self) -> None:
+        """Set up a `PriceHistory` service on a fake session."""
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.progress_file = pathlib.Path(self.temp_directory.name).joinpath('progress.jsonl')
+        self.failing = set()
+
+        def respond(endpoint: str, params: dict) -> dict:
+            symbol = endpoint.split('/')[1]
+            if symbol in self.failing:
+                raise ValueError('No candles.')
+            return {'symbol': symbol, 'candles': []}
+
+        self.session = FakeSession(respond=respond)
+        self.service = PriceHistory(session=self.session)
+        self.symbols = [f'SYM{number}' for number in range(10)]
+
+    def tearDown(self) -> None:
+        """Remove the progress file."""
+
+        self.temp_directory.cleanup()
+
+    def bulk_price_history(self, symbols: list, max_workers: int = 2):
+        """Starts a daily bulk download with the progress file."""
+
+        return self.service.get_bulk_price_history(
+            symbols=symbols,
+            frequency_type='daily',
+            frequency=1,
+            period_type='year',
+            period=1,
+            max_workers=max_workers,
+            progress_file=self.progress_file
+        )
+
+    def fetched_symbols(self) -> list:
+        """Returns the symbols requested from the fake session."""
+
+        return [endpoint.split('/')[1] for endpoint, _ in self.session.requests]
+
+    def test_resume_interrupted_run(self):
+        """Test a resumed run only fetches the symbols that did not finish."""
+
+        price_histories = self.bulk_price_history(symbols=self.symbols)
+        finished = []
+
+        # The caller stops after moving past three symbols.
+        for symbol, _ in price_histories:
+            finished.append(symbol)
+            if len(finished) == 4:
+                break
+
+        price_histories.close()
+
+        # The fourth symbol was handed out but never moved past.
+        self.assertEqual(self.service._load_progress(progress_file=self.progress_file), set(finished[:3]))
+
+        self.session.requests.clear()
+        resumed = dict(self.bulk_price_history(symbols=self.symbols))
+
+        self.assertEqual(set(resumed), set(self.symbols) - set(finished[:3]))
+        self.assertEqual(sorted(self.fetched_symbols()), sorted(resumed))
+
+        # Everything is done, a third run makes no request.
+        self.session.requests.clear()
+
+        self.assertEqual(list(self.bulk_price_history(symbols=self.symbols)), [])
+        self.assertEqual(self.session.requests, [])
+
+    def test_failed_symbols_are_retried(self):
+        """Test failed symbols are not marked as done."""
+
+        self.failing = {'SYM2', 'SYM7'}
+
+        with self.assertRaises(BulkPriceHistoryError) as context:
+            list(self.bulk_price_history(symbols=self.symbols, max_workers=3))
+
+        self.assertEqual(set(context.exception.errors), {'SYM2', 'SYM7'})
+
+        self.failing = set()
+        self.session.requests.clear()
+
+        self.assertEqual(
+            sorted(symbol for symbol, _ in self.bulk_price_history(symbols=self.symbols)),
+            ['SYM2', 'SYM7']
+        )
+        self.assertEqual(sorted(self.fetched_symbols()), ['SYM2', 'SYM7'])
+
+    def test_break_early(self):
+        """Test stopping early does not wait for the requests in flight."""
+
+        self.session.delay = 0.2
+
+        price_histories = self.bulk_price_history(symbols=self.symbols)
+
+        for _ in price_histories:
+            break
+
+        start = time.monotonic()
+        price_histories.close()
+
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        time.sleep(0.5)
+
+        self.assertLessEqual(len(self.session.requests), 3)
+
+
+class TestPriceHistoryRange(TestCase):
+
+    """Will perform a unit test for `PriceHistory.get_price_history_range` without the API."""
+
+    def setUp(self) -> None:
+        """Set up regular hours minute candles over three weeks, across a DST change."""
+
+        self.eastern = market_time_zone()
+        self.failing_start = None
+
+        timestamps = []
+
+        for day in range(19):
+
+            session_start = datetime(2021, 3, 1, 9, 30, tzinfo=self.eastern) + timedelta(days=day)
+
+            if session_start.weekday() < 5:
+                first = int(session_start.timestamp() * 1000)
+                timestamps.extend(range(first, first + 390 * 60000, 60000))
+
+        self.timestamps = np.array(timestamps, dtype=np.int64)
+
+        # Thirty minutes are missing on a Thursday morning.
+        self.gap_start = self.timestamp(datetime(2021, 3, 4, 10, 59))
+        self.gap_end = self.timestamp(datetime(2021, 3, 4, 11, 30))
+        self.available = self.timestamps[(self.timestamps <= self.gap_start) | (self.timestamps >= self.gap_end)]
+
+        def respond(endpoint: str, params: dict) -> dict:
+
+            if params['startDate'] == self.failing_start:
+                raise ValueError('Window failed.')
+
+            window = self.available[
+                (self.available >= params['startDate']) & (self.available <= params['endDate'])
+            ]
+
+            return {
+                'candles': [
+                    {'datetime': int(timestamp), 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1}
+                    for timestamp in window
+                ]
+            }
+
+        self.session = FakeSession(respond=respond)
+        self.service = PriceHistory(session=self.session)
+
+    def timestamp(self, local_time: datetime) -> int:
+        """Converts a local market time to milliseconds."""
+
+        return int(local_time.replace(tzinfo=self.eastern).timestamp() * 1000)
+
+    def price_history_range(self, **kwargs) -> dict:
+        """Requests the minute candles of the three weeks."""
+
+        return self.service.get_price_history_range(
+            symbol='MSFT',
+            frequency_type='minute',
+            frequency=1,
+            start_date=datetime(2021, 3, 1, 10, 0, tzinfo=self.eastern),
+            end_date=datetime(2021, 3, 19, 17, 0, tzinfo=self.eastern),
+            **kwargs
+        )
+
+    def test_build_range_windows(self):
+        """Test the range is split into windows that share their boundaries."""
+
+        start = self.timestamp(datetime(2021, 3, 1))
+        windows, window_params = self.service._build_range_windows(
+            frequency_type='minute',
+            frequency=1,
+            start_date=start,
+            end_date=start + 25 * 86400000,
+            extended_hours_needed=False
+        )
+
+        self.assertEqual(
+            windows,
+            [
+                (start, start + 10 * 86400000),
+                (start + 10 * 86400000, start + 20 * 86400000),
+                (start + 20 * 86400000, start + 25 * 86400000)
+            ]
+        )
+        self.assertEqual(window_params[1]['startDate'], start + 10 * 86400000)
+        self.assertEqual(window_params[1]['periodType'], 'day')
+
+        with self.assertRaises(ValueError):
+            self.service._build_range_windows('minute', 1, start + 1, start, False)
+
+        with self.assertRaises(KeyError):
+            self.service._build_range_windows('hourly', 1, start, start + 1, False)
+
+    def test_range_removes_duplicates(self):
+        """Test the candle on the window boundary is only kept once."""
+
+        price_history = self.price_history_range()
+        expected = self.available[self.available >= self.timestamp(datetime(2021, 3, 1, 10, 0))]
+
+        self.assertEqual(len(self.session.requests), 2)
+        np.testing.assert_array_equal(price_history['candles']['datetime'], expected)
+        self.assertEqual(price_history['failed_windows'], [])
+
+    def test_range_gaps(self):
+        """Test only the missing minutes are gaps, not nights, weekends or the DST change."""
+
+        price_history = self.price_history_range()
+
+        self.assertEqual(price_history['gaps'].tolist(), [[self.gap_start, self.gap_end]])
+
+        # Gaps shorter than the threshold are not reported.
+        price_history = self.price_history_range(gap_threshold=3600000)
+
+        self.assertEqual(len(price_history['gaps']), 0)
+
+        # The same gaps without the time zone database.
+        price_history = self.price_history_range(time_zone=UsEasternTime())
+
+        self.assertEqual(price_history['gaps'].tolist(), [[self.gap_start, self.gap_end]])
+
+    def test_range_failed_window(self):
+        """Test a failed window is raised, or listed when not raising."""
+
+        self.failing_start = self.timestamp(datetime(2021, 3, 11, 10, 0))
+
+        with self.assertRaises(BulkPriceHistoryError):
+            self.price_history_range()
+
+        with self.assertLogs(level='ERROR'):
+            price_history = self.price_history_range(raise_errors=False)
+
+        self.assertEqual(len(price_history['failed_windows']), 1)
+        self.assertTrue(price_history['candles']['datetime'][-1] <= self.failing_start)
+
+
+class TestCachedPriceHistory(TestCase):
+
+    """Will perform a unit test for `PriceHistory.get_cached_price_history` without the API."""
+
+    def setUp(self) -> None:
+        """Set up a `PriceHistory` service with a candle store, one candle a minute is available."""
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+
+        def respond(endpoint: str, params: dict) -> dict:
+
+            start = params['startDate'] or params['endDate'] - 3600000
+            timestamps = range(start - start % 60000, params['endDate'] + 1, 60000)
+
+            return {
+                'candles': [
+                    {'datetime': timestamp, 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1}
+                    for timestamp in timestamps
+                ]
+            }
+
+        self.session = FakeSession(respond=respond)
+        self.service = PriceHistory(
+            session=self.session,
+            candle_store=CandleStore(directory=self.temp_directory.name)
+        )
+
+    def tearDown(self) -> None:
+        """Remove the candle store."""
+
+        self.temp_directory.cleanup()
+
+    def cached_price_history(self, start_date: datetime, end_date: datetime):
+        """Requests the minute candles of the window."""
+
+        return self.service.get_cached_price_history(
+            symbol='MSFT',
+            frequency_type='minute',
+            frequency=1,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def test_earlier_start_date(self):
+        """Test the candles before the first stored one are fetched, the stored ones are not."""
+
+        first_start = datetime(2021, 3, 1, 12, 0)
+        end = datetime(2021, 3, 1, 13, 0)
+
+        candles = self.cached_price_history(start_date=first_start, end_date=end)
+
+        self.assertEqual(len(candles), 61)
+
+        earlier_start = datetime(2021, 3, 1, 10, 0)
+        candles = self.cached_price_history(start_date=earlier_start, end_date=end)
+
+        self.assertEqual(len(candles), 181)
+        self.assertEqual(candles['datetime'][0], int(earlier_start.timestamp() * 1000))
+        self.assertTrue(np.all(np.diff(candles['datetime']) == 60000))
+
+        # The head ends at the first stored candle, the tail starts at the last one.
+        head_params = self.session.requests[1][1]
+        tail_params = self.session.requests[2][1]
+
+        self.assertEqual(head_params['endDate'], int(first_start.timestamp() * 1000))
+        self.assertEqual(tail_params['startDate'], int(end.timestamp() * 1000))
+
+        # Nothing earlier is missing now, only the tail is requested.
+        self.cached_price_history(start_date=earlier_start, end_date=end)
+
+        self.assertEqual(len(self.session.requests), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
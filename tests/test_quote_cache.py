@@ -0,0 +1,141 @@
+import time
+import unittest
+import threading
+from unittest import TestCase
+
+from td.utils.quote_cache import QuoteCache
+from td.rest.quotes import QuotesChunkError
+
+
+class TestQuoteCache(TestCase):
+
+    """Will perform a unit test for the `QuoteCache` object."""
+
+    def setUp(self) -> None:
+        """Set up the `QuoteCache` and a fake fetch function."""
+
+        self.quote_cache = QuoteCache(ttl=0.2, max_size=3)
+        self.fetched = []
+
+    def fetch(self, symbols: list) -> dict:
+        """Pretends to call the Get Quotes endpoint."""
+
+        self.fetched.append(symbols)
+        time.sleep(0.05)
+        return {symbol: {'lastPrice': 1.0} for symbol in symbols}
+
+    def test_hits_and_misses(self):
+        """Make sure fresh quotes are served from the cache."""
+
+        self.quote_cache.get_or_fetch(symbols=['AAPL', 'SQ'], fetch=self.fetch)
+        quotes = self.quote_cache.get_or_fetch(symbols=['SQ', 'MSFT'], fetch=self.fetch)
+
+        self.assertListEqual(list(quotes.keys()), ['SQ', 'MSFT'])
+        self.assertListEqual(self.fetched, [['AAPL', 'SQ'], ['MSFT']])
+        self.assertEqual(self.quote_cache.stats['hits'], 1)
+        self.assertEqual(self.quote_cache.stats['misses'], 3)
+
+    def test_ttl_expiry(self):
+        """Make sure stale quotes are fetched again."""
+
+        self.quote_cache.get_or_fetch(symbols=['AAPL'], fetch=self.fetch)
+        time.sleep(0.25)
+        self.quote_cache.get_or_fetch(symbols=['AAPL'], fetch=self.fetch)
+
+        self.assertEqual(len(self.fetched), 2)
+
+    def test_lru_eviction(self):
+        """Make sure the least recently used symbols are evicted."""
+
+        self.quote_cache.get_or_fetch(symbols=['A', 'B', 'C'], fetch=self.fetch)
+        self.quote_cache.get_or_fetch(symbols=['A'], fetch=self.fetch)
+        self.quote_cache.get_or_fetch(symbols=['D'], fetch=self.fetch)
+        self.quote_cache.get_or_fetch(symbols=['B'], fetch=self.fetch)
+
+        self.assertListEqual(self.fetched[-1], ['B'])
+        self.assertEqual(self.quote_cache.stats['size'], 3)
+        self.assertGreaterEqual(self.quote_cache.stats['evictions'], 1)
+
+    def test_request_coalescing(self):
+        """Make sure concurrent callers share one pending fetch."""
+
+        threads = [
+            threading.Thread(
+                target=self.quote_cache.get_or_fetch,
+                kwargs={'symbols': ['AAPL'], 'fetch': self.fetch}
+            )
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual(self.quote_cache.stats['coalesced'], 3)
+
+    def test_partial_chunk_failure(self):
+        """Make sure the quotes of the chunks that succeeded are kept."""
+
+        def fetch(symbols: list) -> dict:
+            self.fetched.append(symbols)
+            raise QuotesChunkError(
+                content={'AAPL': {'lastPrice': 1.0}},
+                errors={('SQ', 'MSFT'): ValueError('Chunk failed.')}
+            )
+
+        with self.assertRaises(QuotesChunkError):
+            self.quote_cache.get_or_fetch(symbols=['AAPL', 'SQ', 'MSFT'], fetch=fetch)
+
+        quotes = self.quote_cache.get_or_fetch(symbols=['AAPL', 'SQ'], fetch=self.fetch)
+
+        self.assertEqual(quotes, {'AAPL': {'lastPrice': 1.0}, 'SQ': {'lastPrice': 1.0}})
+        self.assertListEqual(self.fetched[-1], ['SQ'])
+        self.assertEqual(self.quote_cache.stats['hits'], 1)
+
+    def test_partial_chunk_failure_waiters(self):
+        """Make sure callers waiting on a succeeded symbol get its quote."""
+
+        started = threading.Event()
+
+        def fetch(symbols: list) -> dict:
+            started.set()
+            time.sleep(0.1)
+            raise QuotesChunkError(
+                content={'AAPL': {'lastPrice': 1.0}},
+                errors={('SQ',): ValueError('Chunk failed.')}
+            )
+
+        results = {}
+
+        def wait_for(symbol: str) -> None:
+            try:
+                results[symbol] = self.quote_cache.get_or_fetch(symbols=[symbol], fetch=self.fetch)
+            except QuotesChunkError as chunk_error:
+                results[symbol] = chunk_error
+
+        def fetch_and_fail() -> None:
+            with self.assertRaises(QuotesChunkError):
+                self.quote_cache.get_or_fetch(symbols=['AAPL', 'SQ'], fetch=fetch)
+
+        fetch_thread = threading.Thread(target=fetch_and_fail)
+        fetch_thread.start()
+        started.wait()
+
+        waiters = [threading.Thread(target=wait_for, args=(symbol,)) for symbol in ['AAPL', 'SQ']]
+
+        for thread in waiters:
+            thread.start()
+
+        for thread in waiters + [fetch_thread]:
+            thread.join()
+
+        self.assertEqual(results['AAPL'], {'AAPL': {'lastPrice': 1.0}})
+        self.assertIsInstance(results['SQ'], QuotesChunkError)
+        self.assertEqual(self.fetched, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.quote_frame import QuoteFrame
+
+
+class TestQuoteFrame(TestCase):
+
+    """Will perform a unit test for the `QuoteFrame` object."""
+
+    def setUp(self) -> None:
+        """Set up a fake Get Quotes response."""
+
+        self.content = {
+            'AAPL': {'symbol': 'AAPL', 'bidPrice': 130.1, 'totalVolume': 100, 'shortable': True},
+            'SQ': {'symbol': 'SQ', 'bidPrice': 240.5, 'totalVolume': 200, 'shortable': False},
+            'MSFT': {'symbol': 'MSFT', 'totalVolume': 300, 'shortable': True}
+        }
+
+    def test_columns_and_dtypes(self):
+        """Make sure each field becomes a typed column."""
+
+        quote_frame = QuoteFrame.from_quotes(content=self.content)
+
+        self.assertEqual(len(quote_frame), 3)
+        self.assertListEqual(
+            quote_frame.fields,
+            ['symbol', 'bidPrice', 'totalVolume', 'shortable']
+        )
+        self.assertEqual(quote_frame['totalVolume'].dtype, np.int64)
+        self.assertEqual(quote_frame['shortable'].dtype, np.bool_)
+        self.assertEqual(quote_frame['bidPrice'].dtype, np.float64)
+        self.assertTrue(np.isnan(quote_frame['bidPrice'][2]))
+
+    def test_field_subset(self):
+        """Make sure only the requested fields are decoded."""
+
+        quote_frame = QuoteFrame.from_quotes(
+            content=self.content,
+            fields=['totalVolume']
+        )
+
+        self.assertListEqual(quote_frame.fields, ['totalVolume'])
+        self.assertEqual(quote_frame.row('SQ')['totalVolume'], 200)
+        self.assertIn('MSFT', quote_frame)
+        self.assertListEqual(
+            quote_frame.symbols[quote_frame['totalVolume'] > 150].tolist(),
+            ['SQ', 'MSFT']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,12 @@ from unittest import TestCase
 from configparser import ConfigParser
 
 from td.rest.quotes import Quotes
+from td.rest.quotes import QuotesChunkError
 from td.client import TdAmeritradeClient
 from td.credentials import TdCredentials
+from td.utils.quote_cache import QuoteCache
+
+from fakes import FakeSession
 
 
 class TestQuotesService(TestCase):
@@ -68,5 +72,118 @@ class TestQuotesService(TestCase):
         del self.td_credentials
 
 
+class TestQuoteChunks(TestCase):
+
+    """Will perform a unit test for the chunked `Quotes.get_quotes` without the API."""
+
+    def setUp(self) -> None:
+        """Set up a `Quotes` service on a fake session."""
+
+        self.failing = set()
+
+        def respond(endpoint: str, params: dict) -> dict:
+            symbols = params['symbol'].split(',')
+            if self.failing & set(symbols):
+                raise ValueError('Chunk failed.')
+            return {symbol: {'symbol': symbol} for symbol in symbols}
+
+        self.session = FakeSession(respond=respond)
+        self.service = Quotes(session=self.session)
+        self.symbols = [f'SYM{number}' for number in range(10)]
+
+    def test_chunk_size(self):
+        """Test the chunks hold at most `chunk_size` unique symbols."""
+
+        chunks = self.service._chunk_instruments(
+            instruments=self.symbols + self.symbols[:3],
+            chunk_size=4,
+            max_url_length=4000
+        )
+
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        self.assertEqual(sum(chunks, []), self.symbols)
+
+    def test_chunk_url_length(self):
+        """Test the chunks keep the encoded symbols within `max_url_length`."""
+
+        # `SYM0` is 4 characters plus an encoded comma, 7 in total.
+        chunks = self.service._chunk_instruments(instruments=self.symbols, chunk_size=500, max_url_length=21)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 3, 1])
+
+        # Encoded characters count at their encoded length, `%24SPX.X` and `BRK%2FB` take 21.
+        chunks = self.service._chunk_instruments(instruments=['$SPX.X', 'BRK/B', 'MSFT'], chunk_size=500, max_url_length=21)
+
+        self.assertEqual(chunks, [['$SPX.X', 'BRK/B'], ['MSFT']])
+
+        # A symbol longer than the limit still gets its own chunk.
+        self.assertEqual(
+            self.service._chunk_instruments(instruments=['MSFT'], chunk_size=500, max_url_length=1),
+            [['MSFT']]
+        )
+
+    def test_merge_chunks(self):
+        """Test merging the chunk results, with and without raising."""
+
+        chunks = [['MSFT', 'AAPL'], ['SQ']]
+        results = [{'MSFT': 1, 'AAPL': 2}, ValueError('Chunk failed.')]
+
+        with self.assertRaises(QuotesChunkError) as context:
+            self.service._merge_chunks(chunks=chunks, results=results, raise_errors=True)
+
+        self.assertEqual(context.exception.content, {'MSFT': 1, 'AAPL': 2})
+        self.assertEqual(list(context.exception.errors), [('SQ',)])
+
+        with self.assertLogs(level='ERROR'):
+            content = self.service._merge_chunks(chunks=chunks, results=results, raise_errors=False)
+
+        self.assertEqual(content, {'MSFT': 1, 'AAPL': 2})
+
+    def test_get_quotes(self):
+        """Test a large list is requested in chunks and merged."""
+
+        quotes = self.service.get_quotes(instruments=self.symbols, chunk_size=3)
+
+        self.assertEqual(list(quotes), self.symbols)
+        self.assertEqual(len(self.session.requests), 4)
+
+    def test_get_quotes_partial_failure(self):
+        """Test the quotes of the chunks that succeeded are kept on the error."""
+
+        self.failing = {'SYM4'}
+
+        with self.assertRaises(QuotesChunkError) as context:
+            self.service.get_quotes(instruments=self.symbols, chunk_size=3)
+
+        self.assertEqual(set(context.exception.content), set(self.symbols) - {'SYM3', 'SYM4', 'SYM5'})
+        self.assertEqual(list(context.exception.errors), [('SYM3', 'SYM4', 'SYM5')])
+
+        with self.assertLogs(level='ERROR'):
+            quotes = self.service.get_quotes(instruments=self.symbols, chunk_size=3, raise_errors=False)
+
+        self.assertEqual(len(quotes), 7)
+
+    def test_get_quotes_partial_failure_cached(self):
+        """Test the cache keeps the quotes of the chunks that succeeded."""
+
+        self.service.quote_cache = QuoteCache(ttl=60.0)
+        self.failing = {'SYM4'}
+
+        with self.assertRaises(QuotesChunkError):
+            self.service.get_quotes(instruments=self.symbols, chunk_size=3)
+
+        self.failing = set()
+        self.session.requests.clear()
+
+        self.assertEqual(list(self.service.get_quotes(instruments=self.symbols, chunk_size=3)), self.symbols)
+        self.assertEqual(self.session.requests, [('marketdata/quotes', {'symbol': 'SYM3,SYM4,SYM5'})])
+
+    def test_get_quotes_without_symbols(self):
+        """Test an empty list makes no request."""
+
+        self.assertEqual(self.service.get_quotes(instruments=[]), {})
+        self.assertEqual(self.session.requests, [])
+
+
 if __name__ == '__main__':
     unittest.main()
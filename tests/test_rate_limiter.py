@@ -0,0 +1,84 @@
+import time
+import asyncio
+import unittest
+import threading
+from unittest import TestCase
+
+from td.utils.enums import RequestPriority
+from td.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+
+    """Will perform a unit test for the `RateLimiter` object."""
+
+    def setUp(self) -> None:
+        """Set up a `RateLimiter` with a single token."""
+
+        self.rate_limiter = RateLimiter(max_requests=20, period=1, burst=1)
+
+    def test_burst_does_not_wait(self):
+        """Make sure the first token is handed out right away."""
+
+        wait_time = self.rate_limiter.acquire()
+        self.assertLess(wait_time, 0.01)
+
+    def test_refill_rate(self):
+        """Make sure tokens are handed out at the configured rate."""
+
+        start = time.monotonic()
+
+        for _ in range(4):
+            self.rate_limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.14)
+
+    def test_priority_lanes(self):
+        """Make sure `High` requests jump ahead of queued `Low` requests."""
+
+        self.rate_limiter.acquire()
+        order = []
+
+        def worker(priority: RequestPriority, name: str):
+            self.rate_limiter.acquire(priority=priority)
+            order.append(name)
+
+        threads = [
+            threading.Thread(target=worker, args=(RequestPriority.Low, 'low'))
+            for _ in range(2)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        time.sleep(0.01)
+        self.assertEqual(self.rate_limiter.metrics['queue_depth'], 2)
+
+        threads.append(
+            threading.Thread(target=worker, args=(RequestPriority.High, 'high'))
+        )
+        threads[-1].start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(order, ['high', 'low', 'low'])
+
+    def test_acquire_async(self):
+        """Make sure async tasks share the bucket and record metrics."""
+
+        async def acquire_many():
+            await asyncio.gather(
+                *[self.rate_limiter.acquire_async() for _ in range(3)]
+            )
+
+        asyncio.run(acquire_many())
+
+        metrics = self.rate_limiter.metrics
+        self.assertEqual(metrics['requests_acquired'], 3)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertGreater(metrics['max_wait_time'], 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest import TestCase
+
+from td.utils.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+
+    """Will perform a unit test for the `RetryPolicy` object."""
+
+    def setUp(self) -> None:
+        """Set up the `RetryPolicy` object."""
+
+        self.retry_policy = RetryPolicy(
+            max_retries=3,
+            backoff_factor=0.5,
+            max_backoff=10.0,
+            max_retry_time=20.0,
+            max_retry_after=15.0
+        )
+
+    def test_only_get_is_retried_by_default(self):
+        """Make sure order placements are never retried without opting in."""
+
+        self.assertTrue(self.retry_policy.is_retryable_method(method='get'))
+        self.assertFalse(self.retry_policy.is_retryable_method(method='post'))
+        self.assertFalse(self.retry_policy.is_retryable_method(method='delete'))
+        self.assertTrue(
+            self.retry_policy.is_retryable_method(method='post', retry=True)
+        )
+        self.assertFalse(
+            self.retry_policy.is_retryable_method(method='get', retry=False)
+        )
+
+    def test_retryable_statuses(self):
+        """Make sure only transient statuses are retried."""
+
+        for status_code in [429, 500, 502, 503, 504]:
+            self.assertTrue(self.retry_policy.is_retryable_status(status_code))
+
+        for status_code in [400, 401, 403, 404]:
+            self.assertFalse(self.retry_policy.is_retryable_status(status_code))
+
+    def test_jittered_backoff(self):
+        """Make sure the delay stays under the exponential cap."""
+
+        for attempt in range(3):
+            delay = self.retry_policy.get_retry_delay(attempt=attempt, elapsed=0)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, 0.5 * (2 ** attempt))
+
+    def test_retry_after(self):
+        """Make sure the `Retry-After` header is honored past the backoff cap."""
+
+        self.assertEqual(
+            self.retry_policy.get_retry_delay(attempt=0, elapsed=0, retry_after='4'),
+            4.0
+        )
+        self.assertEqual(
+            self.retry_policy.get_retry_delay(attempt=0, elapsed=0, retry_after='12'),
+            12.0
+        )
+
+        # Longer than the policy waits for, retrying early would be refused again.
+        self.assertIsNone(
+            self.retry_policy.get_retry_delay(attempt=0, elapsed=0, retry_after='120')
+        )
+        self.assertEqual(
+            self.retry_policy.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'),
+            0.0
+        )
+        self.assertIsNone(self.retry_policy.parse_retry_after('soon'))
+
+    def test_retry_budget(self):
+        """Make sure the policy gives up once the budget is spent."""
+
+        self.assertIsNone(
+            self.retry_policy.get_retry_delay(attempt=3, elapsed=0)
+        )
+        self.assertIsNone(
+            self.retry_policy.get_retry_delay(attempt=0, elapsed=18, retry_after='4')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
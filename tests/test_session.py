@@ -0,0 +1,138 @@
+import threading
+import unittest
+from unittest import mock
+from unittest import TestCase
+from http.server import HTTPServer
+from http.server import BaseHTTPRequestHandler
+
+import requests
+
+from td.session import TdAmeritradeSession
+from td.utils.rate_limiter import RateLimiter
+from td.utils.retry_policy import RetryPolicy
+
+from fakes import FakeAdapter
+from fakes import FakeTdClient
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+
+    """Answers every `GET` with an empty JSON object over HTTP/1.1."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestTdAmeritradeSession(TestCase):
+
+    """Will perform a unit test for the `TdAmeritradeSession` object against a local server."""
+
+    def setUp(self) -> None:
+        """Set up a session pointed at a local keep-alive server."""
+
+        self.server = HTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        self.td_session = TdAmeritradeSession(td_client=FakeTdClient())
+        self.td_session.resource_url = f'http://127.0.0.1:{self.server.server_port}/'
+        self.td_session.http_session.mount('http://', self.td_session._http_adapter)
+
+    def tearDown(self) -> None:
+        """Stop the server and close the session."""
+
+        self.td_session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_stats(self):
+        """Test the counters keep growing after the pools are closed."""
+
+        for _ in range(3):
+            self.td_session.make_request(method='get', endpoint='marketdata/quotes')
+
+        self.assertEqual(
+            self.td_session.connection_stats,
+            {'requests_sent': 3, 'connections_opened': 1, 'connections_reused': 2}
+        )
+
+        self.td_session.close()
+
+        for _ in range(2):
+            self.td_session.make_request(method='get', endpoint='marketdata/quotes')
+
+        self.assertEqual(
+            self.td_session.connection_stats,
+            {'requests_sent': 5, 'connections_opened': 2, 'connections_reused': 3}
+        )
+
+
+class TestMakeRequestRetries(TestCase):
+
+    """Will perform a unit test for the retry loop of `TdAmeritradeSession.make_request`."""
+
+    def setUp(self) -> None:
+        """Set up a session with a fast rate limiter, the sleeps are recorded instead."""
+
+        self.td_session = TdAmeritradeSession(
+            td_client=FakeTdClient(),
+            rate_limiter=RateLimiter(max_requests=1000, period=1),
+            retry_policy=RetryPolicy(max_retries=3, backoff_factor=0.5, max_backoff=1.0)
+        )
+        self.delays = []
+
+    def tearDown(self) -> None:
+        """Close the session."""
+
+        self.td_session.close()
+
+    def make_request(self, script: list, method: str = 'get') -> dict:
+        """Sends one request through an adapter answering from the script."""
+
+        self.adapter = FakeAdapter(script=script)
+        self.td_session.http_session.mount('https://', self.adapter)
+
+        with mock.patch('td.session.time.sleep', self.delays.append):
+            return self.td_session.make_request(method=method, endpoint='marketdata/quotes')
+
+    def test_retry_until_success(self):
+        """Test a 429 waits for its `Retry-After` and a 503 backs off, then the response is returned."""
+
+        content = self.make_request(
+            script=[(429, {'Retry-After': '45'}), (503, {}), (200, {})]
+        )
+
+        self.assertEqual(content, {'ok': True})
+        self.assertEqual(len(self.adapter.sent), 3)
+        self.assertEqual(self.delays[0], 45.0)
+        self.assertLessEqual(self.delays[1], 1.0)
+        self.assertEqual(self.td_session.connection_stats['requests_sent'], 3)
+
+    def test_give_up(self):
+        """Test the loop stops at the retry count, on long `Retry-After`, and on non-idempotent methods."""
+
+        with self.assertLogs(level='ERROR'), self.assertRaises(requests.HTTPError):
+            self.make_request(script=[(500, {})] * 4)
+
+        self.assertEqual(len(self.adapter.sent), 4)
+
+        with self.assertLogs(level='ERROR'), self.assertRaises(requests.HTTPError):
+            self.make_request(script=[(429, {'Retry-After': '3600'})])
+
+        with self.assertLogs(level='ERROR'), self.assertRaises(requests.HTTPError):
+            self.make_request(script=[(503, {})], method='post')
+
+        self.assertEqual(len(self.delays), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+import json
+import asyncio
+import unittest
+from unittest import TestCase
+from unittest import mock
+
+from td.streaming.sharded import ShardedStreamingClient
+from td.utils.retry_policy import RetryPolicy
+
+
+from fakes import LOGIN_RESPONSE
+from fakes import FakeWebSocket
+from fakes import OfflineStreamingApiClient
+from fakes import fake_connect
+
+
+def quote_message(symbol: str, bid_price: float) -> str:
+    """Builds a level one quote message."""
+
+    return json.dumps({
+        'data': [
+            {
+                'service': 'QUOTE',
+                'timestamp': 1,
+                'command': 'SUBS',
+                'content': [{'key': symbol, '1': bid_price}]
+            }
+        ]
+    })
+
+
+class TestShardedStreamingClient(TestCase):
+
+    """Will perform a unit test for the `ShardedStreamingClient` object."""
+
+    def setUp(self) -> None:
+        """Set up three offline shards."""
+
+        self.sharded_streaming_client = ShardedStreamingClient(
+            streaming_api_clients=[OfflineStreamingApiClient(session=None) for _ in range(3)]
+        )
+        self.symbols = [f'SYM{number}' for number in range(300)]
+
+    def test_requires_shards(self):
+        """Test a client without shards."""
+
+        with self.assertRaises(ValueError):
+            ShardedStreamingClient(streaming_api_clients=[])
+
+    def test_add_symbols(self):
+        """Test the symbols are spread over the shards."""
+
+        requests = asyncio.run(
+            self.sharded_streaming_client.add_symbols(
+                service='QUOTE',
+                symbols=self.symbols,
+                fields=['0', '1', '2']
+            )
+        )
+
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(sum(self.sharded_streaming_client.stats['symbols']), 300)
+        self.assertTrue(all(count > 50 for count in self.sharded_streaming_client.stats['symbols']))
+        self.assertEqual(
+            self.sharded_streaming_client.subscriptions['QUOTE']['keys'],
+            set(self.symbols)
+        )
+
+        # Every symbol lives on the shard it hashes to.
+        for position, shard in enumerate(self.sharded_streaming_client.shards):
+            for symbol in shard.subscriptions['QUOTE']['keys']:
+                self.assertEqual(self.sharded_streaming_client.shard_for(symbol=symbol), position)
+
+    def test_add_symbols_reuses_fields(self):
+        """Test a shard without the service takes the fields of the others."""
+
+        first = self.symbols[0]
+        shard = self.sharded_streaming_client.shard_for(symbol=first)
+        other = next(
+            symbol for symbol in self.symbols
+            if self.sharded_streaming_client.shard_for(symbol=symbol) != shard
+        )
+
+        asyncio.run(self.sharded_streaming_client.add_symbols(service='QUOTE', symbols=[first], fields=['0', '1']))
+        requests = asyncio.run(self.sharded_streaming_client.add_symbols(service='QUOTE', symbols=[other]))
+
+        self.assertEqual(requests[0]['command'], 'SUBS')
+        self.assertEqual(requests[0]['parameters']['fields'], '0,1')
+
+    def test_remove_symbols_and_set_fields(self):
+        """Test removing symbols and changing the fields."""
+
+        asyncio.run(
+            self.sharded_streaming_client.add_symbols(service='QUOTE', symbols=self.symbols, fields=['0', '1'])
+        )
+        asyncio.run(self.sharded_streaming_client.remove_symbols(service='QUOTE', symbols=self.symbols[:100]))
+
+        self.assertEqual(
+            self.sharded_streaming_client.subscriptions['QUOTE']['keys'],
+            set(self.symbols[100:])
+        )
+
+        requests = asyncio.run(self.sharded_streaming_client.set_fields(service='QUOTE', fields=['0', '1', '2']))
+
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(self.sharded_streaming_client.subscriptions['QUOTE']['fields'], ['0', '1', '2'])
+
+
+class TestShardedStream(TestCase):
+
+    """Will perform a unit test for the merged stream of the `ShardedStreamingClient` object."""
+
+    def setUp(self) -> None:
+        """Set up two shards streaming scripted quotes."""
+
+        self.sharded_streaming_client = ShardedStreamingClient(
+            streaming_api_clients=[
+                OfflineStreamingApiClient(session=None, auto_reconnect=False)
+                for _ in range(2)
+            ]
+        )
+        self.symbols = [f'SYM{number}' for number in range(20)]
+
+        asyncio.run(
+            self.sharded_streaming_client.add_symbols(service='QUOTE', symbols=self.symbols, fields=['0', '1'])
+        )
+
+        # Each shard streams two quotes of every symbol it owns.
+        for shard in self.sharded_streaming_client.shards:
+            shard.connection = FakeWebSocket(
+                messages=[
+                    quote_message(symbol=symbol, bid_price=float(number))
+                    for number in range(2)
+                    for symbol in sorted(shard.subscriptions['QUOTE']['keys'])
+                ]
+            )
+
+    def collect(self, **kwargs) -> list:
+        """Reads the merged stream until every shard closed."""
+
+        async def read() -> list:
+            return [record async for record in self.sharded_streaming_client.stream(block=True, **kwargs)]
+
+        return asyncio.run(read())
+
+    def assert_merged(self, records: list) -> None:
+        """Checks every quote of every shard came through decoded."""
+
+        self.assertEqual(len(records), 40)
+        self.assertEqual(sorted(record.key for record in records), sorted(self.symbols * 2))
+        self.assertEqual(records[0].fields['BidPrice'], 0.0)
+
+        # The records of one shard keep their order.
+        for shard in self.sharded_streaming_client.shards:
+            shard_records = [record for record in records if record.key in shard.subscriptions['QUOTE']['keys']]
+            self.assertEqual([record.fields['BidPrice'] for record in shard_records][-1], 1.0)
+
+    def test_merged_stream(self):
+        """Test the records of every shard are merged into one stream."""
+
+        self.assert_merged(records=self.collect())
+
+    def test_early_exit(self):
+        """Test leaving the stream early waits for the shard readers to stop."""
+
+        for shard in self.sharded_streaming_client.shards:
+            shard.connection.messages.append(None)
+
+        async def read() -> list:
+            stream = self.sharded_streaming_client.stream(block=True)
+            async for _ in stream:
+                break
+            await stream.aclose()
+            return [
+                task for task in asyncio.all_tasks()
+                if task is not asyncio.current_task() and not task.done()
+            ]
+
+        self.assertEqual(asyncio.run(read()), [])
+
+    def test_close(self):
+        """Test closing the shards ends the stream without reconnecting."""
+
+        for shard in self.sharded_streaming_client.shards:
+            shard.auto_reconnect = True
+            shard.connection.messages.clear()
+            shard.connection.messages.append(None)
+
+        async def read() -> list:
+            records = []
+            async for record in self.sharded_streaming_client.stream(block=True):
+                records.append(record)
+            return records
+
+        async def close_and_read() -> list:
+            reading = asyncio.ensure_future(read())
+            await asyncio.sleep(0.01)
+            await self.sharded_streaming_client.close()
+            return await reading
+
+        self.assertEqual(asyncio.run(close_and_read()), [])
+        self.assertEqual(self.sharded_streaming_client.stats['reconnect_count'], 0)
+
+    def test_gap_records(self):
+        """Test a reconnecting shard tags its gap records without changing `gaps`."""
+
+        shard = self.sharded_streaming_client.shards[0]
+        shard.auto_reconnect = True
+        shard.reconnect_policy = RetryPolicy(max_retries=1, backoff_factor=0.0)
+
+        sockets = [FakeWebSocket(messages=[LOGIN_RESPONSE, quote_message(symbol='SYM0', bid_price=5.0)])]
+
+        with mock.patch('td.streaming.client.ws_client.connect', fake_connect(sockets=sockets + [OSError()])):
+            records = self.collect()
+
+        gaps = [record for record in records if record.kind == 'gap']
+
+        self.assertEqual(len(gaps), 1)
+        self.assertEqual(gaps[0].fields['shard'], 0)
+        self.assertNotIn('shard', shard.gaps[-1])
+        self.assertEqual(len(records), 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
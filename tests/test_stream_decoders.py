@@ -0,0 +1,113 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.enums import Timesale
+from td.utils.enums import LevelOneQuotes
+from td.streaming.records import split_message
+from td.streaming.decoders import StreamDecoder
+
+
+class TestStreamDecoder(TestCase):
+
+    """Will perform a unit test for the `StreamDecoder` object."""
+
+    def setUp(self) -> None:
+        """Set up a level one quote decoder."""
+
+        self.decoder = StreamDecoder(
+            service='QUOTE',
+            fields=['0', '1', '2', '4', '17', '25']
+        )
+
+        # Level one quotes only carry the fields that changed.
+        self.records = [
+            {'key': 'MSFT', 'delayed': False, '1': 251.1, '2': 251.2, '4': 3, '17': True, '25': 'Microsoft'},
+            {'key': 'AAPL', '2': 130.5},
+            {'key': 'MSFT', '1': 251.0, '4': 5}
+        ]
+
+    def test_columns(self):
+        """Test the columns follow the subscribed fields."""
+
+        self.assertEqual(
+            self.decoder.columns,
+            ['Symbol', 'BidPrice', 'AskPrice', 'BidSize', 'Marginable', 'Description']
+        )
+        self.assertEqual(self.decoder.dtypes['BidPrice'], np.float64)
+        self.assertEqual(self.decoder.dtypes['BidSize'], np.int64)
+        self.assertEqual(self.decoder.dtypes['Marginable'], np.bool_)
+        self.assertEqual(self.decoder.dtypes['Symbol'], object)
+
+    def test_decode(self):
+        """Test renaming the fields of a record."""
+
+        self.assertEqual(
+            self.decoder.decode(record=self.records[1]),
+            {'Symbol': 'AAPL', 'AskPrice': 130.5}
+        )
+
+        # Keys without a field number are kept.
+        self.assertIn('delayed', self.decoder.decode(record=self.records[0]))
+
+    def test_to_array(self):
+        """Test decoding records into arrays."""
+
+        out, present = self.decoder.to_array(records=self.records)
+
+        np.testing.assert_array_equal(out['Symbol'], ['MSFT', 'AAPL', 'MSFT'])
+        np.testing.assert_array_equal(out['BidPrice'], [251.1, np.nan, 251.0])
+        np.testing.assert_array_equal(out['BidSize'], [3, 0, 5])
+        np.testing.assert_array_equal(
+            present[:, self.decoder.position('AskPrice')],
+            [True, True, False]
+        )
+
+    def test_decode_into(self):
+        """Test writing into preallocated arrays."""
+
+        out, present = self.decoder.allocate(size=10)
+
+        written = self.decoder.decode_into(records=self.records, out=out, present=present, start=4)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(out['Symbol'][5], 'AAPL')
+        self.assertTrue(np.isnan(out['BidPrice'][0]))
+        self.assertFalse(present[:4].any())
+        self.assertEqual(present[4:7].sum(), 11)
+
+    def test_default_fields(self):
+        """Test a decoder for every field of a service."""
+
+        decoder = StreamDecoder(service='TIMESALE_EQUITY')
+
+        self.assertEqual(len(decoder.columns), len(Timesale.All.value))
+        self.assertEqual(decoder.dtypes['LastSequence'], np.int64)
+
+        quote_decoder = StreamDecoder(service='QUOTE', fields=LevelOneQuotes.All.value)
+        self.assertEqual(quote_decoder.columns[-1], 'RegularMarketTradeTimeInLong')
+
+    def test_unknown_service(self):
+        """Test a service without a field enum."""
+
+        with self.assertRaises(ValueError):
+            StreamDecoder(service='ACCT_ACTIVITY')
+
+    def test_split_message(self):
+        """Test decoding while splitting a message."""
+
+        message = {
+            'data': [
+                {'service': 'QUOTE', 'timestamp': 1, 'command': 'SUBS', 'content': self.records}
+            ]
+        }
+
+        records = split_message(message=message, decoders={'QUOTE': self.decoder})
+
+        self.assertEqual(records[1].key, 'AAPL')
+        self.assertEqual(records[1].fields, {'Symbol': 'AAPL', 'AskPrice': 130.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest import TestCase
+
+from td.streaming.records import StreamRecord
+from td.streaming.records import split_message
+
+
+class TestStreamRecords(TestCase):
+
+    """Will perform a unit test for the `split_message` function."""
+
+    def setUp(self) -> None:
+        """Set up a message with every section."""
+
+        self.message = {
+            'data': [
+                {
+                    'service': 'QUOTE',
+                    'timestamp': 1620000000000,
+                    'command': 'SUBS',
+                    'content': [
+                        {'key': 'MSFT', '1': 251.1, '2': 251.2},
+                        {'key': 'AAPL', '1': 130.5}
+                    ]
+                },
+                {
+                    'service': 'TIMESALE_EQUITY',
+                    'timestamp': 1620000000001,
+                    'command': 'SUBS',
+                    'content': [
+                        {'key': 'MSFT', '1': 1620000000000, '2': 251.15, '3': 100.0}
+                    ]
+                }
+            ],
+            'response': [
+                {
+                    'service': 'ADMIN',
+                    'command': 'LOGIN',
+                    'timestamp': 1620000000002,
+                    'content': {'code': 0, 'msg': '29-3'}
+                }
+            ],
+            'notify': [
+                {'heartbeat': '1620000000003'}
+            ]
+        }
+
+    def test_split_data(self):
+        """Test splitting the data entries into one record per symbol."""
+
+        records = split_message(message=self.message)
+
+        self.assertEqual(len(records), 3)
+        self.assertIsInstance(records[0], StreamRecord)
+        self.assertEqual(
+            [(record.service, record.key) for record in records],
+            [('QUOTE', 'MSFT'), ('QUOTE', 'AAPL'), ('TIMESALE_EQUITY', 'MSFT')]
+        )
+        self.assertEqual(records[0].kind, 'data')
+        self.assertEqual(records[0].timestamp, 1620000000000)
+        self.assertEqual(records[0].fields['2'], 251.2)
+
+    def test_split_responses(self):
+        """Test including the response and notify entries."""
+
+        records = split_message(message=self.message, include_responses=True)
+
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[3].kind, 'response')
+        self.assertEqual(records[3].fields['code'], 0)
+        self.assertEqual(records[4].service, 'HEARTBEAT')
+        self.assertEqual(records[4].timestamp, 1620000000003)
+
+    def test_split_empty(self):
+        """Test splitting a message without data."""
+
+        self.assertEqual(split_message(message={'notify': [{'heartbeat': '1'}]}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import unittest
+from unittest import TestCase
+
+from fakes import OfflineStreamingApiClient
+
+
+class TestStreamingHandlers(TestCase):
+
+    """Will perform a unit test for the handlers of the `StreamingApiClient` object."""
+
+    def setUp(self) -> None:
+        """Set up a client and a message with every section."""
+
+        self.streaming_api_client = OfflineStreamingApiClient(session=None)
+        self.received = []
+
+        self.message = {
+            'data': [
+                {'service': 'QUOTE', 'timestamp': 1, 'command': 'SUBS', 'content': [{'key': 'MSFT'}, {'key': 'AAPL'}]},
+                {'service': 'TIMESALE_EQUITY', 'timestamp': 2, 'command': 'SUBS', 'content': [{'key': 'MSFT'}]}
+            ],
+            'response': [
+                {'service': 'ADMIN', 'timestamp': 3, 'command': 'LOGIN', 'content': {'code': 0}}
+            ],
+            'notify': [
+                {'heartbeat': '4'}
+            ]
+        }
+
+    def handler(self, name: str):
+        """Returns a handler that records the entries it is given."""
+
+        def handle(entry: dict) -> None:
+            self.received.append((name, entry))
+
+        return handle
+
+    def dispatch(self) -> None:
+        """Hands the message to the handlers."""
+
+        asyncio.run(self.streaming_api_client._dispatch_message(message=self.message))
+
+    def test_routing(self):
+        """Test each entry goes to the handlers of its service and to `*`."""
+
+        self.streaming_api_client.add_handler(service='quote', handler=self.handler('quote'))
+        self.streaming_api_client.add_handler(service='RESPONSE', handler=self.handler('response'))
+        self.streaming_api_client.add_handler(service='NOTIFY', handler=self.handler('notify'))
+        self.streaming_api_client.add_handler(service='*', handler=self.handler('all'))
+
+        self.dispatch()
+
+        self.assertEqual(
+            [(name, entry.get('service')) for name, entry in self.received],
+            [
+                ('quote', 'QUOTE'),
+                ('all', 'QUOTE'),
+                ('all', 'TIMESALE_EQUITY'),
+                ('response', 'ADMIN'),
+                ('all', 'ADMIN'),
+                ('notify', None),
+                ('all', None)
+            ]
+        )
+        self.assertEqual(self.received[-1][1], {'heartbeat': '4'})
+
+    def test_remove_handler(self):
+        """Test a removed handler is no longer called."""
+
+        handler = self.handler('quote')
+
+        self.streaming_api_client.add_handler(service='QUOTE', handler=handler)
+        self.streaming_api_client.remove_handler(service='QUOTE', handler=handler)
+        self.dispatch()
+
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.streaming_api_client._handlers, {})
+
+    def test_coroutine_handler(self):
+        """Test coroutine handlers are awaited."""
+
+        async def handle(entry: dict) -> None:
+            await asyncio.sleep(0)
+            self.received.append(('quote', entry))
+
+        self.streaming_api_client.add_handler(service='QUOTE', handler=handle)
+        self.dispatch()
+
+        self.assertEqual(len(self.received), 1)
+
+    def test_failing_handler(self):
+        """Test a failing handler is logged and the other handlers still run."""
+
+        def fail(entry: dict) -> None:
+            raise RuntimeError('Handler failed.')
+
+        self.streaming_api_client.add_handler(service='QUOTE', handler=fail)
+        self.streaming_api_client.add_handler(service='*', handler=self.handler('all'))
+
+        with self.assertLogs(level=logging.ERROR) as logs:
+            self.dispatch()
+
+        self.assertEqual(len(self.received), 4)
+        self.assertIn('Streaming handler for QUOTE failed.', logs.output[0])
+
+    def test_message_logging(self):
+        """Test every entry is logged with structured fields."""
+
+        logger = logging.getLogger('td.streaming.test')
+
+        self.streaming_api_client.enable_message_logging(logger=logger, level=logging.INFO)
+
+        with self.assertLogs(logger=logger, level=logging.INFO) as logs:
+            self.dispatch()
+
+        quote_record = logs.records[0]
+
+        self.assertEqual(len(logs.records), 4)
+        self.assertEqual(quote_record.getMessage(), 'Streaming data QUOTE')
+        self.assertEqual(
+            (quote_record.service, quote_record.command, quote_record.timestamp, quote_record.records),
+            ('QUOTE', 'SUBS', 1, 2)
+        )
+        self.assertEqual(logs.records[2].service, 'RESPONSE')
+
+        self.streaming_api_client.disable_message_logging()
+        self.assertIsNone(self.streaming_api_client._message_logger)
+
+
+if __name__ == '__main__':
+    unittest.main()
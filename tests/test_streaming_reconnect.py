@@ -0,0 +1,140 @@
+import json
+import asyncio
+import unittest
+from unittest import TestCase
+from unittest import mock
+
+from td.utils.retry_policy import RetryPolicy
+
+from fakes import LOGIN_RESPONSE
+from fakes import FakeWebSocket
+from fakes import OfflineStreamingApiClient
+from fakes import fake_connect
+
+
+QUOTE_MESSAGE = json.dumps({
+    'data': [
+        {
+            'service': 'QUOTE',
+            'timestamp': 1,
+            'command': 'SUBS',
+            'content': [{'key': 'MSFT', '1': 251.1}]
+        }
+    ]
+})
+
+REFUSED_RESPONSE = json.dumps({
+    'response': [
+        {
+            'service': 'ADMIN',
+            'command': 'LOGIN',
+            'requestid': '0',
+            'timestamp': 1,
+            'content': {'code': 3, 'msg': 'Login failed.'}
+        }
+    ]
+})
+
+
+class TestStreamingReconnect(TestCase):
+
+    """Will perform a unit test for the reconnects of the `StreamingApiClient` object."""
+
+    def setUp(self) -> None:
+        """Set up a client with queued subscriptions on a socket that drops."""
+
+        self.streaming_api_client = OfflineStreamingApiClient(
+            session=None,
+            reconnect_policy=RetryPolicy(max_retries=2, backoff_factor=0.0)
+        )
+
+        streaming_services = self.streaming_api_client.services()
+        streaming_services.quality_of_service(qos_level='0')
+        streaming_services.level_one_quotes(symbols=['MSFT', 'AAPL'], fields=['0', '1'])
+
+        self.streaming_api_client.connection = FakeWebSocket(messages=[QUOTE_MESSAGE])
+
+    def reconnect(self, sockets: list) -> bool:
+        """Runs one reconnect against the scripted sockets."""
+
+        with mock.patch('td.streaming.client.ws_client.connect', fake_connect(sockets=sockets)):
+            return asyncio.run(self.streaming_api_client._reconnect(reason=ConnectionError('Dropped.')))
+
+    def test_stream_reconnects(self):
+        """Test a dropped stream logs in again, replays the subscriptions and yields a gap."""
+
+        socket = FakeWebSocket(messages=[LOGIN_RESPONSE, QUOTE_MESSAGE])
+
+        async def read() -> list:
+            return [record async for record in self.streaming_api_client.stream(block=True)]
+
+        # The second socket drops too, and every reconnect attempt after it fails.
+        with mock.patch('td.streaming.client.ws_client.connect', fake_connect(sockets=[socket, OSError(), OSError()])):
+            records = asyncio.run(read())
+
+        self.assertEqual([record.kind for record in records], ['data', 'gap', 'data'])
+        self.assertEqual(records[1].fields['attempts'], 1)
+        self.assertLessEqual(records[1].fields['disconnected'], records[1].fields['reconnected'])
+
+        # The login comes first, then one request with the current subscriptions.
+        self.assertEqual(socket.sent[0]['requests'][0]['command'], 'LOGIN')
+        self.assertEqual(
+            [request['command'] for request in socket.sent[1]['requests']],
+            ['QOS', 'SUBS']
+        )
+        self.assertEqual(socket.sent[1]['requests'][1]['parameters']['keys'], 'AAPL,MSFT')
+
+        self.assertEqual(self.streaming_api_client.reconnect_count, 1)
+        self.assertEqual(self.streaming_api_client.reconnect_attempts, 3)
+        self.assertEqual(list(self.streaming_api_client.gaps), [records[1].fields])
+
+    def test_gives_up(self):
+        """Test the reconnect stops once the policy is spent."""
+
+        self.assertFalse(self.reconnect(sockets=[OSError(), OSError(), FakeWebSocket()]))
+        self.assertEqual(self.streaming_api_client.reconnect_attempts, 2)
+        self.assertEqual(self.streaming_api_client.reconnect_count, 0)
+        self.assertEqual(len(self.streaming_api_client.gaps), 0)
+
+    def test_disabled(self):
+        """Test nothing is tried without `auto_reconnect` or after a close."""
+
+        self.streaming_api_client.auto_reconnect = False
+        self.assertFalse(self.reconnect(sockets=[]))
+
+        self.streaming_api_client.auto_reconnect = True
+        self.streaming_api_client._closing = True
+        self.assertFalse(self.reconnect(sockets=[]))
+
+        self.assertEqual(self.streaming_api_client.reconnect_attempts, 0)
+
+    def test_refused_login_reloads_the_streamer_info(self):
+        """Test a refused login reloads the streamer info before the next attempt."""
+
+        load_user_principals = mock.Mock(wraps=self.streaming_api_client._load_user_principals)
+        self.streaming_api_client._load_user_principals = load_user_principals
+
+        sockets = [
+            FakeWebSocket(messages=[REFUSED_RESPONSE]),
+            FakeWebSocket(messages=[LOGIN_RESPONSE])
+        ]
+
+        self.assertTrue(self.reconnect(sockets=sockets))
+        self.assertEqual(load_user_principals.call_count, 1)
+        self.assertEqual(self.streaming_api_client.reconnect_attempts, 2)
+
+    def test_login_timeout(self):
+        """Test a login that is never answered counts as a failed attempt."""
+
+        self.streaming_api_client.login_timeout = 0.05
+
+        silent = FakeWebSocket(messages=[None])
+
+        self.assertTrue(self.reconnect(sockets=[silent, FakeWebSocket(messages=[LOGIN_RESPONSE])]))
+        self.assertFalse(silent.open)
+        self.assertEqual(self.streaming_api_client.reconnect_attempts, 2)
+        self.assertEqual(self.streaming_api_client.reconnect_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
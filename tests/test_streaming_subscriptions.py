@@ -0,0 +1,155 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+from td.utils.enums import LevelOneQuotes
+
+
+from fakes import FakeWebSocket
+from fakes import OfflineStreamingApiClient
+
+
+class TestStreamingSubscriptions(TestCase):
+
+    """Will perform a unit test for the subscriptions of the `StreamingApiClient` object."""
+
+    def setUp(self) -> None:
+        """Set up a client with two queued services."""
+
+        self.streaming_api_client = OfflineStreamingApiClient(session=None)
+        self.streaming_services = self.streaming_api_client.services()
+
+        self.streaming_services.quality_of_service(qos_level='0')
+        self.streaming_services.level_one_quotes(
+            symbols=['MSFT', 'AAPL'],
+            fields=[LevelOneQuotes.Symbol, LevelOneQuotes.BidPrice, LevelOneQuotes.AskPrice]
+        )
+        self.streaming_services.timesale(
+            service='TIMESALE_EQUITY',
+            symbols=['MSFT'],
+            fields=['0', '1', '2']
+        )
+
+    def test_tracked_subscriptions(self):
+        """Test the queued requests are tracked."""
+
+        self.assertEqual(
+            self.streaming_api_client.subscriptions['QUOTE'],
+            {'keys': {'MSFT', 'AAPL'}, 'fields': ['0', '1', '2'], 'requestid': 2}
+        )
+        self.assertIn('TIMESALE_EQUITY', self.streaming_api_client.decoders)
+        self.assertNotIn('ADMIN', self.streaming_api_client.subscriptions)
+
+    def test_add_symbols(self):
+        """Test only the new symbols are added."""
+
+        request = asyncio.run(
+            self.streaming_api_client.add_symbols(service='QUOTE', symbols=['AAPL', 'NVDA', 'NVDA'])
+        )
+
+        self.assertEqual(request['command'], 'ADD')
+        self.assertEqual(request['parameters'], {'keys': 'NVDA', 'fields': '0,1,2'})
+        self.assertEqual(
+            self.streaming_api_client.subscriptions['QUOTE']['keys'],
+            {'MSFT', 'AAPL', 'NVDA'}
+        )
+        self.assertIsNone(
+            asyncio.run(self.streaming_api_client.add_symbols(service='QUOTE', symbols=['MSFT']))
+        )
+
+    def test_add_new_service(self):
+        """Test adding symbols to a service that is not subscribed."""
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self.streaming_api_client.add_symbols(service='OPTION', symbols=['MSFT_061821C250']))
+
+        request = asyncio.run(
+            self.streaming_api_client.add_symbols(
+                service='OPTION',
+                symbols=['MSFT_061821C250'],
+                fields=['0', '2', '3']
+            )
+        )
+
+        self.assertEqual(request['command'], 'SUBS')
+        self.assertIn('OPTION', self.streaming_api_client.decoders)
+
+    def test_remove_symbols(self):
+        """Test removing symbols and then the whole service."""
+
+        request = asyncio.run(
+            self.streaming_api_client.remove_symbols(service='QUOTE', symbols=['AAPL', 'GOOG'])
+        )
+
+        self.assertEqual(request['command'], 'UNSUBS')
+        self.assertEqual(request['parameters'], {'keys': 'AAPL'})
+        self.assertEqual(self.streaming_api_client.subscriptions['QUOTE']['keys'], {'MSFT'})
+
+        asyncio.run(self.streaming_api_client.remove_symbols(service='QUOTE', symbols=['MSFT']))
+
+        self.assertNotIn('QUOTE', self.streaming_api_client.subscriptions)
+
+    def test_set_fields(self):
+        """Test changing the fields of a service."""
+
+        request = asyncio.run(
+            self.streaming_api_client.set_fields(service='QUOTE', fields=LevelOneQuotes.All)
+        )
+
+        self.assertEqual(request['command'], 'VIEW')
+        self.assertEqual(len(self.streaming_api_client.decoders['QUOTE'].columns), 53)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self.streaming_api_client.set_fields(service='OPTION', fields=['0']))
+
+    def test_subscription_requests(self):
+        """Test the replayed requests follow the live changes."""
+
+        asyncio.run(self.streaming_api_client.add_symbols(service='QUOTE', symbols=['NVDA']))
+        asyncio.run(self.streaming_api_client.remove_symbols(service='TIMESALE_EQUITY', symbols=['MSFT']))
+
+        requests = self.streaming_api_client._subscription_requests()['requests']
+
+        self.assertEqual([request['command'] for request in requests], ['QOS', 'SUBS'])
+        self.assertEqual(requests[1]['parameters']['keys'], 'AAPL,MSFT,NVDA')
+
+        # The queued requests are left as they were.
+        self.assertEqual(len(self.streaming_api_client.data_requests['requests']), 3)
+
+    def test_unsubscribe(self):
+        """Test unsubscribing sends the request without reading from the stream."""
+
+        connection = FakeWebSocket(messages=[])
+        self.streaming_api_client.connection = connection
+
+        request = asyncio.run(self.streaming_api_client.unsubscribe(service='quote'))
+
+        self.assertEqual(connection.sent, [{'requests': [request]}])
+        self.assertEqual((request['service'], request['command']), ('QUOTE', 'UNSUBS'))
+        self.assertNotIn('QUOTE', self.streaming_api_client.subscriptions)
+
+        # The socket was never read, so it is still open.
+        self.assertTrue(connection.open)
+
+    def test_replay_requests(self):
+        """Test a reconnect resends the settings and subscriptions only, with their ids."""
+
+        self.streaming_services.chart_history_futures(symbols=['/ES'], frequency='m1', period='d1')
+
+        first = self.streaming_api_client._subscription_requests()['requests']
+        unsubscribe_count = self.streaming_api_client.unsubscribe_count
+
+        for _ in range(2):
+            replayed = self.streaming_api_client._subscription_requests(replay=True)['requests']
+
+        self.assertEqual([request['command'] for request in first], ['QOS', 'SUBS', 'SUBS', 'GET'])
+        self.assertEqual([request['command'] for request in replayed], ['QOS', 'SUBS', 'SUBS'])
+        self.assertEqual(
+            [request['requestid'] for request in replayed],
+            [request['requestid'] for request in first[:3]]
+        )
+        self.assertEqual(self.streaming_api_client.unsubscribe_count, unsubscribe_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+import tempfile
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from td.utils.black_scholes import black_scholes
+from td.utils.option_chain_frame import OptionChainFrame
+from td.utils.option_chain_cache import diff_option_chains
+from td.utils.volatility_surface import VolatilitySurface
+
+
+class TestVolatilitySurface(TestCase):
+
+    """Will perform a unit test for the `VolatilitySurface` object."""
+
+    def build_chain(self, smiles: dict, days_passed: int = 0, underlying_price: float = 100.0) -> OptionChainFrame:
+        """Builds a chain with a call and a put per strike."""
+
+        content = {
+            'symbol': 'MSFT',
+            'underlyingPrice': underlying_price,
+            'interestRate': 0.0,
+            'callExpDateMap': {},
+            'putExpDateMap': {}
+        }
+
+        for days, volatility in smiles.items():
+            expiration = f'2021-{days:03d}:{days}'
+            for side, side_map in (('C', 'callExpDateMap'), ('P', 'putExpDateMap')):
+                content[side_map][expiration] = {
+                    str(strike): [{
+                        'symbol': f'MSFT_{days}{side}{strike}',
+                        'strikePrice': strike,
+                        'daysToExpiration': days - days_passed,
+                        'volatility': vol * 100.0
+                    }]
+                    for strike, vol in zip(range(80, 125, 5), volatility)
+                }
+
+        return OptionChainFrame.from_chain(content=content)
+
+    def setUp(self) -> None:
+        """Set up a smile that gets flatter with time."""
+
+        strikes = np.arange(80, 125, 5)
+        self.smiles = {
+            30: 0.20 + 0.5 * ((strikes - 100) / 100.0) ** 2,
+            90: 0.22 + 0.3 * ((strikes - 100) / 100.0) ** 2
+        }
+        self.option_chain_frame = self.build_chain(smiles=self.smiles)
+
+    def test_grid_matches_clean_quotes(self):
+        """Make sure an arbitrage free chain is left alone."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+
+        self.assertEqual(volatility_surface.volatility.shape, (2, 9))
+        np.testing.assert_allclose(volatility_surface.volatility[0], self.smiles[30], rtol=1e-6)
+        np.testing.assert_allclose(
+            volatility_surface.volatility_at(days_to_expiration=30, strike=np.array([90.0, 102.5])),
+            [self.smiles[30][2], (self.smiles[30][4] + self.smiles[30][5]) / 2.0],
+            rtol=1e-6
+        )
+
+    def test_time_interpolation(self):
+        """Make sure total variance is interpolated between expirations."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+
+        expected_variance = (0.20 ** 2 * 30 + 0.22 ** 2 * 90) / 2.0
+        self.assertAlmostEqual(
+            float(volatility_surface.volatility_at(days_to_expiration=60, strike=100.0)),
+            np.sqrt(expected_variance / 60),
+            places=6
+        )
+        self.assertAlmostEqual(
+            float(volatility_surface.volatility_at(days_to_expiration=5, strike=100.0)), 0.20, places=6
+        )
+
+    def test_delta_lookup(self):
+        """Make sure put and call deltas of one strike agree."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+        call_delta = black_scholes(
+            is_call=True,
+            underlying_price=100.0,
+            strike_price=90.0,
+            time_to_expiration=30 / 365,
+            volatility=self.smiles[30][2],
+            interest_rate=0.0
+        )['delta']
+
+        self.assertAlmostEqual(
+            float(volatility_surface.volatility_at_delta(days_to_expiration=30, delta=call_delta)),
+            self.smiles[30][2],
+            places=4
+        )
+        self.assertAlmostEqual(
+            float(volatility_surface.volatility_at_delta(days_to_expiration=30, delta=call_delta - 1.0)),
+            self.smiles[30][2],
+            places=4
+        )
+        self.assertEqual(volatility_surface.delta_grid().shape, (2, 19))
+
+    def test_arbitrage_is_removed(self):
+        """Make sure a spike and an inverted term structure are smoothed."""
+
+        smiles = dict(self.smiles)
+        smiles[30] = smiles[30].copy()
+        smiles[30][4] = 0.60
+        smiles[90] = np.full(9, 0.10)
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.build_chain(smiles=smiles)
+        )
+
+        prices = black_scholes(
+            is_call=True,
+            underlying_price=100.0,
+            strike_price=volatility_surface.strikes,
+            time_to_expiration=volatility_surface.time_to_expiration[:, np.newaxis],
+            volatility=volatility_surface.volatility,
+            interest_rate=0.0
+        )['price']
+        total_variance = np.square(volatility_surface.volatility) * volatility_surface.time_to_expiration[:, np.newaxis]
+
+        self.assertLess(volatility_surface.volatility[0][4], 0.60)
+        self.assertTrue((np.diff(prices, n=2, axis=1) >= -1e-8).all())
+        self.assertTrue((np.diff(total_variance, axis=0) >= -1e-12).all())
+
+    def test_refresh_rebuilds_changed_slices(self):
+        """Make sure only the moved expiration is rebuilt."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+        far_slice = volatility_surface.volatility[1].copy()
+
+        smiles = dict(self.smiles)
+        smiles[30] = smiles[30] + 0.01
+        snapshot = self.build_chain(smiles=smiles)
+
+        rebuilt = volatility_surface.refresh(
+            option_chain_diff=diff_option_chains(previous=self.option_chain_frame, current=snapshot)
+        )
+
+        self.assertListEqual(rebuilt.tolist(), ['2021-030:30'])
+        np.testing.assert_allclose(volatility_surface.volatility[0], smiles[30], rtol=1e-6)
+        np.testing.assert_allclose(volatility_surface.volatility[1], far_slice)
+
+    def test_refresh_keeps_slices_current(self):
+        """Make sure a refresh ages every slice, follows the underlying and drops empty slices."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+
+        # A day later nothing moved but the time.
+        snapshot = self.build_chain(smiles=self.smiles, days_passed=1)
+        rebuilt = volatility_surface.refresh(
+            option_chain_diff=diff_option_chains(previous=self.option_chain_frame, current=snapshot)
+        )
+
+        self.assertListEqual(rebuilt.tolist(), ['2021-030:30', '2021-090:90'])
+        self.assertListEqual(volatility_surface.days_to_expiration.tolist(), [29.0, 89.0])
+
+        # The put of a crossed strike is used once the underlying rises past it.
+        previous = snapshot
+        snapshot = self.build_chain(smiles=self.smiles, days_passed=1, underlying_price=106.0)
+        snapshot.columns['volatility'][(snapshot['strikePrice'] == 105.0) & (snapshot.put_call == 1)] = 50.0
+        previous.columns['volatility'][(previous['strikePrice'] == 105.0) & (previous.put_call == 1)] = 50.0
+
+        volatility_surface.refresh(
+            option_chain_diff=diff_option_chains(previous=previous, current=snapshot)
+        )
+
+        self.assertEqual(volatility_surface.raw_volatility[0][5], 0.5)
+
+        # Without a usable contract the near slice is dropped.
+        previous = snapshot
+        snapshot = self.build_chain(smiles={30: np.full(9, np.nan), 90: self.smiles[90]}, days_passed=1)
+
+        rebuilt = volatility_surface.refresh(
+            option_chain_diff=diff_option_chains(previous=previous, current=snapshot)
+        )
+
+        self.assertListEqual(volatility_surface.expirations.tolist(), ['2021-090:90'])
+        self.assertEqual(volatility_surface.volatility.shape, (1, 9))
+        self.assertTrue(np.isfinite(volatility_surface.volatility_at(days_to_expiration=30, strike=100.0)))
+
+    def test_duplicate_days_to_expiration(self):
+        """Make sure two slices with the same time don't break the lookups."""
+
+        volatility_surface = VolatilitySurface(
+            days_to_expiration=np.array([30.0, 30.0, 90.0]),
+            strikes=np.arange(80, 125, 5),
+            raw_volatility=np.array([self.smiles[30], self.smiles[30], self.smiles[90]]),
+            underlying_price=100.0,
+            interest_rate=0.0
+        )
+
+        self.assertTrue(np.isfinite(volatility_surface.volatility_at(days_to_expiration=[20, 30, 60], strike=100.0)).all())
+        self.assertTrue(np.isfinite(volatility_surface.volatility_at_delta(days_to_expiration=30, delta=0.5)))
+
+    def test_save_and_load(self):
+        """Make sure a saved surface answers the same queries."""
+
+        volatility_surface = VolatilitySurface.from_chain(
+            option_chain_frame=self.option_chain_frame
+        )
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            file_path = f'{temp_directory}/surface.npz'
+            volatility_surface.save(file_path=file_path)
+            loaded = VolatilitySurface.load(file_path=file_path)
+
+        np.testing.assert_allclose(loaded.volatility, volatility_surface.volatility)
+        self.assertListEqual(loaded.expirations.tolist(), volatility_surface.expirations.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()